@@ -2,6 +2,7 @@ import bpy
 from . import (
     command_perf_ie,
     command_create_asset_library,
+    command_convert,
 )
 
 
@@ -14,6 +15,7 @@ if bpy.app.version >= (4, 2, 0):
         for cmd_id, cmd_exec in (
             command_perf_ie.CMD,
             command_create_asset_library.CMD,
+            command_convert.CMD,
         ):
             cli_commands.append(bpy.utils.register_cli_command(cmd_id, cmd_exec))
 
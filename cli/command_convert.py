@@ -0,0 +1,370 @@
+from pathlib import Path
+
+CMD_ID = "sz_convert"
+
+JOURNAL_DIR_NAME = ".sz_convert_journal"
+
+SUPPORTED_EXTENSIONS = (".ydr", ".ydd", ".yft", ".ybn", ".ytd", ".ytyp", ".ymap")
+
+
+def _split_name(file: Path) -> tuple[str, str]:
+    """Splits the file name into (name, extension), with multi-dot extensions like '.ydr.xml'."""
+    name = file.name
+    if name.endswith(".xml"):
+        name = name[:-4]
+        is_xml = True
+    else:
+        is_xml = False
+
+    i = name.rfind(".")
+    if i <= 0:
+        return file.name, ""
+
+    ext = name[i:] + (".xml" if is_xml else "")
+    return name[:i], ext
+
+
+def _is_dependency_of_other_file(file: Path, sibling_names: set[str]) -> bool:
+    """Whether the file is loaded automatically by the importer when importing another file in the same directory, e.g.
+    '_hi.yft' with its '.yft', or '+hidr.ytd' with its '.ydr'. These are converted along with the main file.
+    """
+    name, ext = _split_name(file)
+    binary_ext = ext.removesuffix(".xml")
+
+    def _has_sibling(base_name: str, base_ext: str) -> bool:
+        return f"{base_name}{base_ext}" in sibling_names or f"{base_name}{base_ext}.xml" in sibling_names
+
+    match binary_ext:
+        case ".yft":
+            return name.endswith("_hi") and _has_sibling(name[:-3], ".yft")
+        case ".ytd":
+            if name.endswith("+hi"):
+                return _has_sibling(name[:-3], ".ytd")
+            for suffix, asset_ext in (("+hidr", ".ydr"), ("+hifr", ".yft"), ("+hidd", ".ydd")):
+                if name.endswith(suffix):
+                    return _has_sibling(name.removesuffix(suffix), asset_ext)
+
+    return False
+
+
+def collect_files(input_directory: Path, exclude_directory: Path | None = None) -> list[Path]:
+    """Finds all the files to convert in the directory tree. Returns paths relative to ``input_directory``.
+    Files inside ``exclude_directory`` are ignored, so converting into a subdirectory of the input doesn't pick up the
+    output files.
+    """
+    files_by_dir: dict[Path, list[Path]] = {}
+    for f in input_directory.rglob("*"):
+        if not f.is_file() or (exclude_directory is not None and f.is_relative_to(exclude_directory)):
+            continue
+
+        _, ext = _split_name(f)
+        if ext.removesuffix(".xml") not in SUPPORTED_EXTENSIONS:
+            continue
+
+        files_by_dir.setdefault(f.parent, []).append(f)
+
+    files = []
+    for d, dir_files in files_by_dir.items():
+        sibling_names = {f.name for f in dir_files}
+        files.extend(
+            f.relative_to(input_directory) for f in dir_files if not _is_dependency_of_other_file(f, sibling_names)
+        )
+
+    return sorted(files)
+
+
+def read_journal(journal_directory: Path) -> dict[str, dict]:
+    """Reads the records from all the journal files in the directory. Returns the most recent record of each file,
+    keyed by the file path relative to the input directory.
+    """
+    import json
+
+    records = {}
+    if not journal_directory.is_dir():
+        return records
+
+    for journal_file in sorted(journal_directory.glob("*.jsonl")):
+        with journal_file.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partially written line, the process crashed while writing it. The file will be converted again.
+                    continue
+
+                records[record["file"]] = record
+
+    return records
+
+
+def shard_files(files: list[Path], sizes: dict[Path, int], num_shards: int) -> list[list[Path]]:
+    """Distributes the files into shards of similar total size, biggest files first."""
+    num_shards = max(1, min(num_shards, len(files)))
+    shards = [[] for _ in range(num_shards)]
+    shard_sizes = [0] * num_shards
+    for f in sorted(files, key=lambda f: sizes[f], reverse=True):
+        i = shard_sizes.index(min(shard_sizes))
+        shards[i].append(f)
+        shard_sizes[i] += sizes[f]
+    return [s for s in shards if s]
+
+
+def _convert_file(input_directory: Path, output_directory: Path, file: Path, target_format: str, target_version: str) -> bool:
+    import bpy
+    from ..logger import LoggerBase, use_logger
+
+    class _ErrorCounter(LoggerBase):
+        def __init__(self):
+            self.num_errors = 0
+
+        def do_log(self, msg: str, level: str):
+            if level == "ERROR":
+                self.num_errors += 1
+
+    bpy.ops.wm.read_homefile(use_factory_startup=True, use_empty=True)
+
+    src_file = input_directory / file
+    out_dir = output_directory / file.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    _, ext = _split_name(src_file)
+    binary_ext = ext.removesuffix(".xml")
+    common_settings = {
+        "directory": str(out_dir.absolute()),
+        "direct_export": True,
+        "use_custom_settings": True,
+        "target_formats": {target_format},
+        "target_versions": {target_version},
+    }
+
+    with use_logger(_ErrorCounter()) as errors:
+        res = bpy.ops.sollumz.import_assets(
+            directory=str(src_file.parent.absolute()),
+            files=[{"name": src_file.name}],
+            use_custom_settings=True,
+            textures_mode="PACK",
+            ymap_instance_entities=False,
+            ytyp_mlo_instance_entities=False,
+        )
+        if res != {"FINISHED"} or errors.num_errors:
+            return False
+
+        match binary_ext:
+            case ".ytyp":
+                res = bpy.ops.sollumz.export_ytyp_io(**common_settings, export_ytyps_include="ALL")
+            case ".ymap":
+                res = bpy.ops.sollumz.export_ymap(**common_settings, export_ymaps_include="ALL")
+            case ".ytd":
+                res = bpy.ops.sollumz.export_ytd(**common_settings, export_ytds_include="ALL")
+            case _:
+                res = bpy.ops.sollumz.export_assets(**common_settings, limit_to_selected=False)
+
+        return res == {"FINISHED"} and errors.num_errors == 0
+
+
+def convert_files(
+    input_directory: Path,
+    output_directory: Path,
+    files: list[Path],
+    journal_file: Path,
+    target_format: str,
+    target_version: str,
+):
+    """Converts the files in the current process, appending a record to ``journal_file`` after each one."""
+    import json
+    import os
+    import time
+    import traceback
+
+    journal_file.parent.mkdir(parents=True, exist_ok=True)
+    with journal_file.open("a", encoding="utf-8") as journal:
+        for file in files:
+            t0 = time.perf_counter()
+            try:
+                ok = _convert_file(input_directory, output_directory, file, target_format, target_version)
+            except Exception:
+                print(f"Error converting '{file}':\n{traceback.format_exc()}")
+                ok = False
+            elapsed = time.perf_counter() - t0
+
+            record = {
+                "file": file.as_posix(),
+                "ok": ok,
+                "bytes": (input_directory / file).stat().st_size,
+                "seconds": elapsed,
+            }
+            journal.write(json.dumps(record, separators=(",", ":")) + "\n")
+            # Make sure the record survives a crash of this process, so a resumed conversion skips this file
+            journal.flush()
+            os.fsync(journal.fileno())
+
+
+def _print_summary(records: list[dict], elapsed: float):
+    num_ok = sum(1 for r in records if r["ok"])
+    failed = sorted(r["file"] for r in records if not r["ok"])
+    total_bytes = sum(r["bytes"] for r in records)
+
+    print()
+    print(f"Converted {num_ok} file(s), {len(failed)} failed, in {elapsed:.2f} seconds")
+    if elapsed > 0.0:
+        print(f"Throughput: {len(records) / elapsed:.2f} files/s, {total_bytes / elapsed / (1024 * 1024):.2f} MB/s")
+    if failed:
+        print("Failed files:")
+        for f in failed:
+            print(f"  {f}")
+
+
+def main(argv: list[str]) -> int:
+    import sys
+    import os
+    import time
+    import shutil
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(
+        prog=os.path.basename(sys.argv[0]) + " --command " + CMD_ID,
+        description="Convert all assets in a directory tree to another format and/or game version.",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=Path,
+        help="Input directory. Searched recursively.",
+        required=True,
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Output directory. The directory structure of the input directory is kept.",
+        required=True,
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("NATIVE", "CWXML"),
+        help="Target format.",
+        required=True,
+    )
+    parser.add_argument(
+        "-v",
+        "--version",
+        choices=("GEN8", "GEN9"),
+        help="Target game version.",
+        required=True,
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of Blender processes to convert files in parallel. With 0, files are converted in this process.",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        help=f"Directory of the progress journal. Defaults to '{JOURNAL_DIR_NAME}' in the output directory.",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard the progress journal and convert all files again.",
+    )
+    # Internal arguments used by the worker processes
+    parser.add_argument("--worker-files", type=Path, help="Internal. File with the list of files to convert.")
+    parser.add_argument("--worker-journal", type=Path, help="Internal. Journal file of this worker.")
+    parser.add_argument("--exit-with-parent", action="store_true", help="Internal. Terminate when the parent exits.")
+    args = parser.parse_args(argv)
+
+    input_directory: Path = args.input.absolute()
+    output_directory: Path = args.output.absolute()
+    journal_directory: Path = (args.journal or output_directory / JOURNAL_DIR_NAME).absolute()
+
+    if args.worker_files is not None:
+        # Worker process: convert the files in the list given by the parent
+        if args.exit_with_parent:
+            from .command_create_asset_library import _start_exit_with_parent_watcher
+
+            _start_exit_with_parent_watcher()
+
+        files = [Path(line) for line in args.worker_files.read_text(encoding="utf-8").splitlines() if line]
+        convert_files(input_directory, output_directory, files, args.worker_journal, args.format, args.version)
+        return 0
+
+    if args.restart and journal_directory.is_dir():
+        shutil.rmtree(journal_directory)
+
+    files = collect_files(input_directory, exclude_directory=output_directory)
+    done = {f for f, r in read_journal(journal_directory).items() if r["ok"]}
+    pending = [f for f in files if f.as_posix() not in done]
+    print(f"Found {len(files)} file(s) to convert, {len(files) - len(pending)} already converted, {len(pending)} pending")
+    if not pending:
+        return 0
+
+    run_id = time.strftime("%Y%m%d%H%M%S")
+    journal_directory.mkdir(parents=True, exist_ok=True)
+
+    t0 = time.perf_counter()
+    if args.jobs < 1:
+        run_journals = [journal_directory / f"{run_id}.jsonl"]
+        convert_files(input_directory, output_directory, pending, run_journals[0], args.format, args.version)
+    else:
+        import bpy
+        from ..shared.process_pool import ProcessPool
+
+        sizes = {f: (input_directory / f).stat().st_size for f in pending}
+        cmds = []
+        run_journals = []
+        for shard_index, shard in enumerate(shard_files(pending, sizes, args.jobs)):
+            shard_list = journal_directory / f"{run_id}_{shard_index}.txt"
+            shard_list.write_text("\n".join(f.as_posix() for f in shard), encoding="utf-8")
+            shard_journal = journal_directory / f"{run_id}_{shard_index}.jsonl"
+            run_journals.append(shard_journal)
+            cmds.append(
+                [
+                    bpy.app.binary_path,
+                    "-c",
+                    CMD_ID,
+                    "-i",
+                    str(input_directory),
+                    "-o",
+                    str(output_directory),
+                    "-f",
+                    args.format,
+                    "-v",
+                    args.version,
+                    "--worker-files",
+                    str(shard_list),
+                    "--worker-journal",
+                    str(shard_journal),
+                    "--exit-with-parent",
+                ]
+            )
+
+        proc_pool = ProcessPool(cmds, max_parallel=args.jobs)
+        while proc_pool.update():
+            time.sleep(0.5)
+
+    elapsed = time.perf_counter() - t0
+
+    import json
+
+    records = []
+    for journal_file in run_journals:
+        if journal_file.is_file():
+            with journal_file.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+
+    _print_summary(records, elapsed)
+    if len(records) < len(pending):
+        print(f"{len(pending) - len(records)} file(s) were not processed, a worker process may have crashed. "
+              "Run the same command again to resume.")
+
+    return 0 if len(records) == len(pending) and all(r["ok"] for r in records) else 1
+
+
+CMD = (CMD_ID, main)
@@ -3,7 +3,20 @@ from pathlib import Path
 CMD_ID = "sz_perf_ie"
 
 
-def _print_stats(stats: dict[Path, dict[str, float]]):
+def _file_keys(files: list[Path]) -> dict[Path, str]:
+    """Gets the key of each file in the stats, its path relative to the common directory of all files. Files with the
+    same name in different directories get different keys.
+    """
+    import os
+
+    if not files:
+        return {}
+
+    common_dir = Path(os.path.commonpath([f.absolute().parent for f in files]))
+    return {f: f.absolute().relative_to(common_dir).as_posix() for f in files}
+
+
+def _print_stats(stats: dict[Path, dict]):
     col_file = 30
     col = 10
 
@@ -18,22 +31,24 @@ def _print_stats(stats: dict[Path, dict[str, float]]):
     print(header2)
     print("-" * len(header2))
 
+    keys = _file_keys(list(stats))
     for file in sorted(stats):
-        v = stats[file]
+        vi = stats[file]["import"]["total"]
+        ve = stats[file]["export"]["total"]
         print(
-            f"{file.name:<{col_file}} "
-            f"{v['import_avg']:>{col}.6f} "
-            f"{v['import_min']:>{col}.6f} "
-            f"{v['import_max']:>{col}.6f} "
-            f"{v['import_stdev']:>{col}.6f} "
-            f"{v['export_avg']:>{col}.6f} "
-            f"{v['export_min']:>{col}.6f} "
-            f"{v['export_max']:>{col}.6f} "
-            f"{v['export_stdev']:>{col}.6f}"
+            f"{keys[file]:<{col_file}} "
+            f"{vi['avg']:>{col}.6f} "
+            f"{vi['min']:>{col}.6f} "
+            f"{vi['max']:>{col}.6f} "
+            f"{vi['stdev']:>{col}.6f} "
+            f"{ve['avg']:>{col}.6f} "
+            f"{ve['min']:>{col}.6f} "
+            f"{ve['max']:>{col}.6f} "
+            f"{ve['stdev']:>{col}.6f}"
         )
 
 
-def _save_stats_csv(stats: dict[Path, dict[str, float]], output: Path):
+def _save_stats_csv(stats: dict[Path, dict], output: Path):
     import csv
 
     output.parent.mkdir(parents=True, exist_ok=True)
@@ -54,38 +69,67 @@ def _save_stats_csv(stats: dict[Path, dict[str, float]], output: Path):
             ]
         )
 
+        keys = _file_keys(list(stats))
         for file in sorted(stats):
-            v = stats[file]
+            vi = stats[file]["import"]["total"]
+            ve = stats[file]["export"]["total"]
             writer.writerow(
                 [
-                    file.name,
-                    v["import_avg"],
-                    v["import_min"],
-                    v["import_max"],
-                    v["import_stdev"],
-                    v["export_avg"],
-                    v["export_min"],
-                    v["export_max"],
-                    v["export_stdev"],
+                    keys[file],
+                    vi["avg"],
+                    vi["min"],
+                    vi["max"],
+                    vi["stdev"],
+                    ve["avg"],
+                    ve["min"],
+                    ve["max"],
+                    ve["stdev"],
                 ]
             )
 
 
-def _do_import_export(file: Path) -> tuple[float, float]:
+IMPORT_STAGES = (
+    "asset_load",
+    "dependency_resolution",
+    "model_data_extraction",
+    "material_creation",
+    "mesh_building",
+)
+EXPORT_STAGES = (
+    "export_geometry_building",
+    "save",
+)
+
+
+def _do_import_export(file: Path, track_memory: bool = False) -> dict:
+    """Imports and exports the file once. Returns the total import/export times, the time of each stage and, if
+    ``track_memory`` is set, the peak memory allocated during import/export (tracked with `tracemalloc`, which slows
+    down everything, so the timings of this run should not be used).
+    """
     import bpy
     import time
     import tempfile
+    import tracemalloc
+    from ..profiling import record_stage_times
 
     bpy.ops.wm.read_homefile()
 
-    t0 = time.perf_counter()
-    bpy.ops.sollumz.import_assets(
-        directory=str(file.parent.absolute()),
-        files=[{"name": file.name}],
-    )
-    t1 = time.perf_counter()
+    if track_memory:
+        tracemalloc.start()
+
+    with record_stage_times() as import_stages:
+        t0 = time.perf_counter()
+        bpy.ops.sollumz.import_assets(
+            directory=str(file.parent.absolute()),
+            files=[{"name": file.name}],
+        )
+        t1 = time.perf_counter()
     time_import = t1 - t0
 
+    if track_memory:
+        _, peak_memory_import = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
     is_ytyp = ".ytyp" in file.name
     while file.suffix:
         file = file.with_suffix("")
@@ -100,7 +144,7 @@ def _do_import_export(file: Path) -> tuple[float, float]:
 
         export_op = bpy.ops.sollumz.export_assets
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory() as tmpdir, record_stage_times() as export_stages:
         t0 = time.perf_counter()
         export_op(
             directory=str(tmpdir),
@@ -109,13 +153,136 @@ def _do_import_export(file: Path) -> tuple[float, float]:
 
     time_export = t1 - t0
 
-    return time_import, time_export
+    result = {
+        "import": time_import,
+        "export": time_export,
+        "import_stages": {s: import_stages.totals.get(s, 0.0) for s in IMPORT_STAGES},
+        "export_stages": {s: export_stages.totals.get(s, 0.0) for s in EXPORT_STAGES},
+    }
+
+    if track_memory:
+        _, peak_memory_export = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory"] = {"import": peak_memory_import, "export": peak_memory_export}
+
+    return result
+
+
+def _summarize(values: list[float]) -> dict[str, float]:
+    import statistics
+
+    return {
+        "avg": sum(values) / len(values),
+        "min": min(values),
+        "max": max(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+    }
+
+
+def _environment_metadata(args) -> dict:
+    import bpy
+    import os
+    import sys
+    import platform
+    import datetime
+    import numpy as np
+    from ..meta import sollumz_version
+    from ..dependencies import IS_SZIO_NATIVE_AVAILABLE
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "sollumz_version": sollumz_version(),
+        "blender_version": bpy.app.version_string,
+        "python_version": sys.version,
+        "numpy_version": np.__version__,
+        "szio_native_available": IS_SZIO_NATIVE_AVAILABLE,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+    }
+
+
+def _save_stats_json(stats: dict[Path, dict], environment: dict, output: Path):
+    import json
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    keys = _file_keys(list(stats))
+    data = {
+        "environment": environment,
+        "files": {keys[file]: stats[file] for file in sorted(stats)},
+    }
+    with output.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def _find_regressions(
+    stats: dict[Path, dict], baseline: dict, threshold_percent: float, min_delta: float
+) -> list[str]:
+    """Compares the average times of each file and stage with the baseline JSON. A stage regresses when it is slower
+    than the baseline by more than ``threshold_percent`` and by more than ``min_delta`` seconds, to ignore noise on
+    very fast stages.
+    """
+    regressions = []
+    baseline_files = baseline.get("files", {})
+    keys = _file_keys(list(stats))
+    for file in sorted(stats):
+        base = baseline_files.get(keys[file], None)
+        if base is None:
+            continue
+
+        cur = stats[file]
+        for phase in ("import", "export"):
+            timings = [("total", cur[phase]["total"], base.get(phase, {}).get("total", None))]
+            base_stages = base.get(phase, {}).get("stages", {})
+            timings.extend(
+                (stage_name, cur_stage, base_stages.get(stage_name, None))
+                for stage_name, cur_stage in cur[phase]["stages"].items()
+            )
+            for stage_name, cur_stage, base_stage in timings:
+                if base_stage is None:
+                    continue
+
+                cur_avg = cur_stage["avg"]
+                base_avg = base_stage["avg"]
+                delta = cur_avg - base_avg
+                if delta > min_delta and cur_avg > base_avg * (1.0 + threshold_percent / 100.0):
+                    percent = (delta / base_avg * 100.0) if base_avg > 0.0 else float("inf")
+                    regressions.append(
+                        f"{keys[file]} {phase}/{stage_name}: {base_avg:.6f}s -> {cur_avg:.6f}s (+{percent:.1f}%)"
+                    )
+
+    return regressions
+
+
+def _print_stage_stats(stats: dict[Path, dict]):
+    col_stage = 30
+    col = 10
+
+    keys = _file_keys(list(stats))
+    for file in sorted(stats):
+        v = stats[file]
+        print()
+        print(f"{keys[file]}")
+        print(f"  {'Stage':<{col_stage}} {'Avg':>{col}} {'Min':>{col}} {'Max':>{col}} {'σ':>{col}}")
+        for phase in ("import", "export"):
+            for stage_name, s in v[phase]["stages"].items():
+                print(
+                    f"  {phase + '/' + stage_name:<{col_stage}} "
+                    f"{s['avg']:>{col}.6f} {s['min']:>{col}.6f} {s['max']:>{col}.6f} {s['stdev']:>{col}.6f}"
+                )
+        if (mem := v.get("peak_memory", None)) is not None:
+            print(
+                f"  Peak memory: import {mem['import'] / (1024 * 1024):.2f} MiB, "
+                f"export {mem['export'] / (1024 * 1024):.2f} MiB"
+            )
 
 
 def main(argv: list[str]) -> int:
     import sys
     import os
-    import statistics
     from argparse import ArgumentParser
 
     parser = ArgumentParser(
@@ -151,39 +318,90 @@ def main(argv: list[str]) -> int:
         help="Number of warm-up iterations per file (not included in stats).",
         required=False,
     )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        help="Output JSON file with the stats of each stage and environment metadata.",
+        required=False,
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Do not measure peak memory usage. Otherwise, an extra untimed iteration per file is run with tracemalloc.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="JSON file from a previous run (see --json). Fails if any stage is slower than the baseline by more than "
+        "--threshold.",
+        required=False,
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Allowed slowdown in percent compared to the baseline before it is considered a regression.",
+        required=False,
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.001,
+        help="Minimum slowdown in seconds compared to the baseline before it is considered a regression. Avoids "
+        "false positives on very fast stages.",
+        required=False,
+    )
     args = parser.parse_args(argv)
 
     stats = {}
     for file in args.files:
-        import_times = []
-        export_times = []
+        runs = []
 
         for _ in range(args.warmup):
             _do_import_export(file)
 
         for _ in range(args.repeat):
-            timport, texport = _do_import_export(file)
-            import_times.append(timport)
-            export_times.append(texport)
+            runs.append(_do_import_export(file))
 
         stats[file] = {
-            "import_avg": sum(import_times) / len(import_times),
-            "import_min": min(import_times),
-            "import_max": max(import_times),
-            "import_stdev": statistics.stdev(import_times),
-            "export_avg": sum(export_times) / len(export_times),
-            "export_min": min(export_times),
-            "export_max": max(export_times),
-            "export_stdev": statistics.stdev(export_times),
+            phase: {
+                "total": _summarize([r[phase] for r in runs]),
+                "stages": {
+                    stage_name: _summarize([r[f"{phase}_stages"][stage_name] for r in runs])
+                    for stage_name in stages
+                },
+            }
+            for phase, stages in (("import", IMPORT_STAGES), ("export", EXPORT_STAGES))
         }
 
+        if not args.no_memory:
+            stats[file]["peak_memory"] = _do_import_export(file, track_memory=True)["peak_memory"]
+
     print()
     _print_stats(stats)
+    _print_stage_stats(stats)
 
     if args.output:
         _save_stats_csv(stats, args.output)
         print(f"\nSaved CSV to {args.output}")
 
+    if args.json:
+        _save_stats_json(stats, _environment_metadata(args), args.json)
+        print(f"\nSaved JSON to {args.json}")
+
+    if args.baseline:
+        import json
+
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = _find_regressions(stats, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) found compared to baseline '{args.baseline}':")
+            for r in regressions:
+                print(f"  {r}")
+            return 1
+
+        print(f"\nNo regressions found compared to baseline '{args.baseline}'")
+
     return 0
 
 
@@ -1,15 +1,23 @@
 import contextlib
+import os
 import shutil
+import threading
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
-from szio.gta5 import Asset, AssetFormat, AssetTarget, SaveOptions, save_asset
+from szio.gta5 import Asset, AssetFormat, AssetTarget, AssetType, AssetVersion, SaveOptions, save_asset
 from szio.types import DataSource
 
+from .profiling import traced
 from .ydr.vertex_buffer_builder_domain import VBBuilderDomain
 
+if TYPE_CHECKING:
+    from .ydr.geometry_cache import GeometryCache
+    from .ybn.collision_materials import CollisionMaterialRegistry
+
 
 class ImportTexturesMode(Enum):
     PACK = auto()
@@ -42,6 +50,81 @@ class ImportSettings:
     """How to handle imported textures."""
     textures_extract_custom_directory: Path | None = None
     """Custom directory for textures when mode is 'CUSTOM_DIR'."""
+    pipelined: bool = False
+    """Load and decode the next files on worker threads while the current one is being created in Blender."""
+    pipelined_num_workers: int = 4
+    """Number of worker threads used when `pipelined` is enabled."""
+    geometry_cache_directory: Path | None = None
+    """Directory of the on-disk cache of decoded drawable assets. If None, the cache is disabled."""
+    geometry_cache_max_size: int = 1024 * 1024 * 1024
+    """Max size in bytes of the geometry cache. Least recently used entries are removed above this size."""
+    validate_meshes: bool = False
+    """Run `Mesh.validate` on the imported drawable meshes to fix invalid geometry."""
+    defer_lod_meshes: bool = False
+    """Only build the mesh of the highest LOD level of drawable models, other LOD levels are stored as deferred data."""
+    compact_bound_primitives: bool = False
+    """Import the box, sphere, capsule and cylinder primitives of each Bound GeometryBVH as points of a single object,
+    instead of one object per primitive.
+    """
+
+
+class DirectoryIndex:
+    """Case-insensitive index of the files in a directory, to find the external dependencies of imported assets (e.g.
+    '_hi.yft' or '+hidr.ytd' files) without checking whether each candidate file exists. The directory is listed once,
+    the first time the index is used, and shared by all the assets imported at once.
+
+    Files are indexed by stem and extension, split at the first dot, e.g. 'prop+hi.ytd.xml' -> ('prop+hi', '.ytd.xml').
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._files: dict[str, dict[str, str]] | None = None
+        # Dependencies are resolved from worker threads during pipelined imports
+        self._lock = threading.Lock()
+
+    def _get_files(self) -> dict[str, dict[str, str]]:
+        with self._lock:
+            if self._files is None:
+                files = {}
+                try:
+                    with os.scandir(self.directory) as it:
+                        for entry in it:
+                            if not entry.is_file():
+                                continue
+
+                            name = entry.name
+                            i = name.find(".")
+                            if i <= 0:
+                                continue
+
+                            files.setdefault(name[:i].lower(), {})[name[i:].lower()] = name
+                except OSError:
+                    pass
+                self._files = files
+
+            return self._files
+
+    def find(self, stem: str, extensions: Sequence[str]) -> list[Path]:
+        """Finds the files named ``stem`` with any of ``extensions``, in the same order as ``extensions``."""
+        available = self._get_files().get(stem.lower(), None)
+        if available is None:
+            return []
+
+        return [
+            self.directory / name
+            for ext in extensions
+            if (name := available.get(ext.lower(), None)) is not None
+        ]
+
+    def find_any(self, extensions: Sequence[str]) -> Path | None:
+        """Finds any file with one of ``extensions``."""
+        extensions = {ext.lower() for ext in extensions}
+        for available in self._get_files().values():
+            for ext, name in available.items():
+                if ext in extensions:
+                    return self.directory / name
+
+        return None
 
 
 @dataclass(slots=True, frozen=True)
@@ -52,6 +135,24 @@ class ImportContext:
     asset_target: AssetTarget
     directory: Path
     settings: ImportSettings
+    filepath: Path | None = None
+    """File being imported. None if the asset doesn't come from a file."""
+    directory_index: DirectoryIndex | None = None
+    """Index of the files in `directory`. If None, one is created for this context."""
+    collision_materials: "CollisionMaterialRegistry | None" = None
+    """Collision materials shared by all the assets of the import operation. If None, one is created for this context."""
+
+    def __post_init__(self):
+        if self.directory_index is None:
+            object.__setattr__(self, "directory_index", DirectoryIndex(self.directory))
+        if self.collision_materials is None:
+            from .ybn.collision_materials import CollisionMaterialRegistry
+            object.__setattr__(self, "collision_materials", CollisionMaterialRegistry())
+
+    def find_files(self, stem: str, extensions: Sequence[str]) -> list[Path]:
+        """Finds the files in the import directory named ``stem`` with any of ``extensions``, in the same order as
+        ``extensions``."""
+        return self.directory_index.find(stem, extensions)
 
     @property
     def textures_extract_directory(self) -> Path | None:
@@ -71,6 +172,23 @@ class ImportContext:
         return self.directory / self.asset_name
 
 
+_ASSET_FILE_EXTENSIONS = {
+    AssetType.BOUND: ".ybn",
+    AssetType.DRAWABLE: ".ydr",
+    AssetType.DRAWABLE_DICTIONARY: ".ydd",
+    AssetType.FRAGMENT: ".yft",
+    AssetType.CLOTH_DICTIONARY: ".yld",
+    AssetType.MAP_TYPES: ".ytyp",
+    AssetType.MAP_DATA: ".ymap",
+    AssetType.TEXTURE_DICTIONARY: ".ytd",
+}
+
+
+def _asset_file_extension(asset: Asset, target: AssetTarget) -> str:
+    ext = _ASSET_FILE_EXTENSIONS[asset.ASSET_TYPE]
+    return ext + ".xml" if target.format == AssetFormat.CWXML else ext
+
+
 @dataclass(slots=True, frozen=True)
 class ExportBundle:
     """Result of an export operation.
@@ -90,8 +208,9 @@ class ExportBundle:
     secondary_extra_files: tuple[tuple[str, tuple[DataSource, ...]], ...]
     """Additional files to write to a folder with same name as the asset with a suffix."""
 
-    def save(self, directory: Path, targets: Sequence[AssetTarget]):
-        """Writes the whole bundle to disk at the specified directory."""
+    @traced("save")
+    def save(self, directory: Path, targets: Sequence[AssetTarget]) -> list[Path]:
+        """Writes the whole bundle to disk at the specified directory. Returns the paths of the asset files written."""
 
         from .meta import sollumz_version
 
@@ -100,10 +219,19 @@ class ExportBundle:
             gen9_directory=directory / "gen9",
             tool_metadata=("Sollumz", sollumz_version()),
         )
-        main_asset = self.main_asset
-        save_asset(main_asset, targets, directory, self.asset_name, options)
-        for suffix, asset in self.secondary_assets:
-            save_asset(asset, targets, directory, self.asset_name + suffix, options)
+        if len({t.version for t in targets}) > 1:
+            target_dirs = {AssetVersion.GEN8: options.gen8_directory, AssetVersion.GEN9: options.gen9_directory}
+        else:
+            target_dirs = {t.version: directory for t in targets}
+
+        named_assets = (
+            (self.asset_name, self.main_asset),
+            *((self.asset_name + suffix, asset) for suffix, asset in self.secondary_assets),
+        )
+        output_files = []
+        for name, asset in named_assets:
+            save_asset(asset, targets, directory, name, options)
+            output_files.extend(target_dirs[t.version] / (name + _asset_file_extension(asset, t)) for t in targets)
 
         # We only use extra_files for embedded textures, which are only really needed for CWXML. Initially, these
         # were always copied but users requested that this not be done for native format.
@@ -137,6 +265,8 @@ class ExportBundle:
                         with src_data.open() as src, dst_file.open("wb") as dst:
                             shutil.copyfileobj(src, dst)
 
+        return output_files
+
     def is_valid(self) -> bool:
         """Checks whether the export operation was successful."""
         return self.main_asset is not None
@@ -152,6 +282,18 @@ class ExportSettings:
     apply_transforms: bool = False
     exclude_skeleton: bool = False
     mesh_domain: VBBuilderDomain = VBBuilderDomain.FACE_CORNER
+    optimize_vertex_order: bool = False
+    """Reorder triangles and vertices of drawable geometries for GPU vertex cache and fetch locality."""
+    concurrent_save: bool = False
+    """Save finished bundles in worker threads while the next ones are being built."""
+    concurrent_save_num_workers: int = 2
+    """Number of worker threads used when `concurrent_save` is enabled."""
+    parallel_geometry_build: bool = False
+    """Build the buffers of drawable model geometries in worker threads, after reading the mesh data from Blender."""
+    parallel_geometry_build_num_workers: int = 4
+    """Number of worker threads used when `parallel_geometry_build` is enabled."""
+    incremental: bool = False
+    """Skip objects that didn't change since the last export to the same directory."""
 
 
 @dataclass(slots=True, frozen=True)
@@ -160,6 +302,8 @@ class ExportContext:
 
     asset_name: str
     settings: ExportSettings
+    geometry_cache: "GeometryCache | None" = None
+    """Geometries of drawable models shared within the asset being exported. If None, not cached."""
 
     def make_bundle(
         self,
@@ -194,30 +338,32 @@ class ExportContext:
         )
 
 
-g_import_context: ImportContext | None = None
+# Import context is per-thread so dependencies can be loaded by worker threads in pipelined imports while the main
+# thread creates the previous asset in Blender.
+g_import_context_local = threading.local()
 g_export_context: ExportContext | None = None
 
 
 def import_context() -> ImportContext:
     """Gets the current import context. Raises an error if not in import context."""
-    if g_import_context is None:
+    ctx = getattr(g_import_context_local, "ctx", None)
+    if ctx is None:
         raise RuntimeError(
             "No import context! Make sure to use `import_context_scope` before calling import functions."
         )
-    return g_import_context
+    return ctx
 
 
 @contextlib.contextmanager
 def import_context_scope(ctx: ImportContext):
-    """Starts an import context. Returns a context manager."""
-    global g_import_context
-    if g_import_context is not None:
+    """Starts an import context in the current thread. Returns a context manager."""
+    if getattr(g_import_context_local, "ctx", None) is not None:
         raise RuntimeError("Already in import context!")
-    g_import_context = ctx
+    g_import_context_local.ctx = ctx
     try:
         yield
     finally:
-        g_import_context = None
+        g_import_context_local.ctx = None
 
 
 def export_context() -> ExportContext:
@@ -34,7 +34,10 @@ class LODLevelProps(PropertyGroup):
         """Called when the LOD level switches to this level."""
         obj: Object = self.id_data
 
-        if self.has_mesh:
+        if self.has_deferred_mesh:
+            # Build the mesh now, setting it also updates the object current mesh
+            self.load_deferred_mesh()
+        elif self.has_mesh:
             # Update the object current mesh to this LOD mesh
             obj.data = self.mesh_ref
             self.mesh_ref = None  # keep a single ref to the mesh, in Object.data
@@ -71,6 +74,23 @@ class LODLevelProps(PropertyGroup):
     # object.data is actually our mesh or not.
     has_mesh: BoolProperty(default=False)  # DO NOT MODIFY DIRECTLY OUTSIDE THIS CLASS, use .mesh or .mesh_name
 
+    # Whether this LOD geometry is stored as deferred data in the object instead of a mesh, see `ydr.deferred_lods`.
+    # The mesh is built when switching to this LOD level or by calling `load_deferred_mesh`.
+    has_deferred_mesh: BoolProperty(default=False)
+
+    @property
+    def has_geometry(self) -> bool:
+        """Whether this LOD level has a mesh or deferred geometry."""
+        return self.has_mesh or self.has_deferred_mesh
+
+    def load_deferred_mesh(self) -> Optional[Mesh]:
+        """Builds the mesh of this LOD level if its geometry is deferred. Returns the LOD mesh."""
+        if self.has_deferred_mesh:
+            from .ydr.deferred_lods import load_deferred_lod
+            load_deferred_lod(self.id_data, self.level)
+
+        return self.mesh
+
     @property
     def mesh(self) -> Optional[Mesh]:
         """Gets the mesh of this LOD level, or ``None`` if there is no mesh."""
@@ -89,6 +109,10 @@ class LODLevelProps(PropertyGroup):
         """Sets the mesh of this LOD level. Set to ``None`` to remove the mesh."""
         obj: Object = self.id_data
         lods: LODLevels = obj.sz_lods
+        if self.has_deferred_mesh:
+            from .ydr.deferred_lods import remove_deferred_lod
+            remove_deferred_lod(obj, self.level)
+
         self.has_mesh = value is not None
         if lods.active_lod_level == self.level:
             self.mesh_ref = None
@@ -161,7 +185,7 @@ class LODLevels(PropertyGroup):
     def set_highest_lod_active(self):
         for lod_level in LODLevel:
             lod = self.get_lod(lod_level)
-            if lod.mesh is not None:
+            if lod.has_geometry:
                 self.active_lod_level = lod_level
                 return
 
@@ -307,7 +331,7 @@ class SOLLUMZ_OT_copy_lod(bpy.types.Operator):
             if lod is None:
                 return {"CANCELLED"}
 
-            if lod.mesh is not None:
+            if lod.has_geometry:
                 self.report({"INFO"}, f"{SOLLUMZ_UI_NAMES[lod_level]} already has a mesh!")
                 return {"CANCELLED"}
 
@@ -346,7 +370,10 @@ class SOLLUMZ_PT_LOD_LEVEL_PANEL(bpy.types.Panel):
             lod = lods.get_lod(lod_level)
             lod_split = col.split(align=True, factor=0.3)
             lod_split.prop_enum(lods, "active_lod_level", lod_level)
-            lod_split.prop_search(lod, "mesh_name", bpy.data, "meshes", text="")
+            if lod.has_deferred_mesh:
+                lod_split.label(text="Not loaded", icon="MESH_DATA")
+            else:
+                lod_split.prop_search(lod, "mesh_name", bpy.data, "meshes", text="")
 
         row.operator(SOLLUMZ_OT_copy_lod.bl_idname, icon="COPYDOWN", text="")
 
@@ -8,6 +8,7 @@ from typing import Sequence, Iterator
 from collections import defaultdict
 from contextlib import contextmanager, AbstractContextManager
 import logging
+import threading
 
 
 class LoggerBase(ABC):
@@ -55,9 +56,15 @@ class MultiLogger(LoggerBase):
 
 
 _root_logger: MultiLogger = MultiLogger([ConsoleLogger()])
+_thread_state = threading.local()
 
 
 def _log(msg: str, level: str):
+    captured = getattr(_thread_state, "captured", None)
+    if captured is not None:
+        captured.append((msg, level))
+        return
+
     _root_logger.do_log(msg, level)
 
 
@@ -74,6 +81,25 @@ def use_operator_logger(operator: Operator) -> AbstractContextManager[OperatorLo
     return use_logger(OperatorLogger(operator))
 
 
+@contextmanager
+def capture_logs() -> Iterator[list[tuple[str, str]]]:
+    """Collects the messages logged from the current thread instead of dispatching them. Used by worker threads, which
+    cannot report to operators directly, so the main thread can output them later with `replay_logs`.
+    """
+    prev_captured = getattr(_thread_state, "captured", None)
+    captured = []
+    _thread_state.captured = captured
+    try:
+        yield captured
+    finally:
+        _thread_state.captured = prev_captured
+
+
+def replay_logs(records: Sequence[tuple[str, str]]):
+    for msg, level in records:
+        _log(msg, level)
+
+
 def info(msg: str):
     _log(msg, "INFO")
 
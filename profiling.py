@@ -0,0 +1,236 @@
+"""
+Lightweight instrumentation to measure how long import/export code takes.
+
+Code is instrumented with nested spans, using the `span` context manager or the `traced` decorator. Spans are only
+measured while a recorder is active:
+ - `record_stage_times` accumulates the total time of each span name, e.g. for the stage breakdown of `sz_perf_ie`.
+ - `record_trace` keeps every span and can save them as a Chrome trace event JSON file (viewable in
+   `chrome://tracing` or https://ui.perfetto.dev). `trace_operator` does it automatically for each operator run when
+   tracing is enabled in the preferences or with the `SOLLUMZ_TRACE` environment variable.
+
+Otherwise, `span` returns a shared no-op context manager, so instrumented code pays almost nothing for it.
+"""
+
+import inspect
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, AbstractContextManager
+from functools import wraps
+from pathlib import Path
+from typing import TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+TRACE_ENV_VAR = "SOLLUMZ_TRACE"
+"""Environment variable to enable tracing. Set it to the directory where trace files will be written, or to '1' to use
+the default directory."""
+
+
+class SpanRecorder:
+    def add_span(self, name: str, start: float, end: float, args: dict | None):
+        """Called when a span ends. ``start`` and ``end`` are `time.perf_counter` values."""
+        ...
+
+
+class StageTimes(SpanRecorder):
+    """Accumulates the total time and number of calls of each span name."""
+
+    def __init__(self):
+        self.totals: dict[str, float] = defaultdict(float)
+        self.counts: dict[str, int] = defaultdict(int)
+
+    def add_span(self, name: str, start: float, end: float, args: dict | None):
+        self.totals[name] += end - start
+        self.counts[name] += 1
+
+
+class Trace(SpanRecorder):
+    """Keeps every span to save them as a Chrome trace event file."""
+
+    def __init__(self):
+        self.events: list[dict] = []
+        self.thread_names: dict[int, str] = {}
+        self._origin = time.perf_counter()
+
+    def add_span(self, name: str, start: float, end: float, args: dict | None):
+        thread = threading.current_thread()
+        self.thread_names.setdefault(thread.ident, thread.name)
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start - self._origin) * 1_000_000,
+            "dur": (end - start) * 1_000_000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {k: str(v) for k, v in args.items()}
+        self.events.append(event)
+
+    def to_json(self) -> dict:
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def save(self, filepath: Path):
+        import json
+
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with filepath.open("w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, separators=(",", ":"))
+
+
+_recorders: list[SpanRecorder] = []
+# Spans may end in worker threads (pipelined import, background saves)
+_recorders_lock = threading.Lock()
+
+
+class _Span:
+    __slots__ = ("name", "args", "_start")
+
+    def __init__(self, name: str, args: dict | None):
+        self.name = name
+        self.args = args
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter()
+        with _recorders_lock:
+            for recorder in _recorders:
+                recorder.add_span(self.name, self._start, end, self.args)
+
+
+class _NoOpSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+def span(name: str, **args) -> AbstractContextManager:
+    """Measures the time spent in the ``with`` block. ``args`` are included in traces, e.g. the name of the object
+    being exported."""
+    if not _recorders:
+        return _NO_OP_SPAN
+
+    return _Span(name, args)
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """Decorator version of `span`. Measures the time spent in the decorated function. By default, the span is named
+    after the function.
+
+    Generator functions get a span for each item they produce, so the time the caller spends between items is not
+    included.
+    """
+
+    def _decorator(fn: F) -> F:
+        span_name = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+        if inspect.isgeneratorfunction(fn):
+            @wraps(fn)
+            def _gen_wrapper(*args, **kwargs):
+                gen = fn(*args, **kwargs)
+                try:
+                    while True:
+                        with span(span_name):
+                            try:
+                                item = next(gen)
+                            except StopIteration as e:
+                                return e.value
+                        yield item
+                finally:
+                    gen.close()
+
+            return _gen_wrapper
+
+        @wraps(fn)
+        def _wrapper(*args, **kwargs):
+            if not _recorders:
+                return fn(*args, **kwargs)
+
+            with _Span(span_name, None):
+                return fn(*args, **kwargs)
+
+        return _wrapper
+
+    return _decorator
+
+
+@contextmanager
+def _use_recorder(recorder: SpanRecorder):
+    with _recorders_lock:
+        _recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        with _recorders_lock:
+            _recorders.remove(recorder)
+
+
+def record_stage_times() -> AbstractContextManager[StageTimes]:
+    """Records the total time of all spans run while in this context."""
+    return _use_recorder(StageTimes())
+
+
+def record_trace() -> AbstractContextManager[Trace]:
+    """Records all spans run while in this context."""
+    return _use_recorder(Trace())
+
+
+def trace_directory() -> Path | None:
+    """Directory where operator traces are written to, or None if tracing is disabled."""
+    env_value = os.environ.get(TRACE_ENV_VAR, "")
+    if env_value and env_value not in {"0", "1"}:
+        return Path(env_value)
+
+    from .sollumz_preferences import get_addon_preferences
+
+    prefs = get_addon_preferences()
+    if env_value != "1" and not prefs.trace_operators:
+        return None
+
+    if prefs.trace_directory:
+        import bpy
+        return Path(bpy.path.abspath(prefs.trace_directory))
+
+    from .known_paths import data_directory_path
+    return Path(data_directory_path()) / "traces"
+
+
+@contextmanager
+def trace_operator(operator_id: str) -> Iterator[None]:
+    """Records a trace of the operator run and saves it to `trace_directory`, if tracing is enabled."""
+    directory = trace_directory()
+    if directory is None:
+        yield
+        return
+
+    with record_trace() as trace, span(operator_id):
+        yield
+
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    filepath = directory / f"{operator_id.replace('.', '_')}_{timestamp}.json"
+    from . import logger
+    try:
+        trace.save(filepath)
+    except OSError as e:
+        logger.warning(f"Failed to save trace file '{filepath}': {e}")
+    else:
+        logger.info(f"Trace saved to '{filepath}'")
@@ -0,0 +1,203 @@
+"""On-disk cache of the assets decoded from imported files, so importing the same files again doesn't decode them.
+
+Entries are keyed by the source file path, size and modification time, so a cache hit only needs to stat the file. Each
+entry is a directory with a ``meta.json`` file, the pickled asset and its large arrays (e.g. vertex and index buffers)
+stored out-of-band in a single file, which is memory-mapped when loaded. The least recently used entries are removed
+when the cache grows above its maximum size.
+"""
+import copyreg
+import hashlib
+import io
+import json
+import os
+import pickle
+import shutil
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+from mathutils import Color, Euler, Matrix, Quaternion, Vector
+from szio.gta5 import Asset, AssetTarget, AssetType
+
+from ..iecontext import ImportSettings
+from .. import logger
+
+CACHE_FORMAT_VERSION = 2
+META_FILE_NAME = "meta.json"
+ASSET_FILE_NAME = "asset.pickle"
+BUFFERS_FILE_NAME = "buffers.bin"
+TMP_ENTRY_PREFIX = "tmp-"
+
+# Only assets with drawable geometry are worth caching, decoding them is the slow part of an import
+CACHED_ASSET_TYPES = {AssetType.DRAWABLE, AssetType.DRAWABLE_DICTIONARY, AssetType.FRAGMENT}
+
+# Alignment of the out-of-band buffers in the buffers file
+_BUFFER_ALIGNMENT = 64
+
+# mathutils types don't support pickling, store them as tuples
+_DISPATCH_TABLE = copyreg.dispatch_table | {
+    Vector: lambda v: (Vector, (tuple(v),)),
+    Quaternion: lambda q: (Quaternion, (tuple(q),)),
+    Euler: lambda e: (Euler, (tuple(e), e.order)),
+    Color: lambda c: (Color, (tuple(c),)),
+    Matrix: lambda m: (Matrix, (tuple(tuple(row) for row in m),)),
+}
+
+LoadResult = tuple[Asset, AssetTarget]
+
+
+def try_load_asset_cached(
+    filepath: Path,
+    settings: ImportSettings,
+    load: Callable[[], LoadResult | None],
+) -> LoadResult | None:
+    """Gets the asset decoded from ``filepath`` from the cache, if enabled in the import settings. Otherwise, decodes it
+    with ``load`` and stores it in the cache. `evict_cache_entries` should be called once the import is done.
+    """
+    cache_directory = settings.geometry_cache_directory
+    if cache_directory is None:
+        return load()
+
+    key = _cache_key(filepath)
+    if key is None:
+        return load()
+
+    if (load_result := _load_entry(cache_directory / key)) is not None:
+        return load_result
+
+    load_result = load()
+    if load_result is None or load_result[0].ASSET_TYPE not in CACHED_ASSET_TYPES:
+        return load_result
+
+    if _cache_key(filepath) != key:
+        # The file changed while it was being decoded
+        return load_result
+
+    try:
+        _save_entry(cache_directory, key, load_result)
+    except (OSError, pickle.PicklingError, TypeError) as e:
+        logger.warning(f"Failed to write geometry cache at '{cache_directory}': {e}")
+
+    return load_result
+
+
+def _cache_key(filepath: Path) -> str | None:
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+
+    key = (CACHE_FORMAT_VERSION, str(filepath.absolute()), stat.st_size, stat.st_mtime_ns)
+    return hashlib.sha1(json.dumps(key).encode()).hexdigest()
+
+
+def _load_entry(entry_directory: Path) -> LoadResult | None:
+    meta_file = entry_directory / META_FILE_NAME
+    if not meta_file.is_file():
+        return None
+
+    try:
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        if meta["version"] != CACHE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache version {meta['version']}")
+
+        buffers_file = entry_directory / BUFFERS_FILE_NAME
+        buffer_ranges = meta["buffers"]
+        if buffers_file.stat().st_size > 0:
+            # Copy-on-write mapping, the arrays can be modified in memory without touching the cache
+            buffers_map = np.memmap(buffers_file, dtype=np.uint8, mode="c")
+            buffers = [buffers_map[offset:offset + size] for offset, size in buffer_ranges]
+        else:
+            buffers = [bytearray() for _ in buffer_ranges]
+
+        asset, asset_target = pickle.loads((entry_directory / ASSET_FILE_NAME).read_bytes(), buffers=buffers)
+    except (OSError, ValueError, KeyError, TypeError, EOFError, pickle.UnpicklingError) as e:
+        logger.warning(f"Discarding invalid geometry cache entry '{entry_directory}': {e}")
+        shutil.rmtree(entry_directory, ignore_errors=True)
+        return None
+
+    # Mark as recently used
+    try:
+        os.utime(meta_file)
+    except OSError:
+        pass
+
+    return asset, asset_target
+
+
+def _save_entry(cache_directory: Path, key: str, load_result: LoadResult):
+    buffers: list[pickle.PickleBuffer] = []
+    data = io.BytesIO()
+    pickler = pickle.Pickler(data, protocol=5, buffer_callback=buffers.append)
+    pickler.dispatch_table = _DISPATCH_TABLE
+    pickler.dump(load_result)
+
+    cache_directory.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary directory first, so other Blender instances never see a partially written entry
+    tmp_directory = cache_directory / f"{TMP_ENTRY_PREFIX}{uuid.uuid4().hex}"
+    tmp_directory.mkdir()
+    try:
+        buffer_ranges = []
+        with open(tmp_directory / BUFFERS_FILE_NAME, "wb") as f:
+            for buffer in buffers:
+                offset = (f.tell() + _BUFFER_ALIGNMENT - 1) // _BUFFER_ALIGNMENT * _BUFFER_ALIGNMENT
+                f.seek(offset)
+                raw = buffer.raw()
+                f.write(raw)
+                buffer_ranges.append((offset, raw.nbytes))
+
+        (tmp_directory / ASSET_FILE_NAME).write_bytes(data.getbuffer())
+
+        meta = {"version": CACHE_FORMAT_VERSION, "buffers": buffer_ranges}
+        (tmp_directory / META_FILE_NAME).write_text(json.dumps(meta), encoding="utf-8")
+
+        try:
+            tmp_directory.rename(cache_directory / key)
+        except OSError:
+            # Another instance stored the same entry in the meantime
+            pass
+    finally:
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+
+
+def _cache_entries(cache_directory: Path) -> list[tuple[Path, int, float]]:
+    """Gets the cache entries as a list of (directory, total size in bytes, last use time) tuples."""
+    entries = []
+    if not cache_directory.is_dir():
+        return entries
+
+    with os.scandir(cache_directory) as it:
+        for entry in it:
+            if not entry.is_dir() or entry.name.startswith(TMP_ENTRY_PREFIX):
+                continue
+
+            entry_directory = Path(entry.path)
+            try:
+                size = sum(f.stat().st_size for f in entry_directory.iterdir())
+                last_use = (entry_directory / META_FILE_NAME).stat().st_mtime
+            except OSError:
+                continue
+
+            entries.append((entry_directory, size, last_use))
+
+    return entries
+
+
+def evict_cache_entries(cache_directory: Path, max_size: int):
+    """Removes the least recently used entries until the cache is at most ``max_size`` bytes."""
+    entries = _cache_entries(cache_directory)
+    total_size = sum(size for _, size, _ in entries)
+    if total_size <= max_size:
+        return
+
+    entries.sort(key=lambda e: e[2])
+    for entry_directory, size, _ in entries:
+        if total_size <= max_size:
+            break
+
+        # May fail on Windows if the entry is memory-mapped right now, it will be removed in a later eviction
+        shutil.rmtree(entry_directory, ignore_errors=True)
+        if not entry_directory.exists():
+            total_size -= size
@@ -0,0 +1,318 @@
+"""Incremental export support. A manifest in the output directory stores a fingerprint of each exported object, so
+unchanged objects can be skipped on the next export.
+
+The fingerprint covers everything that affects the exported files: the object hierarchy, transforms, mesh data,
+custom properties, modifiers, armatures, materials and their shader node parameters, referenced images, Sollumz
+properties and the export settings.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import bpy
+import numpy as np
+from bpy.types import ID, Object, Mesh, Material, Image, bpy_struct
+
+MANIFEST_FILE_NAME = ".sollumz_export_manifest.json"
+MANIFEST_VERSION = 1
+
+# Limit for recursion into nested property groups, we only need to go deep enough to reach all Sollumz properties
+_MAX_RNA_DEPTH = 8
+
+
+class ExportManifest:
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.entries: dict[str, dict] = {}
+        self._dirty = False
+
+    @staticmethod
+    def load(directory: Path) -> "ExportManifest":
+        manifest = ExportManifest(directory)
+        try:
+            data = json.loads((directory / MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                manifest.entries = data["entries"]
+        except (OSError, ValueError, KeyError):
+            # Missing or corrupted manifest, everything will be exported again
+            pass
+        return manifest
+
+    def is_up_to_date(self, asset_name: str, fingerprint: str) -> bool:
+        """Whether the asset was exported with the same fingerprint and its output files were not modified since."""
+        entry = self.entries.get(asset_name, None)
+        if entry is None or entry["fingerprint"] != fingerprint or not entry["files"]:
+            return False
+
+        for rel_path, (size, mtime_ns) in entry["files"].items():
+            try:
+                stat = (self.directory / rel_path).stat()
+            except OSError:
+                return False
+
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return False
+
+        return True
+
+    def update(self, asset_name: str, fingerprint: str, files: list[Path]):
+        file_stats = {}
+        for f in files:
+            try:
+                stat = f.stat()
+            except OSError:
+                continue
+            file_stats[f.relative_to(self.directory).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+
+        self.entries[asset_name] = {"fingerprint": fingerprint, "files": file_stats}
+        self._dirty = True
+
+    def remove(self, asset_name: str):
+        if self.entries.pop(asset_name, None) is not None:
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+
+        manifest_file = self.directory / MANIFEST_FILE_NAME
+        tmp_file = manifest_file.with_suffix(".tmp")
+        tmp_file.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "entries": self.entries}, indent=1),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, manifest_file)
+        self._dirty = False
+
+
+def compute_export_fingerprint(obj: Object, export_settings) -> str:
+    """Computes a hash of everything that affects the export of ``obj``."""
+    from ..meta import sollumz_version
+
+    h = hashlib.sha1()
+    _hash_value(h, sollumz_version())
+    # Ignore settings that only change how the export runs, not the output
+    _hash_value(h, repr(dataclasses.replace(
+        export_settings,
+        concurrent_save=False,
+        concurrent_save_num_workers=0,
+        parallel_geometry_build=False,
+        parallel_geometry_build_num_workers=0,
+        incremental=False,
+    )))
+
+    visited_ids = set()
+    for o in (obj, *obj.children_recursive):
+        _hash_object(h, o, visited_ids)
+
+    return h.hexdigest()
+
+
+def _hash_value(h, value):
+    h.update(repr(value).encode())
+    h.update(b"\0")
+
+
+def _hash_array(h, collection, attr: str, dtype, size: int):
+    arr = np.empty(size, dtype=dtype)
+    collection.foreach_get(attr, arr)
+    h.update(arr.tobytes())
+
+
+def _hash_object(h, obj: Object, visited_ids: set):
+    _hash_value(h, (obj.name, obj.type, obj.parent.name if obj.parent else None, obj.parent_type, obj.parent_bone))
+    _hash_value(h, tuple(tuple(row) for row in obj.matrix_world))
+    _hash_value(h, (obj.hide_render, tuple(obj.lock_scale)))
+    _hash_rna(h, obj, runtime_only=True)
+    # Includes the geometry of deferred LODs
+    _hash_id_properties(h, obj)
+
+    for mod in obj.modifiers:
+        _hash_rna(h, mod, runtime_only=False)
+        # Geometry nodes inputs are stored as ID properties
+        _hash_id_properties(h, mod)
+    for con in obj.constraints:
+        _hash_rna(h, con, runtime_only=False)
+    for vg in obj.vertex_groups:
+        _hash_value(h, vg.name)
+
+    if obj.pose is not None:
+        for pose_bone in obj.pose.bones:
+            _hash_value(h, pose_bone.name)
+            _hash_rna(h, pose_bone, runtime_only=True)
+            for con in pose_bone.constraints:
+                _hash_rna(h, con, runtime_only=False)
+
+    for slot in obj.material_slots:
+        _hash_value(h, slot.link)
+        _hash_id(h, slot.material, visited_ids)
+
+    _hash_id(h, obj.data, visited_ids)
+
+
+def _hash_id(h, id_data: ID | None, visited_ids: set):
+    if id_data is None:
+        _hash_value(h, None)
+        return
+
+    _hash_value(h, (type(id_data).__name__, id_data.name, id_data.library.filepath if id_data.library else None))
+    key = (type(id_data).__name__, id_data.name_full)
+    if key in visited_ids:
+        # Already hashed, e.g. a material used by several objects
+        return
+    visited_ids.add(key)
+
+    match id_data:
+        case Mesh():
+            _hash_mesh(h, id_data)
+            for mat in id_data.materials:
+                _hash_id(h, mat, visited_ids)
+        case Material():
+            _hash_material(h, id_data, visited_ids)
+        case Image():
+            _hash_image(h, id_data)
+        case bpy.types.Armature():
+            for bone in id_data.bones:
+                _hash_value(h, (bone.name, bone.parent.name if bone.parent else None))
+                _hash_value(h, tuple(tuple(row) for row in bone.matrix_local))
+                _hash_value(h, (tuple(bone.head_local), tuple(bone.tail_local)))
+                _hash_rna(h, bone, runtime_only=True)
+        case _:
+            # Lights, curves, etc.
+            _hash_rna(h, id_data, runtime_only=False)
+
+
+def _hash_mesh(h, mesh: Mesh):
+    num_verts = len(mesh.vertices)
+    num_loops = len(mesh.loops)
+    num_polys = len(mesh.polygons)
+    _hash_value(h, (num_verts, num_loops, num_polys))
+    _hash_array(h, mesh.vertices, "co", np.float32, num_verts * 3)
+    _hash_array(h, mesh.loops, "vertex_index", np.int32, num_loops)
+    _hash_array(h, mesh.polygons, "loop_total", np.int32, num_polys)
+    _hash_array(h, mesh.polygons, "material_index", np.int32, num_polys)
+
+    # Includes UVs, colors and any other data Sollumz stores as attributes
+    for attr in mesh.attributes:
+        if attr.name.startswith("."):
+            # Internal attributes, e.g. selection state
+            continue
+
+        _hash_value(h, (attr.name, attr.domain, attr.data_type))
+        match attr.data_type:
+            case "FLOAT_VECTOR":
+                _hash_array(h, attr.data, "vector", np.float32, len(attr.data) * 3)
+            case "FLOAT2":
+                _hash_array(h, attr.data, "vector", np.float32, len(attr.data) * 2)
+            case "FLOAT_COLOR" | "BYTE_COLOR":
+                _hash_array(h, attr.data, "color", np.float32, len(attr.data) * 4)
+            case "FLOAT":
+                _hash_array(h, attr.data, "value", np.float32, len(attr.data))
+            case "INT" | "INT8":
+                _hash_array(h, attr.data, "value", np.int32, len(attr.data))
+            case "BOOLEAN":
+                _hash_array(h, attr.data, "value", bool, len(attr.data))
+            case _:
+                _hash_value(h, [tuple(d.value) if hasattr(d.value, "__len__") else d.value for d in attr.data])
+
+    if mesh.has_custom_normals:
+        if bpy.app.version >= (4, 1, 0):
+            _hash_array(h, mesh.corner_normals, "vector", np.float32, num_loops * 3)
+        else:
+            mesh.calc_normals_split()
+            _hash_array(h, mesh.loops, "normal", np.float32, num_loops * 3)
+
+    if mesh.shape_keys is not None:
+        for key_block in mesh.shape_keys.key_blocks:
+            _hash_value(h, (key_block.name, key_block.value))
+            _hash_array(h, key_block.data, "co", np.float32, num_verts * 3)
+
+
+def _hash_material(h, mat: Material, visited_ids: set):
+    _hash_rna(h, mat, runtime_only=True)
+    if mat.node_tree is None:
+        return
+
+    for node in mat.node_tree.nodes:
+        _hash_value(h, (node.bl_idname, node.name))
+        _hash_rna(h, node, runtime_only=True)
+        for socket in node.inputs:
+            if hasattr(socket, "default_value"):
+                value = socket.default_value
+                _hash_value(h, tuple(value) if hasattr(value, "__len__") and not isinstance(value, str) else value)
+        if (image := getattr(node, "image", None)) is not None:
+            _hash_id(h, image, visited_ids)
+
+
+def _hash_image(h, img: Image):
+    _hash_value(h, (img.filepath, img.source, tuple(img.size), img.colorspace_settings.name, img.alpha_mode))
+    _hash_rna(h, img, runtime_only=True)
+    if img.packed_file is not None:
+        _hash_value(h, img.packed_file.size)
+        h.update(img.packed_file.data)
+    else:
+        try:
+            stat = Path(bpy.path.abspath(img.filepath, library=img.library)).stat()
+            _hash_value(h, (stat.st_size, stat.st_mtime_ns))
+        except (OSError, ValueError):
+            _hash_value(h, None)
+
+
+def _hash_rna(h, struct: bpy_struct, runtime_only: bool, depth: int = 0):
+    """Hashes the properties of ``struct``. With ``runtime_only``, only properties registered by add-ons (e.g. Sollumz
+    properties) are included.
+    """
+    if depth > _MAX_RNA_DEPTH:
+        return
+
+    for prop in struct.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier == "rna_type" or (runtime_only and not prop.is_runtime):
+            continue
+
+        match prop.type:
+            case "POINTER":
+                value = getattr(struct, identifier, None)
+                if value is None:
+                    _hash_value(h, (identifier, None))
+                elif isinstance(value, ID):
+                    _hash_value(h, (identifier, value.name))
+                elif prop.is_runtime:
+                    # Property group, everything in it is registered by add-ons
+                    _hash_rna(h, value, runtime_only=False, depth=depth + 1)
+            case "COLLECTION":
+                if not prop.is_runtime:
+                    continue
+                items = getattr(struct, identifier)
+                _hash_value(h, (identifier, len(items)))
+                for item in items:
+                    _hash_rna(h, item, runtime_only=False, depth=depth + 1)
+            case _:
+                value = getattr(struct, identifier, None)
+                if isinstance(value, set):
+                    # Enum flags, sets don't have a stable order between sessions
+                    value = tuple(sorted(value))
+                elif hasattr(value, "__len__") and not isinstance(value, str):
+                    value = tuple(value)
+                _hash_value(h, (identifier, value))
+
+
+def _hash_id_properties(h, struct):
+    for key, value in struct.items():
+        if isinstance(value, ID):
+            value = value.name
+        elif hasattr(value, "typecode"):
+            # Arrays can be large (e.g. deferred LOD geometry), hash the raw data
+            _hash_value(h, (key, value.typecode, len(value)))
+            h.update(np.asarray(value).tobytes())
+            continue
+        elif hasattr(value, "to_dict"):
+            _hash_value(h, key)
+            _hash_id_properties(h, value)
+            continue
+        elif hasattr(value, "to_list"):
+            value = value.to_list()
+        _hash_value(h, (key, value))
@@ -1,10 +1,12 @@
 """
 Various functions related to geometry math.
 """
+import hashlib
 import numpy as np
 from numpy.typing import NDArray
 from mathutils import Vector
 from typing import NamedTuple
+from collections import OrderedDict
 from collections.abc import Sequence, Iterator
 from enum import Enum
 from dataclasses import dataclass
@@ -20,6 +22,88 @@ class MassProperties(NamedTuple):
     inertia: Vector
 
 
+class MassShape(Enum):
+    """Shape codes of `get_mass_properties_of_primitives`."""
+    BOX = 0
+    SPHERE = 1
+    CAPSULE = 2
+    CYLINDER = 3
+    DISC = 4
+
+
+def get_mass_properties_of_primitives(
+    shapes: NDArray[np.int32],
+    dimensions: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Calculates the volumes and the inertias per unit mass of multiple primitives placed at origin, so their center of
+    gravity is always zero.
+
+    ``shapes`` contains the `MassShape` value of each primitive and ``dimensions`` is a (N, 3) array with the box size,
+    or the radius in X and the length in Y for the other shapes.
+
+    Returns a tuple with the volumes (N,) and inertias (N, 3) arrays.
+    """
+    shapes = np.asarray(shapes)
+    dimensions = np.asarray(dimensions, dtype=np.float64).reshape((-1, 3))
+    num = len(shapes)
+    volumes = np.zeros(num, dtype=np.float64)
+    inertias = np.zeros((num, 3), dtype=np.float64)
+
+    # Box
+    m = shapes == MassShape.BOX.value
+    x, y, z = dimensions[m].T
+    x2, y2, z2 = x * x, y * y, z * z
+    volumes[m] = x * y * z
+    # moment of inertia of a solid rectangular cuboid
+    # https://en.wikipedia.org/wiki/List_of_moments_of_inertia#List_of_3D_inertia_tensors
+    inertias[m] = np.column_stack(((y2 + z2) / 12, (z2 + x2) / 12, (x2 + y2) / 12))
+
+    # Sphere
+    m = shapes == MassShape.SPHERE.value
+    radius = dimensions[m, 0]
+    radius2 = radius * radius
+    volumes[m] = (4 / 3) * np.pi * radius2 * radius
+    # https://scienceworld.wolfram.com/physics/MomentofInertiaSphere.html
+    inertias[m] = (2 * radius2 / 5)[:, np.newaxis]
+
+    # Cylinder, disc mass properties are the same as a cylinder
+    m = (shapes == MassShape.CYLINDER.value) | (shapes == MassShape.DISC.value)
+    radius = dimensions[m, 0]
+    length = dimensions[m, 1]
+    radius2 = radius * radius
+    volumes[m] = np.pi * radius2 * length
+    # https://scienceworld.wolfram.com/physics/MomentofInertiaCylinder.html
+    ixx = length * length / 12 + radius2 / 4
+    inertias[m] = np.column_stack((ixx, radius2 / 2, ixx))
+
+    # Capsule
+    m = shapes == MassShape.CAPSULE.value
+    radius = dimensions[m, 0]
+    length = dimensions[m, 1]
+    radius2 = radius * radius
+    radius3 = radius2 * radius
+    length2 = length * length
+    length3 = length2 * length
+    # volume capsule = volume cylinder + sphere
+    volumes[m] = np.pi * radius2 * length + (4 / 3) * np.pi * radius3
+    # https://www.wolframalpha.com/input?i=moment+of+inertia+of+a+capsule
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ixx = (5 * length3 + 20 * length2 * radius + 45 * length * radius2 + 32 * radius3) / (60 * length + 80 * radius)
+        iyy = (radius2 * (15 * length + 16 * radius)) / (30 * length + 40 * radius)
+    inertias[m] = np.nan_to_num(np.column_stack((ixx, iyy, ixx)))
+
+    return volumes, inertias
+
+
+def _get_mass_properties_of_primitive(shape: MassShape, dimensions: Sequence[float]) -> MassProperties:
+    volumes, inertias = get_mass_properties_of_primitives(np.array([shape.value]), np.array([dimensions]))
+
+    # Assume a primitive placed at origin
+    cg = Vector((0.0, 0.0, 0.0))
+
+    return MassProperties(float(volumes[0]), cg, Vector(inertias[0]))
+
+
 def get_centroid_of_cylinder(radius: float, length: float) -> Centroid:
     half_length = length * 0.5
 
@@ -36,21 +120,7 @@ def get_centroid_of_cylinder(radius: float, length: float) -> Centroid:
 
 
 def get_mass_properties_of_cylinder(radius: float, length: float) -> MassProperties:
-    radius2 = radius * radius
-    length2 = length * length
-
-    # Assume a cylinder placed at origin
-    cg = Vector((0.0, 0.0, 0.0))
-
-    volume = np.pi * radius2 * length
-
-    # https://scienceworld.wolfram.com/physics/MomentofInertiaCylinder.html
-    ixx = length2 / 12 + radius2 / 4
-    iyy = radius2 / 2
-    izz = ixx
-    inertia = Vector((ixx, iyy, izz))
-
-    return MassProperties(volume, cg, inertia)
+    return _get_mass_properties_of_primitive(MassShape.CYLINDER, (radius, length, 0.0))
 
 
 def get_centroid_of_disc(radius: float) -> Centroid:
@@ -64,8 +134,7 @@ def get_centroid_of_disc(radius: float) -> Centroid:
 
 
 def get_mass_properties_of_disc(radius: float, length: float) -> MassProperties:
-    # Disc mass properties are the same as a cylinder
-    return get_mass_properties_of_cylinder(radius, length)
+    return _get_mass_properties_of_primitive(MassShape.DISC, (radius, length, 0.0))
 
 
 def get_centroid_of_capsule(radius: float, length: float) -> Centroid:
@@ -79,26 +148,7 @@ def get_centroid_of_capsule(radius: float, length: float) -> Centroid:
 
 
 def get_mass_properties_of_capsule(radius: float, length: float) -> MassProperties:
-    radius2 = radius * radius
-    radius3 = radius2 * radius
-    length2 = length * length
-    length3 = length2 * length
-
-    # Assume a capsule placed at origin
-    cg = Vector((0.0, 0.0, 0.0))
-
-    # volume capsule = volume cylinder + sphere
-    volume_sphere = (4 / 3) * np.pi * radius3
-    volume_cylinder = np.pi * radius2 * length
-    volume = volume_cylinder + volume_sphere
-
-    # https://www.wolframalpha.com/input?i=moment+of+inertia+of+a+capsule
-    ixx = (5 * length3 + 20 * length2 * radius + 45 * length * radius2 + 32 * radius3) / (60 * length + 80 * radius)
-    iyy = (radius2 * (15 * length + 16 * radius)) / (30 * length + 40 * radius)
-    izz = ixx
-    inertia = Vector((ixx, iyy, izz))
-
-    return MassProperties(volume, cg, inertia)
+    return _get_mass_properties_of_primitive(MassShape.CAPSULE, (radius, length, 0.0))
 
 
 def get_centroid_of_sphere(radius: float) -> Centroid:
@@ -110,19 +160,7 @@ def get_centroid_of_sphere(radius: float) -> Centroid:
 
 
 def get_mass_properties_of_sphere(radius: float) -> MassProperties:
-    radius2 = radius * radius
-    radius3 = radius2 * radius
-
-    # Assume a sphere placed at origin
-    cg = Vector((0.0, 0.0, 0.0))
-
-    volume = (4 / 3) * np.pi * radius3
-
-    # https://scienceworld.wolfram.com/physics/MomentofInertiaSphere.html
-    ixx = iyy = izz = 2 * radius2 / 5
-    inertia = Vector((ixx, iyy, izz))
-
-    return MassProperties(volume, cg, inertia)
+    return _get_mass_properties_of_primitive(MassShape.SPHERE, (radius, 0.0, 0.0))
 
 
 def get_centroid_of_box(box_min: Vector, box_max: Vector) -> Centroid:
@@ -134,22 +172,7 @@ def get_centroid_of_box(box_min: Vector, box_max: Vector) -> Centroid:
 
 
 def get_mass_properties_of_box(box_min: Vector, box_max: Vector) -> MassProperties:
-    x, y, z = box_max - box_min
-    x2, y2, z2 = x * x, y * y, z * z
-
-    # Assume a box placed at origin
-    cg = Vector((0.0, 0.0, 0.0))
-
-    volume = x * y * z
-
-    # moment of inertia of a solid rectangular cuboid
-    # https://en.wikipedia.org/wiki/List_of_moments_of_inertia#List_of_3D_inertia_tensors
-    ixx = (y2 + z2) / 12
-    iyy = (z2 + x2) / 12
-    izz = (x2 + y2) / 12
-    inertia = Vector((ixx, iyy, izz))
-
-    return MassProperties(volume, cg, inertia)
+    return _get_mass_properties_of_primitive(MassShape.BOX, box_max - box_min)
 
 
 def _bounding_ball_ritter(points: NDArray[np.float64]):
@@ -289,12 +312,93 @@ def calculate_composite_inertia(
     assert len(parts_cg) == len(parts_mass)
     assert len(parts_cg) == len(parts_inertia)
 
-    total_inertia = Vector((0.0, 0.0, 0.0))
-    for cg, mass, inertia in zip(parts_cg, parts_mass, parts_inertia):
-        cg_offset = cg - root_cg
-        total_inertia += transform_inertia(inertia, mass, cg_offset)
+    if len(parts_cg) == 0:
+        return Vector((0.0, 0.0, 0.0))
+
+    parts_cg = np.asarray(parts_cg, dtype=np.float64).reshape((-1, 3))
+    parts_mass = np.asarray(parts_mass, dtype=np.float64)
+    parts_inertia = np.asarray(parts_inertia, dtype=np.float64).reshape((-1, 3))
+
+    # Same as `transform_inertia` applied to each part
+    d2 = np.square(parts_cg - np.asarray(root_cg, dtype=np.float64))
+    offsets = np.column_stack((d2[:, 1] + d2[:, 2], d2[:, 0] + d2[:, 2], d2[:, 0] + d2[:, 1]))
+    total_inertia = (parts_inertia + parts_mass[:, np.newaxis] * offsets).sum(axis=0)
+
+    return Vector(total_inertia)
+
+
+def get_composite_mass_properties(
+    parts_volume: NDArray[np.float64],
+    parts_cg: NDArray[np.float64],
+    parts_inertia: NDArray[np.float64],
+) -> MassProperties:
+    """Combines the mass properties of the parts of a composite with uniform density, so volume is used as mass.
+    ``parts_cg`` are in the composite space and ``parts_inertia`` are per unit mass, as returned by the
+    ``get_mass_properties_of_*`` functions. Without volume, the inertia defaults to (1, 1, 1).
+    """
+    parts_volume = np.asarray(parts_volume, dtype=np.float64)
+    parts_cg = np.asarray(parts_cg, dtype=np.float64).reshape((-1, 3))
+    parts_inertia = np.asarray(parts_inertia, dtype=np.float64).reshape((-1, 3))
+
+    volume = float(parts_volume.sum())
+    if volume > 0.0:
+        cg = (parts_cg * parts_volume[:, np.newaxis]).sum(axis=0) / volume
+        inertia = calculate_composite_inertia(cg, parts_cg, parts_volume, parts_inertia * parts_volume[:, np.newaxis])
+        inertia /= volume
+    else:
+        cg = np.zeros(3, dtype=np.float64)
+        inertia = Vector((1.0, 1.0, 1.0))
+
+    return MassProperties(volume, Vector(cg), inertia)
+
+
+class MeshMassPropertiesCache:
+    """Mass properties of meshes keyed by a hash of their vertices and faces. It lives for the whole session, so
+    unchanged collision meshes are not recalculated on each export.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self._entries: OrderedDict[bytes, MassProperties] = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, mesh_vertices, mesh_faces) -> MassProperties:
+        """Gets the mass properties of the mesh, calculating them with `get_mass_properties_of_mesh` if not cached."""
+        mesh_vertices = np.ascontiguousarray(mesh_vertices, dtype=np.float64)
+        mesh_faces = np.ascontiguousarray(mesh_faces, dtype=np.int64)
+
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(np.array((len(mesh_vertices), len(mesh_faces)), dtype=np.int64).tobytes())
+        key_hash.update(mesh_vertices.tobytes())
+        key_hash.update(mesh_faces.tobytes())
+        key = key_hash.digest()
+
+        mass_properties = self._entries.get(key, None)
+        if mass_properties is None:
+            self.misses += 1
+            mass_properties = get_mass_properties_of_mesh(mesh_vertices, mesh_faces)
+            self._entries[key] = mass_properties
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        # Copy the vectors so changes to them don't affect the cache
+        volume, cg, inertia = mass_properties
+        return MassProperties(volume, cg.copy(), inertia.copy())
+
+    def clear(self):
+        self._entries.clear()
+
+
+mesh_mass_properties_cache = MeshMassPropertiesCache()
+
 
-    return total_inertia
+def get_mass_properties_of_mesh_cached(mesh_vertices, mesh_faces) -> MassProperties:
+    """Same as `get_mass_properties_of_mesh`, but reuses the results of meshes with the same vertices and faces."""
+    return mesh_mass_properties_cache.get(mesh_vertices, mesh_faces)
 
 
 NO_NEIGHBOR = -1
@@ -0,0 +1,94 @@
+"""Helpers to overlap work that doesn't touch `bpy` (file I/O, decoding, serialization) with the work the main thread
+has to do. Functions passed to these helpers run in worker threads, so they must not access Blender data.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def prefetch_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    num_workers: int,
+    max_prefetch: int | None = None,
+) -> Iterator[R]:
+    """Lazily maps ``fn`` over ``items`` using a pool of worker threads, yielding the results in the same order as
+    ``items``. At most ``max_prefetch`` results (by default, twice the number of workers) are computed ahead of the
+    consumer, so memory usage stays bounded no matter how many items there are.
+
+    If ``num_workers`` is less than 1, ``fn`` is called in the current thread as results are requested.
+
+    Exceptions raised by ``fn`` are re-raised when its result is consumed.
+    """
+    if num_workers < 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    if max_prefetch is None:
+        max_prefetch = num_workers * 2
+    max_prefetch = max(max_prefetch, 1)
+
+    items_iter = iter(items)
+    pending: deque[Future[R]] = deque()
+    with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="sz_prefetch") as executor:
+        try:
+            for item in items_iter:
+                pending.append(executor.submit(fn, item))
+                if len(pending) >= max_prefetch:
+                    break
+
+            while pending:
+                result = pending.popleft().result()
+                for item in items_iter:
+                    pending.append(executor.submit(fn, item))
+                    break
+                yield result
+        finally:
+            # Consumer stopped early or an exception was raised, don't keep computing results nobody will read
+            for f in pending:
+                f.cancel()
+
+
+class BoundedExecutor:
+    """Thread pool with a bounded queue. `submit` blocks while ``max_pending`` tasks are already queued or running, so
+    the producer cannot get arbitrarily far ahead of the workers (e.g. keep every export result in memory).
+    """
+
+    def __init__(self, num_workers: int, max_pending: int | None = None):
+        num_workers = max(num_workers, 1)
+        if max_pending is None:
+            max_pending = num_workers * 2
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="sz_worker")
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self.wait_time = 0.0
+        """Total time in seconds `submit` has been blocked waiting for a free slot."""
+
+    def submit(self, fn: Callable[..., R], /, *args, **kwargs) -> Future[R]:
+        t0 = time.perf_counter()
+        self._slots.acquire()
+        self.wait_time += time.perf_counter() - t0
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "BoundedExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
@@ -11,6 +11,7 @@ from .tools.blenderhelper import get_bone_pose_matrix
 
 
 from .sollumz_preferences import get_export_settings
+from .profiling import trace_operator
 from .tools.blenderhelper import get_children_recursive, get_object_with_children
 from .sollumz_properties import BOUND_TYPES, SollumType, MaterialType, LODLevel
 
@@ -32,7 +33,8 @@ class SOLLUMZ_OT_base:
     def execute(self, context):
         start = time.time()
         try:
-            result = self.run(context)
+            with trace_operator(self.bl_idname):
+                result = self.run(context)
         except:
             result = False
             self.error(
@@ -180,11 +182,15 @@ def get_sollumz_materials(
         lods = child.sz_lods
         for lod_level in lod_levels:
             lod = lods.get_lod(lod_level)
-            lod_mesh = lod.mesh
-            if lod_mesh is None:
-                continue
+            if lod.has_deferred_mesh:
+                from .ydr.deferred_lods import get_deferred_lod_materials
+                mats = get_deferred_lod_materials(child, lod_level)
+            else:
+                lod_mesh = lod.mesh
+                if lod_mesh is None:
+                    continue
 
-            mats = lod_mesh.materials
+                mats = lod_mesh.materials
 
             for mat in mats:
                 if mat.sollum_type != MaterialType.SHADER:
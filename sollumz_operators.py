@@ -10,10 +10,18 @@ from bpy.props import (
     BoolProperty,
     PointerProperty,
 )
+import os
 import time
 import re
+import shutil
+import tempfile
+import contextlib
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Literal, TYPE_CHECKING
 from mathutils import Quaternion
 from .sollumz_helper import SOLLUMZ_OT_base, find_sollumz_parent
 from .sollumz_properties import SollumType, SOLLUMZ_UI_NAMES, TimeFlagsMixin
@@ -35,9 +43,17 @@ from .iecontext import (
     ExportBundle,
     import_context_scope,
     ImportContext,
+    DirectoryIndex,
 )
+from .shared.pipeline import prefetch_ordered, BoundedExecutor
+from .shared.export_manifest import ExportManifest, compute_export_fingerprint
+from .ydr.geometry_cache import GeometryCache
 
 from . import logger
+from .profiling import span, trace_operator
+
+if TYPE_CHECKING:
+    from szio.gta5 import AssetTarget, AssetWithDependencies
 
 
 class TimedOperator:
@@ -52,12 +68,26 @@ class TimedOperator:
 
     def execute(self, context: Context):
         self._start = time.time()
-        return self.execute_timed(context)
+        with trace_operator(self.bl_idname):
+            return self.execute_timed(context)
 
     def execute_timed(self, context: Context):
         ...
 
 
+@dataclass(slots=True)
+class _LoadedAsset:
+    """Asset file loaded from disk, along with its dependencies, ready to be created in Blender."""
+
+    filepath: Path
+    asset_with_deps: "AssetWithDependencies | None" = None
+    asset_target: "AssetTarget | None" = None
+    is_legacy: bool = False
+    """Legacy formats are loaded and created at once on the main thread."""
+    logs: list[tuple[str, str]] = field(default_factory=list)
+    """Messages logged while loading, output when the asset is created."""
+
+
 class ImportAssetsOperatorImpl(ImportSettingsBase, TimedOperator):
     bl_description = "Import RAGE asset files"
 
@@ -122,17 +152,30 @@ class ImportAssetsOperatorImpl(ImportSettingsBase, TimedOperator):
             from szio import VPath
             from szio.gta5 import try_load_asset, AssetType, AssetWithDependencies
             from .ybn.ybnimport import import_ybn as import_ybn_asset
+            from .ybn.collision_materials import CollisionMaterialRegistry
             from .ydr.ydrimport import import_ydr as import_ydr_asset, find_ydr_external_dependencies
             from .ydd.yddimport import import_ydd as import_ydd_asset, find_ydd_external_dependencies
             from .yft.yftimport import import_yft as import_yft_asset, find_yft_external_dependencies
             from .ytyp.ytypimport import import_ytyp as import_ytyp_asset
             from .ytd.ytdimport import import_ytd as import_ytd_asset, find_ytd_external_dependencies
             from .ymap_next.ymapimport import import_ymap as import_ymap_asset, begin_import_ymap_group, end_import_ymap_group
+            from .shared.asset_cache import try_load_asset_cached, evict_cache_entries
 
             prefs_import_settings = self if self.use_custom_settings else get_import_settings()
             import_settings = prefs_import_settings.to_import_context_settings(import_as_asset=self.import_as_asset)
 
             directory = Path(self.directory)
+            # Listed once and shared by all the imported assets, to find their external dependencies
+            directory_index = DirectoryIndex(directory)
+            # Shared by all the imported assets, so bounds with the same collision material use a single material
+            collision_materials = CollisionMaterialRegistry()
+
+            def _is_legacy_asset(filename: str) -> bool:
+                return (
+                    filename.endswith(YCD.file_extension) or
+                    filename.endswith(YNV.file_extension) or
+                    Path(filename).suffix in {".ycd", ".ynv"}
+                )
 
             def _import_asset_legacy(filename: str) -> bool:
                 filepath = directory / filename
@@ -150,53 +193,88 @@ class ImportAssetsOperatorImpl(ImportSettingsBase, TimedOperator):
 
                 return True
 
-            def _import_asset(filename: str) -> bool:
+            def _load_asset(filename: str) -> _LoadedAsset:
+                """Loads the asset file and its external dependencies. Doesn't access Blender data, so it can run in a
+                worker thread during pipelined imports. Logs are captured and output later by `_import_asset`.
+                """
                 filepath = directory / filename
+                loaded = _LoadedAsset(filepath)
+                with logger.capture_logs() as loaded.logs:
+                    try:
+                        if _is_legacy_asset(filename):
+                            loaded.is_legacy = True
+                            return loaded
+
+                        with span("asset_load", file=filename):
+                            load_result = try_load_asset_cached(
+                                filepath,
+                                import_settings,
+                                lambda: try_load_asset(VPath(filepath), return_target=True),
+                            )
+
+                        if load_result is None:
+                            if not IS_SZIO_NATIVE_AVAILABLE and filepath.suffix in {".ybn", ".ydr", ".ydd", ".yft", ".ytyp", ".ytd", ".ymap"}:
+                                logger.warning(f"Could not import '{filepath}'. {PYMATERIA_REQUIRED_MSG}")
+                            else:
+                                logger.warning(f"Could not import '{filepath}'. Unsupported file format.")
+                            return loaded
+
+                        asset, asset_target = load_result
+
+                        name = filepath.name
+                        i = name.find('.')
+                        if 0 < i < len(name) - 1:
+                            name = name[:i]
+
+                        # Search asset external dependencies
+                        with (
+                            span("dependency_resolution"),
+                            import_context_scope(ImportContext(
+                                name, asset_target, directory, import_settings, filepath, directory_index, collision_materials
+                            )),
+                        ):
+                            match asset.ASSET_TYPE:
+                                case AssetType.DRAWABLE:
+                                    asset_with_deps = find_ydr_external_dependencies(asset, name)
+                                case AssetType.DRAWABLE_DICTIONARY:
+                                    asset_with_deps = find_ydd_external_dependencies(asset, name)
+                                case AssetType.FRAGMENT:
+                                    asset_with_deps = find_yft_external_dependencies(asset, name)
+                                case AssetType.TEXTURE_DICTIONARY:
+                                    asset_with_deps = find_ytd_external_dependencies(asset, name)
+                                case _:
+                                    asset_with_deps = AssetWithDependencies(name, asset, {})
+
+                        # Failed to find required dependencies if None, finder functions should have logged the error
+                        # already.
+                        # Otherwise, find dependencies can potentially change the main asset we are exporting, e.g.
+                        # _hi to non-hi .yft
+                        loaded.asset_with_deps = asset_with_deps
+                        loaded.asset_target = asset_target
+                    except:
+                        logger.error(f"Error importing: {filepath} \n {traceback.format_exc()}")
+                        loaded.asset_with_deps = None
+
+                return loaded
+
+            def _import_asset(loaded: _LoadedAsset) -> bool:
+                filepath = loaded.filepath
+                logger.replay_logs(loaded.logs)
 
                 try:
-                    if _import_asset_legacy(str(filepath)):
-                        return True
-
-                    if (load_result := try_load_asset(VPath(filepath), return_target=True)) is None:
-                        if not IS_SZIO_NATIVE_AVAILABLE and filepath.suffix in {".ybn", ".ydr", ".ydd", ".yft", ".ytyp", ".ytd", ".ymap"}:
-                            logger.warning(f"Could not import '{filepath}'. {PYMATERIA_REQUIRED_MSG}")
-                        else:
-                            logger.warning(f"Could not import '{filepath}'. Unsupported file format.")
-                        return False
-
-                    asset, asset_target = load_result
-
-                    name = filepath.name
-                    i = name.find('.')
-                    if 0 < i < len(name) - 1:
-                        name = name[:i]
-
-                    # Search asset external dependencies
-                    with import_context_scope(ImportContext(name, asset_target, directory, import_settings)):
-                        match asset.ASSET_TYPE:
-                            case AssetType.DRAWABLE:
-                                asset_with_deps = find_ydr_external_dependencies(asset, name)
-                            case AssetType.DRAWABLE_DICTIONARY:
-                                asset_with_deps = find_ydd_external_dependencies(asset, name)
-                            case AssetType.FRAGMENT:
-                                asset_with_deps = find_yft_external_dependencies(asset, name)
-                            case AssetType.TEXTURE_DICTIONARY:
-                                asset_with_deps = find_ytd_external_dependencies(asset, name)
-                            case _:
-                                asset_with_deps = AssetWithDependencies(name, asset, {})
+                    if loaded.is_legacy:
+                        return _import_asset_legacy(str(filepath))
 
-                        if asset_with_deps is not None:
-                            # find dependencies can potentially change the main asset we are
-                            # exporting, e.g. _hi to non-hi .yft
-                            asset = asset_with_deps.main_asset
-                            name = asset_with_deps.name
-
-                    if asset_with_deps is None:
-                        # Failed to find required dependencies, finder functions should have logged the error already
+                    if (asset_with_deps := loaded.asset_with_deps) is None:
                         return False
 
+                    asset = asset_with_deps.main_asset
+                    name = asset_with_deps.name
+
                     # Import asset into Blender
-                    with import_context_scope(ImportContext(name, asset_target, directory, import_settings)):
+                    with import_context_scope(ImportContext(
+                        name, loaded.asset_target, directory, import_settings, filepath, directory_index, collision_materials
+                    )):
                         match asset.ASSET_TYPE:
                             case AssetType.BOUND:
                                 import_ybn_asset(asset, name)
@@ -221,23 +299,34 @@ class ImportAssetsOperatorImpl(ImportSettingsBase, TimedOperator):
                     logger.error(f"Error importing: {filepath} \n {traceback.format_exc()}")
                     return False
 
-            # Import the .ytds before all the assets to ensure that their images are used
-            for filename in ytd_filenames:
-                _import_asset(filename)
-
-            for filename in filenames:
-                _import_asset(filename)
-
+            # Import the .ytds before all the assets to ensure that their images are used.
             # Import the .ytyps and .ymaps after all the assets to ensure that the archetypes get linked to their object
-            # in case they are imported together
-            for filename in ytyp_filenames:
-                _import_asset(filename)
+            # in case they are imported together.
+            # In pipelined mode, files are still created in Blender in this same order, only the loading is done ahead
+            # of time by worker threads.
+            non_ymap_filenames = [*ytd_filenames, *filenames, *ytyp_filenames]
+            loaded_assets = prefetch_ordered(
+                _load_asset,
+                non_ymap_filenames + ymap_filenames,
+                import_settings.pipelined_num_workers if import_settings.pipelined else 0,
+            )
+            with contextlib.closing(loaded_assets):
+                for _ in non_ymap_filenames:
+                    _import_asset(next(loaded_assets))
 
-            begin_import_ymap_group()
-            for filename in ymap_filenames:
-                _import_asset(filename)
-            end_import_ymap_group()
+                begin_import_ymap_group()
+                for loaded in loaded_assets:
+                    _import_asset(loaded)
+                end_import_ymap_group()
 
+            if import_settings.geometry_cache_directory is not None:
+                evict_cache_entries(import_settings.geometry_cache_directory, import_settings.geometry_cache_max_size)
+
+            if collision_materials.hits:
+                logger.info(
+                    f"Reused collision materials {collision_materials.hits} time(s) "
+                    f"({collision_materials.misses} created)"
+                )
             logger.info(f"Imported in {self.time_elapsed} seconds")
             return {"FINISHED"}
 
@@ -361,6 +450,15 @@ def _get_only_parent_objs(objs: list[Object]) -> list[Object]:
     return list(parent_objs)
 
 
+_INCREMENTAL_EXPORT_TYPES = {
+    SollumType.BOUND_COMPOSITE,
+    SollumType.DRAWABLE,
+    SollumType.DRAWABLE_DICTIONARY,
+    SollumType.FRAGMENT,
+}
+"""Object types skipped by incremental exports when unchanged."""
+
+
 class ExportAssetsOperatorImpl(ExportSettingsBase, TimedOperator):
     """Export RAGE asset files"""
 
@@ -468,22 +566,67 @@ class ExportAssetsOperatorImpl(ExportSettingsBase, TimedOperator):
             directory = Path(self.directory)
             any_warnings_or_errors = False
 
-            if objs:
-                any_warnings_or_errors = self._export_objects(objs, directory, export_settings, op_log) or any_warnings_or_errors
+            self._save_time = 0.0
+            self._num_skipped = 0
+            self._manifest = ExportManifest.load(directory) if export_settings.incremental else None
+            self._geometry_cache = GeometryCache()
+            self._pending_saves = deque()
+            self._bundle_writer = (
+                BoundedExecutor(export_settings.concurrent_save_num_workers)
+                if export_settings.concurrent_save
+                else None
+            )
+            try:
+                if objs:
+                    any_warnings_or_errors = self._export_objects(objs, directory, export_settings, op_log) or any_warnings_or_errors
+
+                if export_ytyps:
+                    ytyps = self._collect_ytyps_for_export(context, prefs_export_settings.export_ytyps_include)
+                    any_warnings_or_errors = self._export_ytyps(context, ytyps, directory, export_settings, op_log) or any_warnings_or_errors
+
+                if export_ymaps:
+                    ymaps = self._collect_ymaps_for_export(context, prefs_export_settings.export_ymaps_include)
+                    any_warnings_or_errors = self._export_ymaps(context, ymaps, directory, export_settings, op_log) or any_warnings_or_errors
+
+                if export_ytds:
+                    ytds = self._collect_ytds_for_export(context, prefs_export_settings.export_ytds_include)
+                    any_warnings_or_errors = self._export_ytds(context, ytds, directory, export_settings, op_log) or any_warnings_or_errors
+            finally:
+                if self._bundle_writer is not None:
+                    t0 = time.perf_counter()
+                    any_warnings_or_errors = self._report_pending_saves(wait=True) or any_warnings_or_errors
+                    self._bundle_writer.shutdown()
+                    save_wait_time = time.perf_counter() - t0 + self._bundle_writer.wait_time
+                    self._bundle_writer = None
+                else:
+                    save_wait_time = self._save_time
 
-            if export_ytyps:
-                ytyps = self._collect_ytyps_for_export(context, prefs_export_settings.export_ytyps_include)
-                any_warnings_or_errors = self._export_ytyps(context, ytyps, directory, export_settings, op_log) or any_warnings_or_errors
+                if self._manifest is not None:
+                    try:
+                        self._manifest.save()
+                    except OSError as e:
+                        logger.warning(f"Failed to save the incremental export manifest: {e}")
+                    self._manifest = None
 
-            if export_ymaps:
-                ymaps = self._collect_ymaps_for_export(context, prefs_export_settings.export_ymaps_include)
-                any_warnings_or_errors = self._export_ymaps(context, ymaps, directory, export_settings, op_log) or any_warnings_or_errors
+            if self._num_skipped:
+                logger.info(f"Skipped {self._num_skipped} unchanged object(s)")
 
-            if export_ytds:
-                ytds = self._collect_ytds_for_export(context, prefs_export_settings.export_ytds_include)
-                any_warnings_or_errors = self._export_ytds(context, ytds, directory, export_settings, op_log) or any_warnings_or_errors
+            if self._geometry_cache.hits:
+                logger.info(
+                    f"Reused geometries of {self._geometry_cache.hits} drawable model(s) with shared meshes "
+                    f"({self._geometry_cache.misses} built)"
+                )
+            self._geometry_cache = None
 
-            logger.info(f"Exported in {self.time_elapsed} seconds")
+            build_time = max(self.time_elapsed - save_wait_time, 0.0)
+            if export_settings.concurrent_save:
+                breakdown = (
+                    f"build {build_time:.3f} s, save {self._save_time:.3f} s in background, "
+                    f"{save_wait_time:.3f} s waiting for saves"
+                )
+            else:
+                breakdown = f"build {build_time:.3f} s, save {self._save_time:.3f} s"
+            logger.info(f"Exported in {self.time_elapsed} seconds ({breakdown})")
             if any_warnings_or_errors and bpy.ops.screen.info_log_show.poll():
                 bpy.ops.screen.info_log_show()
             return {"FINISHED"}
@@ -500,9 +643,17 @@ class ExportAssetsOperatorImpl(ExportSettingsBase, TimedOperator):
             op_log.clear_log_counts()
             try:
                 asset_name = remove_number_suffix(obj.name.lower())
+                fingerprint = None
+                if self._manifest is not None and obj.sollum_type in _INCREMENTAL_EXPORT_TYPES:
+                    fingerprint = compute_export_fingerprint(obj, export_settings)
+                    if self._manifest.is_up_to_date(asset_name, fingerprint):
+                        logger.info(f"Skipped '{obj.name}', unchanged since the last export")
+                        self._num_skipped += 1
+                        continue
+
                 export_bundle = None
                 legacy_success = False
-                with export_context_scope(ExportContext(asset_name, export_settings)):
+                with export_context_scope(ExportContext(asset_name, export_settings, self._geometry_cache)):
                     match obj.sollum_type:
                         case SollumType.BOUND_COMPOSITE:
                             export_bundle = export_ybn_asset(obj)
@@ -523,10 +674,17 @@ class ExportAssetsOperatorImpl(ExportSettingsBase, TimedOperator):
                             assert False, f"Unsupported asset type '{obj.sollum_type}'"
 
 
-                any_warnings_or_errors = self._save_bundle(obj.name, export_bundle, directory, export_settings, op_log, legacy_success=legacy_success) or any_warnings_or_errors
+                any_warnings_or_errors = self._save_bundle(
+                    obj.name, export_bundle, directory, export_settings, op_log,
+                    legacy_success=legacy_success,
+                    fingerprint=(asset_name, fingerprint) if fingerprint is not None else None,
+                ) or any_warnings_or_errors
             except:
                 logger.error(f"Error exporting: {obj.name} \n {traceback.format_exc()}")
                 any_warnings_or_errors = True
+            finally:
+                # Geometries are only reused within the same asset, release them once it is built
+                self._geometry_cache.clear()
 
         return any_warnings_or_errors
 
@@ -569,7 +727,7 @@ class ExportAssetsOperatorImpl(ExportSettingsBase, TimedOperator):
 
     def _export_ymaps(self, context, ymap_indices: list[int], directory: Path, export_settings, op_log) -> bool:
         from .ymap_next.properties.map import get_maps
-        from .ymap_next.ymapexport import export_ymap as export_ymap_asset
+        from .ymap_next.ymapexport import export_ymap_iter as export_ymap_asset_iter
 
         any_warnings_or_errors = False
         maps = get_maps(context)
@@ -579,9 +737,9 @@ class ExportAssetsOperatorImpl(ExportSettingsBase, TimedOperator):
             try:
                 asset_name = map_group.name.lower()
                 with export_context_scope(ExportContext(asset_name, export_settings)):
-                    export_bundles = export_ymap_asset(map_group)
-
-                any_warnings_or_errors = self._save_bundle(map_group.name, export_bundles, directory, export_settings, op_log) or any_warnings_or_errors
+                    # Each map data bundle is built and saved one by one, groups can contain hundreds of them
+                    export_bundles = export_ymap_asset_iter(map_group)
+                    any_warnings_or_errors = self._save_bundle(map_group.name, export_bundles, directory, export_settings, op_log) or any_warnings_or_errors
             except Exception:
                 logger.error(f"Error exporting: {map_group.name} \n {traceback.format_exc()}")
                 any_warnings_or_errors = True
@@ -615,32 +773,226 @@ class ExportAssetsOperatorImpl(ExportSettingsBase, TimedOperator):
 
         return any_warnings_or_errors
 
-    def _save_bundle(self, name: str, export_bundle: ExportBundle | list[ExportBundle] | None, directory: Path, export_settings, op_log, legacy_success=False) -> bool:
-        any_warnings_or_errors = False
-        export_bundles = export_bundle if isinstance(export_bundle, list) else [export_bundle] if export_bundle else []
-        success = legacy_success or (export_bundles and all(b.is_valid() for b in export_bundles))
-        if success:
+    def _save_bundle(
+        self,
+        name: str,
+        export_bundle: ExportBundle | Iterable[ExportBundle] | None,
+        directory: Path,
+        export_settings,
+        op_log,
+        legacy_success=False,
+        fingerprint: tuple[str, str] | None = None,
+    ) -> bool:
+        """Saves the bundles and reports the result.
+
+        ``export_bundle`` can also be an iterator that builds the bundles lazily. Each bundle is saved as soon as it is
+        built and then released, so memory usage doesn't grow with the number of bundles. These are saved to a staging
+        directory first and only moved to ``directory`` once all of them were built and saved successfully, so a
+        failure partway through doesn't leave some of the files on disk.
+
+        ``fingerprint`` is a (asset name, fingerprint) tuple to store in the incremental export manifest once saved.
+        """
+        staging_directory = None
+        if export_bundle is None:
+            export_bundles = ()
+        elif isinstance(export_bundle, ExportBundle):
+            export_bundles = (export_bundle,)
+        else:
+            export_bundles = export_bundle
+            staging_directory = Path(tempfile.mkdtemp(prefix=".sollumz_export_", dir=directory))
+
+        save_directory = staging_directory or directory
+        want_files = self._manifest is not None and fingerprint is not None
+        any_valid = False
+        any_invalid = False
+        futures = []
+        files = []
+        try:
             for b in export_bundles:
-                if b:
-                    b.save(directory, export_settings.targets)
-
+                if not b:
+                    any_invalid = True
+                    continue
+
+                any_valid = True
+                if any_invalid:
+                    # The export already failed, the remaining bundles are only built to report their errors
+                    continue
+
+                if self._bundle_writer is not None:
+                    # Saving doesn't access Blender data, so it can overlap with building the next bundles. The result
+                    # is reported once the save finishes.
+                    futures.append(
+                        self._bundle_writer.submit(
+                            _save_bundle_task, b, save_directory, export_settings.targets, want_files
+                        )
+                    )
+                else:
+                    t0 = time.perf_counter()
+                    try:
+                        saved_files = b.save(save_directory, export_settings.targets)
+                    finally:
+                        self._save_time += time.perf_counter() - t0
+                    if want_files:
+                        files.extend(saved_files)
+        except BaseException:
+            self._discard_saves(name, futures, staging_directory)
+            raise
+
+        success = (legacy_success or any_valid) and not any_invalid
+        if not success:
+            any_warnings_or_errors = False
             if op_log.has_warnings_or_errors:
                 logger.info(
-                    f"Exported '{name}' with WARNINGS or ERRORS! Please check the Info Log for details."
+                    f"Failed to export '{name}', ERRORS found! Please check the Info Log for details."
                 )
                 any_warnings_or_errors = True
-            else:
-                logger.info(f"Successfully exported '{name}'")
+            any_warnings_or_errors = self._discard_saves(name, futures, staging_directory) or any_warnings_or_errors
+            self._update_manifest(fingerprint, [], True)
+            return any_warnings_or_errors
+
+        had_warnings_or_errors = op_log.has_warnings_or_errors
+        if futures:
+            self._pending_saves.append(
+                _PendingSave(name, had_warnings_or_errors, futures, fingerprint, staging_directory)
+            )
+            return self._report_pending_saves(wait=False)
+
+        if staging_directory is not None:
+            files = _commit_staged_files(staging_directory, files)
+
+        any_warnings_or_errors = self._report_saved(name, had_warnings_or_errors)
+        self._update_manifest(fingerprint, files, had_warnings_or_errors)
+        return any_warnings_or_errors
+
+    def _discard_saves(self, name: str, futures: "list[Future]", staging_directory: Path | None) -> bool:
+        """Waits for the saves of a failed export and removes the files they staged. Returns whether any of the saves
+        raised an exception.
+        """
+        any_errors = False
+        for future in futures:
+            try:
+                logs, save_time, _ = future.result()
+            except Exception:
+                logger.error(f"Error exporting: {name} \n {traceback.format_exc()}")
+                any_errors = True
+                continue
+
+            self._save_time += save_time
+            logger.replay_logs(logs)
+
+        if staging_directory is not None:
+            shutil.rmtree(staging_directory, ignore_errors=True)
+            logger.info(f"No files were written for '{name}'.")
+
+        return any_errors
+
+    def _update_manifest(self, fingerprint: tuple[str, str] | None, files: list[Path], had_warnings_or_errors: bool):
+        if self._manifest is None or fingerprint is None:
+            return
+
+        asset_name, fingerprint = fingerprint
+        if had_warnings_or_errors:
+            # Export it again next time, so the warnings are not hidden
+            self._manifest.remove(asset_name)
         else:
-            if op_log.has_warnings_or_errors:
-                logger.info(
-                    f"Failed to export '{name}', ERRORS found! Please check the Info Log for details."
+            self._manifest.update(asset_name, fingerprint, files)
+
+    def _report_saved(self, name: str, had_warnings_or_errors: bool) -> bool:
+        if had_warnings_or_errors:
+            logger.info(
+                f"Exported '{name}' with WARNINGS or ERRORS! Please check the Info Log for details."
+            )
+            return True
+        else:
+            logger.info(f"Successfully exported '{name}'")
+            return False
+
+    def _report_pending_saves(self, wait: bool) -> bool:
+        """Reports the result of the saves running in the background, in the same order they were submitted. If ``wait``
+        is false, stops at the first save that hasn't finished yet.
+        """
+        any_warnings_or_errors = False
+        while self._pending_saves and (wait or all(f.done() for f in self._pending_saves[0].futures)):
+            pending = self._pending_saves.popleft()
+            had_warnings_or_errors = pending.had_warnings_or_errors
+            failed = False
+            files = []
+            for future in pending.futures:
+                try:
+                    logs, save_time, bundle_files = future.result()
+                except Exception:
+                    logger.error(f"Error exporting: {pending.name} \n {traceback.format_exc()}")
+                    failed = True
+                    continue
+
+                self._save_time += save_time
+                logger.replay_logs(logs)
+                had_warnings_or_errors = had_warnings_or_errors or any(
+                    level in {"WARNING", "ERROR"} for _, level in logs
                 )
+                files.extend(bundle_files)
+
+            if failed:
                 any_warnings_or_errors = True
+                if pending.staging_directory is not None:
+                    shutil.rmtree(pending.staging_directory, ignore_errors=True)
+                    logger.info(f"No files were written for '{pending.name}'.")
+                self._update_manifest(pending.fingerprint, [], True)
+                continue
+
+            if pending.staging_directory is not None:
+                files = _commit_staged_files(pending.staging_directory, files)
+
+            any_warnings_or_errors = self._report_saved(pending.name, had_warnings_or_errors) or any_warnings_or_errors
+            self._update_manifest(pending.fingerprint, files, had_warnings_or_errors)
 
         return any_warnings_or_errors
 
 
+@dataclass(slots=True)
+class _PendingSave:
+    """Export bundles being saved in the background. Only the futures are kept, the bundles are released by the workers
+    as soon as they are written."""
+
+    name: str
+    had_warnings_or_errors: bool
+    """Whether warnings or errors were logged while building the bundles."""
+    futures: "list[Future[tuple[list[tuple[str, str]], float, list[Path]]]]"
+    fingerprint: tuple[str, str] | None = None
+    """Incremental export manifest entry, see `ExportAssetsOperatorImpl._save_bundle`."""
+    staging_directory: Path | None = None
+    """Directory inside the export directory the bundles are saved to, see `ExportAssetsOperatorImpl._save_bundle`."""
+
+
+def _save_bundle_task(
+    export_bundle: ExportBundle, directory: Path, targets: "tuple[AssetTarget, ...]", want_files: bool
+) -> tuple[list[tuple[str, str]], float, list[Path]]:
+    """Saves the bundle in a worker thread. Returns the captured logs, the time it took to save and, if ``want_files``,
+    the files written."""
+    t0 = time.perf_counter()
+    with logger.capture_logs() as logs:
+        saved_files = export_bundle.save(directory, targets)
+    save_time = time.perf_counter() - t0
+    return logs, save_time, saved_files if want_files else []
+
+
+def _commit_staged_files(staging_directory: Path, staged_files: list[Path]) -> list[Path]:
+    """Moves all the files saved to ``staging_directory`` to the same relative location in the export directory, its
+    parent, and removes the staging directory. Returns the new paths of ``staged_files``.
+    """
+    directory = staging_directory.parent
+    for src in sorted(staging_directory.rglob("*")):
+        if not src.is_file():
+            continue
+
+        dst = directory / src.relative_to(staging_directory)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(src, dst)
+
+    shutil.rmtree(staging_directory, ignore_errors=True)
+    return [directory / f.relative_to(staging_directory) for f in staged_files]
+
+
 class SOLLUMZ_OT_export_assets(ExportAssetsOperatorImpl, Operator):
     """Export RAGE asset files"""
     bl_idname = "sollumz.export_assets"
@@ -163,6 +163,16 @@ class ExportSettingsBase:
         update=_on_update_thunk,
     )
 
+    optimize_vertex_order: BoolProperty(
+        name="Optimize Vertex Order",
+        description=(
+            "Reorder the triangles and vertices of each mesh to render faster in-game, by improving the use of the "
+            "GPU vertex cache. Slows down the export of high-poly meshes"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
     export_ytyps: BoolProperty(
         name="Export YTYPs",
         default=False,
@@ -208,6 +218,54 @@ class ExportSettingsBase:
         update=_on_update_thunk,
     )
 
+    concurrent_save: BoolProperty(
+        name="Save in Background",
+        description=(
+            "Write the exported files in background threads while the next objects are being exported. Speeds up "
+            "exporting many objects or to multiple targets at once"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
+    concurrent_save_num_workers: IntProperty(
+        name="Worker Threads",
+        description="Number of background threads used to write exported files",
+        default=2,
+        min=1,
+        max=32,
+        update=_on_update_thunk,
+    )
+
+    parallel_geometry_build: BoolProperty(
+        name="Build Geometries in Parallel",
+        description=(
+            "Process the vertex and index buffers of the drawable models in background threads. The mesh data is still "
+            "read from Blender one model at a time. Speeds up exporting drawables with many models"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
+    parallel_geometry_build_num_workers: IntProperty(
+        name="Worker Threads",
+        description="Number of background threads used to build geometries",
+        default=4,
+        min=1,
+        max=32,
+        update=_on_update_thunk,
+    )
+
+    incremental_export: BoolProperty(
+        name="Incremental Export",
+        description=(
+            "Skip objects that didn't change since they were last exported to the same directory. Changes are "
+            "tracked in a manifest file in the output directory"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
     def to_export_context_settings(self) -> "ExportSettings":
         import itertools
         from .iecontext import ExportSettings, VBBuilderDomain
@@ -221,9 +279,18 @@ class ExportSettingsBase:
             apply_transforms=self.apply_transforms,
             exclude_skeleton=self.exclude_skeleton,
             mesh_domain=VBBuilderDomain[self.mesh_domain],
+            optimize_vertex_order=self.optimize_vertex_order,
+            concurrent_save=self.concurrent_save,
+            concurrent_save_num_workers=self.concurrent_save_num_workers,
+            parallel_geometry_build=self.parallel_geometry_build,
+            parallel_geometry_build_num_workers=self.parallel_geometry_build_num_workers,
+            incremental=self.incremental_export,
         )
 
 
+GEOMETRY_CACHE_DIR_NAME = "geometry_cache"
+
+
 class ImportSettingsBase:
     def _on_update(self, context):
         ...
@@ -337,6 +404,75 @@ class ImportSettingsBase:
         update=_on_update_thunk,
     )
 
+    pipelined_import: BoolProperty(
+        name="Pipelined Import",
+        description=(
+            "Load the next files in background threads while the current file is being created in the scene. Speeds up "
+            "importing many files at once"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
+    pipelined_import_num_workers: IntProperty(
+        name="Worker Threads",
+        description="Number of background threads used to load files ahead of time during pipelined imports",
+        default=4,
+        min=1,
+        max=32,
+        update=_on_update_thunk,
+    )
+
+    geometry_cache: BoolProperty(
+        name="Cache Geometry",
+        description=(
+            "Store the drawables, drawable dictionaries and fragments decoded from imported files on disk, so importing "
+            "the same unchanged files again doesn't decode them. The cache is stored in the Sollumz data directory"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
+    geometry_cache_max_size: IntProperty(
+        name="Max Cache Size (MB)",
+        description="Maximum size of the geometry cache. The least recently used entries are removed above this size",
+        default=1024,
+        min=16,
+        update=_on_update_thunk,
+    )
+
+    validate_meshes: BoolProperty(
+        name="Validate Meshes",
+        description=(
+            "Check the imported drawable meshes for invalid geometry and fix it. Slower, only needed if the imported "
+            "files are malformed"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
+    defer_lod_meshes: BoolProperty(
+        name="Defer LOD Meshes",
+        description=(
+            "Only create the mesh of the highest LOD level of each drawable model. The geometry of other LOD levels "
+            "is stored in the object and their meshes are created when switching to that LOD level. Unmodified LOD "
+            "levels are exported directly from the stored geometry"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
+    compact_bound_primitives: BoolProperty(
+        name="Compact Bound Primitives",
+        description=(
+            "Import the box, sphere, capsule and cylinder primitives of each Bound GeometryBVH as points of a single "
+            "Bound Poly Primitives object, previewed with geometry nodes, instead of one object per primitive. Use "
+            "'Explode Primitives' to edit them as separate objects"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
     def to_import_context_settings(self, import_as_asset: bool = False) -> "ImportSettings":
         from .iecontext import ImportSettings, ImportTexturesMode, ImportExternalSkeletonMode
 
@@ -367,6 +503,15 @@ class ImportSettingsBase:
             map_instance_entities=self.ymap_instance_entities,
             textures_mode=textures_mode,
             textures_extract_custom_directory=textures_extract_custom_dir,
+            pipelined=self.pipelined_import,
+            pipelined_num_workers=self.pipelined_import_num_workers,
+            geometry_cache_directory=(
+                Path(data_directory_path()) / GEOMETRY_CACHE_DIR_NAME if self.geometry_cache else None
+            ),
+            geometry_cache_max_size=self.geometry_cache_max_size * 1024 * 1024,
+            validate_meshes=self.validate_meshes,
+            defer_lod_meshes=self.defer_lod_meshes,
+            compact_bound_primitives=self.compact_bound_primitives,
         )
 
 
@@ -1104,6 +1249,24 @@ class SollumzAddonPreferences(AddonPreferences):
         update=_on_custom_procids_path_update,
     )
 
+    trace_operators: BoolProperty(
+        name="Record Performance Traces",
+        description=(
+            "Save a trace of each import/export operator run, showing how long each step took. Traces can be opened "
+            "in chrome://tracing or https://ui.perfetto.dev. Can also be enabled with the SOLLUMZ_TRACE environment "
+            "variable"
+        ),
+        default=False,
+        update=_save_preferences_on_update
+    )
+
+    trace_directory: StringProperty(
+        name="Traces Directory",
+        description="Directory where traces are saved. If empty, they are saved to the 'traces' directory in the Sollumz data directory",
+        subtype="DIR_PATH",
+        update=_save_preferences_on_update
+    )
+
     popup_shown_install_dependencies: BoolProperty(
         default=False,
         update=_save_preferences_on_update
@@ -1345,6 +1508,10 @@ class SollumzAddonPreferences(AddonPreferences):
         if body:
             # intentionally not using `body` here because it makes the panel look weird inside the prefs default box layout
             layout.prop(self, "custom_procids_path")
+            layout.prop(self, "trace_operators")
+            row = layout.row()
+            row.enabled = self.trace_operators
+            row.prop(self, "trace_directory")
 
     def draw_import_export(self, context, layout: UILayout):
         def _section_header(layout: UILayout, text: str, first: bool = False):
@@ -1405,6 +1572,19 @@ class SollumzAddonPreferences(AddonPreferences):
         _section_header(box, "Maps")
         box.prop(settings, "ymap_instance_entities")
 
+        _section_header(box, "Performance")
+        box.prop(settings, "pipelined_import")
+        row = box.row()
+        row.enabled = settings.pipelined_import
+        row.prop(settings, "pipelined_import_num_workers")
+        box.prop(settings, "geometry_cache")
+        row = box.row()
+        row.enabled = settings.geometry_cache
+        row.prop(settings, "geometry_cache_max_size")
+        box.prop(settings, "validate_meshes")
+        box.prop(settings, "defer_lod_meshes")
+        box.prop(settings, "compact_bound_primitives")
+
         # Export settings
         box = sublayout.box()
         box.label(text="Export", icon="EXPORT")
@@ -1441,10 +1621,22 @@ class SollumzAddonPreferences(AddonPreferences):
         _section_header(box, "Drawable")
         box.prop(settings, "apply_transforms")
         box.prop(settings, "mesh_domain", expand=True)
+        box.prop(settings, "optimize_vertex_order")
 
         _section_header(box, "Drawable Dictionary")
         box.prop(settings, "exclude_skeleton")
 
+        _section_header(box, "Performance")
+        box.prop(settings, "concurrent_save")
+        row = box.row()
+        row.enabled = settings.concurrent_save
+        row.prop(settings, "concurrent_save_num_workers")
+        box.prop(settings, "parallel_geometry_build")
+        row = box.row()
+        row.enabled = settings.parallel_geometry_build
+        row.prop(settings, "parallel_geometry_build_num_workers")
+        box.prop(settings, "incremental_export")
+
     def draw_keymap(self, context, layout: UILayout):
         wm = bpy.context.window_manager
         kc = wm.keyconfigs.user
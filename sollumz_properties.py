@@ -38,6 +38,7 @@ class SollumType(str, Enum):
     BOUND_POLY_CAPSULE = "sollumz_bound_poly_capsule"
     BOUND_POLY_CYLINDER = "sollumz_bound_poly_cylinder"
     BOUND_POLY_TRIANGLE = "sollumz_bound_poly_triangle"
+    BOUND_POLY_PRIMITIVES = "sollumz_bound_poly_primitives"
 
     NAVMESH = "sollumz_navmesh"
     NAVMESH_POLY_MESH = "sollumz_navmesh_mesh"
@@ -244,6 +245,7 @@ BOUND_POLYGON_TYPES = [
     SollumType.BOUND_POLY_CAPSULE,
     SollumType.BOUND_POLY_CYLINDER,
     SollumType.BOUND_POLY_TRIANGLE,
+    SollumType.BOUND_POLY_PRIMITIVES,
 ]
 
 DRAWABLE_TYPES = [
@@ -271,6 +273,7 @@ SOLLUMZ_UI_NAMES = {
     SollumType.BOUND_POLY_CAPSULE: "Bound Poly Capsule",
     SollumType.BOUND_POLY_CYLINDER: "Bound Poly Cylinder",
     SollumType.BOUND_POLY_TRIANGLE: "Bound Poly Mesh",
+    SollumType.BOUND_POLY_PRIMITIVES: "Bound Poly Primitives",
 
     SollumType.FRAGMENT: "Fragment",
     SollumType.FRAGGROUP: "Fragment Group",
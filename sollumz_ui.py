@@ -273,6 +273,25 @@ class SOLLUMZ_PT_import_ymap_concrete(bpy.types.Panel, _SollumzImportYmapPanel):
         super().draw_settings(layout, settings)
 
 
+class SOLLUMZ_PT_import_performance(bpy.types.Panel, SollumzImportSettingsPanel):
+    bl_label = "Performance"
+    bl_order = 6
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzImportSettings):
+        layout.prop(settings, "pipelined_import")
+        row = layout.row()
+        row.enabled = settings.pipelined_import
+        row.prop(settings, "pipelined_import_num_workers")
+        layout.prop(settings, "geometry_cache")
+        row = layout.row()
+        row.enabled = settings.geometry_cache
+        row.prop(settings, "geometry_cache_max_size")
+        layout.prop(settings, "validate_meshes")
+        layout.prop(settings, "defer_lod_meshes")
+        layout.prop(settings, "compact_bound_primitives")
+
+
 class SOLLUMZ_PT_export_include(bpy.types.Panel, SollumzExportSettingsPanel):
     bl_label = "Include"
     bl_order = 0
@@ -289,6 +308,7 @@ class SOLLUMZ_PT_export_drawable(bpy.types.Panel, SollumzExportSettingsPanel):
     def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzExportSettings):
         layout.prop(settings, "apply_transforms")
         layout.prop(settings, "mesh_domain", expand=True)
+        layout.prop(settings, "optimize_vertex_order")
 
 
 # Empty for now
@@ -317,6 +337,23 @@ class SOLLUMZ_PT_export_ydd(bpy.types.Panel, SollumzExportSettingsPanel):
         layout.prop(settings, "exclude_skeleton")
 
 
+class SOLLUMZ_PT_export_performance(bpy.types.Panel, SollumzExportSettingsPanel):
+    bl_label = "Performance"
+    bl_order = 9
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzExportSettings):
+        layout.prop(settings, "concurrent_save")
+        row = layout.row()
+        row.enabled = settings.concurrent_save
+        row.prop(settings, "concurrent_save_num_workers")
+        layout.prop(settings, "parallel_geometry_build")
+        row = layout.row()
+        row.enabled = settings.parallel_geometry_build
+        row.prop(settings, "parallel_geometry_build_num_workers")
+        layout.prop(settings, "incremental_export")
+
+
 class _SollumzExportYtypPanel(SollumzExportSettingsPanel):
     bl_label = "Archetype Definitions"
 
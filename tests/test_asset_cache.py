@@ -0,0 +1,116 @@
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+from szio import VPath
+from szio.gta5 import try_load_asset
+
+from ..iecontext import ImportSettings
+from ..shared.asset_cache import try_load_asset_cached, evict_cache_entries
+from ..ydr.model_data import get_model_data
+from .shared import asset_path
+
+
+def _settings(cache_directory: Path) -> ImportSettings:
+    return ImportSettings(
+        import_as_asset=False,
+        split_by_group=False,
+        mlo_instance_entities=False,
+        map_instance_entities=False,
+        geometry_cache_directory=cache_directory,
+    )
+
+
+class _CountingLoader:
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.num_calls = 0
+
+    def __call__(self):
+        self.num_calls += 1
+        return try_load_asset(VPath(self.filepath), return_target=True)
+
+
+def _cache_entries(cache_directory: Path) -> list[Path]:
+    return [d for d in cache_directory.iterdir() if d.is_dir()]
+
+
+def _is_memory_mapped(arr: np.ndarray) -> bool:
+    while arr is not None:
+        if isinstance(arr, np.memmap):
+            return True
+        arr = getattr(arr, "base", None)
+    return False
+
+
+def _assert_model_datas_equal(a, b):
+    assert len(a) == len(b)
+    for model_a, model_b in zip(a, b):
+        assert model_a.bone_index == model_b.bone_index
+        assert model_a.mesh_data_lods.keys() == model_b.mesh_data_lods.keys()
+        for lod_level, mesh_a in model_a.mesh_data_lods.items():
+            mesh_b = model_b.mesh_data_lods[lod_level]
+            assert np.array_equal(mesh_a.vert_arr, mesh_b.vert_arr)
+            assert np.array_equal(mesh_a.ind_arr, mesh_b.ind_arr)
+            assert np.array_equal(mesh_a.mat_inds, mesh_b.mat_inds)
+
+
+def test_asset_cache_hit_does_not_load_file(tmp_path: Path):
+    filepath = asset_path("sollumz_cube.ydr.xml")
+    settings = _settings(tmp_path / "cache")
+    loader = _CountingLoader(filepath)
+
+    miss_asset, miss_target = try_load_asset_cached(filepath, settings, loader)
+    assert loader.num_calls == 1
+
+    hit_asset, hit_target = try_load_asset_cached(filepath, settings, loader)
+    assert loader.num_calls == 1
+
+    assert len(_cache_entries(tmp_path / "cache")) == 1
+    assert hit_target == miss_target
+    assert hit_asset.name == miss_asset.name
+    assert hit_asset.shader_group == miss_asset.shader_group
+    _assert_model_datas_equal(get_model_data(miss_asset, None), get_model_data(hit_asset, None))
+
+    # Buffers are memory-mapped from the cache
+    vertex_buffer = next(iter(hit_asset.models.values()))[0].geometries[0].vertex_buffer
+    assert _is_memory_mapped(vertex_buffer)
+
+
+def test_asset_cache_invalidated_on_file_change(tmp_path: Path):
+    filepath = tmp_path / "sollumz_cube.ydr.xml"
+    shutil.copyfile(asset_path("sollumz_cube.ydr.xml"), filepath)
+    settings = _settings(tmp_path / "cache")
+    loader = _CountingLoader(filepath)
+
+    try_load_asset_cached(filepath, settings, loader)
+
+    stat = filepath.stat()
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    try_load_asset_cached(filepath, settings, loader)
+
+    assert loader.num_calls == 2
+    assert len(_cache_entries(tmp_path / "cache")) == 2
+
+
+def test_asset_cache_disabled(tmp_path: Path):
+    filepath = asset_path("sollumz_cube.ydr.xml")
+    settings = _settings(None)
+    loader = _CountingLoader(filepath)
+
+    try_load_asset_cached(filepath, settings, loader)
+    try_load_asset_cached(filepath, settings, loader)
+
+    assert loader.num_calls == 2
+
+
+def test_asset_cache_eviction(tmp_path: Path):
+    filepath = asset_path("sollumz_cube.ydr.xml")
+    cache_directory = tmp_path / "cache"
+
+    try_load_asset_cached(filepath, _settings(cache_directory), _CountingLoader(filepath))
+
+    assert len(_cache_entries(cache_directory)) == 1
+    evict_cache_entries(cache_directory, max_size=0)
+    assert len(_cache_entries(cache_directory)) == 0
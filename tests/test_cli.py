@@ -28,3 +28,105 @@ def test_cli_perf_ie(tmp_path: Path):
     assert rows[0][0] == "file"
     assert rows[1][0] == "sollumz_cube.ydr.xml"
     assert rows[2][0] == "sollumz_cube.yft.xml"
+
+
+def test_cli_perf_ie_json_and_baseline(tmp_path: Path):
+    import json
+    from ..cli.command_perf_ie import main, IMPORT_STAGES, EXPORT_STAGES
+
+    output_json = tmp_path / "times.json"
+    args = ["-r", "2", "-w", "0", "--json", str(output_json), str(asset_path("sollumz_cube.ydr.xml"))]
+    assert main(args) == 0
+
+    data = json.loads(output_json.read_text())
+    assert "sollumz_version" in data["environment"]
+    assert "blender_version" in data["environment"]
+    file_stats = data["files"]["sollumz_cube.ydr.xml"]
+    assert set(file_stats["import"]["stages"]) == set(IMPORT_STAGES)
+    assert set(file_stats["export"]["stages"]) == set(EXPORT_STAGES)
+    assert file_stats["import"]["stages"]["mesh_building"]["avg"] > 0.0
+    assert file_stats["export"]["stages"]["save"]["avg"] > 0.0
+    assert file_stats["peak_memory"]["import"] > 0
+
+    # Baseline where everything was instant, any stage is a regression
+    for phase in ("import", "export"):
+        file_stats[phase]["total"]["avg"] = 0.0
+        for s in file_stats[phase]["stages"].values():
+            s["avg"] = 0.0
+    baseline_json = tmp_path / "baseline.json"
+    baseline_json.write_text(json.dumps(data))
+    assert main(["-r", "2", "-w", "0", "--no-memory", "--baseline", str(baseline_json), str(asset_path("sollumz_cube.ydr.xml"))]) == 1
+
+    # Huge threshold, nothing is a regression
+    assert main([
+        "-r", "2", "-w", "0", "--no-memory", "--baseline", str(baseline_json), "--threshold", "1e12", "--min-delta", "1e6",
+        str(asset_path("sollumz_cube.ydr.xml")),
+    ]) == 0
+
+
+def test_cli_perf_ie_file_keys_of_same_named_files(tmp_path: Path):
+    from ..cli.command_perf_ie import _file_keys
+
+    files = [tmp_path / "gen8" / "a.ydr", tmp_path / "gen9" / "a.ydr", tmp_path / "b.ydr"]
+
+    assert _file_keys(files) == {
+        files[0]: "gen8/a.ydr",
+        files[1]: "gen9/a.ydr",
+        files[2]: "b.ydr",
+    }
+    assert _file_keys(files[:1]) == {files[0]: "a.ydr"}
+
+
+def test_cli_convert_collect_files(tmp_path: Path):
+    from ..cli.command_convert import collect_files
+
+    for name in (
+        "a.ydr", "a+hidr.ytd", "b.yft.xml", "b_hi.yft.xml", "c_hi.yft", "d.ytd", "d+hi.ytd", "e+hi.ytd",
+        "sub/f.ybn", "sub/g.txt", "sub/h.ymap.xml",
+    ):
+        f = tmp_path / name
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_bytes(b"")
+
+    files = [f.as_posix() for f in collect_files(tmp_path)]
+
+    # Dependencies loaded along with their main file are skipped, unless the main file is missing
+    assert files == ["a.ydr", "b.yft.xml", "c_hi.yft", "d.ytd", "e+hi.ytd", "sub/f.ybn", "sub/h.ymap.xml"]
+
+
+def test_cli_convert_shard_files():
+    from ..cli.command_convert import shard_files
+
+    files = [Path(f"{i}.ydr") for i in range(7)]
+    sizes = {f: int(f.stem) * 10 for f in files}
+    shards = shard_files(files, sizes, 3)
+
+    assert len(shards) == 3
+    assert sorted(f for s in shards for f in s) == sorted(files)
+    shard_sizes = [sum(sizes[f] for f in s) for s in shards]
+    assert max(shard_sizes) - min(shard_sizes) <= 10
+
+
+def test_cli_convert_resumes_from_journal(tmp_path: Path):
+    from ..cli.command_convert import main, read_journal, JOURNAL_DIR_NAME
+
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("sollumz_cube.ydr.xml", "sollumz_cube.yft.xml"):
+        (input_dir / name).write_bytes(asset_path(name).read_bytes())
+
+    output_dir = tmp_path / "output"
+    args = ["-i", str(input_dir), "-o", str(output_dir), "-f", "CWXML", "-v", "GEN9", "-j", "0"]
+    assert main(args) == 0
+    assert (output_dir / "sollumz_cube.ydr.xml").is_file()
+    assert (output_dir / "sollumz_cube.yft.xml").is_file()
+
+    journal_dir = output_dir / JOURNAL_DIR_NAME
+    records = read_journal(journal_dir)
+    assert set(records) == {"sollumz_cube.ydr.xml", "sollumz_cube.yft.xml"}
+    assert all(r["ok"] for r in records.values())
+
+    # Second run has nothing left to do, so it doesn't write a new journal
+    num_journals = len(list(journal_dir.glob("*.jsonl")))
+    assert main(args) == 0
+    assert len(list(journal_dir.glob("*.jsonl"))) == num_journals
@@ -0,0 +1,53 @@
+import bpy
+from szio.gta5 import CollisionMaterial, CollisionMaterialFlags
+
+from ..ybn.collision_materials import (
+    CollisionMaterialRegistry,
+    create_collision_material_from_data,
+    get_collision_material_data,
+    merge_duplicate_collision_materials,
+)
+
+
+def _collision_material(material_index: int, room_id: int = 0) -> CollisionMaterial:
+    return CollisionMaterial(
+        material_index=material_index,
+        material_color_index=0,
+        procedural_id=0,
+        room_id=room_id,
+        ped_density=0,
+        material_flags=CollisionMaterialFlags(0),
+    )
+
+
+def test_collision_material_registry_reuses_materials():
+    bpy.ops.wm.read_homefile()
+    existing_mat = create_collision_material_from_data(_collision_material(1))
+
+    registry = CollisionMaterialRegistry()
+    concrete = registry.get(_collision_material(1))
+    tarmac = registry.get(_collision_material(4))
+    tarmac_room = registry.get(_collision_material(4, room_id=2))
+
+    assert concrete == existing_mat
+    assert registry.get(_collision_material(4)) == tarmac
+    assert tarmac_room != tarmac
+    assert get_collision_material_data(tarmac_room) == _collision_material(4, room_id=2)
+    assert registry.hits == 2
+    assert registry.misses == 2
+
+
+def test_merge_duplicate_collision_materials():
+    bpy.ops.wm.read_homefile()
+    mats = [create_collision_material_from_data(_collision_material(1)) for _ in range(3)]
+    other_mat = create_collision_material_from_data(_collision_material(4))
+    mesh = bpy.data.meshes.new("mesh")
+    for mat in (*mats, other_mat):
+        mesh.materials.append(mat)
+    kept_name = mats[0].name
+
+    num_removed = merge_duplicate_collision_materials()
+
+    assert num_removed == 2
+    assert [m.name for m in mesh.materials] == [kept_name, kept_name, kept_name, other_mat.name]
+    bpy.data.meshes.remove(mesh)
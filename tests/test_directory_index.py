@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from ..iecontext import DirectoryIndex
+
+
+def test_directory_index_find_is_case_insensitive(tmp_path: Path):
+    for name in ("prop+hi.YTD", "prop+hi.ytd.xml", "prop_hi.yft.xml", "prop.ydr", "readme"):
+        (tmp_path / name).touch()
+    (tmp_path / "sub.yft").mkdir()
+
+    index = DirectoryIndex(tmp_path)
+
+    assert index.find("Prop+Hi", (".ytd.xml", ".ytd")) == [tmp_path / "prop+hi.ytd.xml", tmp_path / "prop+hi.YTD"]
+    assert index.find("prop_hi", (".yft", ".yft.xml")) == [tmp_path / "prop_hi.yft.xml"]
+    assert index.find("prop", (".yft",)) == []
+    assert index.find("missing", (".ydr",)) == []
+    assert index.find_any((".yft", ".yft.xml")) == tmp_path / "prop_hi.yft.xml"
+
+
+def test_directory_index_lists_directory_once(tmp_path: Path):
+    index = DirectoryIndex(tmp_path)
+    assert index.find("prop", (".ydr",)) == []
+
+    (tmp_path / "prop.ydr").touch()
+    assert index.find("prop", (".ydr",)) == []
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+from szio import VPath
+from szio.gta5 import AssetFormat, AssetTarget, AssetVersion, try_load_asset
+
+from ..iecontext import ExportBundle
+from .shared import asset_path
+
+
+@pytest.mark.parametrize("targets, expected_files", (
+    ((AssetTarget(AssetFormat.CWXML, AssetVersion.GEN8),), ("cube.ydr.xml", "cube_hi.ydr.xml")),
+    (
+        (AssetTarget(AssetFormat.CWXML, AssetVersion.GEN8), AssetTarget(AssetFormat.CWXML, AssetVersion.GEN9)),
+        ("gen8/cube.ydr.xml", "gen9/cube.ydr.xml", "gen8/cube_hi.ydr.xml", "gen9/cube_hi.ydr.xml"),
+    ),
+))
+def test_export_bundle_save_returns_written_files(tmp_path: Path, targets, expected_files):
+    drawable = try_load_asset(VPath(asset_path("sollumz_cube.ydr.xml")))
+    bundle = ExportBundle("cube", drawable, (("_hi", drawable),), (), ())
+
+    # Files with the same name from previous exports are not reported
+    (tmp_path / "cube.ydr").write_bytes(b"")
+    (tmp_path / "cube.old.xml").write_bytes(b"")
+
+    output_files = bundle.save(tmp_path, targets)
+
+    assert output_files == [tmp_path / f for f in expected_files]
+    assert all(f.is_file() for f in output_files)
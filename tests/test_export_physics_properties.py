@@ -28,6 +28,119 @@ def elem_to_vec_list(e: ET.Element):
     return np.fromstring(e.text.replace(", ", " ").replace("\n", " "), dtype=np.float32, sep=" ").reshape((-1, 3))
 
 
+def test_fragment_bone_objects_index_resolves_each_object_once(monkeypatch):
+    from ..tools.blenderhelper import create_blender_object, create_empty_object
+    from ..tools.boundhelper import create_bound_box
+    from ..ybn.collision_materials import create_collision_material_from_index
+    from ..yft import yftexport
+
+    bpy.ops.wm.read_homefile()
+
+    # Vehicles have 100+ bones, previously each bone scanned the whole hierarchy
+    num_bones = 150
+    armature = bpy.data.armatures.new("frag.skel")
+    frag_obj = create_blender_object(SollumType.FRAGMENT, "frag", armature)
+    bpy.context.view_layer.objects.active = frag_obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    for i in range(num_bones):
+        bone = armature.edit_bones.new(f"bone{i}")
+        bone.head = (i, 0.0, 0.0)
+        bone.tail = (i, 0.0, 0.1)
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    drawable_obj = create_empty_object(SollumType.DRAWABLE)
+    drawable_obj.parent = frag_obj
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE)
+    composite_obj.parent = frag_obj
+    material = create_collision_material_from_index(0)
+    col_objs = []
+    for bone in armature.bones:
+        bone.sollumz_use_physics = True
+        col_obj = create_bound_box()
+        col_obj.data.materials.append(material)
+        col_obj.parent = composite_obj
+        constraint = col_obj.constraints.new("COPY_TRANSFORMS")
+        constraint.target = frag_obj
+        constraint.subtarget = bone.name
+        col_objs.append(col_obj)
+
+    num_calls = 0
+    get_child_of_bone = yftexport.get_child_of_bone
+
+    def _counting_get_child_of_bone(obj):
+        nonlocal num_calls
+        num_calls += 1
+        return get_child_of_bone(obj)
+
+    monkeypatch.setattr(yftexport, "get_child_of_bone", _counting_get_child_of_bone)
+
+    frag_objs = yftexport.locate_fragment_objects(frag_obj)
+    groups, _ = yftexport.create_frag_phys_groups(frag_objs, [])
+    child_cols = yftexport.find_frag_phys_children_collisions(frag_objs)
+    child_meshes = yftexport.find_frag_phys_children_meshes(frag_objs)
+
+    assert num_calls == len(col_objs)
+    assert [g.name for g in groups] == [b.name for b in armature.bones]
+    assert child_cols == {bone.name: [col_obj] for bone, col_obj in zip(armature.bones, col_objs)}
+    assert child_meshes == {}
+    assert not yftexport.does_bone_have_cloth("bone0", frag_objs)
+    assert not yftexport.does_bone_have_collision("unknown_bone", frag_objs)
+
+
+def test_fragment_phys_children_keep_hierarchy_order():
+    from ..tools.blenderhelper import create_blender_object, create_empty_object
+    from ..tools.boundhelper import create_bound_box
+    from ..ybn.collision_materials import create_collision_material_from_index
+    from ..yft import yftexport
+
+    bpy.ops.wm.read_homefile()
+
+    armature = bpy.data.armatures.new("frag.skel")
+    frag_obj = create_blender_object(SollumType.FRAGMENT, "frag", armature)
+    bpy.context.view_layer.objects.active = frag_obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    for i, bone_name in enumerate(("bone_a", "bone_b")):
+        bone = armature.edit_bones.new(bone_name)
+        bone.head = (i, 0.0, 0.0)
+        bone.tail = (i, 0.0, 0.1)
+    bpy.ops.object.mode_set(mode="OBJECT")
+    for bone in armature.bones:
+        bone.sollumz_use_physics = True
+
+    def _attach_to_bone(obj, bone_name: str):
+        constraint = obj.constraints.new("COPY_TRANSFORMS")
+        constraint.target = frag_obj
+        constraint.subtarget = bone_name
+
+    drawable_obj = create_empty_object(SollumType.DRAWABLE, "frag.drawable")
+    drawable_obj.parent = frag_obj
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE, "frag.col")
+    composite_obj.parent = frag_obj
+
+    # The model comes first in the hierarchy, but its bone comes after in the collisions order
+    model_obj = create_blender_object(SollumType.DRAWABLE_MODEL, "a_model")
+    model_obj.sollumz_is_physics_child_mesh = True
+    model_obj.parent = drawable_obj
+    _attach_to_bone(model_obj, "bone_a")
+
+    material = create_collision_material_from_index(0)
+    col_objs = []
+    for name, bone_name in (("b_col0", "bone_b"), ("b_col1", "bone_a")):
+        col_obj = create_bound_box()
+        col_obj.name = name
+        col_obj.data.materials.append(material)
+        col_obj.parent = composite_obj
+        _attach_to_bone(col_obj, bone_name)
+        col_objs.append(col_obj)
+
+    frag_objs = yftexport.locate_fragment_objects(frag_obj)
+    child_cols = yftexport.find_frag_phys_children_collisions(frag_objs)
+    child_meshes = yftexport.find_frag_phys_children_meshes(frag_objs)
+
+    assert list(child_cols.items()) == [("bone_b", [col_objs[0]]), ("bone_a", [col_objs[1]])]
+    assert list(child_meshes.items()) == [("bone_a", [model_obj])]
+
+
 class YftFileTestCase(NamedTuple):
     input_path: Path
     input_root: ET.Element
@@ -1,6 +1,16 @@
 import pytest
 import numpy as np
-from ..shared.geometry import shrink_mesh
+from mathutils import Vector
+from ..shared.geometry import (
+    shrink_mesh,
+    MassShape,
+    MeshMassPropertiesCache,
+    calculate_composite_inertia,
+    get_composite_mass_properties,
+    get_mass_properties_of_mesh,
+    get_mass_properties_of_primitives,
+    transform_inertia,
+)
 from .shared import SOLLUMZ_TEST_ASSETS_DIR
 
 def read_shrink_mesh_test_data(file_path):
@@ -41,3 +51,88 @@ def test_geometry_shrink_mesh(test_data_file_name):
                   f"   diff={output_vertex - expected_vertex}\n")
 
     assert n == 0, f"{n} / {len(output_vertices)}{s}"
+
+
+def test_geometry_mass_properties_of_primitives():
+    shapes = np.array([
+        MassShape.BOX.value,
+        MassShape.SPHERE.value,
+        MassShape.CYLINDER.value,
+        MassShape.DISC.value,
+        MassShape.CAPSULE.value,
+    ])
+    dimensions = np.array([
+        (1.0, 2.0, 3.0),
+        (0.5, 0.0, 0.0),
+        (0.5, 2.0, 0.0),
+        (0.5, 2.0, 0.0),
+        (0.5, 0.0, 0.0),
+    ])
+
+    volumes, inertias = get_mass_properties_of_primitives(shapes, dimensions)
+
+    sphere_inertia = 2 * 0.25 / 5
+    cylinder_inertia = (4 / 12 + 0.25 / 4, 0.25 / 2, 4 / 12 + 0.25 / 4)
+    assert np.allclose(volumes, [
+        6.0,
+        (4 / 3) * np.pi * 0.125,
+        np.pi * 0.25 * 2.0,
+        np.pi * 0.25 * 2.0,
+        (4 / 3) * np.pi * 0.125,
+    ])
+    assert np.allclose(inertias, [
+        ((4 + 9) / 12, (9 + 1) / 12, (1 + 4) / 12),
+        (sphere_inertia,) * 3,
+        cylinder_inertia,
+        cylinder_inertia,
+        (sphere_inertia,) * 3,  # capsule without length is a sphere
+    ])
+
+
+def test_geometry_composite_mass_properties():
+    volumes = np.array([1.0, 2.0, 3.0])
+    cgs = np.array([(1.0, 0.0, 0.0), (0.0, 2.0, 0.0), (0.0, 0.0, -3.0)])
+    inertias = np.array([(1.0, 2.0, 3.0), (0.5, 0.5, 0.5), (2.0, 1.0, 0.25)])
+
+    volume, cg, inertia = get_composite_mass_properties(volumes, cgs, inertias)
+
+    expected_cg = Vector((1.0, 4.0, -9.0)) / 6.0
+    expected_inertia = Vector((0.0, 0.0, 0.0))
+    for part_volume, part_cg, part_inertia in zip(volumes, cgs, inertias):
+        expected_inertia += transform_inertia(
+            Vector(part_inertia) * part_volume, part_volume, Vector(part_cg) - expected_cg
+        )
+    expected_inertia /= 6.0
+
+    assert volume == pytest.approx(6.0)
+    assert np.allclose(cg, expected_cg)
+    assert np.allclose(inertia, expected_inertia)
+    assert calculate_composite_inertia(Vector(), [], [], []) == Vector((0.0, 0.0, 0.0))
+
+
+def test_geometry_mesh_mass_properties_cache():
+    # Unit cube
+    vertices = np.array([
+        (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+        (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+    ], dtype=np.float64)
+    faces = np.array([
+        (0, 2, 1), (0, 3, 2), (4, 5, 6), (4, 6, 7),
+        (0, 1, 5), (0, 5, 4), (1, 2, 6), (1, 6, 5),
+        (2, 3, 7), (2, 7, 6), (3, 0, 4), (3, 4, 7),
+    ])
+    cache = MeshMassPropertiesCache(max_size=1)
+
+    expected = get_mass_properties_of_mesh(vertices, faces)
+    first = cache.get(vertices, faces)
+    first.center_of_gravity.x = 100.0  # modifying the result doesn't affect the cache
+    second = cache.get(vertices.copy(), faces.copy())
+    cache.get(vertices * 2.0, faces)
+    cache.get(vertices, faces)
+
+    assert first.volume == pytest.approx(1.0)
+    assert second.volume == expected.volume
+    assert second.center_of_gravity == expected.center_of_gravity
+    assert second.inertia == expected.inertia
+    assert cache.hits == 1
+    assert cache.misses == 3
@@ -0,0 +1,48 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from ..ydr.ydrexport import split_vert_buffers, MAX_VERTS_PER_GEOMETRY
+
+
+def _grid(size: int) -> tuple[np.ndarray, np.ndarray]:
+    ys, xs = np.mgrid[0:size - 1, 0:size - 1]
+    a = (ys * size + xs).ravel()
+    b = a + 1
+    c = a + size
+    d = c + 1
+    ind_buffer = np.stack((np.stack((a, b, c), axis=1), np.stack((b, d, c), axis=1)), axis=1).ravel().astype(np.uint32)
+
+    vert_buffer = np.zeros(size * size, dtype=[("Position", np.float32, 3)])
+    vert_buffer["Position"][:, 1], vert_buffer["Position"][:, 0] = np.divmod(np.arange(size * size), size)
+    return vert_buffer, ind_buffer
+
+
+def test_split_vert_buffers_small_geometry_is_not_split():
+    vert_buffer, ind_buffer = _grid(100)
+
+    vert_buffers, ind_buffers = split_vert_buffers(vert_buffer, ind_buffer)
+
+    assert len(vert_buffers) == 1
+    assert vert_buffers[0] is vert_buffer
+    assert ind_buffers[0] is ind_buffer
+
+
+def test_split_vert_buffers_large_geometry():
+    vert_buffer, ind_buffer = _grid(300)
+    # Shuffle the triangles, splitting should not depend on their order
+    tris = ind_buffer.reshape((-1, 3))
+    ind_buffer = tris[np.random.default_rng(0).permutation(len(tris))].ravel()
+
+    vert_buffers, ind_buffers = split_vert_buffers(vert_buffer, ind_buffer)
+
+    assert len(vert_buffers) == 2
+    assert all(len(v) <= MAX_VERTS_PER_GEOMETRY for v in vert_buffers)
+    # Only the vertices along the boundary between both chunks are duplicated
+    assert sum(len(v) for v in vert_buffers) - len(vert_buffer) < 1000
+
+    split_tris = np.concatenate([v["Position"][i] for v, i in zip(vert_buffers, ind_buffers)]).reshape((-1, 3, 3))
+    orig_tris = vert_buffer["Position"][ind_buffer].reshape((-1, 3, 3))
+    assert_array_equal(
+        np.unique(split_tris.reshape((-1, 9)), axis=0),
+        np.unique(orig_tris.reshape((-1, 9)), axis=0),
+    )
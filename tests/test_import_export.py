@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
@@ -270,12 +271,18 @@ DEFAULT_EXPORT_SETTINGS = {
     "ymap_car_generators": False,
     "apply_transforms": False,
     "mesh_domain": "FACE_CORNER",
+    "optimize_vertex_order": False,
     "export_ytyps": False,
     "export_ytyps_include": "ALL",
     "export_ymaps": False,
     "export_ymaps_include": "ALL",
     "export_ytds": False,
     "export_ytds_include": "ALL",
+    "concurrent_save": False,
+    "concurrent_save_num_workers": 2,
+    "parallel_geometry_build": False,
+    "parallel_geometry_build_num_workers": 4,
+    "incremental_export": False,
 }
 
 
@@ -294,9 +301,39 @@ DEFAULT_IMPORT_SETTINGS = {
     "ytyp_mlo_instance_entities": True,
     "textures_mode": "PACK",
     "textures_extract_custom_directory": "",
+    "pipelined_import": False,
+    "pipelined_import_num_workers": 4,
+    "geometry_cache": False,
+    "geometry_cache_max_size": 1024,
+    "validate_meshes": False,
+    "defer_lod_meshes": False,
+    "compact_bound_primitives": False,
 }
 
 
+@pytest.mark.parametrize("pipelined", (False, True))
+@assert_logs_no_warnings_or_errors
+def test_import_multiple_files_pipelined(pipelined: bool):
+    bpy.ops.wm.read_homefile()
+
+    files = ("sollumz_cube.ydr.xml", "sollumz_cube.yft.xml")
+    res = bpy.ops.sollumz.import_assets(
+        directory=str(asset_path().absolute()),
+        files=[{"name": f} for f in files],
+        use_custom_settings=True,
+        **DEFAULT_IMPORT_SETTINGS | {
+            "pipelined_import": pipelined,
+            "pipelined_import_num_workers": 2,
+        },
+    )
+    assert res == {"FINISHED"}
+
+    drawable_objs = [o for o in bpy.data.objects if o.sollum_type == SollumType.DRAWABLE]
+    fragment_objs = [o for o in bpy.data.objects if o.sollum_type == SollumType.FRAGMENT]
+    assert len(drawable_objs) == 1
+    assert len(fragment_objs) == 1
+
+
 @assert_logs_no_warnings_or_errors
 def test_export_model_with_packed_textures(tmp_path: Path):
     data = load_blend_data("model_with_packed_textures.blend")
@@ -318,6 +355,139 @@ def test_export_model_with_packed_textures(tmp_path: Path):
         assert expected_file.read_bytes() == expected_contents
 
 
+@assert_logs_no_warnings_or_errors
+def test_export_concurrent_save_matches_sequential(tmp_path: Path):
+    load_blend_data("model_with_packed_textures.blend")
+
+    for concurrent_save, out_dir in ((False, tmp_path / "sequential"), (True, tmp_path / "concurrent")):
+        out_dir.mkdir()
+        res = bpy.ops.sollumz.export_assets(
+            directory=str(out_dir.absolute()),
+            direct_export=True,
+            use_custom_settings=True,
+            **DEFAULT_EXPORT_SETTINGS | {
+                "target_formats": {"CWXML"},
+                "concurrent_save": concurrent_save,
+            },
+        )
+        assert res == {"FINISHED"}
+
+    sequential_files = sorted(p.relative_to(tmp_path / "sequential") for p in (tmp_path / "sequential").rglob("*"))
+    concurrent_files = sorted(p.relative_to(tmp_path / "concurrent") for p in (tmp_path / "concurrent").rglob("*"))
+    assert sequential_files
+    assert sequential_files == concurrent_files
+    for f in sequential_files:
+        if (tmp_path / "sequential" / f).is_file():
+            assert (tmp_path / "sequential" / f).read_bytes() == (tmp_path / "concurrent" / f).read_bytes()
+
+
+@assert_logs_no_warnings_or_errors
+def test_export_incremental_skips_unchanged_objects(tmp_path: Path):
+    from ..shared.export_manifest import MANIFEST_FILE_NAME
+
+    load_blend_data("model_with_packed_textures.blend")
+    obj = bpy.context.selected_objects[0]
+
+    def _export() -> dict[Path, int]:
+        res = bpy.ops.sollumz.export_assets(
+            directory=str(tmp_path.absolute()),
+            direct_export=True,
+            use_custom_settings=True,
+            **DEFAULT_EXPORT_SETTINGS | {
+                "target_formats": {"CWXML"},
+                "incremental_export": True,
+            },
+        )
+        assert res == {"FINISHED"}
+        return {f: f.stat().st_mtime_ns for f in tmp_path.rglob("*.ydr.xml")}
+
+    first = _export()
+    assert first
+    assert (tmp_path / MANIFEST_FILE_NAME).is_file()
+
+    second = _export()
+    assert second == first
+
+    def _fingerprints() -> list[str]:
+        entries = json.loads((tmp_path / MANIFEST_FILE_NAME).read_text())["entries"]
+        return [e["fingerprint"] for e in entries.values()]
+
+    fingerprints_before = _fingerprints()
+    obj.location.x += 1.0
+    bpy.context.view_layer.update()
+    _export()
+    assert _fingerprints() != fingerprints_before
+
+
+@pytest.mark.parametrize("parallel_geometry_build", (False, True))
+def test_export_reuses_geometries_of_shared_meshes(tmp_path: Path, parallel_geometry_build: bool):
+    load_blend_data("model_with_packed_textures.blend")
+    drawable_obj = bpy.context.selected_objects[0]
+    model_obj = next(c for c in drawable_obj.children if c.sollum_type == SollumType.DRAWABLE_MODEL)
+
+    # Linked duplicate, shares the mesh
+    model_obj_copy = model_obj.copy()
+    for collection in model_obj.users_collection:
+        collection.objects.link(model_obj_copy)
+    assert model_obj_copy.data == model_obj.data
+
+    with log_capture() as logs:
+        res = bpy.ops.sollumz.export_assets(
+            directory=str(tmp_path.absolute()),
+            direct_export=True,
+            use_custom_settings=True,
+            **DEFAULT_EXPORT_SETTINGS | {
+                "target_formats": {"CWXML"},
+                "target_versions": {"GEN8"},
+                "parallel_geometry_build": parallel_geometry_build,
+            },
+        )
+    assert res == {"FINISHED"}
+    logs.assert_no_warnings_or_errors()
+    assert any(msg.startswith("Reused geometries of 1 drawable model(s)") for msg in logs.infos)
+
+    tree = ET.parse(next(tmp_path.glob("*.ydr.xml")))
+    models = tree.findall("DrawableModelsHigh/Item")
+    assert len(models) == 2
+    vertex_data = [m.find("Geometries/Item/VertexBuffer/Data").text for m in models]
+    assert vertex_data[0] == vertex_data[1]
+
+
+@assert_logs_no_warnings_or_errors
+def test_export_parallel_geometry_build_matches_sequential(tmp_path: Path):
+    load_blend_data("model_with_packed_textures.blend")
+    drawable_obj = bpy.context.selected_objects[0]
+    model_obj = next(c for c in drawable_obj.children if c.sollum_type == SollumType.DRAWABLE_MODEL)
+
+    # Add models with their own mesh, so there are multiple geometries to build
+    for _ in range(3):
+        model_obj_copy = model_obj.copy()
+        model_obj_copy.data = model_obj.data.copy()
+        for collection in model_obj.users_collection:
+            collection.objects.link(model_obj_copy)
+
+    for parallel, out_dir in ((False, tmp_path / "sequential"), (True, tmp_path / "parallel")):
+        out_dir.mkdir()
+        res = bpy.ops.sollumz.export_assets(
+            directory=str(out_dir.absolute()),
+            direct_export=True,
+            use_custom_settings=True,
+            **DEFAULT_EXPORT_SETTINGS | {
+                "target_formats": {"CWXML"},
+                "target_versions": {"GEN8"},
+                "parallel_geometry_build": parallel,
+            },
+        )
+        assert res == {"FINISHED"}
+
+    sequential_files = sorted(p.relative_to(tmp_path / "sequential") for p in (tmp_path / "sequential").rglob("*.xml"))
+    parallel_files = sorted(p.relative_to(tmp_path / "parallel") for p in (tmp_path / "parallel").rglob("*.xml"))
+    assert sequential_files
+    assert sequential_files == parallel_files
+    for f in sequential_files:
+        assert (tmp_path / "sequential" / f).read_bytes() == (tmp_path / "parallel" / f).read_bytes()
+
+
 @assert_logs_no_warnings_or_errors
 def test_export_model_with_external_textures(tmp_path: Path):
     data = load_blend_data("model_with_external_textures.blend")
@@ -405,6 +575,41 @@ def test_import_model_with_embedded_textures(tmp_path: Path, version_dir: str, t
             assert not img.packed_file
 
 
+@requires_szio_native
+@assert_logs_no_warnings_or_errors
+def test_import_model_with_embedded_textures_keeps_existing_files(tmp_path: Path):
+    bpy.ops.wm.read_homefile()
+
+    ydr_filename = "model_with_embedded_textures.ydr"
+    ydr_path = asset_path("gen8", ydr_filename)
+    (tmp_path / ydr_filename).write_bytes(ydr_path.read_bytes())
+
+    textures_dir = tmp_path / "model_with_embedded_textures"
+    textures_dir.mkdir()
+    # Different case than the embedded texture, should still be considered the same file
+    existing_texture = textures_dir / "TEST_IMAGE.dds"
+    existing_texture_contents = asset_path("cwxml", "model_with_embedded_textures", "test_image.dds").read_bytes()
+    existing_texture.write_bytes(existing_texture_contents)
+
+    res = bpy.ops.sollumz.import_assets(
+        directory=str(tmp_path.absolute()),
+        files=[{"name": ydr_path.name}],
+        use_custom_settings=True,
+        **DEFAULT_IMPORT_SETTINGS | {"textures_mode": "IMPORT_DIR"},
+    )
+    assert res == {"FINISHED"}
+
+    assert [f.name for f in textures_dir.iterdir()] == ["TEST_IMAGE.dds"]
+    assert existing_texture.read_bytes() == existing_texture_contents
+
+    # The existing file is used by the material instead of a placeholder image
+    assert "test_image" not in bpy.data.images
+    img = bpy.data.images["TEST_IMAGE.dds"]
+    assert Path(bpy.path.abspath(img.filepath)).samefile(existing_texture)
+    assert img.size[:] == (64, 64)
+    assert len(img.pixels) == 64 * 64 * 4
+
+
 @pytest.mark.parametrize("textures_mode", ("PACK", "IMPORT_DIR", "CUSTOM_DIR", "CUSTOM_DIR_NOT_SET"))
 @assert_logs_no_warnings_or_errors
 def test_import_model_with_embedded_textures_cwxml(tmp_path: Path, textures_mode: str):
@@ -895,3 +1100,92 @@ def test_import_drawable_with_simple_bounds(version_dir: str, tmp_path: Path):
     assert (export_dir / "gen8" / "model_with_simple_bounds.ydr.xml").is_file()
     assert (export_dir / "gen9" / "model_with_simple_bounds.ydr").is_file()
     assert (export_dir / "gen9" / "model_with_simple_bounds.ydr.xml").is_file()
+
+
+@assert_logs_no_warnings_or_errors
+def test_import_drawable_with_deferred_lod_meshes(tmp_path: Path):
+    from ..sollumz_properties import LODLevel
+
+    bpy.ops.wm.read_homefile()
+
+    ydr_path = asset_path("cwxml", "model_with_simple_bounds.ydr.xml")
+    res = bpy.ops.sollumz.import_assets(
+        directory=str(ydr_path.parent),
+        files=[{"name": ydr_path.name}],
+        use_custom_settings=True,
+        **DEFAULT_IMPORT_SETTINGS | {"defer_lod_meshes": True},
+    )
+    assert res == {"FINISHED"}
+
+    drw_obj = bpy.data.objects["model_with_simple_bounds"]
+    model_obj = next(c for c in drw_obj.children if c.sollum_type == SollumType.DRAWABLE_MODEL)
+    lods = model_obj.sz_lods
+    high = lods.get_lod(LODLevel.HIGH)
+    medium = lods.get_lod(LODLevel.MEDIUM)
+    assert lods.active_lod_level == LODLevel.HIGH
+    assert high.mesh is not None
+    assert medium.mesh is None
+    assert medium.has_deferred_mesh
+
+    # Untouched deferred LOD is exported from the stored geometry
+    drw_obj.select_set(True)
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    res = bpy.ops.sollumz.export_assets(
+        directory=str(export_dir.absolute()),
+        direct_export=True,
+        use_custom_settings=True,
+        **DEFAULT_EXPORT_SETTINGS | {"target_formats": {"CWXML"}, "target_versions": {"GEN8"}},
+    )
+    assert res == {"FINISHED"}
+    assert medium.has_deferred_mesh
+    exported_xml = ET.parse(export_dir / "model_with_simple_bounds.ydr.xml")
+    assert exported_xml.find("DrawableModelsMedium/Item/Geometries/Item/IndexBuffer") is not None
+
+    lods.active_lod_level = LODLevel.MEDIUM
+    assert not medium.has_deferred_mesh
+    assert medium.mesh is not None
+    assert model_obj.data == medium.mesh
+    assert len(medium.mesh.polygons) > 0
+
+
+@assert_logs_no_warnings_or_errors
+def test_export_deferred_lod_meshes_matches_built_lod_meshes(tmp_path: Path):
+    ydr_path = asset_path("cwxml", "model_with_simple_bounds.ydr.xml")
+
+    def _import_and_export(defer_lod_meshes: bool) -> ET.ElementTree:
+        bpy.ops.wm.read_homefile()
+
+        res = bpy.ops.sollumz.import_assets(
+            directory=str(ydr_path.parent),
+            files=[{"name": ydr_path.name}],
+            use_custom_settings=True,
+            **DEFAULT_IMPORT_SETTINGS | {"defer_lod_meshes": defer_lod_meshes},
+        )
+        assert res == {"FINISHED"}
+
+        bpy.data.objects["model_with_simple_bounds"].select_set(True)
+        export_dir = tmp_path / ("deferred" if defer_lod_meshes else "built")
+        export_dir.mkdir()
+        res = bpy.ops.sollumz.export_assets(
+            directory=str(export_dir.absolute()),
+            direct_export=True,
+            use_custom_settings=True,
+            **DEFAULT_EXPORT_SETTINGS | {"target_formats": {"CWXML"}, "target_versions": {"GEN8"}},
+        )
+        assert res == {"FINISHED"}
+        return ET.parse(export_dir / "model_with_simple_bounds.ydr.xml")
+
+    deferred_xml = _import_and_export(defer_lod_meshes=True)
+    built_xml = _import_and_export(defer_lod_meshes=False)
+
+    for lod_name in ("High", "Medium", "Low", "VeryLow"):
+        deferred_geoms = deferred_xml.findall(f"DrawableModels{lod_name}/Item/Geometries/Item")
+        built_geoms = built_xml.findall(f"DrawableModels{lod_name}/Item/Geometries/Item")
+        assert len(deferred_geoms) == len(built_geoms)
+        for deferred_geom, built_geom in zip(deferred_geoms, built_geoms):
+            for buffer_path in ("VertexBuffer/Layout", "VertexBuffer/Data", "IndexBuffer/Data"):
+                assert ET.tostring(deferred_geom.find(buffer_path)) == ET.tostring(built_geom.find(buffer_path))
+
+    # The model has more than one LOD, so the deferred path was actually exercised
+    assert deferred_xml.findall("DrawableModelsMedium/Item/Geometries/Item")
@@ -2,6 +2,7 @@ from pathlib import Path
 from xml.etree import ElementTree as ET
 
 import bpy
+import pytest
 from numpy.testing import assert_allclose
 
 from ..ymap_next.ymapexport import export_ymap
@@ -1121,3 +1122,46 @@ def test_ymap_export_warns_unassigned_items(tmp_path: Path):
     root = _parse_xml(tmp_path / "test_unassigned_warn.ymap.xml")
     names = [_get_text(e, "archetypeName") for e in root.findall("./entities/Item")]
     assert names == ["test_assigned"]
+
+
+@pytest.mark.parametrize("failure", ("invalid", "raise"))
+@pytest.mark.parametrize("concurrent_save", (False, True))
+def test_ymap_export_failure_partway_writes_no_files(tmp_path: Path, monkeypatch, failure: str, concurrent_save: bool):
+    """A map data failing after others were already built and saved must not leave the saved ones on disk."""
+    from dataclasses import replace
+    from ..ymap_next import ymapexport
+    from .test_import_export import DEFAULT_EXPORT_SETTINGS
+
+    bpy.ops.wm.read_homefile()
+    _import_ymaps("test_hd_lod_pair.ymap.xml", "test_hd_lod_pair_lod.ymap.xml")
+
+    export_ymap_iter = ymapexport.export_ymap_iter
+
+    def _failing_export_ymap_iter(map_group):
+        bundles = export_ymap_iter(map_group)
+        yield next(bundles)
+        if failure == "invalid":
+            yield replace(next(bundles), main_asset=None)
+        else:
+            raise RuntimeError("map data failed")
+
+    monkeypatch.setattr(ymapexport, "export_ymap_iter", _failing_export_ymap_iter)
+
+    with log_capture() as logs:
+        res = bpy.ops.sollumz.export_assets(
+            directory=str(tmp_path),
+            direct_export=True,
+            use_custom_settings=True,
+            **DEFAULT_EXPORT_SETTINGS | {
+                "target_formats": {"CWXML"},
+                "target_versions": {"GEN8"},
+                "export_ymaps": True,
+                "concurrent_save": concurrent_save,
+            },
+        )
+
+    assert res == {"FINISHED"}
+    assert list(tmp_path.iterdir()) == []
+    assert any("No files were written" in msg for msg in logs.infos)
+    if failure == "raise":
+        assert any("map data failed" in msg for msg in logs.errors)
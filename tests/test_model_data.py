@@ -0,0 +1,40 @@
+from typing import NamedTuple
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from ..ydr.model_data import MeshData, get_bone_ancestors_matrix, get_group_face_inds
+
+
+class _Bone(NamedTuple):
+    parent_index: int
+
+
+def test_bone_ancestors_matrix():
+    parent_inds = np.array([-1, 0, 1, 2, 2, 0])
+
+    ancestors = get_bone_ancestors_matrix(parent_inds)
+
+    # The root bone is never an ancestor
+    assert_array_equal(np.flatnonzero(ancestors[0]), [])
+    assert_array_equal(np.flatnonzero(ancestors[1]), [])
+    assert_array_equal(np.flatnonzero(ancestors[2]), [1])
+    assert_array_equal(np.flatnonzero(ancestors[3]), [1, 2])
+    assert_array_equal(np.flatnonzero(ancestors[4]), [1, 2])
+    assert_array_equal(np.flatnonzero(ancestors[5]), [])
+
+
+def test_group_face_inds_merges_overlapping_groups():
+    bones = [_Bone(-1), _Bone(0), _Bone(1), _Bone(2), _Bone(2), _Bone(0)]
+    vert_arr = np.zeros(9, dtype=[("BlendWeights", np.uint8, 4), ("BlendIndices", np.uint8, 4)])
+    vert_arr["BlendWeights"][:, 0] = 255
+    vert_arr["BlendIndices"][:, 0] = [3, 3, 3, 3, 4, 4, 5, 5, 5]
+    ind_arr = np.arange(9, dtype=np.uint32)
+    mesh_data = MeshData(vert_arr, ind_arr, np.zeros(3, dtype=np.uint32))
+
+    group_face_inds = get_group_face_inds(mesh_data, bones)
+
+    # Bones 3 and 4 share a face, so both go to their common parent highest in the hierarchy
+    assert group_face_inds.keys() == {1, 5}
+    assert_array_equal(group_face_inds[1], [0, 1])
+    assert_array_equal(group_face_inds[5], [2])
@@ -0,0 +1,60 @@
+import gc
+import threading
+import weakref
+
+import pytest
+
+from ..shared.pipeline import prefetch_ordered, BoundedExecutor
+
+
+@pytest.mark.parametrize("num_workers", (0, 1, 4))
+def test_prefetch_ordered_preserves_order(num_workers: int):
+    res = list(prefetch_ordered(lambda x: x * 2, range(100), num_workers))
+    assert res == [x * 2 for x in range(100)]
+
+
+def test_prefetch_ordered_is_bounded():
+    max_prefetch = 3
+    started = []
+    lock = threading.Lock()
+
+    def _fn(x):
+        with lock:
+            started.append(x)
+        return x
+
+    results = prefetch_ordered(_fn, range(100), num_workers=2, max_prefetch=max_prefetch)
+    first = next(results)
+    assert first == 0
+    # One consumed plus the queued ones, never the whole input
+    assert len(started) <= max_prefetch + 1
+    results.close()
+
+
+def test_prefetch_ordered_reraises_exceptions():
+    def _fn(x):
+        if x == 5:
+            raise ValueError("boom")
+        return x
+
+    results = prefetch_ordered(_fn, range(10), num_workers=2)
+    assert [next(results) for _ in range(5)] == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError, match="boom"):
+        next(results)
+
+
+def test_bounded_executor_releases_arguments_once_done():
+    class _Payload:
+        pass
+
+    payload = _Payload()
+    payload_ref = weakref.ref(payload)
+    with BoundedExecutor(num_workers=1) as executor:
+        future = executor.submit(lambda p: None, payload)
+        del payload
+        future.result()
+
+    gc.collect()
+    # The future is still alive (e.g. waiting to be reported) but the payload must have been released
+    assert future.done()
+    assert payload_ref() is None
@@ -0,0 +1,72 @@
+import json
+import threading
+
+from ..profiling import span, traced, record_trace, record_stage_times
+
+
+def test_span_is_no_op_without_recorders():
+    assert span("a") is span("b")
+
+
+def test_record_trace_nested_spans(tmp_path):
+    @traced()
+    def _inner():
+        pass
+
+    with record_trace() as trace:
+        with span("outer", file="test.ydr"):
+            _inner()
+            _inner()
+
+        t = threading.Thread(target=_inner, name="sz_test_thread")
+        t.start()
+        t.join()
+
+    names = [e["name"] for e in trace.events]
+    assert names.count("test_profiling.test_record_trace_nested_spans.<locals>._inner") == 3
+    outer = next(e for e in trace.events if e["name"] == "outer")
+    assert outer["args"] == {"file": "test.ydr"}
+    for e in trace.events:
+        if e["name"] != "outer" and e["tid"] == outer["tid"]:
+            assert outer["ts"] <= e["ts"] and e["ts"] + e["dur"] <= outer["ts"] + outer["dur"]
+
+    filepath = tmp_path / "trace.json"
+    trace.save(filepath)
+    data = json.loads(filepath.read_text())
+    thread_names = {e["args"]["name"] for e in data["traceEvents"] if e["ph"] == "M"}
+    assert "sz_test_thread" in thread_names
+    assert sum(1 for e in data["traceEvents"] if e["ph"] == "X") == 4
+
+
+def test_record_stage_times_accumulates():
+    with record_stage_times() as stages:
+        for _ in range(3):
+            with span("stage"):
+                pass
+
+    assert stages.counts["stage"] == 3
+    assert stages.totals["stage"] >= 0.0
+
+    with span("stage"):
+        pass
+    assert stages.counts["stage"] == 3
+
+
+def test_traced_generator_spans_each_item():
+    @traced("gen")
+    def _gen():
+        yield 1
+        yield 2
+        return 3
+
+    with record_stage_times() as stages:
+        items = []
+        for item in _gen():
+            items.append(item)
+            with span("consumer"):
+                pass
+
+    assert items == [1, 2]
+    # One span per item plus the last one that finishes the generator
+    assert stages.counts["gen"] == 3
+    assert stages.counts["consumer"] == 2
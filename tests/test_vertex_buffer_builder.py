@@ -1,7 +1,18 @@
+import bpy
 import pytest
 import numpy as np
 from numpy.testing import assert_array_equal, assert_allclose
-from ..ydr.vertex_buffer_builder import dedupe_and_get_indices
+from ..ydr.vertex_buffer_builder import (
+    dedupe_and_get_indices,
+    get_top_vertex_weights,
+    read_vertex_group_elements,
+    VertexBufferBuilder,
+    VBBuilderDomain,
+    VGROUP_CLOTH_ID,
+)
+from ..ydr.mesh_builder import MeshBuilder
+from ..ydr.shader_materials import create_shader
+from ..tools.meshhelper import get_color_attr_name, get_uv_map_name
 from szio.gta5 import STANDARD_VERTEX_ATTR_DTYPES
 
 
@@ -93,3 +104,228 @@ def test_dedupe_repeated_but_with_rounding_errors():
     assert len(vertex_arr) == 2
     assert len(ind_arr) == 9
     assert_allclose(vertex_arr[ind_arr]["Normal"], input_vertex_arr["Normal"], atol=1e-6)
+
+
+def test_dedupe_keeps_first_occurrence_order():
+    struct_dtype = [STANDARD_VERTEX_ATTR_DTYPES["Position"], STANDARD_VERTEX_ATTR_DTYPES["Colour0"]]
+    input_vertex_arr = np.empty(5, dtype=struct_dtype)
+    input_vertex_arr["Position"] = [
+        [3, 0, 0],
+        [1, 0, 0],
+        [3, 0, 0],  # repeated
+        [2, 0, 0],
+        [1, 0, 0],  # repeated
+    ]
+    input_vertex_arr["Colour0"] = [255, 0, 0, 255]
+
+    vertex_arr, ind_arr = dedupe_and_get_indices(input_vertex_arr)
+
+    assert_array_equal(vertex_arr["Position"], [[3, 0, 0], [1, 0, 0], [2, 0, 0]])
+    assert_array_equal(ind_arr, [0, 1, 0, 2, 1])
+
+
+def test_top_vertex_weights():
+    # vertex group -> bone, group 3 has no bone
+    bone_by_vgroup = {0: 5, 1: 6, 2: 7, 4: 8, 5: 9, 6: VGROUP_CLOTH_ID}
+    groups = [
+        [(0, 0.5), (1, 0.25), (3, 1.0)],  # invalid group ignored
+        [],  # ungrouped
+        [(3, 1.0)],  # only invalid groups, ungrouped
+        [(0, 0.1), (1, 0.2), (2, 0.3), (4, 0.4), (5, 0.05)],  # more than 4 groups, lowest dropped
+        [(0, 0.5), (6, 1.0)],  # cloth
+        [(1, 0.5), (0, 0.5), (2, 0.5), (4, 0.5), (5, 0.5)],  # ties keep the original order
+    ]
+    groups_per_vert = np.array([len(g) for g in groups])
+    group_indices = np.array([g for vert_groups in groups for g, _ in vert_groups])
+    group_weights = np.array([w for vert_groups in groups for _, w in vert_groups], dtype=np.float32)
+
+    weights, indices, cloth_mask, ungrouped_mask = get_top_vertex_weights(
+        groups_per_vert, group_indices, group_weights, bone_by_vgroup
+    )
+
+    assert_allclose(weights, [
+        [0.5, 0.25, 0, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0],
+        [0.4, 0.3, 0.2, 0.1],
+        [0, 0, 0, 0],
+        [0.5, 0.5, 0.5, 0.5],
+    ])
+    assert_array_equal(indices, [
+        [5, 6, 0, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0],
+        [8, 7, 6, 5],
+        [0, 0, 0, 0],
+        [6, 5, 7, 8],
+    ])
+    assert_array_equal(cloth_mask, [False, False, False, False, True, False])
+    assert_array_equal(ungrouped_mask, [False, True, True, False, False, False])
+
+
+def test_mesh_builder_bulk_geometry():
+    size = 300
+    ys, xs = np.mgrid[0:size - 1, 0:size - 1]
+    a = (ys * size + xs).ravel()
+    b = a + 1
+    c = a + size
+    d = c + 1
+    ind_arr = np.stack((np.stack((a, b, c), axis=1), np.stack((b, d, c), axis=1)), axis=1).ravel().astype(np.uint32)
+    # Add a degenerate triangle, should be removed
+    ind_arr = np.concatenate((ind_arr, [0, 0, 1])).astype(np.uint32)
+    num_tris = len(ind_arr) // 3
+
+    vertex_arr = np.zeros(size * size, dtype=[STANDARD_VERTEX_ATTR_DTYPES["Position"]])
+    vertex_arr["Position"][:, 1], vertex_arr["Position"][:, 0] = np.divmod(np.arange(size * size), size)
+
+    material = bpy.data.materials.new("test_mesh_builder_mat")
+    mat_inds = np.zeros(num_tris, dtype=np.uint32)
+
+    mesh = MeshBuilder("test_mesh_builder", vertex_arr, ind_arr, mat_inds, [material]).build()
+
+    ref_mesh = bpy.data.meshes.new("test_mesh_builder_ref")
+    ref_mesh.from_pydata(vertex_arr["Position"], [], ind_arr[:-3].reshape((-1, 3)))
+    ref_mesh.validate()
+
+    try:
+        assert len(mesh.vertices) == size * size
+        assert len(mesh.polygons) == num_tris - 1
+        assert len(mesh.edges) == len(ref_mesh.edges)
+
+        loops = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loops)
+        assert_array_equal(loops, ind_arr[:-3])
+
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        assert_array_equal(co.reshape((-1, 3)), vertex_arr["Position"])
+
+        # Same topology as the mesh built with `from_pydata` and `validate`
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        ref_edges = np.empty(len(ref_mesh.edges) * 2, dtype=np.int32)
+        ref_mesh.edges.foreach_get("vertices", ref_edges)
+        assert_array_equal(
+            np.unique(np.sort(edges.reshape((-1, 2)), axis=1), axis=0),
+            np.unique(np.sort(ref_edges.reshape((-1, 2)), axis=1), axis=0),
+        )
+
+        loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+        ref_loops = np.empty(len(ref_mesh.loops), dtype=np.int32)
+        ref_mesh.loops.foreach_get("vertex_index", ref_loops)
+        assert_array_equal(loops, ref_loops)
+        # Each loop edge connects the loop vertex with the next one in the face
+        loop_edge_verts = np.sort(edges.reshape((-1, 2))[loop_edges], axis=1)
+        tris = loops.reshape((-1, 3))
+        expected_loop_edge_verts = np.sort(np.stack((tris, np.roll(tris, -1, axis=1)), axis=2).reshape((-1, 2)), axis=1)
+        assert_array_equal(loop_edge_verts, expected_loop_edge_verts)
+
+        # Nothing to fix, the mesh is already valid without calling `Mesh.validate`
+        assert not mesh.validate()
+    finally:
+        bpy.data.meshes.remove(mesh)
+        bpy.data.meshes.remove(ref_mesh)
+        bpy.data.materials.remove(material)
+
+
+@pytest.mark.parametrize("domain", (VBBuilderDomain.FACE_CORNER, VBBuilderDomain.VERTEX))
+def test_vertex_buffer_builder_per_material_matches_full_build(domain: VBBuilderDomain):
+    size = 20
+    verts = [(x, y, 0.0) for y in range(size) for x in range(size)]
+    faces = [
+        (y * size + x, y * size + x + 1, (y + 1) * size + x + 1, (y + 1) * size + x)
+        for y in range(size - 1) for x in range(size - 1)
+    ]
+    mesh = bpy.data.meshes.new("test_vb_builder_per_material")
+    mesh.from_pydata(verts, [], faces)
+
+    materials = [create_shader("default.sps"), create_shader("normal.sps")]
+    for mat in materials:
+        mesh.materials.append(mat)
+    mesh.polygons.foreach_set("material_index", np.arange(len(faces)) % 2)
+
+    rng = np.random.default_rng(0)
+    uv_layer = mesh.uv_layers.new(name=get_uv_map_name(0))
+    uv_layer.uv.foreach_set("vector", rng.random(len(mesh.loops) * 2, dtype=np.float32))
+    color_attr = mesh.color_attributes.new(get_color_attr_name(0), "BYTE_COLOR", "CORNER")
+    color_attr.data.foreach_set("color_srgb", rng.random(len(mesh.loops) * 4, dtype=np.float32))
+    mesh.calc_loop_triangles()
+
+    try:
+        tri_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.uint32)
+        mesh.loop_triangles.foreach_get("loops", tri_loops)
+        tri_mats = np.empty(len(mesh.loop_triangles), dtype=np.uint32)
+        mesh.loop_triangles.foreach_get("material_index", tri_mats)
+        loop_inds_by_mat = {i: tri_loops[np.repeat(tri_mats, 3) == i] for i in range(len(materials))}
+
+        builder = VertexBufferBuilder(mesh, domain=domain, materials=materials)
+        attr_names = builder.get_attr_names()
+        fields_by_mat = {0: [n for n in attr_names if n != "Tangent"], 1: attr_names}
+
+        total_vert_buffer = builder.build()
+        vert_buffers_by_mat = builder.build_per_material(loop_inds_by_mat, fields_by_mat)
+
+        loop_to_vert_inds = np.empty(len(mesh.loops), dtype=np.uint32)
+        mesh.loops.foreach_get("vertex_index", loop_to_vert_inds)
+        for mat_index, loop_inds in loop_inds_by_mat.items():
+            if domain == VBBuilderDomain.VERTEX:
+                expected = total_vert_buffer[loop_to_vert_inds[loop_inds]]
+            else:
+                expected = total_vert_buffer[loop_inds]
+            expected = expected[fields_by_mat[mat_index]]
+
+            actual = vert_buffers_by_mat[mat_index]
+            assert actual.dtype.names == expected.dtype.names
+            for name in expected.dtype.names:
+                assert_array_equal(actual[name], expected[name])
+    finally:
+        bpy.data.meshes.remove(mesh)
+        for mat in materials:
+            bpy.data.materials.remove(mat)
+
+
+class _FakeVertexGroups:
+    """Vertex groups of a vertex that only support bulk reads, counting them."""
+
+    def __init__(self, elements: list[tuple[int, float]], counter: dict):
+        self._elements = elements
+        self._counter = counter
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __iter__(self):
+        raise AssertionError("Vertex group elements should not be read one by one")
+
+    def foreach_get(self, attr: str, buffer):
+        self._counter[attr] += 1
+        buffer[:] = [g if attr == "group" else w for g, w in self._elements]
+
+
+class _FakeVertex:
+    def __init__(self, groups: _FakeVertexGroups):
+        self.groups = groups
+
+
+def test_read_vertex_group_elements():
+    from collections import Counter
+
+    counter = Counter()
+    groups = [
+        [(0, 0.5), (1, 0.25)],
+        [],
+        [(3, 1.0)],
+        # More than 4 groups per vertex on average, the preallocated arrays have to grow
+        *([[(i, i / 10) for i in range(10)]] * 20),
+    ]
+    vertices = [_FakeVertex(_FakeVertexGroups(g, counter)) for g in groups]
+
+    groups_per_vert, group_indices, group_weights = read_vertex_group_elements(vertices)
+
+    assert_array_equal(groups_per_vert, [len(g) for g in groups])
+    assert_array_equal(group_indices, [g for vert_groups in groups for g, _ in vert_groups])
+    assert_allclose(group_weights, [w for vert_groups in groups for _, w in vert_groups])
+    # A single bulk read of each attribute per weighted vertex, regardless of the number of elements
+    num_weighted_verts = sum(1 for g in groups if g)
+    assert counter == {"group": num_weighted_verts, "weight": num_weighted_verts}
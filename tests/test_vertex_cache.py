@@ -0,0 +1,46 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from numpy.typing import NDArray
+
+from ..ydr.vertex_cache import optimize_vertex_cache, optimize_vertex_fetch, calculate_acmr
+
+
+def _grid_ind_buffer(size: int) -> NDArray:
+    ys, xs = np.mgrid[0:size - 1, 0:size - 1]
+    a = (ys * size + xs).ravel()
+    b = a + 1
+    c = a + size
+    d = c + 1
+    tris = np.stack((np.stack((a, b, c), axis=1), np.stack((b, d, c), axis=1)), axis=1).reshape(-1, 3)
+    return tris.astype(np.uint32)
+
+
+def test_optimize_vertex_cache_keeps_triangles_and_reduces_acmr():
+    size = 32
+    num_verts = size * size
+    tris = _grid_ind_buffer(size)
+    tris = tris[np.random.default_rng(0).permutation(len(tris))]
+    ind_buffer = tris.ravel()
+
+    optimized = optimize_vertex_cache(ind_buffer, num_verts)
+
+    assert sorted(map(tuple, optimized.reshape(-1, 3).tolist())) == sorted(map(tuple, tris.tolist()))
+    assert calculate_acmr(optimized, num_verts) < 1.0 < calculate_acmr(ind_buffer, num_verts)
+
+
+def test_optimize_vertex_fetch_renumbers_in_first_use_order():
+    vert_buffer = np.array([10, 11, 12, 13, 14])
+    ind_buffer = np.array([3, 1, 4, 4, 1, 0], dtype=np.uint32)
+
+    new_vert_buffer, new_ind_buffer = optimize_vertex_fetch(vert_buffer, ind_buffer)
+
+    assert_array_equal(new_ind_buffer, [0, 1, 2, 2, 1, 3])
+    # unused vertex at the end
+    assert_array_equal(new_vert_buffer, [13, 11, 14, 10, 12])
+    assert_array_equal(new_vert_buffer[new_ind_buffer], vert_buffer[ind_buffer])
+
+
+def test_calculate_acmr():
+    assert calculate_acmr(np.array([0, 1, 2], dtype=np.uint32), 3) == 3.0
+    assert calculate_acmr(np.array([0, 1, 2, 2, 1, 3], dtype=np.uint32), 4) == 2.0
+    assert calculate_acmr(np.empty(0, dtype=np.uint32), 0) == 0.0
@@ -0,0 +1,285 @@
+import bpy
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+from mathutils import Matrix, Vector
+from szio.gta5 import BoundPrimitiveType
+from ..sollumz_properties import SollumType
+from ..tools.blenderhelper import create_empty_object
+from ..tools.boundhelper import create_bound_poly_box, create_bound_poly_sphere, create_bound_shape
+from ..ybn.collision_materials import create_collision_material_from_index
+from ..ybn.poly_primitives import (
+    PolyPrimitives,
+    write_poly_primitives,
+    explode_poly_primitives,
+    get_poly_primitives_volumes,
+)
+from ..ybn.ybnexport import create_bound_asset, create_bound_composite_asset
+from .shared import log_capture
+
+
+def test_export_bvh_primitives_share_vertices():
+    material = create_collision_material_from_index(0)
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE)
+    bvh_obj = create_empty_object(SollumType.BOUND_GEOMETRYBVH)
+    bvh_obj.parent = composite_obj
+
+    # Two boxes in the same place and a sphere centered on one of their corners
+    prim_objs = [create_bound_poly_box(), create_bound_poly_box(), create_bound_poly_sphere()]
+    prim_objs[2].location = Vector((-1.0, -1.0, -1.0))
+    prim_objs[2].scale = Vector((0.25, 0.25, 0.25))
+    for prim_obj in prim_objs:
+        prim_obj.data.materials.append(material)
+        prim_obj.parent = bvh_obj
+    bpy.context.view_layer.update()
+
+    try:
+        composite = create_bound_composite_asset(composite_obj)
+        bvh = composite.children[0]
+
+        assert len(bvh.geometry_vertices) == 4
+        assert [p.primitive_type for p in bvh.geometry_primitives] == [
+            BoundPrimitiveType.BOX, BoundPrimitiveType.BOX, BoundPrimitiveType.SPHERE
+        ]
+        box0, box1, sphere = bvh.geometry_primitives
+        assert tuple(box0.vertices) == (0, 1, 2, 3)
+        assert tuple(box1.vertices) == (0, 1, 2, 3)
+        assert tuple(sphere.vertices) == (0,)
+        assert_allclose(np.array(bvh.geometry_vertices[0].co), [-1.0, -1.0, -1.0])
+        assert all(v.color is None for v in bvh.geometry_vertices)
+    finally:
+        for obj in (*prim_objs, bvh_obj, composite_obj):
+            bpy.data.objects.remove(obj)
+        bpy.data.materials.remove(material)
+
+
+def test_export_bvh_poly_primitives_matches_exploded():
+    materials = [create_collision_material_from_index(0), create_collision_material_from_index(1)]
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE)
+    bvh_obj = create_empty_object(SollumType.BOUND_GEOMETRYBVH)
+    bvh_obj.parent = composite_obj
+
+    prims = PolyPrimitives(
+        types=np.array([
+            BoundPrimitiveType.BOX.value,
+            BoundPrimitiveType.SPHERE.value,
+            BoundPrimitiveType.CYLINDER.value,
+            BoundPrimitiveType.CAPSULE.value,
+        ], dtype=np.int32),
+        positions=np.array([(0.0, 0.0, 0.0), (3.0, 0.0, 0.0), (0.0, 3.0, 0.0), (0.0, 0.0, 3.0)], dtype=np.float32),
+        rotations=np.array([(0.5, 0.0, 0.25), (0.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.3, 0.2, 0.1)], dtype=np.float32),
+        sizes=np.array([(1.0, 2.0, 3.0), (0.5, 0.5, 0.5), (0.25, 0.25, 2.0), (0.5, 0.5, 1.0)], dtype=np.float32),
+        material_inds=np.array([0, 1, 1, 0], dtype=np.int32),
+    )
+    mesh = bpy.data.meshes.new("prims")
+    write_poly_primitives(mesh, prims)
+    for material in materials:
+        mesh.materials.append(material)
+    prims_obj = bpy.data.objects.new("prims", mesh)
+    prims_obj.sollum_type = SollumType.BOUND_POLY_PRIMITIVES
+    bpy.context.collection.objects.link(prims_obj)
+    prims_obj.parent = bvh_obj
+    prims_obj.location = Vector((1.0, 2.0, 3.0))
+    bpy.context.view_layer.update()
+
+    exploded_objs = []
+    try:
+        compact = create_bound_composite_asset(composite_obj).children[0]
+
+        exploded_objs = explode_poly_primitives(prims_obj)
+        bpy.data.objects.remove(prims_obj)
+        bpy.context.view_layer.update()
+        exploded = create_bound_composite_asset(composite_obj).children[0]
+
+        assert len(compact.geometry_vertices) == len(exploded.geometry_vertices)
+        assert_allclose(
+            np.array([v.co for v in compact.geometry_vertices]),
+            np.array([v.co for v in exploded.geometry_vertices]),
+            atol=1e-5,
+        )
+        assert len(compact.geometry_primitives) == 4
+        for a, b in zip(compact.geometry_primitives, exploded.geometry_primitives):
+            assert a.primitive_type == b.primitive_type
+            assert a.material == b.material
+            assert tuple(a.vertices) == tuple(b.vertices)
+            if a.radius is not None:
+                assert a.radius == pytest.approx(b.radius, abs=1e-5)
+    finally:
+        for obj in (*exploded_objs, bvh_obj, composite_obj):
+            bpy.data.objects.remove(obj)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+        for material in materials:
+            bpy.data.materials.remove(material)
+
+
+def test_export_bvh_poly_primitives_with_invalid_material_index():
+    materials = [create_collision_material_from_index(0), create_collision_material_from_index(1)]
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE)
+    bvh_obj = create_empty_object(SollumType.BOUND_GEOMETRYBVH)
+    bvh_obj.parent = composite_obj
+
+    prims = PolyPrimitives(
+        types=np.full(3, BoundPrimitiveType.SPHERE.value, dtype=np.int32),
+        positions=np.array([(0.0, 0.0, 0.0), (3.0, 0.0, 0.0), (6.0, 0.0, 0.0)], dtype=np.float32),
+        rotations=np.zeros((3, 3), dtype=np.float32),
+        sizes=np.full((3, 3), 0.5, dtype=np.float32),
+        material_inds=np.array([0, 5, -1], dtype=np.int32),
+    )
+    mesh = bpy.data.meshes.new("prims")
+    write_poly_primitives(mesh, prims)
+    for material in materials:
+        mesh.materials.append(material)
+    prims_obj = bpy.data.objects.new("prims", mesh)
+    prims_obj.sollum_type = SollumType.BOUND_POLY_PRIMITIVES
+    bpy.context.collection.objects.link(prims_obj)
+    prims_obj.parent = bvh_obj
+    bpy.context.view_layer.update()
+
+    try:
+        with log_capture() as logs:
+            bvh = create_bound_composite_asset(composite_obj).children[0]
+        logs.assert_warning(match=r"2 primitive\(s\) with an invalid material index")
+
+        # Indices out of range use the closest material slot
+        first, second, third = bvh.geometry_primitives
+        assert first.material != second.material
+        assert third.material == first.material
+    finally:
+        for obj in (prims_obj, bvh_obj, composite_obj):
+            bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+        for material in materials:
+            bpy.data.materials.remove(material)
+
+
+def test_export_bvh_poly_primitives_without_materials():
+    material = create_collision_material_from_index(0)
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE)
+    bvh_obj = create_empty_object(SollumType.BOUND_GEOMETRYBVH)
+    bvh_obj.parent = composite_obj
+    box_obj = create_bound_poly_box()
+    box_obj.data.materials.append(material)
+    box_obj.parent = bvh_obj
+
+    prims = PolyPrimitives(
+        types=np.full(2, BoundPrimitiveType.SPHERE.value, dtype=np.int32),
+        positions=np.array([(0.0, 0.0, 0.0), (3.0, 0.0, 0.0)], dtype=np.float32),
+        rotations=np.zeros((2, 3), dtype=np.float32),
+        sizes=np.full((2, 3), 0.5, dtype=np.float32),
+        material_inds=np.zeros(2, dtype=np.int32),
+    )
+    mesh = bpy.data.meshes.new("prims")
+    write_poly_primitives(mesh, prims)
+    prims_obj = bpy.data.objects.new("prims", mesh)
+    prims_obj.sollum_type = SollumType.BOUND_POLY_PRIMITIVES
+    bpy.context.collection.objects.link(prims_obj)
+    # Nested in another primitive, the collision materials of the BVH children were already validated
+    prims_obj.parent = box_obj
+    bpy.context.view_layer.update()
+
+    try:
+        with log_capture() as logs:
+            bvh = create_bound_composite_asset(composite_obj).children[0]
+        assert len(logs.errors) == 1
+        assert "'prims' has no collision materials" in logs.errors[0]
+        assert [p.primitive_type for p in bvh.geometry_primitives] == [BoundPrimitiveType.BOX]
+    finally:
+        for obj in (prims_obj, box_obj, bvh_obj, composite_obj):
+            bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+        bpy.data.materials.remove(material)
+
+
+def test_export_bvh_poly_primitives_extents_with_parent_inverse():
+    material = create_collision_material_from_index(0)
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE)
+    bvh_obj = create_empty_object(SollumType.BOUND_GEOMETRYBVH)
+    bvh_obj.parent = composite_obj
+
+    prims = PolyPrimitives(
+        types=np.full(1, BoundPrimitiveType.SPHERE.value, dtype=np.int32),
+        positions=np.zeros((1, 3), dtype=np.float32),
+        rotations=np.zeros((1, 3), dtype=np.float32),
+        sizes=np.full((1, 3), 0.5, dtype=np.float32),
+        material_inds=np.zeros(1, dtype=np.int32),
+    )
+    mesh = bpy.data.meshes.new("prims")
+    write_poly_primitives(mesh, prims)
+    mesh.materials.append(material)
+    prims_obj = bpy.data.objects.new("prims", mesh)
+    prims_obj.sollum_type = SollumType.BOUND_POLY_PRIMITIVES
+    bpy.context.collection.objects.link(prims_obj)
+    prims_obj.parent = bvh_obj
+    prims_obj.matrix_parent_inverse = Matrix.Translation((5.0, 0.0, 0.0))
+    bpy.context.view_layer.update()
+
+    try:
+        bvh = create_bound_composite_asset(composite_obj).children[0]
+
+        assert_allclose(np.array(bvh.geometry_vertices[0].co), [5.0, 0.0, 0.0], atol=1e-5)
+        # The extents contain the whole sphere
+        bbmin, bbmax = bvh.extent
+        assert np.all(np.array(bbmin) <= np.array([4.5, -0.5, -0.5]) + 1e-5)
+        assert np.all(np.array(bbmax) >= np.array([5.5, 0.5, 0.5]) - 1e-5)
+    finally:
+        for obj in (prims_obj, bvh_obj, composite_obj):
+            bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+        bpy.data.materials.remove(material)
+
+
+def test_poly_primitives_volumes():
+    prims = PolyPrimitives(
+        types=np.array([
+            BoundPrimitiveType.BOX.value,
+            BoundPrimitiveType.SPHERE.value,
+            BoundPrimitiveType.CYLINDER.value,
+            BoundPrimitiveType.CAPSULE.value,
+        ], dtype=np.int32),
+        positions=np.zeros((4, 3), dtype=np.float32),
+        rotations=np.zeros((4, 3), dtype=np.float32),
+        sizes=np.array([(1.0, -2.0, 3.0), (0.5, 0.5, 0.5), (0.25, 0.25, 2.0), (0.5, 0.5, 1.0)], dtype=np.float32),
+        material_inds=np.zeros(4, dtype=np.int32),
+    )
+
+    assert_allclose(
+        get_poly_primitives_volumes(prims),
+        [6.0, (4 / 3) * np.pi * 0.125, np.pi * 0.0625 * 2.0, np.pi * 0.25 + (4 / 3) * np.pi * 0.125],
+    )
+
+
+def test_export_composite_primitive_children_mass_properties():
+    material = create_collision_material_from_index(0)
+    composite_obj = create_empty_object(SollumType.BOUND_COMPOSITE)
+    child_objs = [
+        create_bound_shape(bound_type)
+        for bound_type in (
+            SollumType.BOUND_BOX,
+            SollumType.BOUND_SPHERE,
+            SollumType.BOUND_CAPSULE,
+            SollumType.BOUND_CYLINDER,
+            SollumType.BOUND_DISC,
+        )
+    ]
+    for i, child_obj in enumerate(child_objs):
+        child_obj.data.materials.append(material)
+        child_obj.parent = composite_obj
+        child_obj.location = Vector((i * 3.0, 0.0, 0.0))
+        child_obj.scale = Vector((1.0 + i * 0.5, 1.0 + i * 0.5, 1.0 + i * 0.5))
+    bpy.context.view_layer.update()
+
+    try:
+        composite = create_bound_composite_asset(composite_obj)
+
+        # The mass properties of all the children are calculated at once, same result as one by one
+        assert len(composite.children) == len(child_objs)
+        for child, child_obj in zip(composite.children, child_objs):
+            expected = create_bound_asset(child_obj)
+            assert child.volume > 0.0
+            assert child.volume == pytest.approx(expected.volume)
+            assert_allclose(np.array(child.inertia), np.array(expected.inertia))
+    finally:
+        for obj in (*child_objs, composite_obj):
+            bpy.data.objects.remove(obj)
+        bpy.data.materials.remove(material)
@@ -248,6 +248,7 @@ _types_to_hide_in_render = {
     SollumType.BOUND_DISC, SollumType.BOUND_PLANE, SollumType.BOUND_GEOMETRY, SollumType.BOUND_GEOMETRYBVH,
     SollumType.BOUND_COMPOSITE, SollumType.BOUND_POLY_BOX, SollumType.BOUND_POLY_CAPSULE,
     SollumType.BOUND_POLY_CYLINDER, SollumType.BOUND_POLY_SPHERE, SollumType.BOUND_POLY_TRIANGLE,
+    SollumType.BOUND_POLY_PRIMITIVES,
 
     SollumType.SHATTERMAP,
 
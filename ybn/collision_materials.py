@@ -1,3 +1,4 @@
+import bpy
 from bpy.types import (
     Material
 )
@@ -9,7 +10,7 @@ from ..shared.shader_expr import (
     expr,
     compile_to_material,
 )
-from szio.gta5 import CollisionMaterial
+from szio.gta5 import CollisionMaterial, CollisionMaterialFlags
 from ..sollumz_properties import MaterialType
 from typing import NamedTuple
 from .. import logger
@@ -254,3 +255,85 @@ def create_collision_material_from_data(material: CollisionMaterial) -> Material
         (mat_flags >> 8) & 0xFF
     )
     return mat
+
+
+def get_collision_material_data(mat: Material) -> CollisionMaterial:
+    """Gets the `CollisionMaterial` stored in the properties of the collision material ``mat``."""
+    from .properties import get_collision_mat_raw_flags
+    col_props = mat.collision_properties
+    flags_lo, flags_hi = get_collision_mat_raw_flags(mat.collision_flags)
+    return CollisionMaterial(
+        material_index=col_props.collision_index,
+        material_color_index=col_props.material_color_index,
+        procedural_id=col_props.procedural_id,
+        room_id=col_props.room_id,
+        ped_density=col_props.ped_density,
+        material_flags=CollisionMaterialFlags(((flags_hi & 0xFF) << 8) | (flags_lo & 0xFF)),
+    )
+
+
+class CollisionMaterialRegistry:
+    """Collision materials shared by all the bounds of an import operation, keyed by their `CollisionMaterial` data.
+    Matching collision materials already in the .blend file are reused instead of creating new ones.
+    """
+
+    def __init__(self):
+        self._materials: dict[CollisionMaterial, Material] = {}
+        self._indexed_blend_data = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, material: CollisionMaterial) -> Material:
+        """Gets the collision material with ``material`` data, creating it if there is none yet."""
+        if not self._indexed_blend_data:
+            self._index_blend_data()
+
+        mat = self._materials.get(material, None)
+        if mat is not None:
+            try:
+                mat.name
+                self.hits += 1
+                return mat
+            except ReferenceError:
+                # Material removed since it was registered
+                pass
+
+        mat = create_collision_material_from_data(material)
+        self._materials[material] = mat
+        self.misses += 1
+        return mat
+
+    def _index_blend_data(self):
+        self._indexed_blend_data = True
+        for mat in bpy.data.materials:
+            if mat.sollum_type != MaterialType.COLLISION or mat.library is not None:
+                continue
+
+            # Keep the first material if there are duplicates already
+            self._materials.setdefault(get_collision_material_data(mat), mat)
+
+    def clear(self):
+        self._materials.clear()
+        self._indexed_blend_data = False
+
+
+def merge_duplicate_collision_materials() -> int:
+    """Replaces all the uses of collision materials with the same `CollisionMaterial` data by a single material, and
+    removes the duplicates. Returns the number of materials removed.
+    """
+    kept: dict[CollisionMaterial, Material] = {}
+    duplicates: list[tuple[Material, Material]] = []
+    # Sorted by name, so the material without number suffix is kept
+    for mat in bpy.data.materials:
+        if mat.sollum_type != MaterialType.COLLISION or mat.library is not None:
+            continue
+
+        kept_mat = kept.setdefault(get_collision_material_data(mat), mat)
+        if kept_mat != mat:
+            duplicates.append((mat, kept_mat))
+
+    for mat, kept_mat in duplicates:
+        mat.user_remap(kept_mat)
+        bpy.data.materials.remove(mat)
+
+    return len(duplicates)
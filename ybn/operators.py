@@ -1,9 +1,10 @@
 from math import ceil
 from ..tools.obb import get_obb, get_obb_extents
 from ..ybn.properties import BoundFlags
-from ..ybn.collision_materials import create_collision_material_from_index
+from ..ybn.collision_materials import create_collision_material_from_index, merge_duplicate_collision_materials
 from ..tools.boundhelper import create_bound_shape, convert_objs_to_composites, convert_objs_to_single_composite, center_composite_to_children, apply_flag_preset
 from ..tools.meshhelper import create_box_from_extents
+from .poly_primitives import explode_poly_primitives
 from ..sollumz_properties import SollumType, SOLLUMZ_UI_NAMES, BOUND_TYPES, MaterialType, BOUND_POLYGON_TYPES
 from ..sollumz_helper import SOLLUMZ_OT_base
 from ..tools.blenderhelper import get_selected_vertices, get_children_recursive, create_blender_object, create_empty_object, tag_redraw
@@ -166,6 +167,33 @@ class SOLLUMZ_OT_create_bound(bpy.types.Operator):
         return {"FINISHED"}
 
 
+class SOLLUMZ_OT_explode_bound_poly_primitives(bpy.types.Operator):
+    """Create a separate bound polygon object for each primitive of the selected Bound Poly Primitives objects, so they
+    can be edited individually"""
+    bl_idname = "sollumz.explode_bound_poly_primitives"
+    bl_label = "Explode Primitives"
+    bl_options = {"UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.sollum_type == SollumType.BOUND_POLY_PRIMITIVES for obj in context.selected_objects)
+
+    def execute(self, context):
+        prims_objs = [obj for obj in context.selected_objects if obj.sollum_type == SollumType.BOUND_POLY_PRIMITIVES]
+
+        num_created = 0
+        for obj in prims_objs:
+            num_created += len(explode_poly_primitives(obj))
+            mesh = obj.data
+            bpy.data.objects.remove(obj)
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+        self.report({"INFO"}, f"Created {num_created} primitive objects.")
+
+        return {"FINISHED"}
+
+
 class CreateCollisionMatHelper:
     def create_material(self, mat_index: int, obj: bpy.types.Object):
         mat = create_collision_material_from_index(mat_index)
@@ -221,6 +249,20 @@ class SOLLUMZ_OT_convert_non_collision_materials_to_selected(CreateCollisionMatH
             obj.data.materials[i] = mat
 
 
+class SOLLUMZ_OT_merge_duplicate_collision_materials(bpy.types.Operator):
+    """Replace collision materials with the same properties by a single material and delete the duplicates"""
+    bl_idname = "sollumz.merge_duplicate_collision_materials"
+    bl_label = "Merge Duplicate Collision Materials"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        num_removed = merge_duplicate_collision_materials()
+
+        self.report({"INFO"}, f"Removed {num_removed} duplicate collision materials.")
+
+        return {"FINISHED"}
+
+
 class SOLLUMZ_OT_convert_to_collision_material(SOLLUMZ_OT_base, bpy.types.Operator):
     """Convert material to a collision material"""
     bl_idname = "sollumz.converttocollisionmaterial"
@@ -0,0 +1,337 @@
+"""Compact representation of the box, sphere, capsule and cylinder primitives of a Bound GeometryBVH. All primitives are
+stored as points of a single Bound Poly Primitives object, with point attributes for their type, rotation, size and
+material, instead of one object per primitive. The shapes are previewed with a geometry nodes modifier that instances
+them on the points.
+"""
+from typing import NamedTuple
+
+import bpy
+import numpy as np
+from numpy.typing import NDArray
+from bpy.types import Mesh, Object, NodeTree
+from mathutils import Euler, Matrix, Vector
+from szio.gta5 import BoundPrimitiveType
+
+from ..shared.geometry import MassShape, get_mass_properties_of_primitives
+from ..sollumz_properties import SollumType, SOLLUMZ_UI_NAMES
+from ..tools.blenderhelper import create_blender_object
+from ..tools.meshhelper import create_box, create_sphere, create_capsule, create_cylinder
+
+PRIM_TYPE_ATTR_NAME = "sz_prim_type"
+PRIM_ROTATION_ATTR_NAME = "sz_prim_rotation"
+PRIM_SIZE_ATTR_NAME = "sz_prim_size"
+PRIM_MATERIAL_ATTR_NAME = "sz_prim_material_index"
+
+PREVIEW_NODE_GROUP_NAME = ".SZ.BoundPolyPrimitivesPreview"
+PREVIEW_MODIFIER_NAME = "Primitives Preview"
+
+
+class PolyPrimitives(NamedTuple):
+    types: NDArray[np.int32]
+    """`BoundPrimitiveType` value of each primitive."""
+    positions: NDArray[np.float32]
+    """Center of each primitive."""
+    rotations: NDArray[np.float32]
+    """Rotation of each primitive, as XYZ Euler angles."""
+    sizes: NDArray[np.float32]
+    """Size of each primitive. Boxes: length of their edges, may be negative if the box axes are mirrored. Spheres:
+    radius in all components. Capsules and cylinders: radius in X and Y, and distance between the end points in Z.
+    """
+    material_inds: NDArray[np.int32]
+    """Index of the material of each primitive in the mesh materials."""
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+
+def write_poly_primitives(mesh: Mesh, primitives: PolyPrimitives):
+    """Adds ``primitives`` as points of ``mesh``, which must not have any vertices yet."""
+    assert len(mesh.vertices) == 0, "Expected an empty mesh"
+
+    num_prims = len(primitives)
+    mesh.vertices.add(num_prims)
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(primitives.positions, dtype=np.float32).ravel())
+
+    for name, data_type, values in (
+        (PRIM_TYPE_ATTR_NAME, "INT", primitives.types),
+        (PRIM_ROTATION_ATTR_NAME, "FLOAT_VECTOR", primitives.rotations),
+        (PRIM_SIZE_ATTR_NAME, "FLOAT_VECTOR", primitives.sizes),
+        (PRIM_MATERIAL_ATTR_NAME, "INT", primitives.material_inds),
+    ):
+        attr = mesh.attributes.new(name, data_type, "POINT")
+        if data_type == "INT":
+            attr.data.foreach_set("value", np.ascontiguousarray(values, dtype=np.int32))
+        else:
+            attr.data.foreach_set("vector", np.ascontiguousarray(values, dtype=np.float32).ravel())
+
+    mesh.update()
+
+
+def read_poly_primitives(mesh: Mesh) -> PolyPrimitives:
+    """Reads the primitives stored in the points of ``mesh``. Missing attributes are read as zeros."""
+    num_prims = len(mesh.vertices)
+
+    positions = np.empty(num_prims * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+
+    def _read_attr(name: str, data_type: str) -> NDArray:
+        is_int = data_type == "INT"
+        values = np.zeros(num_prims if is_int else num_prims * 3, dtype=np.int32 if is_int else np.float32)
+        attr = mesh.attributes.get(name, None)
+        if attr is not None and attr.domain == "POINT" and attr.data_type == data_type:
+            attr.data.foreach_get("value" if is_int else "vector", values)
+        return values if is_int else values.reshape((num_prims, 3))
+
+    return PolyPrimitives(
+        types=_read_attr(PRIM_TYPE_ATTR_NAME, "INT"),
+        positions=positions.reshape((num_prims, 3)),
+        rotations=_read_attr(PRIM_ROTATION_ATTR_NAME, "FLOAT_VECTOR"),
+        sizes=_read_attr(PRIM_SIZE_ATTR_NAME, "FLOAT_VECTOR"),
+        material_inds=_read_attr(PRIM_MATERIAL_ATTR_NAME, "INT"),
+    )
+
+
+def euler_to_matrices(rotations: NDArray[np.float32]) -> NDArray[np.float64]:
+    """Converts XYZ Euler angles to rotation matrices, same as `mathutils.Euler.to_matrix`."""
+    rotations = np.asarray(rotations, dtype=np.float64)
+    cx, cy, cz = np.cos(rotations).T
+    sx, sy, sz = np.sin(rotations).T
+
+    # Rz @ Ry @ Rx
+    matrices = np.empty((len(rotations), 3, 3), dtype=np.float64)
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    return matrices
+
+
+def get_poly_primitives_half_extents(primitives: PolyPrimitives) -> NDArray[np.float64]:
+    """Gets the half size of the oriented bounding box of each primitive, in the primitive local space."""
+    sizes = np.abs(primitives.sizes.astype(np.float64))
+    half_extents = sizes * 0.5
+    radii = sizes[:, 0]
+
+    is_sphere = primitives.types == BoundPrimitiveType.SPHERE.value
+    half_extents[is_sphere] = radii[is_sphere, np.newaxis]
+
+    is_cylinder = primitives.types == BoundPrimitiveType.CYLINDER.value
+    half_extents[is_cylinder, :2] = radii[is_cylinder, np.newaxis]
+
+    is_capsule = primitives.types == BoundPrimitiveType.CAPSULE.value
+    half_extents[is_capsule, :2] = radii[is_capsule, np.newaxis]
+    half_extents[is_capsule, 2] += radii[is_capsule]
+
+    return half_extents
+
+
+def get_poly_primitives_corners(primitives: PolyPrimitives) -> NDArray[np.float64]:
+    """Gets the 8 corners of the oriented bounding box of each primitive, as an array of shape (N, 8, 3)."""
+    signs = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float64)
+    axes = euler_to_matrices(primitives.rotations) * get_poly_primitives_half_extents(primitives)[:, np.newaxis, :]
+    return primitives.positions[:, np.newaxis, :] + np.einsum("nij,kj->nki", axes, signs)
+
+
+def get_poly_primitives_volumes(primitives: PolyPrimitives) -> NDArray[np.float64]:
+    """Gets the volume of each primitive. Primitives of unknown type have no volume."""
+    sizes = np.abs(primitives.sizes.astype(np.float64))
+    shapes = np.full(len(primitives), -1, dtype=np.int32)
+    dimensions = np.zeros_like(sizes)
+
+    is_box = primitives.types == BoundPrimitiveType.BOX.value
+    shapes[is_box] = MassShape.BOX.value
+    dimensions[is_box] = sizes[is_box]
+
+    for primitive_type, shape in (
+        (BoundPrimitiveType.SPHERE, MassShape.SPHERE),
+        (BoundPrimitiveType.CAPSULE, MassShape.CAPSULE),
+        (BoundPrimitiveType.CYLINDER, MassShape.CYLINDER),
+    ):
+        is_type = primitives.types == primitive_type.value
+        shapes[is_type] = shape.value
+        # Radius in X and length in Y
+        dimensions[is_type, 0] = sizes[is_type, 0]
+        dimensions[is_type, 1] = sizes[is_type, 2]
+
+    volumes, _ = get_mass_properties_of_primitives(shapes, dimensions)
+    return volumes
+
+
+def explode_poly_primitives(obj: Object) -> list[Object]:
+    """Creates a separate Bound Poly object for each primitive of the Bound Poly Primitives ``obj``, with the same
+    parent and world transforms. ``obj`` is not modified.
+    """
+    mesh = obj.data
+    prims = read_poly_primitives(mesh)
+
+    new_objs = []
+    for prim_type, position, rotation, size, material_index in zip(
+        prims.types.tolist(),
+        prims.positions.tolist(),
+        prims.rotations.tolist(),
+        prims.sizes.tolist(),
+        prims.material_inds.tolist(),
+    ):
+        match prim_type:
+            case BoundPrimitiveType.BOX.value:
+                sollum_type = SollumType.BOUND_POLY_BOX
+            case BoundPrimitiveType.SPHERE.value:
+                sollum_type = SollumType.BOUND_POLY_SPHERE
+            case BoundPrimitiveType.CAPSULE.value:
+                sollum_type = SollumType.BOUND_POLY_CAPSULE
+            case BoundPrimitiveType.CYLINDER.value:
+                sollum_type = SollumType.BOUND_POLY_CYLINDER
+            case _:
+                continue
+
+        name = SOLLUMZ_UI_NAMES[sollum_type]
+        prim_mesh = bpy.data.meshes.new(name)
+        radius, _, length = size
+        match sollum_type:
+            case SollumType.BOUND_POLY_BOX:
+                create_box(prim_mesh, size=1)
+                matrix = Matrix.LocRotScale(Vector(position), Euler(rotation), Vector(size))
+            case SollumType.BOUND_POLY_SPHERE:
+                create_sphere(prim_mesh, radius)
+                matrix = Matrix.Translation(position)
+            case SollumType.BOUND_POLY_CAPSULE:
+                create_capsule(prim_mesh, radius=radius, length=length, axis="Z")
+                matrix = Matrix.LocRotScale(Vector(position), Euler(rotation), None)
+            case SollumType.BOUND_POLY_CYLINDER:
+                create_cylinder(prim_mesh, radius=radius, length=length, axis="Z")
+                matrix = Matrix.LocRotScale(Vector(position), Euler(rotation), None)
+
+        if 0 <= material_index < len(mesh.materials):
+            prim_mesh.materials.append(mesh.materials[material_index])
+
+        prim_obj = create_blender_object(sollum_type, name, prim_mesh)
+        prim_obj.parent = obj.parent
+        prim_obj.matrix_parent_inverse = obj.matrix_parent_inverse
+        prim_obj.matrix_basis = obj.matrix_basis @ matrix
+        new_objs.append(prim_obj)
+
+    return new_objs
+
+
+def add_poly_primitives_preview_modifier(obj: Object):
+    mod = obj.modifiers.new(PREVIEW_MODIFIER_NAME, "NODES")
+    mod.node_group = get_poly_primitives_preview_node_group()
+    mod.show_group_selector = False
+    if bpy.app.version >= (5, 0, 0):
+        mod.show_manage_panel = False
+    return mod
+
+
+def get_poly_primitives_preview_node_group() -> NodeTree:
+    """Gets the geometry nodes group that instances the shape of each primitive on the points. Created the first time it
+    is used.
+    """
+    ng = bpy.data.node_groups.get(PREVIEW_NODE_GROUP_NAME, None)
+    if ng is not None and ng.bl_idname == "GeometryNodeTree":
+        return ng
+
+    ng = bpy.data.node_groups.new(PREVIEW_NODE_GROUP_NAME, "GeometryNodeTree")
+    ng.interface.new_socket("Geometry", in_out="INPUT", socket_type="NodeSocketGeometry")
+    ng.interface.new_socket("Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry")
+
+    nodes = ng.nodes
+    links = ng.links
+
+    def _node(idname: str, x: float, y: float, **props):
+        node = nodes.new(idname)
+        node.location = (x, y)
+        for k, v in props.items():
+            setattr(node, k, v)
+        return node
+
+    def _named_attr(name: str, data_type: str, x: float, y: float):
+        node = _node("GeometryNodeInputNamedAttribute", x, y, data_type=data_type)
+        node.inputs["Name"].default_value = name
+        return node.outputs["Attribute"]
+
+    group_in = _node("NodeGroupInput", -1000, 0)
+    group_out = _node("NodeGroupOutput", 1000, 0)
+    points = group_in.outputs[0]
+
+    prim_type = _named_attr(PRIM_TYPE_ATTR_NAME, "INT", -1000, -200)
+    rotation = _named_attr(PRIM_ROTATION_ATTR_NAME, "FLOAT_VECTOR", -1000, -350)
+    size = _named_attr(PRIM_SIZE_ATTR_NAME, "FLOAT_VECTOR", -1000, -500)
+    material_index = _named_attr(PRIM_MATERIAL_ATTR_NAME, "INT", 600, -200)
+
+    separate_size = _node("ShaderNodeSeparateXYZ", -800, -500)
+    links.new(separate_size.inputs[0], size)
+    radius = separate_size.outputs["X"]
+
+    def _is_type(prim: BoundPrimitiveType, y: float):
+        compare = _node("FunctionNodeCompare", -600, y, data_type="INT", operation="EQUAL")
+        # Integer A and B inputs
+        links.new(compare.inputs[2], prim_type)
+        compare.inputs[3].default_value = prim.value
+        return compare.outputs["Result"]
+
+    def _instance(geometry, selection, instance, scale, y: float):
+        inst = _node("GeometryNodeInstanceOnPoints", 200, y)
+        links.new(inst.inputs["Points"], geometry)
+        links.new(inst.inputs["Selection"], selection)
+        links.new(inst.inputs["Instance"], instance)
+        links.new(inst.inputs["Rotation"], rotation)
+        links.new(inst.inputs["Scale"], scale)
+        return inst.outputs["Instances"]
+
+    cube = _node("GeometryNodeMeshCube", -200, 400)
+    cube.inputs["Size"].default_value = (1.0, 1.0, 1.0)
+    sphere = _node("GeometryNodeMeshUVSphere", -200, 200)
+    sphere.inputs["Segments"].default_value = 16
+    sphere.inputs["Rings"].default_value = 8
+    sphere.inputs["Radius"].default_value = 1.0
+    cylinder = _node("GeometryNodeMeshCylinder", -200, 0)
+    cylinder.inputs["Vertices"].default_value = 16
+    cylinder.inputs["Radius"].default_value = 1.0
+    cylinder.inputs["Depth"].default_value = 1.0
+
+    is_capsule = _is_type(BoundPrimitiveType.CAPSULE, -800)
+    instances = [
+        _instance(points, _is_type(BoundPrimitiveType.BOX, 200), cube.outputs["Mesh"], size, 400),
+        _instance(points, _is_type(BoundPrimitiveType.SPHERE, 0), sphere.outputs["Mesh"], radius, 200),
+        _instance(points, _is_type(BoundPrimitiveType.CYLINDER, -200), cylinder.outputs["Mesh"], size, 0),
+        _instance(points, is_capsule, cylinder.outputs["Mesh"], size, -200),
+    ]
+
+    # Capsule ends, spheres on both sides of the capsule cylinder
+    half_length = _node("ShaderNodeMath", -800, -700, operation="MULTIPLY")
+    links.new(half_length.inputs[0], separate_size.outputs["Z"])
+    half_length.inputs[1].default_value = 0.5
+    end_offset = _node("ShaderNodeCombineXYZ", -600, -700)
+    links.new(end_offset.inputs["Z"], half_length.outputs[0])
+    end_offset_rotated = _node("ShaderNodeVectorRotate", -400, -700, rotation_type="EULER_XYZ")
+    links.new(end_offset_rotated.inputs["Vector"], end_offset.outputs[0])
+    links.new(end_offset_rotated.inputs["Rotation"], rotation)
+    for i, sign in enumerate((1.0, -1.0)):
+        end_offset_signed = _node("ShaderNodeVectorMath", -200, -700 - 150 * i, operation="SCALE")
+        links.new(end_offset_signed.inputs[0], end_offset_rotated.outputs[0])
+        end_offset_signed.inputs["Scale"].default_value = sign
+        capsule_end = _node("GeometryNodeSetPosition", 0, -400 - 150 * i)
+        links.new(capsule_end.inputs["Geometry"], points)
+        links.new(capsule_end.inputs["Selection"], is_capsule)
+        links.new(capsule_end.inputs["Offset"], end_offset_signed.outputs[0])
+        instances.append(_instance(capsule_end.outputs[0], is_capsule, sphere.outputs["Mesh"], radius, -400 - 150 * i))
+
+    join = _node("GeometryNodeJoinGeometry", 400, 0)
+    # Reversed so the multi-input keeps the order
+    for inst in reversed(instances):
+        links.new(join.inputs[0], inst)
+
+    # Realize to assign the material of each primitive, it is propagated from the points to the instance faces
+    realize = _node("GeometryNodeRealizeInstances", 600, 0)
+    links.new(realize.inputs[0], join.outputs[0])
+    set_material = _node("GeometryNodeSetMaterialIndex", 800, 0)
+    links.new(set_material.inputs["Geometry"], realize.outputs[0])
+    links.new(set_material.inputs["Material Index"], material_index)
+    links.new(group_out.inputs[0], set_material.outputs[0])
+
+    return ng
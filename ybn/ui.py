@@ -79,8 +79,9 @@ class SOLLUMZ_PT_BOUND_PROPERTIES_PANEL(bpy.types.Panel):
         return obj and (obj.sollum_type in BOUND_TYPES or obj.sollum_type in BOUND_POLYGON_TYPES)
 
     def draw(self, context):
-        # nothing here currently
-        pass
+        obj = context.active_object
+        if obj.sollum_type == SollumType.BOUND_POLY_PRIMITIVES:
+            self.layout.operator(ybn_ops.SOLLUMZ_OT_explode_bound_poly_primitives.bl_idname, icon="MOD_EXPLODE")
 
 
 class SOLLUMZ_PT_BOUND_SHAPE_PANEL(bpy.types.Panel):
@@ -97,7 +98,7 @@ class SOLLUMZ_PT_BOUND_SHAPE_PANEL(bpy.types.Panel):
     @classmethod
     def poll(self, context):
         obj = context.active_object
-        return obj and (obj.sollum_type != SollumType.BOUND_COMPOSITE and obj.sollum_type != SollumType.BOUND_GEOMETRY and obj.sollum_type != SollumType.BOUND_GEOMETRYBVH and obj.sollum_type != SollumType.BOUND_PLANE and obj.sollum_type != SollumType.BOUND_POLY_TRIANGLE)
+        return obj and (obj.sollum_type != SollumType.BOUND_COMPOSITE and obj.sollum_type != SollumType.BOUND_GEOMETRY and obj.sollum_type != SollumType.BOUND_GEOMETRYBVH and obj.sollum_type != SollumType.BOUND_PLANE and obj.sollum_type != SollumType.BOUND_POLY_TRIANGLE and obj.sollum_type != SollumType.BOUND_POLY_PRIMITIVES)
 
     def draw(self, context):
         obj = context.active_object
@@ -343,5 +344,7 @@ class SOLLUMZ_PT_CREATE_MATERIAL_PANEL(CollisionToolChildPanel, bpy.types.Panel)
         row = layout.row()
         row.operator(
             ybn_ops.SOLLUMZ_OT_convert_non_collision_materials_to_selected.bl_idname)
+        row = layout.row()
+        row.operator(ybn_ops.SOLLUMZ_OT_merge_duplicate_collision_materials.bl_idname, icon="AUTOMERGE_ON")
 
 
@@ -5,9 +5,10 @@ from bpy.types import (
     Mesh,
 )
 from mathutils import Vector, Matrix
-from typing import Optional, Callable, Sequence
+from typing import Optional
 from dataclasses import replace
 import numpy as np
+from numpy.typing import NDArray
 
 from ..sollumz_helper import get_parent_inverse
 from ..tools.blenderhelper import get_pose_inverse, get_evaluated_obj
@@ -24,23 +25,32 @@ from szio.gta5 import (
 )
 from ..tools.utils import get_max_vector_list, get_min_vector_list, get_matrix_without_scale
 from ..tools.meshhelper import (
-    get_corners_from_extents,
     get_inner_sphere_radius,
     get_combined_bound_box_tight,
     get_color_attr_name,
 )
 from ..sollumz_properties import MaterialType, SOLLUMZ_UI_NAMES, SollumType, BOUND_POLYGON_TYPES
 from ..iecontext import export_context, ExportBundle
+from ..profiling import traced
 from .. import logger
 from .properties import CollisionMatFlags, get_collision_mat_raw_flags, BoundFlags
+from ..shared.geometry import MassShape, get_mass_properties_of_primitives
+from .poly_primitives import read_poly_primitives, euler_to_matrices, get_poly_primitives_corners
 
 MAX_VERTICES = 32767
 
+# Selects the max (True) or min (False) extent of each component of the box corners
+_BOX_CORNERS_SELECT = np.array([
+    (x, y, z) for x in (False, True) for y in (False, True) for z in (False, True)
+])
 
+
+@traced()
 def export_ybn(obj: Object) -> ExportBundle:
     return export_context().make_bundle(create_bound_composite_asset(obj))
 
 
+@traced()
 def create_bound_composite_asset(
     obj: Object,
     out_child_obj_to_index: dict[Object, int] = None,
@@ -54,47 +64,54 @@ def create_bound_composite_asset(
         logger.warning(f"Bound composite '{obj.name}' has no children.")
 
     children = []
-    centroid = Vector()
-    cg = Vector()
-    volume = 0.0
-    extents_corners: list[Vector] = []
+    primitive_children = []
+    primitive_mass_shapes = []
     for child_obj in obj.children:
-        child_bound = create_bound_asset(child_obj, allow_planes=allow_planes)
+        child_bound, mass_shape = _create_bound_asset(child_obj, allow_planes=allow_planes)
         if child_bound is None:
             continue
 
         if out_child_obj_to_index is not None:
             out_child_obj_to_index[child_obj] = len(children)
         children.append(child_bound)
+        if mass_shape is not None:
+            primitive_children.append(child_bound)
+            primitive_mass_shapes.append(mass_shape)
 
-        child_transform = child_bound.composite_transform.transposed()
-        child_cg = child_transform @ child_bound.cg
-        child_centroid = child_transform @ child_bound.centroid
-        child_volume = child_bound.volume
-
-        child_min, child_max = child_bound.extent
-        child_corners = get_corners_from_extents(child_min, child_max)
-
-        volume += child_volume
-        cg += child_cg * child_volume  # uniform density so volume == mass
-        centroid += child_centroid
-        extents_corners.extend(child_transform @ c for c in child_corners)
+    if primitive_children:
+        # Mass properties of all the primitive children in a single call
+        _set_primitives_mass_properties(primitive_children, primitive_mass_shapes)
 
     num_children = len(children)
-    cg /= volume if volume > 0 else 1.0
-    centroid /= num_children if num_children > 0 else 1
-    bbmin, bbmax = get_min_vector_list(extents_corners), get_max_vector_list(extents_corners)
-
-    # Calculate combined moment of inertia
-    if volume > 0.0 and num_children > 0:
-        from ..shared.geometry import calculate_composite_inertia
-        child_masses = [child.volume for child in children]
-        child_inertias = [child.inertia * child.volume for child in children]
-        child_cgs = [child.composite_transform.transposed() @ child.cg for child in children]
-        inertia = calculate_composite_inertia(cg, child_cgs, child_masses, child_inertias)
-        inertia /= volume
+    if num_children > 0:
+        from ..shared.geometry import get_composite_mass_properties
+        # Combine the children in a single pass, with their properties in arrays
+        child_transforms = np.array([child.composite_transform.transposed() for child in children], dtype=np.float64)
+        child_rotations = child_transforms[:, :3, :3]
+        child_translations = child_transforms[:, :3, 3]
+
+        def _to_composite_space(points: NDArray) -> NDArray:
+            return np.einsum("nij,n...j->n...i", child_rotations, points) + child_translations.reshape((-1, 1, 3))
+
+        child_cgs = _to_composite_space(np.array([child.cg for child in children])[:, np.newaxis])[:, 0]
+        child_centroids = _to_composite_space(np.array([child.centroid for child in children])[:, np.newaxis])[:, 0]
+        child_extents = np.array([child.extent for child in children], dtype=np.float64)
+        child_corners = np.where(_BOX_CORNERS_SELECT, child_extents[:, 1:2], child_extents[:, 0:1])
+        extents_corners = _to_composite_space(child_corners).reshape((-1, 3))
+
+        volume, cg, inertia = get_composite_mass_properties(
+            np.array([child.volume for child in children], dtype=np.float64),
+            child_cgs,
+            np.array([child.inertia for child in children], dtype=np.float64),
+        )
+        centroid = Vector(child_centroids.mean(axis=0))
+        bbmin, bbmax = Vector(extents_corners.min(axis=0)), Vector(extents_corners.max(axis=0))
     else:
+        volume = 0.0
+        cg = Vector()
         inertia = Vector((1.0, 1.0, 1.0))
+        centroid = Vector()
+        bbmin, bbmax = Vector(), Vector()
 
     composite = AssetBoundComposite()
     composite.children = children
@@ -161,6 +178,34 @@ def init_bound_bvh_asset(obj: Object) -> tuple[AssetBound, list[BoundVertex], li
 
 def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool = False) -> Optional[AssetBound]:
     """Create a ``Bound`` instance based on `obj.sollum_type``."""
+    bound, mass_shape = _create_bound_asset(obj, is_root, allow_planes)
+    if bound is not None and mass_shape is not None:
+        _set_primitives_mass_properties([bound], [mass_shape])
+
+    return bound
+
+
+def _set_primitives_mass_properties(bounds: list[AssetBound], mass_shapes: list[tuple[MassShape, tuple]]):
+    """Sets the volume and inertia of primitive bounds from their `MassShape` and dimensions."""
+    volumes, inertias = get_mass_properties_of_primitives(
+        np.array([shape.value for shape, _ in mass_shapes], dtype=np.int32),
+        np.array([dimensions for _, dimensions in mass_shapes], dtype=np.float64),
+    )
+    for bound, volume, inertia in zip(bounds, volumes.tolist(), inertias.tolist()):
+        bound.volume = volume
+        bound.inertia = Vector(inertia)
+
+
+# Traced with the public name, the children of composites only go through this function
+@traced("ybnexport.create_bound_asset")
+def _create_bound_asset(
+    obj: Object,
+    is_root: bool = False,
+    allow_planes: bool = False,
+) -> tuple[Optional[AssetBound], Optional[tuple[MassShape, tuple]]]:
+    """Like `create_bound_asset`, but the volume and inertia of primitive bounds are not calculated. Instead, returns
+    their `MassShape` and dimensions, so the mass properties of multiple primitives can be calculated at once.
+    """
     if obj.sollum_type not in {
         SollumType.BOUND_BOX,
         SollumType.BOUND_SPHERE,
@@ -175,25 +220,25 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
             f"'{obj.name}' is being exported as bound but has no bound Sollumz type! Please, use a bound type instead "
             f"of '{SOLLUMZ_UI_NAMES[obj.sollum_type]}'."
         )
-        return None
+        return None, None
 
     if not allow_planes and obj.sollum_type == SollumType.BOUND_PLANE:
         logger.warning(
             f"'{obj.name}' is a {SOLLUMZ_UI_NAMES[SollumType.BOUND_PLANE]} but planes are not supported in this "
             f"context! Only fragment cloth world bounds may use planes."
         )
-        return None
+        return None, None
 
     if obj.type == "MESH" and not validate_collision_materials(obj, verbose=True):
-        return None
+        return None, None
 
     from ..shared.geometry import (
-        get_centroid_of_box, get_mass_properties_of_box,
-        get_centroid_of_disc, get_mass_properties_of_disc,
-        get_centroid_of_sphere, get_mass_properties_of_sphere,
-        get_centroid_of_cylinder, get_mass_properties_of_cylinder,
-        get_centroid_of_capsule, get_mass_properties_of_capsule,
-        get_centroid_of_mesh, get_mass_properties_of_mesh,
+        get_centroid_of_box,
+        get_centroid_of_disc,
+        get_centroid_of_sphere,
+        get_centroid_of_cylinder,
+        get_centroid_of_capsule,
+        get_centroid_of_mesh, get_mass_properties_of_mesh_cached,
         grow_sphere,
         shrink_mesh,
     )
@@ -204,6 +249,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
     volume = 0.0
     inertia = Vector((1.0, 1.0, 1.0))
     margin = 0.0
+    mass_shape = None
 
     match obj.sollum_type:
         case SollumType.BOUND_BOX:
@@ -213,7 +259,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
             extents = box_max - box_min
 
             centroid, radius_around_centroid = get_centroid_of_box(box_min, box_max)
-            volume, cg, inertia = get_mass_properties_of_box(box_min, box_max)
+            mass_shape = MassShape.BOX, tuple(extents)
             margin = min(0.04, min(extents) / 8)  # in boxes the margin equals the smallest side divided by 8
 
         case SollumType.BOUND_DISC:
@@ -226,7 +272,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
             length = extents.x
 
             centroid, radius_around_centroid = get_centroid_of_disc(radius)
-            volume, cg, inertia = get_mass_properties_of_disc(radius, length)
+            mass_shape = MassShape.DISC, (radius, length, 0.0)
             margin = length * 0.5  # in discs the margin equals half the length
 
         case SollumType.BOUND_SPHERE:
@@ -234,7 +280,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
             radius = bound.sphere_radius
 
             centroid, radius_around_centroid = get_centroid_of_sphere(radius)
-            volume, cg, inertia = get_mass_properties_of_sphere(radius)
+            mass_shape = MassShape.SPHERE, (radius, 0.0, 0.0)
             margin = radius  # in spheres the margin equals the radius
 
         case SollumType.BOUND_CYLINDER:
@@ -242,7 +288,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
             radius, length = bound.cylinder_radius_length
 
             centroid, radius_around_centroid = get_centroid_of_cylinder(radius, length)
-            volume, cg, inertia = get_mass_properties_of_cylinder(radius, length)
+            mass_shape = MassShape.CYLINDER, (radius, length, 0.0)
             # in cylinders the margin equals 1/4 the minimum between radius and half-length
             margin = min(0.04, min(radius, length * 0.5) / 4)
 
@@ -251,7 +297,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
             radius, length = bound.capsule_radius_length
 
             centroid, radius_around_centroid = get_centroid_of_capsule(radius, length)
-            volume, cg, inertia = get_mass_properties_of_capsule(radius, length)
+            mass_shape = MassShape.CAPSULE, (radius, length, 0.0)
             margin = radius  # in capsules the margin equals the capsule radius
 
         case SollumType.BOUND_PLANE:
@@ -278,7 +324,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
                 mesh_faces = np.array([prim.vertices for prim in primitives])
 
                 centroid, radius_around_centroid = get_centroid_of_mesh(mesh_vertices)
-                volume, cg, inertia = get_mass_properties_of_mesh(mesh_vertices, mesh_faces)
+                volume, cg, inertia = get_mass_properties_of_mesh_cached(mesh_vertices, mesh_faces)
 
             # R* seems to apply the margin to the bbox before calculating the actual margin from shrunk mesh, so
             # the default margin is applied
@@ -297,7 +343,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
 
         case SollumType.BOUND_GEOMETRYBVH:
             if not validate_bvh_collision_materials(obj, verbose=True):
-                return None
+                return None, None
 
             bound, vertices, primitives = init_bound_bvh_asset(obj)
 
@@ -315,7 +361,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
                 if len(mesh_faces) > 0:
                     # If we have a mesh, calculate the center of gravity from the mesh
                     mesh_faces = np.array(mesh_faces)
-                    _, cg, _ = get_mass_properties_of_mesh(mesh_vertices, mesh_faces)
+                    _, cg, _ = get_mass_properties_of_mesh_cached(mesh_vertices, mesh_faces)
                 else:
                     # Otherwise, approximate with the centroid
                     cg = centroid
@@ -390,7 +436,7 @@ def create_bound_asset(obj: Object, is_root: bool = False, allow_planes: bool =
     bound.cg = cg
     bound.inertia = inertia
     bound.margin = margin
-    return bound
+    return bound, mass_shape
 
 
 def validate_collision_materials(obj: Object, verbose: bool = False) -> bool:
@@ -413,7 +459,9 @@ def validate_collision_materials(obj: Object, verbose: bool = False) -> bool:
             )
         return False
 
-    supports_multiple_materials = obj.sollum_type in {SollumType.BOUND_GEOMETRY, SollumType.BOUND_POLY_TRIANGLE}
+    supports_multiple_materials = obj.sollum_type in {
+        SollumType.BOUND_GEOMETRY, SollumType.BOUND_POLY_TRIANGLE, SollumType.BOUND_POLY_PRIMITIVES
+    }
     if not col_mats:
         if verbose:
             logger.warning(f"Bound '{obj.name}' has no collision materials! Please, add a collision material.")
@@ -473,60 +521,157 @@ def init_bound_geometry_primitives(
     return vertices, primitives
 
 
-def create_bound_geometry_vertices_and_primitives(
-    bound: AssetBound,
-    obj: Object
-) -> tuple[list[BoundVertex], list[BoundPrimitive]]:
-    # Create mappings of vertices and materials by index to build the new geom_xml vertices
-    ind_by_vert: dict[tuple, int] = {}
-    data_by_mat: dict[Material, CollisionMaterial] = {}
-
-    vertices = []
-    vertex_colors = []
+class BoundGeometryBuilder:
+    """Assembles the vertices and primitives of a bound geometry or BVH. Each child adds its vertices as a numpy block
+    and its primitives as arrays of indices into that block. `build` removes the duplicate vertices of all blocks at
+    once and creates the primitives with the final vertex indices.
+    """
 
-    def _get_vert_index(vert: Vector, vert_color: Optional[tuple[int, int, int, int]] = None) -> int:
-        default_vert_color = (255, 255, 255, 255)
+    DEFAULT_VERTEX_COLOR = (255, 255, 255, 255)
 
-        # These are safety checks in case the user mixed poly primitives and poly meshes with color attributes
-        # This doesn't occur in original .ybns, if they have vertex colors, only poly triangles (meshes) are used.
-        if vert_color is not None and len(vertex_colors) != len(vertices):
-            # This vertex has color but previous ones didn't, assign a default color to all previous vertices
-            for _ in range(len(vertex_colors), len(vertices)):
-                vertex_colors.append(default_vert_color)
+    def __init__(self):
+        self._position_blocks: list[NDArray[np.float32]] = []
+        self._color_blocks: list[Optional[NDArray[np.uint8]]] = []
+        self._num_vertices = 0
+        self._primitive_blocks: list[
+            tuple[BoundPrimitiveType, NDArray[np.int64], list[CollisionMaterial], Optional[NDArray[np.float32]]]
+        ] = []
+        self._data_by_mat: dict[Material, CollisionMaterial] = {}
 
-        if vert_color is None and len(vertex_colors) != 0:
-            # There are already vertex colors in this geometry, assign a default color
-            vert_color = default_vert_color
+    def get_mat_data(self, mat: Material) -> CollisionMaterial:
+        if mat in self._data_by_mat:
+            return self._data_by_mat[mat]
 
-        # Tuple to uniquely identify this vertex and remove duplicates
-        # Must be tuple since Vector is not hashable
-        vertex_id = (*vert, *(vert_color or default_vert_color))
+        mat_data = create_collision_material_data(mat)
+        self._data_by_mat[mat] = mat_data
+        return mat_data
 
-        if vertex_id in ind_by_vert:
-            return ind_by_vert[vertex_id]
+    def add_vertices(self, positions: NDArray, colors: Optional[NDArray] = None) -> int:
+        """Adds a block of vertices, with optional RGBA colors in range 0-255. Returns the index of the first vertex of
+        the block, to add to the block indices of the primitives.
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape((-1, 3))
+        if colors is not None:
+            colors = np.asarray(colors).reshape((-1, 4)).astype(np.uint8)
+
+        offset = self._num_vertices
+        self._position_blocks.append(positions)
+        self._color_blocks.append(colors)
+        self._num_vertices += len(positions)
+        return offset
+
+    def add_primitives(
+        self,
+        primitive_type: BoundPrimitiveType,
+        vertex_inds: NDArray,
+        materials: list[CollisionMaterial],
+        radii: Optional[NDArray] = None,
+    ):
+        """Adds primitives of the same type. ``vertex_inds`` has the vertex indices of each primitive, as returned by
+        `add_vertices` plus the index within the block.
+        """
+        vertex_inds = np.asarray(vertex_inds, dtype=np.int64).reshape((len(materials), -1))
+        if radii is not None:
+            radii = np.asarray(radii, dtype=np.float32)
+        self._primitive_blocks.append((primitive_type, vertex_inds, materials, radii))
+
+    def build(self) -> tuple[list[BoundVertex], list[BoundPrimitive]]:
+        if self._num_vertices == 0:
+            return [], self._create_primitives(np.empty(0, dtype=np.int64))
+
+        positions = np.concatenate(self._position_blocks)
+
+        # Colors are only exported if any vertex has a color, other vertices get the default color. This doesn't occur
+        # in original .ybns, if they have vertex colors, only poly triangles (meshes) are used.
+        has_colors = any(c is not None for c in self._color_blocks)
+        colors = None
+        if has_colors:
+            colors = np.concatenate([
+                c if c is not None else np.full((len(p), 4), self.DEFAULT_VERTEX_COLOR, dtype=np.uint8)
+                for p, c in zip(self._position_blocks, self._color_blocks)
+            ])
+
+        unique_inds, remap = _dedupe_bound_geometry_vertices(positions, colors)
+
+        unique_positions = positions[unique_inds].tolist()
+        if has_colors:
+            unique_colors = [tuple(c) for c in colors[unique_inds].tolist()]
+            vertices = [BoundVertex(Vector(co), color) for co, color in zip(unique_positions, unique_colors)]
+        else:
+            vertices = [BoundVertex(Vector(co), None) for co in unique_positions]
+
+        return vertices, self._create_primitives(remap)
+
+    def _create_primitives(self, remap: NDArray[np.int64]) -> list[BoundPrimitive]:
+        primitives: list[BoundPrimitive] = []
+        for primitive_type, vertex_inds, materials, radii in self._primitive_blocks:
+            vertex_inds = remap[vertex_inds].tolist()
+            match primitive_type:
+                case BoundPrimitiveType.TRIANGLE:
+                    primitives.extend(
+                        BoundPrimitive.new_triangle(v0, v1, v2, mat)
+                        for (v0, v1, v2), mat in zip(vertex_inds, materials)
+                    )
+                case BoundPrimitiveType.BOX:
+                    primitives.extend(
+                        BoundPrimitive.new_box(v0, v1, v2, v3, mat)
+                        for (v0, v1, v2, v3), mat in zip(vertex_inds, materials)
+                    )
+                case BoundPrimitiveType.SPHERE:
+                    primitives.extend(
+                        BoundPrimitive.new_sphere(v0, radius, mat)
+                        for (v0,), radius, mat in zip(vertex_inds, radii.tolist(), materials)
+                    )
+                case BoundPrimitiveType.CAPSULE:
+                    primitives.extend(
+                        BoundPrimitive.new_capsule(v0, v1, radius, mat)
+                        for (v0, v1), radius, mat in zip(vertex_inds, radii.tolist(), materials)
+                    )
+                case BoundPrimitiveType.CYLINDER:
+                    primitives.extend(
+                        BoundPrimitive.new_cylinder(v0, v1, radius, mat)
+                        for (v0, v1), radius, mat in zip(vertex_inds, radii.tolist(), materials)
+                    )
+                case _:
+                    assert False, f"Unknown primitive type '{primitive_type}'"
+
+        return primitives
+
+
+def _dedupe_bound_geometry_vertices(
+    positions: NDArray[np.float32],
+    colors: Optional[NDArray[np.uint8]],
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Finds the unique vertices, comparing the positions quantized to single precision, as stored in the exported
+    bound, and the colors. Returns the indices of the unique vertices in order of first occurrence, and the new index of
+    each vertex.
+    """
+    # Add 0.0 so -0.0 and 0.0 have the same bits
+    keys = np.empty((len(positions), 4), dtype=np.uint32)
+    keys[:, :3] = (positions + np.float32(0.0)).view(np.uint32)
+    keys[:, 3] = colors.view(np.uint32).ravel() if colors is not None else 0
 
-        vert_ind = len(ind_by_vert)
-        ind_by_vert[vertex_id] = vert_ind
-        vertices.append(Vector(vert))
-        if vert_color is not None:
-            vertex_colors.append(vert_color)
+    _, unique_inds, inverse_inds = np.unique(keys, axis=0, return_index=True, return_inverse=True)
 
-        return vert_ind
+    # np.unique returns the vertices sorted by key, restore the order of first occurrence
+    order = np.argsort(unique_inds)
+    new_inds = np.empty(len(order), dtype=np.int64)
+    new_inds[order] = np.arange(len(order), dtype=np.int64)
+    return unique_inds[order], new_inds[inverse_inds.reshape(-1)]
 
-    def _get_mat_data(mat: Material) -> CollisionMaterial:
-        if mat in data_by_mat:
-            return data_by_mat[mat]
 
-        mat_data = create_collision_material_data(mat)
-        data_by_mat[mat] = mat_data
-        return mat_data
+@traced()
+def create_bound_geometry_vertices_and_primitives(
+    bound: AssetBound,
+    obj: Object
+) -> tuple[list[BoundVertex], list[BoundPrimitive]]:
+    builder = BoundGeometryBuilder()
 
     if bound.bound_type == BoundType.GEOMETRY:
         # If the bound object is a mesh, just convert its mesh data into triangles
-        primitives = create_bound_geometry_primitive_mesh(obj, bound, _get_vert_index, _get_mat_data)
+        create_bound_geometry_primitive_mesh(obj, bound, builder)
     else:
         # For empty bound objects with children, create the bound polygons from its children
-        primitives = []
         for child in obj.children_recursive:
             if child.sollum_type not in BOUND_POLYGON_TYPES:
                 logger.warning(
@@ -535,11 +680,9 @@ def create_bound_geometry_vertices_and_primitives(
                 )
                 continue
 
-            primitives.extend(create_bound_geometry_primitive(child, bound, _get_vert_index, _get_mat_data))
+            create_bound_geometry_primitive(child, bound, builder)
 
-    has_colors = bool(vertex_colors)
-    vertices = [BoundVertex(v, vertex_colors[i] if has_colors else None) for i, v in enumerate(vertices)]
-    return vertices, primitives
+    return builder.build()
 
 
 def create_export_mesh(obj: Object) -> tuple[Object, Mesh]:
@@ -554,51 +697,35 @@ def create_export_mesh(obj: Object) -> tuple[Object, Mesh]:
     return obj_eval, mesh
 
 
-def create_bound_geometry_primitive_mesh(
-    obj: Object,
-    bound: AssetBound,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> list[BoundPrimitive]:
+def create_bound_geometry_primitive_mesh(obj: Object, bound: AssetBound, builder: BoundGeometryBuilder):
     """Create all bound poly triangles and vertices for a ``BoundGeometry`` object."""
     obj_eval, mesh = create_export_mesh(obj)
 
     transforms = calc_bound_primitives_transforms_to_apply(obj, bound.composite_transform)
-    triangles = create_primitive_triangles(mesh, transforms, get_vert_index, get_mat_data)
+    create_primitive_triangles(mesh, transforms, builder)
 
     obj_eval.to_mesh_clear()
 
-    return triangles
-
-
-def create_bound_geometry_primitive(
-    obj: Object,
-    bound: AssetBound,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> Sequence[BoundPrimitive]:
-    obj_eval, mesh = create_export_mesh(obj)
 
+def create_bound_geometry_primitive(obj: Object, bound: AssetBound, builder: BoundGeometryBuilder):
     transforms = calc_bound_primitives_transforms_to_apply(obj, bound.composite_transform)
 
     match obj.sollum_type:
         case SollumType.BOUND_POLY_TRIANGLE:
-            primitives = create_primitive_triangles(mesh, transforms, get_vert_index, get_mat_data)
+            # Only triangles need the evaluated mesh, the other primitives only use the object bounding box
+            obj_eval, mesh = create_export_mesh(obj)
+            create_primitive_triangles(mesh, transforms, builder)
+            obj_eval.to_mesh_clear()
         case SollumType.BOUND_POLY_BOX:
-            box = create_primitive_box(obj, transforms, get_vert_index, get_mat_data)
-            primitives = (box,)
+            create_primitive_box(obj, transforms, builder)
         case SollumType.BOUND_POLY_SPHERE:
-            sphere = create_primitive_sphere(obj, transforms, get_vert_index, get_mat_data)
-            primitives = (sphere,)
+            create_primitive_sphere(obj, transforms, builder)
         case SollumType.BOUND_POLY_CYLINDER:
-            cylinder = create_primitive_cylinder(obj, transforms, get_vert_index, get_mat_data)
-            primitives = (cylinder,)
+            create_primitive_cylinder(obj, transforms, builder)
         case SollumType.BOUND_POLY_CAPSULE:
-            capsule = create_primitive_capsule(obj, transforms, get_vert_index, get_mat_data)
-            primitives = (capsule,)
-
-    obj_eval.to_mesh_clear()
-    return primitives
+            create_primitive_capsule(obj, transforms, builder)
+        case SollumType.BOUND_POLY_PRIMITIVES:
+            create_primitives_from_poly_primitives(obj, transforms, builder)
 
 
 def _batch_extract_mesh_tri_data(mesh: Mesh, transforms: Matrix, color_attr):
@@ -672,12 +799,7 @@ def _dedupe_bound_vertices(loop_positions, loop_to_vert, colors_int, tri_loop_in
     return unique_positions, unique_colors, tri_vert_indices
 
 
-def create_primitive_triangles(
-    mesh: Mesh,
-    transforms: Matrix,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> list[BoundPrimitive]:
+def create_primitive_triangles(mesh: Mesh, transforms: Matrix, builder: BoundGeometryBuilder):
     """Create all primitive triangles objects for this mesh."""
     color_attr_name = get_color_attr_name(0)
     color_attr = mesh.color_attributes.get(color_attr_name, None)
@@ -686,67 +808,37 @@ def create_primitive_triangles(
 
     num_tris = len(mesh.loop_triangles)
     if num_tris == 0:
-        return []
+        return
 
     tri_loop_indices, tri_mat_indices, loop_positions, loop_to_vert, colors_int = \
         _batch_extract_mesh_tri_data(mesh, transforms, color_attr)
     unique_positions, unique_colors, tri_vert_indices = \
         _dedupe_bound_vertices(loop_positions, loop_to_vert, colors_int, tri_loop_indices)
 
-    # Register unique vertices for proper offset handling
-    num_unique = len(unique_positions)
-    local_to_global = np.empty(num_unique, dtype=np.uint32)
-    for i in range(num_unique):
-        pos = Vector(unique_positions[i])
-        vert_color = tuple(int(c) for c in unique_colors[i]) if unique_colors is not None else None
-        local_to_global[i] = get_vert_index(pos, vert_color=vert_color)
+    offset = builder.add_vertices(unique_positions, unique_colors)
 
     unique_mat_indices = np.unique(tri_mat_indices)
     mat_data_map = {}
-    for mat_idx in unique_mat_indices:
-        mat = mesh.materials[int(mat_idx)]
-        mat_data_map[int(mat_idx)] = get_mat_data(mat)
-
-    triangles: list[BoundPrimitive] = []
-    for t in range(num_tris):
-        mat_data = mat_data_map[int(tri_mat_indices[t])]
-        v0 = int(local_to_global[tri_vert_indices[t, 0]])
-        v1 = int(local_to_global[tri_vert_indices[t, 1]])
-        v2 = int(local_to_global[tri_vert_indices[t, 2]])
-        triangles.append(BoundPrimitive.new_triangle(v0, v1, v2, mat_data))
+    for mat_idx in unique_mat_indices.tolist():
+        mat = mesh.materials[mat_idx]
+        mat_data_map[mat_idx] = builder.get_mat_data(mat)
 
-    return triangles
+    tri_mats = [mat_data_map[mat_idx] for mat_idx in tri_mat_indices.tolist()]
+    builder.add_primitives(BoundPrimitiveType.TRIANGLE, tri_vert_indices.astype(np.int64) + offset, tri_mats)
 
 
-def create_primitive_box(
-    obj: Object,
-    transforms: Matrix,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> BoundPrimitive:
-    mat_data = get_mat_data(obj.active_material)
-    indices = []
+def create_primitive_box(obj: Object, transforms: Matrix, builder: BoundGeometryBuilder):
+    mat_data = builder.get_mat_data(obj.active_material)
     bound_box = [transforms @ Vector(pos) for pos in obj.bound_box]
     corners = [bound_box[0], bound_box[5], bound_box[2], bound_box[7]]
-    for vert in corners:
-        indices.append(get_vert_index(vert))
 
-    v0 = indices[0]
-    v1 = indices[1]
-    v2 = indices[2]
-    v3 = indices[3]
+    offset = builder.add_vertices(np.array(corners, dtype=np.float32))
+    builder.add_primitives(BoundPrimitiveType.BOX, np.arange(4) + offset, [mat_data])
 
-    return BoundPrimitive.new_box(v0, v1, v2, v3, mat_data)
 
-
-def create_primitive_sphere(
-    obj: Object,
-    transforms: Matrix,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> BoundPrimitive:
-    mat_data = get_mat_data(obj.active_material)
-    vert_ind = get_vert_index(transforms.translation)
+def create_primitive_sphere(obj: Object, transforms: Matrix, builder: BoundGeometryBuilder):
+    mat_data = builder.get_mat_data(obj.active_material)
+    offset = builder.add_vertices(np.array(transforms.translation, dtype=np.float32))
 
     # Assuming bounding box forms a cube. Get the sphere enclosed by the cube
     # scale = transforms.to_scale()
@@ -755,19 +847,18 @@ def create_primitive_sphere(
 
     radius = (bbmax.x - bbmin.x) / 2
 
-    return BoundPrimitive.new_sphere(vert_ind, radius, mat_data)
+    builder.add_primitives(BoundPrimitiveType.SPHERE, [offset], [mat_data], [radius])
 
 
 def _create_primitive_cylinder_or_capsule(
     is_capsule: bool,
     obj: Object,
     transforms: Matrix,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> BoundPrimitive:
+    builder: BoundGeometryBuilder,
+):
     position = transforms.translation
 
-    mat_data = get_mat_data(obj.active_material)
+    mat_data = builder.get_mat_data(obj.active_material)
 
     # Only apply scale so we can get the oriented bounding box
     # scale = transforms.to_scale()
@@ -784,32 +875,88 @@ def _create_primitive_cylinder_or_capsule(
     vertical = Vector((0, 0, height / 2))
     vertical.rotate(transforms.to_euler("XYZ"))
 
-    v0 = get_vert_index(position - vertical)
-    v1 = get_vert_index(position + vertical)
-
-    return (
-        BoundPrimitive.new_capsule(v0, v1, radius, mat_data)
-        if is_capsule
-        else BoundPrimitive.new_cylinder(v0, v1, radius, mat_data)
+    offset = builder.add_vertices(np.array((position - vertical, position + vertical), dtype=np.float32))
+    builder.add_primitives(
+        BoundPrimitiveType.CAPSULE if is_capsule else BoundPrimitiveType.CYLINDER,
+        np.arange(2) + offset,
+        [mat_data],
+        [radius],
     )
 
 
-def create_primitive_cylinder(
-    obj: Object,
-    transforms: Matrix,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> BoundPrimitive:
-    return _create_primitive_cylinder_or_capsule(False, obj, transforms, get_vert_index, get_mat_data)
+def create_primitive_cylinder(obj: Object, transforms: Matrix, builder: BoundGeometryBuilder):
+    _create_primitive_cylinder_or_capsule(False, obj, transforms, builder)
 
 
-def create_primitive_capsule(
-    obj: Object,
-    transforms: Matrix,
-    get_vert_index: Callable[[Vector], int],
-    get_mat_data: Callable[[Material], CollisionMaterial]
-) -> BoundPrimitive:
-    return _create_primitive_cylinder_or_capsule(True, obj, transforms, get_vert_index, get_mat_data)
+def create_primitive_capsule(obj: Object, transforms: Matrix, builder: BoundGeometryBuilder):
+    _create_primitive_cylinder_or_capsule(True, obj, transforms, builder)
+
+
+def create_primitives_from_poly_primitives(obj: Object, transforms: Matrix, builder: BoundGeometryBuilder):
+    """Create the primitives stored as points of a Bound Poly Primitives object. The point attributes are read from the
+    original mesh, the evaluated mesh only has the preview shapes.
+    """
+    mesh = obj.data
+    prims = read_poly_primitives(mesh)
+    if len(prims) == 0:
+        return
+
+    num_mats = len(mesh.materials)
+    if num_mats == 0:
+        logger.error(f"Bound '{obj.name}' has no collision materials! Skipping its {len(prims)} primitive(s).")
+        return
+
+    material_inds = prims.material_inds
+    is_invalid_mat = (material_inds < 0) | (material_inds >= num_mats)
+    if np.any(is_invalid_mat):
+        logger.warning(
+            f"Bound '{obj.name}' has {np.count_nonzero(is_invalid_mat)} primitive(s) with an invalid material index! "
+            f"Using the closest material slot instead."
+        )
+        material_inds = np.clip(material_inds, 0, num_mats - 1)
+
+    mat_data_map = {}
+    for mat_idx in np.unique(material_inds).tolist():
+        mat_data_map[mat_idx] = builder.get_mat_data(mesh.materials[mat_idx])
+
+    transforms_np = np.array(transforms, dtype=np.float64)
+    rot_scale = transforms_np[:3, :3]
+    translation = transforms_np[:3, 3]
+
+    rotations = euler_to_matrices(prims.rotations)
+    sizes = prims.sizes.astype(np.float64)
+    positions = prims.positions.astype(np.float64)
+
+    def _add(primitive_type: BoundPrimitiveType, points: NDArray[np.float64], selection: NDArray[np.bool_], radii=None):
+        num_prims = len(points)
+        points = points.reshape((-1, 3)) @ rot_scale.T + translation
+        offset = builder.add_vertices(points)
+        vertex_inds = np.arange(len(points), dtype=np.int64).reshape((num_prims, -1)) + offset
+        materials = [mat_data_map[mat_idx] for mat_idx in material_inds[selection].tolist()]
+        builder.add_primitives(primitive_type, vertex_inds, materials, radii)
+
+    # Keep the order of the primitives within each type
+    is_box = prims.types == BoundPrimitiveType.BOX.value
+    if np.any(is_box):
+        # Same corners as `create_primitive_box`
+        corner_signs = np.array(((-1, -1, -1), (1, -1, 1), (-1, 1, 1), (1, 1, -1)), dtype=np.float64) * 0.5
+        axes = rotations[is_box] * sizes[is_box, np.newaxis, :]
+        corners = positions[is_box, np.newaxis, :] + np.einsum("nij,kj->nki", axes, corner_signs)
+        _add(BoundPrimitiveType.BOX, corners, is_box)
+
+    is_sphere = prims.types == BoundPrimitiveType.SPHERE.value
+    if np.any(is_sphere):
+        _add(BoundPrimitiveType.SPHERE, positions[is_sphere], is_sphere, sizes[is_sphere, 0])
+
+    for primitive_type in (BoundPrimitiveType.CYLINDER, BoundPrimitiveType.CAPSULE):
+        is_type = prims.types == primitive_type.value
+        if not np.any(is_type):
+            continue
+
+        half_axis = rotations[is_type, :, 2] * (sizes[is_type, 2, np.newaxis] * 0.5)
+        center = positions[is_type]
+        ends = np.stack((center - half_axis, center + half_axis), axis=1)
+        _add(primitive_type, ends, is_type, sizes[is_type, 0])
 
 
 def create_collision_material_data(mat: Material) -> CollisionMaterial:
@@ -868,6 +1015,20 @@ def calc_bound_bvh_extents(obj: Object, composite_transform: Matrix) -> tuple[Ve
 
     bbmin, bbmax = get_combined_bound_box_tight(obj, matrix=transforms_to_apply)
 
+    # The mesh of poly primitives objects only has the primitive centers, include the full shape of the primitives
+    for child in obj.children_recursive:
+        if child.sollum_type != SollumType.BOUND_POLY_PRIMITIVES or child.type != "MESH":
+            continue
+
+        prims = read_poly_primitives(child.data)
+        if len(prims) == 0:
+            continue
+
+        m = np.array(calc_bound_primitives_transforms_to_apply(child, composite_transform), dtype=np.float64)
+        corners = get_poly_primitives_corners(prims).reshape((-1, 3)) @ m[:3, :3].T + m[:3, 3]
+        bbmin = Vector(np.minimum(bbmin, corners.min(axis=0)))
+        bbmax = Vector(np.maximum(bbmax, corners.max(axis=0)))
+
     return bbmin, bbmax
 
 
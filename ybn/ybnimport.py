@@ -16,7 +16,6 @@ from szio.gta5 import (
     BoundVertex,
 )
 from ..sollumz_properties import SollumType, SOLLUMZ_UI_NAMES
-from .collision_materials import create_collision_material_from_data
 from ..tools.meshhelper import (
     create_box,
     create_sphere,
@@ -28,15 +27,20 @@ from ..tools.meshhelper import (
 )
 from ..tools.utils import get_direction_of_vectors, abs_vector
 from ..tools.blenderhelper import create_blender_object, create_empty_object
-from mathutils import Matrix, Vector
+from ..iecontext import import_context
+from ..profiling import traced
+from .poly_primitives import PolyPrimitives, write_poly_primitives, add_poly_primitives_preview_modifier
+from mathutils import Euler, Matrix, Vector
 from math import radians
 
 
+@traced()
 def import_ybn(asset: AssetBound, name: str):
     assert asset.bound_type == BoundType.COMPOSITE, "Only Bound Composite import is supported"
     return create_bound_composite(asset, name)
 
 
+@traced()
 def create_bound_composite(composite: AssetBound, name: Optional[str] = None, out_children: list[Object | None] | None = None) -> Object:
     obj = create_empty_object(SollumType.BOUND_COMPOSITE, name)
 
@@ -53,6 +57,7 @@ def create_bound_composite(composite: AssetBound, name: Optional[str] = None, ou
     return obj
 
 
+@traced()
 def create_bound_object(bound: AssetBound) -> Object:
     """Create a bound object based on ``bound_xml.type``"""
     match bound.bound_type:
@@ -80,7 +85,7 @@ def create_bound_child_mesh(bound: AssetBound, sollum_type: SollumType, mesh: Op
     """Create a bound mesh object with materials and composite properties set."""
     obj = create_blender_object(sollum_type, object_data=mesh)
 
-    mat = create_collision_material_from_data(bound.material)
+    mat = import_context().collision_materials.get(bound.material)
     obj.data.materials.append(mat)
 
     set_composite_flags(bound, obj)
@@ -161,6 +166,7 @@ def create_bound_geometry(bound: AssetBound) -> Object:
     return obj
 
 
+@traced()
 def create_bound_bvh(bound: AssetBound) -> Object:
     obj = create_empty_object(SollumType.BOUND_GEOMETRYBVH)
 
@@ -174,21 +180,29 @@ def create_bound_bvh(bound: AssetBound) -> Object:
 
 def create_bound_bvh_primitives(bound: AssetBound, bvh_obj: Object) -> list[Object]:
     triangles = []
+    non_triangles = []
     primitive_objects = []
 
     vertices = bound.geometry_vertices
-    materials_cache = {}
+    compact_primitives = import_context().settings.compact_bound_primitives
     for prim in bound.geometry_primitives:
         if prim.primitive_type == BoundPrimitiveType.TRIANGLE:
             triangles.append(prim)
+        elif compact_primitives:
+            non_triangles.append(prim)
         else:
-            prim_obj = create_bound_primitive(prim, vertices, materials_cache)
+            prim_obj = create_bound_primitive(prim, vertices)
             prim_obj.parent = bvh_obj
             primitive_objects.append(prim_obj)
 
+    if non_triangles:
+        prims_obj = create_bound_poly_primitives(non_triangles, vertices)
+        prims_obj.parent = bvh_obj
+        primitive_objects.append(prims_obj)
+
     if triangles:
         center = bound.geometry_center
-        mesh = create_bound_geometry_triangle_mesh(vertices, triangles, center, materials_cache)
+        mesh = create_bound_geometry_triangle_mesh(vertices, triangles, center)
         mesh_obj = create_blender_object(SollumType.BOUND_POLY_TRIANGLE, object_data=mesh)
         mesh_obj.location = center
         mesh_obj.parent = bvh_obj
@@ -197,27 +211,95 @@ def create_bound_bvh_primitives(bound: AssetBound, bvh_obj: Object) -> list[Obje
     return primitive_objects
 
 
-def create_bound_primitive(primitive: BoundPrimitive, vertices: list[BoundVertex], materials_cache: dict[CollisionMaterial, Material]) -> Object:
-    return PRIM_TO_OBJ_MAP[primitive.primitive_type.value](primitive, vertices, materials_cache)
+def create_bound_primitive(primitive: BoundPrimitive, vertices: list[BoundVertex]) -> Object:
+    return PRIM_TO_OBJ_MAP[primitive.primitive_type.value](primitive, vertices)
+
+
+def create_bound_poly_primitives(
+    primitives: list[BoundPrimitive],
+    vertices: list[BoundVertex],
+) -> Object:
+    """Create a single Bound Poly Primitives object with all the non-triangle ``primitives`` stored as points."""
+    num_prims = len(primitives)
+    types = np.empty(num_prims, dtype=np.int32)
+    positions = np.empty((num_prims, 3), dtype=np.float32)
+    rotations = np.zeros((num_prims, 3), dtype=np.float32)
+    sizes = np.empty((num_prims, 3), dtype=np.float32)
+    material_inds = np.empty(num_prims, dtype=np.int32)
+
+    collision_materials = import_context().collision_materials
+    materials: list[Material] = []
+    materials_indices: dict[CollisionMaterial, int] = {}
+    for i, prim in enumerate(primitives):
+        types[i] = prim.primitive_type.value
+
+        match prim.primitive_type:
+            case BoundPrimitiveType.BOX:
+                loc, rot, scale = get_box_primitive_loc_rot_scale(prim, vertices)
+                positions[i] = loc
+                rotations[i] = rot
+                sizes[i] = scale
+            case BoundPrimitiveType.SPHERE:
+                positions[i] = vertices[prim.vertices[0]].co
+                sizes[i] = prim.radius
+            case BoundPrimitiveType.CAPSULE | BoundPrimitiveType.CYLINDER:
+                v1, v2 = prim.vertices
+                v1 = vertices[v1].co
+                v2 = vertices[v2].co
+                positions[i] = (v1 + v2) / 2
+                rotations[i] = get_direction_of_vectors(v1, v2)
+                sizes[i] = prim.radius, prim.radius, (v1 - v2).length
+
+        material_index = materials_indices.get(prim.material, None)
+        if material_index is None:
+            material_index = len(materials)
+            materials.append(collision_materials.get(prim.material))
+            materials_indices[prim.material] = material_index
+        material_inds[i] = material_index
 
+    name = SOLLUMZ_UI_NAMES[SollumType.BOUND_POLY_PRIMITIVES]
+    mesh = bpy.data.meshes.new(name)
+    write_poly_primitives(mesh, PolyPrimitives(types, positions, rotations, sizes, material_inds))
+    for m in materials:
+        mesh.materials.append(m)
 
-def create_bound_primitive_object(primitive: BoundPrimitive, sz_type: SollumType, materials_cache: dict[CollisionMaterial, Material]) -> Object:
+    obj = create_blender_object(SollumType.BOUND_POLY_PRIMITIVES, name, mesh)
+    add_poly_primitives_preview_modifier(obj)
+    return obj
+
+
+def create_bound_primitive_object(primitive: BoundPrimitive, sz_type: SollumType) -> Object:
     name = SOLLUMZ_UI_NAMES[sz_type]
     mesh = bpy.data.meshes.new(name)
 
-    material = materials_cache.get(primitive.material, None)
-    if material is None:
-        material = create_collision_material_from_data(primitive.material)
-        materials_cache[primitive.material] = material
-    mesh.materials.append(material)
+    mesh.materials.append(import_context().collision_materials.get(primitive.material))
 
     obj = create_blender_object(sz_type, name, mesh)
     return obj
 
 
-def create_bound_primitive_box(primitive: BoundPrimitive, vertices: list[BoundVertex], materials_cache: dict[CollisionMaterial, Material]) -> Object:
-    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_BOX, materials_cache)
+def create_bound_primitive_box(primitive: BoundPrimitive, vertices: list[BoundVertex]) -> Object:
+    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_BOX)
+    create_box(obj.data, size=1)
+    obj.matrix_basis = get_box_primitive_matrix(primitive, vertices)
+    return obj
+
+
+def get_box_primitive_loc_rot_scale(primitive: BoundPrimitive, vertices: list[BoundVertex]) -> tuple[Vector, Euler, Vector]:
+    """Gets the center, rotation and edge lengths of a box primitive. If the box axes are mirrored, the Z edge length is
+    negative.
+    """
+    mat = get_box_primitive_matrix(primitive, vertices)
+    basis = mat.to_3x3()
+    scale = Vector(tuple(col.length for col in basis.col))
+    if basis.determinant() < 0.0:
+        basis.col[2] = -basis.col[2]
+        scale.z = -scale.z
+    return mat.translation, basis.normalized().to_euler("XYZ"), scale
 
+
+def get_box_primitive_matrix(primitive: BoundPrimitive, vertices: list[BoundVertex]) -> Matrix:
+    """Gets the transform of a box primitive, the unit cube transformed by it has the shape of the box."""
     v1, v2, v3, v4 = primitive.vertices
     v1 = vertices[v1].co
     v2 = vertices[v2].co
@@ -282,23 +364,19 @@ def create_bound_primitive_box(primitive: BoundPrimitive, vertices: list[BoundVe
     mat[0] = edge1.x, edge2.x, edge3.x, center.x
     mat[1] = edge1.y, edge2.y, edge3.y, center.y
     mat[2] = edge1.z, edge2.z, edge3.z, center.z
-
-    create_box(obj.data, size=1)
-    obj.matrix_basis = mat
-
-    return obj
+    return mat
 
 
-def create_bound_primitive_sphere(primitive: BoundPrimitive, vertices: list[BoundVertex], materials_cache: dict[CollisionMaterial, Material]) -> Object:
-    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_SPHERE, materials_cache)
+def create_bound_primitive_sphere(primitive: BoundPrimitive, vertices: list[BoundVertex]) -> Object:
+    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_SPHERE)
     create_sphere(obj.data, primitive.radius)
     obj.location = vertices[primitive.vertices[0]].co
     return obj
 #
 
 
-def create_bound_primitive_capsule(primitive: BoundPrimitive, vertices: list[BoundVertex], materials_cache: dict[CollisionMaterial, Material]) -> Object:
-    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_CAPSULE, materials_cache)
+def create_bound_primitive_capsule(primitive: BoundPrimitive, vertices: list[BoundVertex]) -> Object:
+    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_CAPSULE)
     v1, v2 = primitive.vertices
     v1 = vertices[v1].co
     v2 = vertices[v2].co
@@ -313,8 +391,8 @@ def create_bound_primitive_capsule(primitive: BoundPrimitive, vertices: list[Bou
     return obj
 
 
-def create_bound_primitive_cylinder(primitive: BoundPrimitive, vertices: list[BoundVertex], materials_cache: dict[CollisionMaterial, Material]) -> Object:
-    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_CYLINDER, materials_cache)
+def create_bound_primitive_cylinder(primitive: BoundPrimitive, vertices: list[BoundVertex]) -> Object:
+    obj = create_bound_primitive_object(primitive, SollumType.BOUND_POLY_CYLINDER)
     v1, v2 = primitive.vertices
     v1 = vertices[v1].co
     v2 = vertices[v2].co
@@ -342,7 +420,6 @@ def create_bound_geometry_triangle_mesh(
     vertices: list[BoundVertex],
     triangles: list[BoundPrimitive],
     geometry_center: Vector,
-    materials_cache: Optional[dict[CollisionMaterial, Material]] = None,
 ) -> Mesh:
     def _color_to_float(color_int: tuple[int, int, int, int]):
         return (color_int[0] / 255, color_int[1] / 255, color_int[2] / 255, color_int[3] / 255)
@@ -355,7 +432,7 @@ def create_bound_geometry_triangle_mesh(
 
     materials: list[Material] = []
     materials_indices: dict[CollisionMaterial, int] = {}
-    has_materials_cache = materials_cache is not None
+    collision_materials = import_context().collision_materials
 
     for tri in triangles:
         face = []
@@ -376,12 +453,7 @@ def create_bound_geometry_triangle_mesh(
         material_index = materials_indices.get(tri.material, None)
         if material_index is None:
             material_index = len(materials)
-            material = materials_cache.get(tri.material, None) if has_materials_cache else None
-            if material is None:
-                material = create_collision_material_from_data(tri.material)
-                if has_materials_cache:
-                    materials_cache[tri.material] = material
-            materials.append(material)
+            materials.append(collision_materials.get(tri.material))
             materials_indices[tri.material] = material_index
 
         face_material_indices.append(material_index)
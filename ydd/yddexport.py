@@ -17,8 +17,10 @@ from ..ydr.cloth_diagnostics import (
 from ..tools.blenderhelper import remove_number_suffix
 from ..sollumz_properties import SollumType
 from ..iecontext import export_context, ExportBundle
+from ..profiling import traced
 
 
+@traced()
 def export_ydd(dwd_obj: Object) -> ExportBundle:
     embedded_tex = []
     hd_tex: dict[str, EmbeddedTexture] = {}
@@ -36,6 +38,7 @@ def export_ydd(dwd_obj: Object) -> ExportBundle:
     )
 
 
+@traced()
 def create_drawable_dictionary_asset(
     dwd_obj: Object,
     cloth_dictionary: AssetClothDictionary | None,
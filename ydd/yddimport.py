@@ -3,7 +3,6 @@ from bpy.types import (
     Object
 )
 from typing import Optional
-from pathlib import Path
 from szio.gta5 import (
     AssetFormat,
     AssetWithDependencies,
@@ -24,6 +23,7 @@ from ..sollumz_properties import SollumType
 from ..tools.blenderhelper import create_empty_object, create_blender_object
 from ..ytd.ytdimport import try_load_hd_txd
 from ..iecontext import import_context, ImportExternalSkeletonMode
+from ..profiling import traced
 from .. import logger
 
 
@@ -51,21 +51,15 @@ def find_ydd_external_dependencies(asset: AssetDrawableDictionary, name: str) ->
 
 
 def try_load_cloth_dictionary(name: str, prefers_xml: bool) -> AssetClothDictionary | None:
-    d = import_context().directory
-    cloth_dictionary = None
-
     possible_exts = (".yld", ".yld.xml")
     if prefers_xml:
         possible_exts = possible_exts[::-1]
 
-    for ext in possible_exts:
-        cloth_dictionary_path = d / f"{name}{ext}"
-        if cloth_dictionary_path.is_file():
-            cloth_dictionary = try_load_asset(cloth_dictionary_path)
-            if cloth_dictionary:
-                break
+    for cloth_dictionary_path in import_context().find_files(name, possible_exts):
+        if cloth_dictionary := try_load_asset(cloth_dictionary_path):
+            return cloth_dictionary
 
-    return cloth_dictionary
+    return None
 
 
 def try_load_external_skeleton() -> Optional[AssetFragment]:
@@ -75,7 +69,7 @@ def try_load_external_skeleton() -> Optional[AssetFragment]:
     match ctx.settings.dwd_import_external_skeleton:
         case ImportExternalSkeletonMode.FROM_DIR:
             directory = ctx.directory
-            yft_filepath = get_first_yft_path(directory)
+            yft_filepath = ctx.directory_index.find_any((".yft", ".yft.xml"))
 
             if yft_filepath is None:
                 logger.warning(f"Could not find external skeleton YFT in directory '{directory}'.")
@@ -98,14 +92,7 @@ def try_load_external_skeleton() -> Optional[AssetFragment]:
     return yft
 
 
-def get_first_yft_path(directory: Path) -> Optional[Path]:
-    for file in directory.iterdir():
-        if file.is_file() and ((name := file.name).endswith(".yft") or name.endswith(".yft.xml")):
-            return file
-
-    return None
-
-
+@traced()
 def import_ydd(asset: AssetWithDependencies, name: str) -> Object | list[Object]:
     dwd = asset.main_asset
     skel_frag = asset.dependencies.get("external_skel", None)
@@ -116,6 +103,7 @@ def import_ydd(asset: AssetWithDependencies, name: str) -> Object | list[Object]
     return create_drawable_dictionary(dwd, name, cloth_dictionary, skel_frag, hd_txd, "+hidd")
 
 
+@traced()
 def create_drawable_dictionary(
     dwd: AssetDrawableDictionary,
     name: str,
@@ -0,0 +1,162 @@
+"""Deferred LOD meshes. On import, the geometry of the LOD levels that are not active can be kept as numpy buffers
+stored in ID properties of the Drawable Model object, instead of building a Blender mesh for each of them. The mesh is
+built when switching to that LOD level. Untouched deferred LODs are exported directly from the stored buffers.
+"""
+import ast
+from typing import NamedTuple, Optional
+
+import numpy as np
+from bpy.types import Object, Material, Mesh
+
+from ..sollumz_properties import LODLevel, SOLLUMZ_UI_NAMES
+from .model_data import MeshData
+from .mesh_builder import MeshBuilder
+from .. import logger
+
+DEFERRED_LODS_PROP_NAME = "sz_deferred_lods"
+
+
+class DeferredLod(NamedTuple):
+    mesh_data: MeshData
+    # Drawable material index -> material, only the materials used by the faces
+    materials: dict[int, Material]
+    mesh_name: str
+    render_mask: int
+    validate_mesh: bool
+
+
+def store_deferred_lod(
+    model_obj: Object,
+    lod_level: LODLevel,
+    mesh_data: MeshData,
+    drawable_mats: list[Material],
+    mesh_name: str,
+    render_mask: int,
+    validate_mesh: bool = False,
+):
+    """Stores ``mesh_data`` in ``model_obj`` to build the LOD mesh later. Replaces the current mesh of the LOD level.
+    If ``validate_mesh`` is set, `Mesh.validate` is called on the mesh once built, as the non-deferred import does.
+    """
+    vert_arr = np.ascontiguousarray(mesh_data.vert_arr)
+    vert_bytes = vert_arr.tobytes()
+    # ID properties only support int and float arrays, so store the raw vertex data as int32 padded to 4 bytes
+    vert_bytes += b"\0" * (-len(vert_bytes) % 4)
+
+    mat_inds = np.asarray(mesh_data.mat_inds, dtype=np.int32)
+    payload = {
+        "vert_dtype": repr(np.lib.format.dtype_to_descr(vert_arr.dtype)),
+        "vert_count": len(vert_arr),
+        "vert_data": np.frombuffer(vert_bytes, dtype=np.int32),
+        "ind_arr": np.asarray(mesh_data.ind_arr, dtype=np.int32),
+        "mat_inds": mat_inds,
+        "materials": {str(i): drawable_mats[i] for i in np.unique(mat_inds).tolist()},
+        "mesh_name": mesh_name,
+        "render_mask": render_mask,
+        "validate_mesh": validate_mesh,
+    }
+
+    lod = model_obj.sz_lods.get_lod(lod_level)
+    if lod.has_mesh:
+        lod.mesh = None
+
+    if DEFERRED_LODS_PROP_NAME not in model_obj:
+        model_obj[DEFERRED_LODS_PROP_NAME] = {}
+    model_obj[DEFERRED_LODS_PROP_NAME][lod_level.value] = payload
+    lod.has_deferred_mesh = True
+
+
+def get_deferred_lod(model_obj: Object, lod_level: LODLevel) -> Optional[DeferredLod]:
+    deferred_lods = model_obj.get(DEFERRED_LODS_PROP_NAME, None)
+    if deferred_lods is None or (payload := deferred_lods.get(lod_level.value, None)) is None:
+        return None
+
+    vert_dtype = np.lib.format.descr_to_dtype(ast.literal_eval(payload["vert_dtype"]))
+    vert_count = payload["vert_count"]
+    vert_data = np.asarray(payload["vert_data"], dtype=np.int32).tobytes()
+    vert_arr = np.frombuffer(vert_data, dtype=vert_dtype, count=vert_count).copy()
+
+    return DeferredLod(
+        mesh_data=MeshData(
+            vert_arr=vert_arr,
+            ind_arr=np.asarray(payload["ind_arr"], dtype=np.int32).astype(np.uint32),
+            mat_inds=np.asarray(payload["mat_inds"], dtype=np.int32).astype(np.uint32),
+        ),
+        materials={int(i): mat for i, mat in payload["materials"].items() if mat is not None},
+        mesh_name=payload["mesh_name"],
+        render_mask=payload["render_mask"],
+        validate_mesh=bool(payload.get("validate_mesh", False)),
+    )
+
+
+def get_deferred_lod_materials(model_obj: Object, lod_level: LODLevel) -> list[Material]:
+    """Gets the materials used by a deferred LOD without reading its geometry."""
+    deferred_lods = model_obj.get(DEFERRED_LODS_PROP_NAME, None)
+    if deferred_lods is None or (payload := deferred_lods.get(lod_level.value, None)) is None:
+        return []
+
+    materials = payload["materials"]
+    return [materials[i] for i in sorted(materials.keys(), key=int) if materials[i] is not None]
+
+
+def get_deferred_lod_counts(model_obj: Object, lod_level: LODLevel) -> tuple[int, int]:
+    """Gets the number of triangles and vertices of a deferred LOD."""
+    deferred_lods = model_obj.get(DEFERRED_LODS_PROP_NAME, None)
+    if deferred_lods is None or (payload := deferred_lods.get(lod_level.value, None)) is None:
+        return 0, 0
+
+    return len(payload["mat_inds"]), payload["vert_count"]
+
+
+def remove_deferred_lod(model_obj: Object, lod_level: LODLevel):
+    model_obj.sz_lods.get_lod(lod_level).has_deferred_mesh = False
+
+    deferred_lods = model_obj.get(DEFERRED_LODS_PROP_NAME, None)
+    if deferred_lods is None:
+        return
+
+    if lod_level.value in deferred_lods:
+        del deferred_lods[lod_level.value]
+    if not deferred_lods.keys():
+        del model_obj[DEFERRED_LODS_PROP_NAME]
+
+
+def load_deferred_lod(model_obj: Object, lod_level: LODLevel) -> Optional[Mesh]:
+    """Builds the Blender mesh of a deferred LOD and sets it as the LOD mesh, removing the stored data."""
+    deferred_lod = get_deferred_lod(model_obj, lod_level)
+    if deferred_lod is None:
+        return None
+
+    mesh_data = deferred_lod.mesh_data
+    num_mats = max(deferred_lod.materials.keys(), default=-1) + 1
+    drawable_mats = [deferred_lod.materials.get(i, None) for i in range(num_mats)]
+    try:
+        mesh_builder = MeshBuilder(
+            deferred_lod.mesh_name,
+            mesh_data.vert_arr,
+            mesh_data.ind_arr,
+            mesh_data.mat_inds,
+            drawable_mats,
+        )
+        mesh = mesh_builder.build()
+        if deferred_lod.validate_mesh:
+            mesh.validate()
+    except Exception as e:
+        logger.error(
+            f"Failed to build {SOLLUMZ_UI_NAMES[lod_level]} mesh of Drawable Model '{model_obj.name}': {e}"
+        )
+        return None
+
+    mesh.drawable_model_properties.render_mask = deferred_lod.render_mask
+
+    is_skinned = "BlendWeights" in mesh_data.vert_arr.dtype.names
+    armature_obj = model_obj.find_armature()
+    if is_skinned and armature_obj is not None:
+        # Vertex groups are assigned to the current object mesh
+        prev_mesh = model_obj.data
+        model_obj.data = mesh
+        mesh_builder.create_vertex_groups(model_obj, armature_obj.data.bones)
+        model_obj.data = prev_mesh
+
+    # Also removes the deferred data
+    model_obj.sz_lods.get_lod(lod_level).mesh = mesh
+    return mesh
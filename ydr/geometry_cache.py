@@ -0,0 +1,80 @@
+"""Cache of the geometries built for drawable models while exporting an asset. Models that share the same mesh (e.g.
+linked duplicates in fragments and drawable dictionaries) only need their vertex and index buffers built once.
+"""
+from typing import TYPE_CHECKING, Hashable, Optional
+
+from bpy.types import Object, Material, Mesh
+from mathutils import Matrix
+
+from ..sollumz_properties import LODLevel
+from .vertex_buffer_builder_domain import VBBuilderDomain
+
+if TYPE_CHECKING:
+    from .ydrexport import PendingModel
+
+
+class GeometryCache:
+    """Geometries built by `create_geometries`, shared within the asset being exported. `clear` must be called once
+    the asset is built, so the geometries are not kept in memory until the end of the export operation. The hit and
+    miss counts are kept for the whole operation.
+    """
+
+    def __init__(self):
+        self._models: dict[Hashable, "PendingModel"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional["PendingModel"]:
+        """Gets the model first prepared with ``key``, or ``None`` if not cached. Its geometries are available once it
+        is finished, so models reusing them must be finished after it.
+        """
+        pending_model = self._models.get(key, None)
+        if pending_model is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return pending_model
+
+    def put(self, key: Hashable, pending_model: "PendingModel"):
+        """Caches ``pending_model`` as soon as it is prepared, before its geometries are built, so models prepared
+        later with the same key don't build them again.
+        """
+        self._models[key] = pending_model
+
+    def clear(self):
+        self._models.clear()
+
+
+def geometry_cache_key(
+    model_obj: Object,
+    lod_level: LODLevel,
+    materials: list[Material],
+    armature_obj: Optional[Object],
+    transforms_to_apply: Optional[Matrix],
+    domain: VBBuilderDomain,
+) -> Optional[Hashable]:
+    """Gets the key of the geometries of the current mesh of ``model_obj``, including everything that affects the built
+    geometries. Returns ``None`` if the geometries cannot be cached or would never be reused.
+    """
+    mesh = model_obj.data
+    if not isinstance(mesh, Mesh) or model_obj.modifiers or mesh.is_editmode:
+        # The evaluated mesh depends on the object
+        return None
+
+    if mesh.users <= 1:
+        # No other model uses this mesh, the geometries would never be reused
+        return None
+
+    return (
+        mesh.name_full,
+        # Vehicle glass geometries are modified for the High LOD
+        lod_level == LODLevel.HIGH,
+        tuple(m.name_full for m in materials),
+        # Material slots linked to the object override the mesh materials
+        tuple(s.material.name_full if s.material else None for s in model_obj.material_slots),
+        armature_obj.data.name_full if armature_obj is not None else None,
+        tuple(vg.name for vg in model_obj.vertex_groups),
+        tuple(round(v, 6) for row in transforms_to_apply for v in row) if transforms_to_apply is not None else None,
+        domain,
+    )
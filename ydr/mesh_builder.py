@@ -45,13 +45,13 @@ class MeshBuilder:
         self._has_uvs = len(self._uv_attrs) > 0
         self._has_colors = len(self._color_attrs) > 0
 
-    def build(self):
+    def build(self) -> bpy.types.Mesh:
+        # Degenerate faces are already removed by the constructor and vertex indices are checked, so `Mesh.validate`
+        # is not called here. Callers can still run it on malformed data.
         mesh = bpy.data.meshes.new(self.name)
-        vert_pos = self.vertex_arr["Position"]
-        faces = self.ind_arr.reshape((int(self.ind_arr.size / 3), 3))
 
         try:
-            mesh.from_pydata(vert_pos, [], faces)
+            self.create_mesh_geometry(mesh)
         except Exception:
             logger.error(
                 f"Error during creation of fragment {self.name}:\n{format_exc()}\nEnsure the mesh data is not malformed."
@@ -69,10 +69,27 @@ class MeshBuilder:
         if self._has_colors:
             self.set_mesh_vertex_colors(mesh)
 
-        mesh.validate()
-
         return mesh
 
+    def create_mesh_geometry(self, mesh: bpy.types.Mesh):
+        """Fills the vertices and triangles of the mesh directly from the numpy arrays."""
+        num_verts = len(self.vertex_arr)
+        num_loops = self.ind_arr.size
+        num_faces = num_loops // 3
+        if num_loops > 0 and self.ind_arr.max() >= num_verts:
+            raise ValueError(f"Index buffer references vertex {self.ind_arr.max()} but there are only {num_verts} vertices")
+
+        mesh.vertices.add(num_verts)
+        mesh.vertices.foreach_set("co", np.ascontiguousarray(self.vertex_arr["Position"], dtype=np.float32).ravel())
+
+        mesh.loops.add(num_loops)
+        mesh.loops.foreach_set("vertex_index", self.ind_arr.astype(np.int32))
+
+        mesh.polygons.add(num_faces)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, num_loops, 3, dtype=np.int32))
+
+        mesh.update(calc_edges=True)
+
     def create_mesh_materials(self, mesh: bpy.types.Mesh):
         drawable_mat_inds = np.unique(self.mat_inds)
         # Map drawable material indices to model material indices
@@ -144,7 +161,9 @@ class MeshBuilder:
         vertex_groups: dict[int, bpy.types.VertexGroup] = {}
         for bone_idx in unique_bones:
             bone_idx_int = int(bone_idx)
-            vertex_groups[bone_idx_int] = obj.vertex_groups.new(name=_get_vertex_group_name(bone_idx_int))
+            # Reuse groups already created by other LOD levels
+            vgroup_name = _get_vertex_group_name(bone_idx_int)
+            vertex_groups[bone_idx_int] = obj.vertex_groups.get(vgroup_name) or obj.vertex_groups.new(name=vgroup_name)
 
         # Sort by bone index to group vertices per bone
         sort_order = np.argsort(valid_bone_indices)
@@ -15,6 +15,10 @@ from szio.gta5 import (
 )
 
 
+# Max number of faces processed at once when finding which vertex groups share faces
+_GROUP_RELATIONS_CHUNK_SIZE = 65536
+
+
 class MeshData(NamedTuple):
     vert_arr: NDArray
     ind_arr: NDArray[np.uint]
@@ -94,6 +98,9 @@ def get_group_face_inds(mesh_data: MeshData, bones: list[SkelBone]):
     weights = mesh_data.vert_arr["BlendWeights"]
 
     num_tris = int(len(mesh_data.ind_arr) / 3)
+    if num_tris == 0:
+        return {}
+
     faces = mesh_data.ind_arr.reshape((num_tris, 3))
 
     # Get all the BlendIndices and BlendWeights in each face
@@ -106,22 +113,14 @@ def get_group_face_inds(mesh_data: MeshData, bones: list[SkelBone]):
     # Mapping of blend indices in each face where (BlendIndex, BlendWeight) pairs are not (0, 0)
     blend_inds_mask = np.logical_or(face_blend_inds != 0, face_weights != 0)
     # Maps group indices to the group index of the object they should be parented to
-    parent_map = get_group_parent_map(face_blend_inds, bones)
-
-    if num_tris == 0:
-        return {}
+    parent_lut = get_group_parent_lut(face_blend_inds, bones)
 
     # Each face takes the group of its first valid BlendIndex (index or weight non-zero), else group 0.
     # argmax gives the first True per row; has_valid gates rows where the mask is all False.
     has_valid = blend_inds_mask.any(axis=1)
     first_slot = blend_inds_mask.argmax(axis=1)
     first_blend_inds = face_blend_inds[np.arange(num_tris), first_slot]
-
-    # parent_map is keyed by blend index, so a flat array turns the per-face lookup into one gather.
-    lut = np.zeros(int(face_blend_inds.max()) + 1, dtype=np.int64)
-    for blend_ind, parent_ind in parent_map.items():
-        lut[blend_ind] = parent_ind
-    face_groups = np.where(has_valid, lut[first_blend_inds], 0)
+    face_groups = np.where(has_valid, parent_lut[first_blend_inds], 0)
 
     # Bucket faces by group. A stable sort keeps faces in ascending order within each group.
     order = np.argsort(face_groups, kind="stable")
@@ -133,60 +132,78 @@ def get_group_face_inds(mesh_data: MeshData, bones: list[SkelBone]):
     return {int(sorted_groups[s]): order[s:e].astype(np.uint32) for s, e in zip(starts, ends)}
 
 
-def get_group_parent_map(face_blend_inds: NDArray[np.uint32], bones: list[SkelBone]) -> dict[int, set]:
-    """Get a mapping of each blend index to the blend index of the object they should be parented to."""
-    # Mapping of each blend index to blend indices with overlapping faces
-    group_relations: dict[int, set[int]] = defaultdict(set)
-    parent_map: dict[int, int] = {}
-    group_inds = np.unique(face_blend_inds)
-
-    for group_ind in group_inds:
-        occurences = np.any(face_blend_inds == group_ind, axis=1)
-        related_groups = np.unique(face_blend_inds[occurences].flatten())
-        # Ignore 0 group because all vertex groups are a part of group 0
-        group_relations[group_ind] = [
-            i for i in related_groups if i != 0 and i != group_ind]
-
-    for blend_ind, blend_inds in group_relations.items():
-        # blend_ind does not overlap with any other vertex groups, so it can be created as its own object
-        if not blend_inds:
-            parent_map[blend_ind] = blend_ind
-            continue
-
-        # Find a parent bone that is shared between all blend_inds. All faces with blend_inds vertex groups will be
-        # created as a single object
-        parent_map[blend_ind] = find_common_bone_parent(blend_inds, bones)
-
-    return parent_map
-
-
-def find_common_bone_parent(bone_inds: list[int], bones: list[SkelBone]) -> int:
-    bone_parents = [get_all_bone_parents(i, bones) for i in bone_inds if bones[i].parent_index > 0]
-
-    if not bone_parents:
-        return 0
-
-    common_bones = bone_parents[0]
-
-    for array in bone_parents[1:]:
-        common_bones = np.intersect1d(common_bones, array)
-
-    if len(common_bones) == 0:
-        return 0
-
-    # Get the parent thats highest in the bone hierarchy
-    return np.min(common_bones)
-
-
-def get_all_bone_parents(bone_ind: int, bones: list[SkelBone]) -> list[int]:
-    parent_inds = []
-    current_bone_ind = bone_ind
-
-    while bones[current_bone_ind].parent_index > 0:
-        current_bone_ind = bones[current_bone_ind].parent_index
-        parent_inds.append(current_bone_ind)
-
-    return parent_inds
+def get_group_parent_lut(face_blend_inds: NDArray[np.uint32], bones: list[SkelBone]) -> NDArray[np.int64]:
+    """Get an array mapping each blend index to the blend index of the object they should be parented to.
+
+    A blend index that doesn't share faces with other blend indices gets its own object. Otherwise, its object is the
+    common ancestor bone of the other blend indices it shares faces with, the one highest in the bone hierarchy.
+    """
+    num_tris = len(face_blend_inds)
+    num_groups = int(face_blend_inds.max()) + 1
+
+    # Number of faces shared by each pair of blend indices, through a face x blend index incidence matrix. Processed in
+    # chunks to limit memory usage, float32 so the products go through BLAS
+    shared_faces = np.zeros((num_groups, num_groups), dtype=np.float32)
+    for chunk_start in range(0, num_tris, _GROUP_RELATIONS_CHUNK_SIZE):
+        chunk = face_blend_inds[chunk_start:chunk_start + _GROUP_RELATIONS_CHUNK_SIZE]
+        incidence = np.zeros((len(chunk), num_groups), dtype=np.float32)
+        incidence[np.arange(len(chunk))[:, None], chunk] = 1.0
+        shared_faces += incidence.T @ incidence
+
+    # Ignore 0 group because all vertex groups are a part of group 0
+    related = shared_faces > 0
+    np.fill_diagonal(related, False)
+    related[:, 0] = False
+
+    # Groups without related groups can be created as their own object
+    lut = np.arange(num_groups, dtype=np.int64)
+    lut[related.any(axis=1)] = 0
+
+    # Find a parent bone that is shared between all related groups. Related groups attached to a root bone don't
+    # restrict the common parent
+    parent_inds = get_bone_parent_inds(bones)
+    group_parent_inds = np.full(num_groups, -1, dtype=np.int64)
+    num_known = min(num_groups, len(parent_inds))
+    group_parent_inds[:num_known] = parent_inds[:num_known]
+    related &= (group_parent_inds > 0)[None, :]
+    num_related = related.sum(axis=1)
+    if not num_related.any():
+        return lut
+
+    ancestors = np.zeros((num_groups, len(parent_inds)), dtype=np.float32)
+    ancestors[:num_known] = get_bone_ancestors_matrix(parent_inds)[:num_known]
+    common = (related.astype(np.float32) @ ancestors) == num_related[:, None]
+    common &= (num_related > 0)[:, None]
+    has_common = common.any(axis=1)
+    # Get the parent that's highest in the bone hierarchy
+    lut[has_common] = common[has_common].argmax(axis=1)
+
+    return lut
+
+
+def get_bone_parent_inds(bones: list[SkelBone]) -> NDArray[np.int64]:
+    return np.fromiter((bone.parent_index for bone in bones), dtype=np.int64, count=len(bones))
+
+
+def get_bone_ancestors_matrix(parent_inds: NDArray[np.int64]) -> NDArray[np.bool_]:
+    """Get a boolean matrix where ``[i, j]`` is True if bone ``j`` is an ancestor of bone ``i``. The root bone (the
+    first bone or bones without parent) is not included as ancestor.
+    """
+    num_bones = len(parent_inds)
+    ancestors = np.zeros((num_bones, num_bones), dtype=bool)
+    bone_inds = np.arange(num_bones)
+    current = bone_inds
+    active = parent_inds > 0
+    # Walk up all the bone chains at the same time, limited to the number of bones in case of parenting loops
+    for _ in range(num_bones):
+        if not active.any():
+            break
+
+        current = np.where(active, parent_inds[current], current)
+        ancestors[bone_inds[active], current[active]] = True
+        active &= parent_inds[current] > 0
+
+    return ancestors
 
 
 def get_faces_subset(vert_arr: NDArray, ind_arr: NDArray[np.uint32], face_inds: NDArray[np.uint32]) -> MeshData:
@@ -522,7 +522,7 @@ class SOLLUMZ_OT_extract_lods(bpy.types.Operator):
         lods = aobj.sz_lods
         for lod_level in lod_levels:
             lod = lods.get_lod(lod_level)
-            lod_mesh = lod.mesh
+            lod_mesh = lod.load_deferred_mesh()
             if lod_mesh is None:
                 continue
 
@@ -640,7 +640,7 @@ class SOLLUMZ_OT_auto_lod(AutoLODSettingsMixin, Operator):
         """Report triangle/vertex counts for each generated LOD."""
         stats = []
         for lod_level in lods:
-            mesh = obj_lods.get_lod(lod_level).mesh
+            mesh = obj_lods.get_lod(lod_level).load_deferred_mesh()
             if mesh is not None:
                 tri_count = get_mesh_tri_count(mesh)
                 stats.append(f"{SOLLUMZ_UI_NAMES[lod_level]}: {tri_count} tris, {len(mesh.vertices)} verts")
@@ -628,7 +628,7 @@ def get_model_properties(model_obj: bpy.types.Object, lod_level: LODLevel) -> Dr
         return drawable_obj.skinned_model_properties.get_lod(lod_level)
 
     lod = model_obj.sz_lods.get_lod(lod_level)
-    lod_mesh = lod.mesh
+    lod_mesh = lod.load_deferred_mesh()
 
     if lod_mesh is None:
         raise ValueError(
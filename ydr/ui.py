@@ -19,6 +19,7 @@ from .cable import CableAttr, is_cable_mesh
 from .cloth import ClothAttr
 from .cloth_char import cloth_char_find_mesh_objects
 from .cloth_diagnostics import cloth_last_export_contexts
+from .deferred_lods import get_deferred_lod_counts
 from szio.gta5 import ShaderManager
 from ..sollumz_ui import SOLLUMZ_PT_OBJECT_PANEL, SOLLUMZ_PT_MAT_PANEL
 from ..sollumz_properties import SollumType, MaterialType, LightType, LODLevel, SOLLUMZ_UI_NAMES
@@ -840,21 +841,25 @@ class SOLLUMZ_PT_AUTO_LOD_PANEL(bpy.types.Panel):
             lods = obj.sz_lods
             has_any = False
             for lod_level in LODLevel:
-                mesh = lods.get_lod(lod_level).mesh
-                if mesh is not None:
+                lod = lods.get_lod(lod_level)
+                if lod.has_geometry:
                     if not has_any:
                         stats_box = box.box()
                         stats_col = stats_box.column(align=True)
                         stats_col.label(text="LOD Statistics", icon="INFO")
                         has_any = True
-                    tri_count = get_mesh_tri_count(mesh)
+                    if lod.has_deferred_mesh:
+                        # Don't build the mesh while drawing the UI
+                        tri_count, vert_count = get_deferred_lod_counts(obj, lod_level)
+                    else:
+                        tri_count, vert_count = get_mesh_tri_count(lod.mesh), len(lod.mesh.vertices)
                     split = stats_col.split(factor=0.4)
                     row = split.row()
                     row.alignment = "RIGHT"
                     row.label(text=f"{SOLLUMZ_UI_NAMES[lod_level]}")
                     row = split.row()
                     row.alignment = "LEFT"
-                    row.label(text=f"{tri_count} tris / {len(mesh.vertices)} verts")
+                    row.label(text=f"{tri_count} tris / {vert_count} verts")
 
 
 class SOLLUMZ_PT_EXTRACT_LODS_PANEL(bpy.types.Panel):
@@ -3,6 +3,7 @@ import numpy as np
 from numpy.typing import NDArray
 from mathutils import Vector
 from typing import Tuple, Optional
+from collections.abc import Iterator
 from enum import Enum, auto
 
 from ..shared.geometry import tris_normals
@@ -94,47 +95,80 @@ def remove_unused_uvs(vertex_arr: NDArray, used_texcoords: set[str]) -> NDArray:
     return vertex_arr[new_names]
 
 
+# Values are considered equal if they are the same when rounded to this number of decimals
+DEDUPE_DECIMALS = 6
+
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
 def dedupe_and_get_indices(vertex_arr: NDArray) -> Tuple[NDArray, NDArray[np.uint32]]:
-    """Remove duplicate vertices from the buffer and get the new vertex indices in triangle order (used for IndexBuffer). Returns vertices, indices."""
+    """Remove duplicate vertices from the buffer and get the new vertex indices in triangle order (used for IndexBuffer). Returns vertices, indices.
+
+    Vertices are kept in order of first occurrence.
+    """
 
     # Cannot use np.unique directly on the vertex array because it doesn't have a tolerance parameter, only checks exact
     # equality, so floating-point values that are only different due to rounding errors would not be deduplicated.
     # For example, normals calculated by Blender for the same vertex in different loops end up slightly different from
     # rounding errors, causing this vertex to appear multiple times on export.
-    # So we first round the values in the vertex array and then pass it to np.unique.
+    # So each value is quantized to an integer, equal to rounding it to `DEDUPE_DECIMALS` decimals, and the vertices
+    # are compared by a 64-bit hash of their quantized values. Columns are processed one at a time, so only a few
+    # arrays with one element per vertex are alive at once, instead of a copy of the whole vertex array.
+    num_verts = len(vertex_arr)
+    if num_verts == 0:
+        return vertex_arr, np.empty(0, dtype=np.uint32)
+
+    vert_hashes = np.zeros(num_verts, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for column in _iter_quantized_columns(vertex_arr):
+            vert_hashes ^= column.view(np.uint64)
+            vert_hashes *= _HASH_MULTIPLIER
+            vert_hashes ^= vert_hashes >> np.uint64(29)
+
+    _, unique_indices, inverse_indices = np.unique(vert_hashes, return_index=True, return_inverse=True)
+    del vert_hashes
+
+    # Check for hash collisions, every vertex must be equal to the first vertex with the same hash
+    representatives = unique_indices[inverse_indices]
+    for column in _iter_quantized_columns(vertex_arr):
+        if not np.array_equal(column, column[representatives]):
+            unique_indices, inverse_indices = _unique_quantized_rows(vertex_arr)
+            break
+    del representatives
+
+    # np.unique returns the vertices sorted by hash, restore the order of first occurrence
+    order = np.argsort(unique_indices)
+    new_indices = np.empty(len(order), dtype=np.uint32)
+    new_indices[order] = np.arange(len(order), dtype=np.uint32)
 
-    # Convert vertex array to a 2D unstructured array of float64 to be able to use np.round, it doesn't work on the
-    # structured array.
-    # Each vertex is converted to a float64 array by concatenating the struct fields: [x, y, z, nx, ny, nz, r, g, b, a, ...]
+    # Lookup the vertices in the original structured and un-rounded array
+    vertex_arr = vertex_arr[unique_indices[order]]
+    index_arr = new_indices[inverse_indices.reshape(-1)]
+    return vertex_arr, index_arr
 
-    # Pre-allocate flattened array
-    names = vertex_arr.dtype.names
-    num_verts = len(vertex_arr)
-    total_cols = sum(
-        vertex_arr[name].shape[1] if vertex_arr[name].ndim > 1 else 1
-        for name in names
-    )
-
-    vertex_arr_flatten = np.empty((num_verts, total_cols), dtype=np.float64)
-    col = 0
-    for name in names:
-        arr = vertex_arr[name]
-        if arr.ndim == 1:
-            vertex_arr_flatten[:, col] = arr
-            col += 1
-        else:
-            width = arr.shape[1]
-            vertex_arr_flatten[:, col:col + width] = arr
-            col += width
 
-    np.round(vertex_arr_flatten, out=vertex_arr_flatten, decimals=6)
+def _iter_quantized_columns(vertex_arr: NDArray) -> Iterator[NDArray[np.int64]]:
+    """Yields each value of the vertices, e.g. x, y, z, nx, ny, nz, r, g, b, a, ..., as an integer array."""
+    scale = 10.0 ** DEDUPE_DECIMALS
+    for name in vertex_arr.dtype.names:
+        arr = vertex_arr[name]
+        columns = (arr,) if arr.ndim == 1 else (arr[:, i] for i in range(arr.shape[1]))
+        for column in columns:
+            if np.issubdtype(column.dtype, np.floating):
+                # Same as np.round(column, decimals=DEDUPE_DECIMALS), which multiplies by the scale and rounds too
+                quantized = column.astype(np.float64)
+                quantized *= scale
+                np.rint(quantized, out=quantized)
+                yield quantized.astype(np.int64)
+            else:
+                yield column.astype(np.int64)
 
-    _, unique_indices, inverse_indices = np.unique(vertex_arr_flatten, axis=0, return_index=True, return_inverse=True)
 
-    # Lookup the vertices in the original structured and un-rounded array
-    vertex_arr = vertex_arr[unique_indices]
-    index_arr = np.asarray(inverse_indices, dtype=np.uint32)
-    return vertex_arr, index_arr
+def _unique_quantized_rows(vertex_arr: NDArray) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Slow path of `dedupe_and_get_indices` in case of hash collisions, compares the full quantized vertices."""
+    quantized = np.column_stack(list(_iter_quantized_columns(vertex_arr)))
+    _, unique_indices, inverse_indices = np.unique(quantized, axis=0, return_index=True, return_inverse=True)
+    return unique_indices, inverse_indices
 
 
 def normalize_weights(weights_arr: NDArray[np.float32]) -> NDArray[np.float32]:
@@ -143,6 +177,107 @@ def normalize_weights(weights_arr: NDArray[np.float32]) -> NDArray[np.float32]:
     return np.divide(weights_arr, row_sums, out=np.zeros_like(weights_arr), where=row_sums != 0)
 
 
+def read_vertex_group_elements(
+    vertices: bpy.types.MeshVertices,
+) -> tuple[NDArray[np.int64], NDArray[np.int32], NDArray[np.float32]]:
+    """Reads the vertex group elements of all vertices into flat arrays, in a single pass over the vertices.
+
+    There is no `foreach_get` for the vertex groups of the whole mesh, but it works on the groups of each vertex. The
+    elements are copied straight into preallocated arrays, without creating a Python object for each of them.
+
+    Returns the number of elements of each vertex, and the group index and weight of each element, as expected by
+    `get_top_vertex_weights`.
+    """
+    num_verts = len(vertices)
+    groups_per_vert = np.empty(num_verts, dtype=np.int64)
+    # Enough for 4 groups per vertex, grown if needed
+    capacity = max(num_verts * 4, 16)
+    group_indices = np.empty(capacity, dtype=np.int32)
+    group_weights = np.empty(capacity, dtype=np.float32)
+    num_elements = 0
+    for vert_index, vert in enumerate(vertices):
+        vert_groups = vert.groups
+        num_vert_groups = len(vert_groups)
+        groups_per_vert[vert_index] = num_vert_groups
+        if num_vert_groups == 0:
+            continue
+
+        end = num_elements + num_vert_groups
+        if end > capacity:
+            capacity = max(capacity * 2, end)
+            group_indices = _grow_array(group_indices, capacity, num_elements)
+            group_weights = _grow_array(group_weights, capacity, num_elements)
+
+        vert_groups.foreach_get("group", group_indices[num_elements:end])
+        vert_groups.foreach_get("weight", group_weights[num_elements:end])
+        num_elements = end
+
+    return groups_per_vert, group_indices[:num_elements], group_weights[:num_elements]
+
+
+def _grow_array(arr: NDArray, capacity: int, num_used: int) -> NDArray:
+    new_arr = np.empty(capacity, dtype=arr.dtype)
+    new_arr[:num_used] = arr[:num_used]
+    return new_arr
+
+
+def get_top_vertex_weights(
+    groups_per_vert: NDArray[np.int64],
+    group_indices: NDArray[np.integer],
+    group_weights: NDArray[np.float32],
+    bone_by_vgroup: dict[int, int],
+) -> tuple[NDArray[np.float32], NDArray[np.uint32], NDArray[np.bool_], NDArray[np.bool_]]:
+    """Picks the 4 vertex groups with the highest weights of each vertex.
+
+    The vertex group elements of all vertices are given as flat arrays, ``groups_per_vert`` has the number of elements of
+    each vertex. Groups without a bone in ``bone_by_vgroup`` are ignored. Ties are resolved by the order of the
+    elements, same as `get_sorted_vertex_group_elements`.
+
+    Returns the weights and bone indices (in descending weight order, unused slots zeroed), and masks of the vertices
+    weighted to the cloth vertex group and of the vertices without any valid group. Cloth vertices are not weighted to
+    any bone.
+    """
+    num_verts = len(groups_per_vert)
+    weights_arr = np.zeros((num_verts, 4), dtype=np.float32)
+    ind_arr = np.zeros((num_verts, 4), dtype=np.uint32)
+
+    # Resolve bone indices through a lookup array, group indices without an entry are invalid
+    lookup_size = max(max(bone_by_vgroup.keys(), default=-1), int(group_indices.max(initial=-1))) + 1
+    bone_lookup = np.full(lookup_size, VGROUP_INVALID_BONE_ID, dtype=np.int64)
+    for vgroup_index, bone_index in bone_by_vgroup.items():
+        bone_lookup[vgroup_index] = bone_index
+    bone_indices = bone_lookup[group_indices]
+
+    vert_indices = np.repeat(np.arange(num_verts), groups_per_vert)
+
+    cloth_bind_verts_mask = np.zeros(num_verts, dtype=bool)
+    cloth_bind_verts_mask[vert_indices[bone_indices == VGROUP_CLOTH_ID]] = True
+
+    # Drop invalid groups and every group of cloth vertices
+    valid = (bone_indices != VGROUP_INVALID_BONE_ID) & ~cloth_bind_verts_mask[vert_indices]
+    vert_indices = vert_indices[valid]
+    bone_indices = bone_indices[valid]
+    group_weights = group_weights[valid]
+
+    ungrouped_verts_mask = np.bincount(vert_indices, minlength=num_verts) == 0
+    ungrouped_verts_mask &= ~cloth_bind_verts_mask
+
+    # Sort by vertex, then by weight descending. lexsort is stable, so equal weights keep their original order
+    order = np.lexsort((-group_weights, vert_indices))
+    vert_indices = vert_indices[order]
+    # Position of each element within its vertex after sorting, only the first 4 are used
+    vert_starts = np.searchsorted(vert_indices, vert_indices, side="left")
+    slot_indices = np.arange(len(vert_indices)) - vert_starts
+    top = slot_indices < 4
+
+    vert_indices = vert_indices[top]
+    slot_indices = slot_indices[top]
+    weights_arr[vert_indices, slot_indices] = group_weights[order][top]
+    ind_arr[vert_indices, slot_indices] = bone_indices[order][top]
+
+    return weights_arr, ind_arr, cloth_bind_verts_mask, ungrouped_verts_mask
+
+
 def get_sorted_vertex_group_elements(vertex: bpy.types.MeshVertex, bone_by_vgroup: dict) -> list[bpy.types.VertexGroupElement]:
     elements = []
     for element in vertex.groups:
@@ -196,6 +331,108 @@ class VertexBufferBuilder:
         self._char_cloth = char_cloth
 
     def build(self):
+        self._prepare_mesh()
+
+        mesh_attrs = self._collect_attrs()
+        return self._structured_array_from_attrs(mesh_attrs)
+
+    def build_per_material(
+        self,
+        loop_inds_by_mat: dict[int, NDArray[np.uint32]],
+        fields_by_mat: dict[int, list[str]],
+    ) -> dict[int, NDArray]:
+        """Builds the vertex buffer of each material directly, without the vertex buffer of the whole mesh.
+
+        ``loop_inds_by_mat`` has the loops of the triangles of each material and ``fields_by_mat`` the vertex attributes
+        included in its vertex buffer, in order, from `get_attr_names`. Returns the vertex buffers with one vertex per
+        loop in ``loop_inds_by_mat``, same as slicing the array returned by `build` and removing the unused fields.
+
+        Attributes are read one at a time into a scratch buffer shared by all of them and copied straight to the
+        vertex buffers of the materials that use them, so the peak memory usage is about the size of the output plus
+        one attribute of the whole mesh. Attributes not used by any material are not read at all.
+        """
+        self._prepare_mesh()
+
+        mesh = self.mesh
+        num_loops = len(mesh.loops)
+
+        out_buffers = {
+            mat_index: np.empty(len(loop_inds), dtype=[STANDARD_VERTEX_ATTR_DTYPES[n] for n in fields_by_mat[mat_index]])
+            for mat_index, loop_inds in loop_inds_by_mat.items()
+        }
+        used_fields = {n for fields in fields_by_mat.values() for n in fields}
+        unknown_fields = used_fields.difference(self.get_attr_names())
+        assert not unknown_fields, f"Unknown vertex attributes requested: {unknown_fields}"
+
+        # Source index of each output vertex in per-vertex attribute arrays and in per-loop attribute arrays
+        vert_inds_by_mat = {m: self._loop_to_vert_inds[loop_inds] for m, loop_inds in loop_inds_by_mat.items()}
+        if self.domain == VBBuilderDomain.FACE_CORNER:
+            corner_inds_by_mat = loop_inds_by_mat
+        elif self.domain == VBBuilderDomain.VERTEX:
+            corner_inds_by_mat = {m: self._vert_to_first_loop[vert_inds] for m, vert_inds in vert_inds_by_mat.items()}
+
+        def _write(name: str, src: NDArray, inds_by_mat: dict[int, NDArray], column: slice | int = slice(None)):
+            for mat_index, out_buffer in out_buffers.items():
+                if name in out_buffer.dtype.names:
+                    _take_into(out_buffer[name][..., column], src, inds_by_mat[mat_index])
+
+        scratch = np.empty(num_loops * 4, dtype=np.float32)
+
+        _write("Position", self._get_vertex_positions(), vert_inds_by_mat)
+
+        if self._has_weights:
+            # Always computed, even if unused, to report issues with the vertex groups
+            blend_weights, blend_indices = self._get_vertex_weights_indices()
+            _write("BlendWeights", blend_weights, vert_inds_by_mat)
+            _write("BlendIndices", blend_indices, vert_inds_by_mat)
+            del blend_weights
+            del blend_indices
+
+        if "Normal" in used_fields:
+            normals = self._read_loop_normals(scratch)
+            if self.domain == VBBuilderDomain.FACE_CORNER:
+                _write("Normal", normals, loop_inds_by_mat)
+            elif self.domain == VBBuilderDomain.VERTEX:
+                _write("Normal", self._loop_to_vertex_normals(normals), vert_inds_by_mat)
+            del normals
+
+        for color_idx, color_attr in self._iter_color_attrs():
+            name = f"Colour{color_idx}"
+            if name in used_fields:
+                _write(name, self._read_colors(color_attr, scratch), corner_inds_by_mat)
+
+        for uvmap_idx, uvmap_attr in self._iter_uv_maps():
+            name = f"TexCoord{uvmap_idx}"
+            if name in used_fields:
+                _write(name, self._read_uvs(uvmap_attr, scratch), corner_inds_by_mat)
+
+        if "Tangent" in used_fields:
+            if mesh.uv_layers:
+                tangents, bitangent_signs = self._read_tangents(scratch)
+                _write("Tangent", tangents, corner_inds_by_mat, column=slice(0, 3))
+                _write("Tangent", bitangent_signs, corner_inds_by_mat, column=3)
+                del tangents
+                del bitangent_signs
+            else:
+                for out_buffer in out_buffers.values():
+                    if "Tangent" in out_buffer.dtype.names:
+                        out_buffer["Tangent"] = 0.0
+
+        return out_buffers
+
+    def get_attr_names(self) -> list[str]:
+        """Gets the names of the vertex attributes available in ``self.mesh``, in vertex buffer order."""
+        names = ["Position"]
+        if self._has_weights:
+            names.append("BlendWeights")
+            names.append("BlendIndices")
+        names.append("Normal")
+        names.extend(f"Colour{color_idx}" for color_idx, _ in self._iter_color_attrs())
+        names.extend(f"TexCoord{uvmap_idx}" for uvmap_idx, _ in self._iter_uv_maps())
+        names.append("Tangent")
+        return names
+
+    def _prepare_mesh(self):
         if not self.mesh.loop_triangles:
             self.mesh.calc_loop_triangles()
 
@@ -203,9 +440,6 @@ class VertexBufferBuilder:
             # needed to fill mesh loops normals with custom split normals pre-4.1
             self.mesh.calc_normals_split()
 
-        mesh_attrs = self._collect_attrs()
-        return self._structured_array_from_attrs(mesh_attrs)
-
     def _collect_attrs(self):
         """Returns a dict mapping arrays of all GTAV vertex attributes in ``self.mesh`` stored on the loop domain."""
         mesh_attrs = {}
@@ -246,99 +480,73 @@ class VertexBufferBuilder:
         return vertex_arr
 
     def _get_positions(self):
-        positions = np.empty(len(self.mesh.vertices) * 3, dtype=np.float32)
-        self.mesh.attributes["position"].data.foreach_get("vector", positions)
-        positions = positions.reshape((len(self.mesh.vertices), 3))
+        positions = self._get_vertex_positions()
 
         if self.domain == VBBuilderDomain.FACE_CORNER:
             return positions[self._loop_to_vert_inds]
         elif self.domain == VBBuilderDomain.VERTEX:
             return positions
 
+    def _get_vertex_positions(self) -> NDArray[np.float32]:
+        positions = np.empty(len(self.mesh.vertices) * 3, dtype=np.float32)
+        self.mesh.attributes["position"].data.foreach_get("vector", positions)
+        return positions.reshape((len(self.mesh.vertices), 3))
+
     def _get_normals(self):
-        normals = np.empty(len(self.mesh.loops) * 3, dtype=np.float32)
-        self.mesh.loops.foreach_get("normal", normals)
-        normals = normals.reshape((len(self.mesh.loops), 3))
+        normals = self._read_loop_normals()
 
         if self.domain == VBBuilderDomain.FACE_CORNER:
             return normals
         elif self.domain == VBBuilderDomain.VERTEX:
-            num_verts = len(self.mesh.vertices)
-
-            # Vectorized accumulation
-            vertex_normals = np.zeros((num_verts, 3), dtype=np.float64)
-            np.add.at(vertex_normals, self._loop_to_vert_inds, normals)
-
-            # Count loops per vertex for averaging
-            loop_counts = np.bincount(self._loop_to_vert_inds, minlength=num_verts)
-
-            vertex_normals /= np.maximum(loop_counts, 1)[:, np.newaxis]
-            norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
-            vertex_normals = np.divide(
-                vertex_normals, norms,
-                out=np.zeros_like(vertex_normals),
-                where=norms != 0
-            )
+            return self._loop_to_vertex_normals(normals)
 
-            return vertex_normals.astype(np.float32)
+    def _read_loop_normals(self, scratch: Optional[NDArray[np.float32]] = None) -> NDArray[np.float32]:
+        num_loops = len(self.mesh.loops)
+        normals = _scratch_view(scratch, num_loops * 3)
+        self.mesh.loops.foreach_get("normal", normals)
+        return normals.reshape((num_loops, 3))
 
-    def _get_weights_indices(self) -> Tuple[NDArray[np.uint32], NDArray[np.uint32]]:
-        """Get all BlendWeights and BlendIndices."""
+    def _loop_to_vertex_normals(self, normals: NDArray[np.float32]) -> NDArray[np.float32]:
         num_verts = len(self.mesh.vertices)
-        bone_by_vgroup = self._bone_by_vgroup
 
-        ind_arr = np.zeros((num_verts, 4), dtype=np.uint32)
-        weights_arr = np.zeros((num_verts, 4), dtype=np.float32)
+        # Vectorized accumulation
+        vertex_normals = np.zeros((num_verts, 3), dtype=np.float64)
+        np.add.at(vertex_normals, self._loop_to_vert_inds, normals)
 
-        cloth_bind_verts = []
-        ungrouped_verts = 0
+        # Count loops per vertex for averaging
+        loop_counts = np.bincount(self._loop_to_vert_inds, minlength=num_verts)
 
-        # Collect all vertex group data in flat arrays for batch processing
-        vert_indices_list = []
-        bone_indices_list = []
-        weights_list = []
-        slot_indices_list = []
+        vertex_normals /= np.maximum(loop_counts, 1)[:, np.newaxis]
+        norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+        vertex_normals = np.divide(
+            vertex_normals, norms,
+            out=np.zeros_like(vertex_normals),
+            where=norms != 0
+        )
 
-        for vi, vert in enumerate(self.mesh.vertices):
-            vert_groups = vert.groups
-            if not vert_groups:
-                ungrouped_verts += 1
-                continue
+        return vertex_normals.astype(np.float32)
 
-            # Collect valid groups for this vertex
-            valid_groups = []
-            has_cloth = False
-            for ge in vert_groups:
-                bone_index = bone_by_vgroup.get(ge.group, VGROUP_INVALID_BONE_ID)
-                if bone_index == VGROUP_INVALID_BONE_ID:
-                    continue
-                if bone_index == VGROUP_CLOTH_ID:
-                    has_cloth = True
-                    break
-                valid_groups.append((ge.weight, bone_index))
-
-            if has_cloth:
-                cloth_bind_verts.append(vi)
-                continue
+    def _get_weights_indices(self) -> Tuple[NDArray[np.uint32], NDArray[np.uint32]]:
+        """Get all BlendWeights and BlendIndices."""
+        weights_arr, ind_arr = self._get_vertex_weights_indices()
 
-            if not valid_groups:
-                ungrouped_verts += 1
-                continue
+        if self.domain == VBBuilderDomain.FACE_CORNER:
+            # Return on loop domain
+            return weights_arr[self._loop_to_vert_inds], ind_arr[self._loop_to_vert_inds]
+        elif self.domain == VBBuilderDomain.VERTEX:
+            return weights_arr, ind_arr
+
+    def _get_vertex_weights_indices(self) -> Tuple[NDArray[np.uint32], NDArray[np.uint32]]:
+        """Get the BlendWeights and BlendIndices of each vertex."""
+        num_verts = len(self.mesh.vertices)
+        bone_by_vgroup = self._bone_by_vgroup
 
-            # Sort by weight descending and take top 4
-            valid_groups.sort(reverse=True, key=lambda x: x[0])
-            for j, (weight, bone_idx) in enumerate(valid_groups[:4]):
-                vert_indices_list.append(vi)
-                bone_indices_list.append(bone_idx)
-                weights_list.append(weight)
-                slot_indices_list.append(j)
-
-        # Batch assign to arrays
-        if vert_indices_list:
-            vert_indices = np.array(vert_indices_list, dtype=np.uint32)
-            slot_indices = np.array(slot_indices_list, dtype=np.uint32)
-            weights_arr[vert_indices, slot_indices] = weights_list
-            ind_arr[vert_indices, slot_indices] = bone_indices_list
+        groups_per_vert, group_indices, group_weights = read_vertex_group_elements(self.mesh.vertices)
+        weights_arr, ind_arr, cloth_bind_verts_mask, ungrouped_verts_mask = get_top_vertex_weights(
+            groups_per_vert, group_indices, group_weights, bone_by_vgroup
+        )
+        num_cloth_bind_verts = int(np.count_nonzero(cloth_bind_verts_mask))
+        ungrouped_verts = int(np.count_nonzero(ungrouped_verts_mask))
 
         if ungrouped_verts != 0:
             logger.warning(
@@ -354,16 +562,13 @@ class VertexBufferBuilder:
         weights_arr = self._convert_to_int_range(weights_arr)
         weights_arr = self._renormalize_converted_weights(weights_arr)
 
-        if cloth_bind_verts and not self._char_cloth:
+        if num_cloth_bind_verts and not self._char_cloth:
             logger.warning(
-                f"Mesh '{self.mesh.name}' has {len(cloth_bind_verts)} vertices weighted to {CLOTH_CHAR_VERTEX_GROUP_NAME} "
+                f"Mesh '{self.mesh.name}' has {num_cloth_bind_verts} vertices weighted to {CLOTH_CHAR_VERTEX_GROUP_NAME} "
                 f"vertex group but this is not a character cloth! These vertices will not be weighted correctly in-game. "
                 f"Remove {CLOTH_CHAR_VERTEX_GROUP_NAME} vertex group if making a character cloth is not intended."
             )
-        elif cloth_bind_verts and self._char_cloth:
-            cloth_bind_verts_mask = np.zeros(num_verts, dtype=bool)
-            cloth_bind_verts_mask[cloth_bind_verts] = 1
-
+        elif num_cloth_bind_verts and self._char_cloth:
             mesh_verts_pos = np.empty(num_verts * 3, dtype=np.float32)
             mesh_verts_normal = np.empty(num_verts * 3, dtype=np.float32)
             self.mesh.attributes["position"].data.foreach_get("vector", mesh_verts_pos)
@@ -459,11 +664,7 @@ class VertexBufferBuilder:
             #
             #     cloth_export_context().diagnostics.mesh_bindings = diag_bindings
 
-        if self.domain == VBBuilderDomain.FACE_CORNER:
-            # Return on loop domain
-            return weights_arr[self._loop_to_vert_inds], ind_arr[self._loop_to_vert_inds]
-        elif self.domain == VBBuilderDomain.VERTEX:
-            return weights_arr, ind_arr
+        return weights_arr, ind_arr
 
     def _get_sorted_vertex_group_elements(self, vertex: bpy.types.MeshVertex) -> list[bpy.types.VertexGroupElement]:
         return get_sorted_vertex_group_elements(vertex, self._bone_by_vgroup)
@@ -495,9 +696,8 @@ class VertexBufferBuilder:
         result[np.arange(len(result)), max_indices] += deltas
         return result
 
-    def _get_colors(self) -> dict[str, NDArray[np.uint32]]:
-        num_loops = len(self.mesh.loops)
-        color_layers = {}
+    def _iter_color_attrs(self) -> Iterator[tuple[int, bpy.types.Attribute]]:
+        """Yields the color attributes used by Sollumz shaders that can be exported, with their color index."""
         for color_idx in get_mesh_used_colors_indices(self.mesh):
             color_attr_name = get_color_attr_name(color_idx)
             color_attr = self.mesh.color_attributes.get(color_attr_name, None)
@@ -508,14 +708,22 @@ class VertexBufferBuilder:
                 # Not in the correct format, ignore it
                 continue
 
-            # Pre-allocate with final shape
-            colors = np.empty((num_loops, 4), dtype=np.float32)
-            color_attr.data.foreach_get("color_srgb", colors.ravel())
+            yield color_idx, color_attr
 
-            # In-place multiply and round to reduce allocations
-            colors *= 255.0
-            np.rint(colors, out=colors)
-            colors = colors.astype(np.uint32)
+    def _iter_uv_maps(self) -> Iterator[tuple[int, bpy.types.MeshUVLoopLayer]]:
+        """Yields the UV maps used by Sollumz shaders, with their texcoord index."""
+        for uvmap_idx in get_mesh_used_texcoords_indices(self.mesh):
+            uvmap_attr_name = get_uv_map_name(uvmap_idx)
+            uvmap_attr = self.mesh.uv_layers.get(uvmap_attr_name, None)
+            if uvmap_attr is None:
+                continue
+
+            yield uvmap_idx, uvmap_attr
+
+    def _get_colors(self) -> dict[str, NDArray[np.uint32]]:
+        color_layers = {}
+        for color_idx, color_attr in self._iter_color_attrs():
+            colors = self._read_colors(color_attr).astype(np.uint32)
 
             if self.domain == VBBuilderDomain.VERTEX:
                 colors = colors[self._vert_to_first_loop]
@@ -524,20 +732,26 @@ class VertexBufferBuilder:
 
         return color_layers
 
-    def _get_uvs(self) -> dict[str, NDArray[np.float32]]:
+    def _read_colors(
+        self,
+        color_attr: bpy.types.Attribute,
+        scratch: Optional[NDArray[np.float32]] = None
+    ) -> NDArray[np.float32]:
+        """Reads the colors of each loop in range 0-255, already rounded."""
         num_loops = len(self.mesh.loops)
-        uv_layers = {}
-        for uvmap_idx in get_mesh_used_texcoords_indices(self.mesh):
-            uvmap_attr_name = get_uv_map_name(uvmap_idx)
-            uvmap_attr = self.mesh.uv_layers.get(uvmap_attr_name, None)
-            if uvmap_attr is None:
-                continue
+        colors = _scratch_view(scratch, num_loops * 4)
+        color_attr.data.foreach_get("color_srgb", colors)
+        colors = colors.reshape((num_loops, 4))
 
-            # Pre-allocate with final shape
-            uvs = np.empty((num_loops, 2), dtype=np.float32)
-            uvmap_attr.uv.foreach_get("vector", uvs.ravel())
+        # In-place multiply and round to reduce allocations
+        colors *= 255.0
+        np.rint(colors, out=colors)
+        return colors
 
-            flip_uvs(uvs)
+    def _get_uvs(self) -> dict[str, NDArray[np.float32]]:
+        uv_layers = {}
+        for uvmap_idx, uvmap_attr in self._iter_uv_maps():
+            uvs = self._read_uvs(uvmap_attr)
 
             if self.domain == VBBuilderDomain.VERTEX:
                 uvs = uvs[self._vert_to_first_loop]
@@ -546,6 +760,19 @@ class VertexBufferBuilder:
 
         return uv_layers
 
+    def _read_uvs(
+        self,
+        uvmap_attr: bpy.types.MeshUVLoopLayer,
+        scratch: Optional[NDArray[np.float32]] = None
+    ) -> NDArray[np.float32]:
+        num_loops = len(self.mesh.loops)
+        uvs = _scratch_view(scratch, num_loops * 2)
+        uvmap_attr.uv.foreach_get("vector", uvs)
+        uvs = uvs.reshape((num_loops, 2))
+
+        flip_uvs(uvs)
+        return uvs
+
     def _get_tangents(self):
         mesh = self.mesh
         num_loops = len(mesh.loops)
@@ -553,20 +780,48 @@ class VertexBufferBuilder:
         if not mesh.uv_layers:
             return np.zeros((num_loops, 4), dtype=np.float32)
 
+        tangents, bitangent_signs = self._read_tangents()
+        tangents_and_sign = np.concatenate((tangents, bitangent_signs.reshape((-1, 1))), axis=1)
+
+        if self.domain == VBBuilderDomain.VERTEX:
+            tangents_and_sign = tangents_and_sign[self._vert_to_first_loop]
+
+        return tangents_and_sign
+
+    def _read_tangents(
+        self,
+        scratch: Optional[NDArray[np.float32]] = None
+    ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+        """Reads the tangent and bitangent sign of each loop. Requires UV maps."""
+        mesh = self.mesh
+        num_loops = len(mesh.loops)
+
         mesh.calc_tangents()
 
-        tangents = np.empty(num_loops * 3, dtype=np.float32)
-        bitangent_signs = np.empty(num_loops, dtype=np.float32)
+        tangents_and_signs = _scratch_view(scratch, num_loops * 4)
+        tangents = tangents_and_signs[:num_loops * 3]
+        bitangent_signs = tangents_and_signs[num_loops * 3:]
 
         mesh.loops.foreach_get("tangent", tangents)
         mesh.loops.foreach_get("bitangent_sign", bitangent_signs)
 
-        tangents = np.reshape(tangents, (num_loops, 3))
-        bitangent_signs = np.reshape(bitangent_signs, (-1, 1))
+        return tangents.reshape((num_loops, 3)), bitangent_signs
 
-        tangents_and_sign = np.concatenate((tangents, bitangent_signs), axis=1)
 
-        if self.domain == VBBuilderDomain.VERTEX:
-            tangents_and_sign = tangents_and_sign[self._vert_to_first_loop]
+def _scratch_view(scratch: Optional[NDArray[np.float32]], size: int) -> NDArray[np.float32]:
+    """Gets a buffer of ``size`` floats from the start of ``scratch``, or a new one if no scratch buffer is given."""
+    if scratch is None:
+        return np.empty(size, dtype=np.float32)
 
-        return tangents_and_sign
+    return scratch[:size]
+
+
+def _take_into(out: NDArray, src: NDArray, inds: NDArray):
+    """Copies ``src[inds]`` into ``out`` (e.g. a field of a structured array), without a temporary copy if the types
+    match.
+    """
+    if out.dtype == src.dtype:
+        # With the default mode="raise", `out` is buffered. The indices come from the mesh so they are always valid
+        np.take(src, inds, axis=0, out=out, mode="clip")
+    else:
+        out[...] = src[inds]
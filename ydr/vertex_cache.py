@@ -0,0 +1,123 @@
+"""Triangle and vertex reordering to improve GPU vertex cache and vertex fetch locality of exported geometries.
+
+Triangles are reordered with the Tipsify algorithm from "Fast Triangle Reordering for Vertex Locality and Reduced
+Overdraw" (Sander, Nehab and Barczak, 2007). Like Forsyth's algorithm it greedily emits triangles around the vertices
+that are still in the simulated cache, but runs in linear time.
+"""
+import numpy as np
+from numpy.typing import NDArray
+
+# Simulated post-transform vertex cache size, a conservative value for the GPUs the game runs on
+VERTEX_CACHE_SIZE = 16
+
+
+def optimize_vertex_cache(ind_buffer: NDArray[np.uint32], num_verts: int) -> NDArray[np.uint32]:
+    """Reorders the triangles in ``ind_buffer`` to reduce vertex cache misses. The vertex order of each triangle is
+    kept, so winding doesn't change.
+    """
+    num_tris = len(ind_buffer) // 3
+    if num_tris <= 1:
+        return ind_buffer
+
+    cache_size = VERTEX_CACHE_SIZE
+
+    # Vertex -> adjacent triangles, as CSR arrays
+    valence = np.bincount(ind_buffer, minlength=num_verts)
+    adj_offsets = np.zeros(num_verts + 1, dtype=np.int64)
+    np.cumsum(valence, out=adj_offsets[1:])
+    adj_tris = (np.argsort(ind_buffer, kind="stable") // 3).tolist()
+    adj_offsets = adj_offsets.tolist()
+
+    tris = ind_buffer.tolist()
+    live_tris = valence.tolist()
+    cache_time = [0] * num_verts
+    emitted = bytearray(num_tris)
+    dead_end = []
+    out = []
+
+    time = cache_size + 1
+    cursor = 0
+    fanning_vert = 0
+    while fanning_vert >= 0:
+        candidates = []
+        for tri in adj_tris[adj_offsets[fanning_vert]:adj_offsets[fanning_vert + 1]]:
+            if emitted[tri]:
+                continue
+
+            emitted[tri] = 1
+            for v in tris[tri * 3:tri * 3 + 3]:
+                out.append(v)
+                dead_end.append(v)
+                candidates.append(v)
+                live_tris[v] -= 1
+                if time - cache_time[v] > cache_size:
+                    cache_time[v] = time
+                    time += 1
+
+        # Next fanning vertex, the candidate that will stay longest in the cache after emitting all its triangles
+        fanning_vert = -1
+        best_priority = -1
+        for v in candidates:
+            if live_tris[v] <= 0:
+                continue
+
+            priority = 0
+            if time - cache_time[v] + 2 * live_tris[v] <= cache_size:
+                priority = time - cache_time[v]
+            if priority > best_priority:
+                best_priority = priority
+                fanning_vert = v
+
+        if fanning_vert == -1:
+            # Dead-end, go back to recently used vertices or continue with the next vertex in input order
+            while dead_end:
+                v = dead_end.pop()
+                if live_tris[v] > 0:
+                    fanning_vert = v
+                    break
+            else:
+                while cursor < num_verts:
+                    if live_tris[cursor] > 0:
+                        fanning_vert = cursor
+                        break
+                    cursor += 1
+
+    return np.array(out, dtype=ind_buffer.dtype)
+
+
+def optimize_vertex_fetch(vert_buffer: NDArray, ind_buffer: NDArray[np.uint32]) -> tuple[NDArray, NDArray[np.uint32]]:
+    """Renumbers the vertices in order of first use by ``ind_buffer``, so vertices are fetched sequentially. Vertices
+    not used by any triangle are kept at the end.
+    """
+    num_verts = len(vert_buffer)
+    used_verts, first_use = np.unique(ind_buffer, return_index=True)
+    new_order = used_verts[np.argsort(first_use)]
+    if len(new_order) < num_verts:
+        unused = np.ones(num_verts, dtype=bool)
+        unused[new_order] = False
+        new_order = np.concatenate((new_order, np.flatnonzero(unused)))
+
+    remap = np.empty(num_verts, dtype=np.uint32)
+    remap[new_order] = np.arange(num_verts, dtype=np.uint32)
+    return vert_buffer[new_order], remap[ind_buffer]
+
+
+def calculate_acmr(ind_buffer: NDArray[np.uint32], num_verts: int) -> float:
+    """Calculates the average cache miss ratio, the number of vertex cache misses per triangle, simulating a FIFO cache
+    of `VERTEX_CACHE_SIZE` vertices. Ranges from 0.5 (best) to 3.0 (worst).
+    """
+    num_tris = len(ind_buffer) // 3
+    if num_tris == 0:
+        return 0.0
+
+    cache_size = VERTEX_CACHE_SIZE
+    cache_time = [0] * num_verts
+    time = cache_size + 1
+    misses = 0
+    for v in ind_buffer.tolist():
+        if time - cache_time[v] > cache_size:
+            cache_time[v] = time
+            time += 1
+            misses += 1
+
+    return misses / num_tris
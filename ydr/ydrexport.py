@@ -15,6 +15,7 @@ import numpy as np
 from numpy.typing import NDArray
 from typing import Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from pathlib import Path
 from mathutils import Quaternion, Vector, Matrix
@@ -74,14 +75,23 @@ from .properties import get_model_properties
 from .render_bucket import RenderBucket
 from .vertex_buffer_builder import VertexBufferBuilder, VBBuilderDomain, dedupe_and_get_indices, remove_arr_field, remove_unused_colors, try_get_bone_by_vgroup, remove_unused_uvs
 from .cable_vertex_buffer_builder import CableVertexBufferBuilder
+from .vertex_cache import optimize_vertex_cache, optimize_vertex_fetch, calculate_acmr
+from .deferred_lods import get_deferred_lod
+from .geometry_cache import geometry_cache_key
+from .model_data import get_faces_subset
 from .cable import is_cable_mesh
 from .cloth_diagnostics import cloth_export_context
+from ..profiling import span, traced
 from .lights import export_lights
 
 from ..iecontext import export_context, ExportBundle
 from .. import logger
 
+# Geometries use 16-bit vertex indices
+MAX_VERTS_PER_GEOMETRY = 65535
 
+
+@traced()
 def export_ydr(obj: Object) -> ExportBundle:
     embedded_tex = []
     hd_tex: dict[str, EmbeddedTexture] = {}
@@ -94,6 +104,7 @@ def export_ydr(obj: Object) -> ExportBundle:
     )
 
 
+@traced()
 def create_drawable_asset(
     drawable_obj: Object,
     armature_obj: Object | None = None,
@@ -155,6 +166,7 @@ def create_drawable_asset(
     return drawable
 
 
+@traced()
 def create_models(
     drawable: AssetDrawable,
     drawable_obj: Object,
@@ -171,21 +183,39 @@ def create_models(
 
     lod_levels = (LODLevel.VERYHIGH,) if hi else (LODLevel.HIGH, LODLevel.MEDIUM, LODLevel.LOW, LODLevel.VERYLOW)
 
-    models: dict[IOLodLevel, list[Model]] = defaultdict(list)
+    # Read the mesh data of all models first, Blender data can only be accessed from the main thread
+    pending_models: list[tuple[LODLevel, PendingModel]] = []
     for model_obj in model_objs:
         transforms_to_apply = get_export_transforms_to_apply(model_obj)
 
         lods = model_obj.sz_lods
         for lod_level in lod_levels:
             lod = lods.get_lod(lod_level)
-            if lod.mesh is None:
+            if not lod.has_geometry:
                 continue
 
-            model = create_model(model_obj, lod_level, materials, armature_obj, transforms_to_apply, char_cloth)
-            if not model.geometries:
-                continue
+            pending_model = None
+            if lod.has_deferred_mesh and char_cloth is None:
+                model = create_model_from_deferred_lod(model_obj, lod_level, materials, transforms_to_apply)
+                if model is not None:
+                    pending_model = PendingModel(model, None, model_obj.name, lod_level, materials, None)
+            if pending_model is None:
+                pending_model = prepare_model(
+                    model_obj, lod_level, materials, armature_obj, transforms_to_apply, char_cloth
+                )
+
+            pending_models.append((lod_level, pending_model))
+
+    build_pending_models([pending_model for _, pending_model in pending_models])
+
+    # Finish in the same order the models were read, so the output doesn't depend on the build order
+    models: dict[IOLodLevel, list[Model]] = defaultdict(list)
+    for lod_level, pending_model in pending_models:
+        model = pending_model.finish()
+        if not model.geometries:
+            continue
 
-            models[lod_level.to_io()].append(model)
+        models[lod_level.to_io()].append(model)
 
     # Drawables only ever have 1 skinned drawable model per LOD level. Since, the skinned portion of the
     # drawable can be split by vertex group, we have to join each separate part into a single object.
@@ -198,6 +228,23 @@ def create_models(
     return models
 
 
+def build_pending_models(pending_models: list["PendingModel"]):
+    """Builds the geometries of the models, in worker threads if enabled in the export settings."""
+    settings = export_context().settings
+    num_jobs = sum(1 for p in pending_models if p.geometry_job is not None)
+    if not settings.parallel_geometry_build or num_jobs <= 1:
+        for pending_model in pending_models:
+            pending_model.build_geometries()
+        return
+
+    num_workers = min(settings.parallel_geometry_build_num_workers, num_jobs)
+    with span("parallel_geometry_building", num_models=num_jobs, num_workers=num_workers):
+        with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="sollumz_geometry") as executor:
+            # Consume the results to propagate exceptions raised in the workers
+            for _ in executor.map(PendingModel.build_geometries, pending_models):
+                pass
+
+
 def get_model_objs(drawable_obj: Object) -> list[Object]:
     """Get all non-skinned Drawable Model objects under ``drawable_obj``."""
     from .cloth import is_cloth_mesh_object
@@ -225,7 +272,7 @@ def sort_skinned_models_by_bone(model_objs: list[Object], bones: list[Bone]) ->
     return sorted(model_objs, key=get_model_bone_ind)
 
 
-@operates_on_lod_level
+@traced()
 def create_model(
     model_obj: Object,
     lod_level: LODLevel,
@@ -235,27 +282,112 @@ def create_model(
     char_cloth: CharacterCloth | None = None,
     mesh_domain_override: Optional[VBBuilderDomain] = None,
 ) -> Model:
-    obj_eval = get_evaluated_obj(model_obj)
-    mesh_eval = obj_eval.to_mesh()
-    triangulate_mesh(mesh_eval)
+    pending_model = prepare_model(
+        model_obj, lod_level, materials, armature_obj, transforms_to_apply, char_cloth, mesh_domain_override
+    )
+    pending_model.build_geometries()
+    return pending_model.finish()
 
-    if transforms_to_apply is not None:
-        mesh_eval.transform(transforms_to_apply)
 
-    if char_cloth:
-        cloth_export_context().diagnostics.drawable_model_obj_name = model_obj.name
+class PendingModel:
+    """Model with the mesh data already read from Blender but whose geometries may not be built yet. `build_geometries`
+    doesn't access Blender data so it can run in worker threads. `finish` must be called from the main thread.
+    """
 
-    geometries = create_geometries(
-        model_obj, mesh_eval, materials, armature_obj, char_cloth, mesh_domain_override
-    )
+    def __init__(
+        self,
+        model: Model,
+        geometry_job: Optional["GeometryBuildJob"],
+        mesh_name: str,
+        lod_level: LODLevel,
+        materials: list[Material],
+        cache_key,
+        source: Optional["PendingModel"] = None,
+    ):
+        # Model without geometries yet, unless they are already available (e.g. from a deferred LOD)
+        self.model = model
+        self.geometry_job = geometry_job
+        self.mesh_name = mesh_name
+        self.lod_level = lod_level
+        self.materials = materials
+        self.cache_key = cache_key
+        # Model with the same cache key prepared before this one, its geometries are reused instead of building them
+        self.source = source
+        self.cached_geometries: Optional[list[Geometry]] = None
+        self.logs: list[tuple[str, str]] = []
+
+    def build_geometries(self):
+        if self.geometry_job is None:
+            return
+
+        # Logs are output in `finish`, so they keep the same order regardless of the thread that built each model
+        with logger.capture_logs() as self.logs:
+            self.model.geometries = self.geometry_job.build()
+
+    def finish(self) -> Model:
+        logger.replay_logs(self.logs)
+        if self.source is not None:
+            assert self.source.cached_geometries is not None, "Source model must be finished first"
+            self.model.geometries = [replace(g) for g in self.source.cached_geometries]
+            return self.model
+
+        if self.geometry_job is None:
+            return self.model
+
+        geometries = self.model.geometries
+        if self.lod_level == LODLevel.HIGH:
+            fix_vehglass_geometry_for_shattermap_generation(self.mesh_name, self.materials, geometries)
+
+        if self.cache_key is not None:
+            # Copy the geometries so later changes to their fields (e.g. joining or splitting models) don't affect the
+            # models reusing them. The buffers are shared, any code modifying them in-place must copy them first.
+            self.cached_geometries = [replace(g) for g in geometries]
+
+        return self.model
+
+
+@traced()
+@operates_on_lod_level
+def prepare_model(
+    model_obj: Object,
+    lod_level: LODLevel,
+    materials: list[Material],
+    armature_obj: Optional[Object] = None,
+    transforms_to_apply: Optional[Matrix] = None,
+    char_cloth: CharacterCloth | None = None,
+    mesh_domain_override: Optional[VBBuilderDomain] = None,
+) -> PendingModel:
+    """Reads the model data from Blender. The geometries are built later by the returned `PendingModel`."""
+    ctx = export_context()
+    geometry_cache = ctx.geometry_cache
+    cache_key = None
+    if geometry_cache is not None and char_cloth is None:
+        domain = ctx.settings.mesh_domain if mesh_domain_override is None else mesh_domain_override
+        cache_key = geometry_cache_key(model_obj, lod_level, materials, armature_obj, transforms_to_apply, domain)
+
+    source = geometry_cache.get(cache_key) if cache_key is not None else None
+    geometry_job = None
+    mesh_name = ""
+    if source is None:
+        obj_eval = get_evaluated_obj(model_obj)
+        mesh_eval = obj_eval.to_mesh()
+        triangulate_mesh(mesh_eval)
+
+        if transforms_to_apply is not None:
+            mesh_eval.transform(transforms_to_apply)
+
+        if char_cloth:
+            cloth_export_context().diagnostics.drawable_model_obj_name = model_obj.name
+
+        mesh_name = mesh_eval.name
+        geometry_job = prepare_geometries(
+            model_obj, mesh_eval, materials, armature_obj, char_cloth, mesh_domain_override
+        )
 
-    if lod_level == LODLevel.HIGH:
-        fix_vehglass_geometry_for_shattermap_generation(mesh_eval, materials, geometries)
+        obj_eval.to_mesh_clear()
 
     bone_index = get_model_bone_index(model_obj)
 
-    obj_eval.to_mesh_clear()
-
     bones = armature_obj.data.bones if armature_obj is not None else None
     model_props = get_model_properties(model_obj, lod_level)
     render_mask = model_props.render_mask
@@ -267,14 +399,89 @@ def create_model(
         flags = 0
         matrix_count = 0
 
-    return Model(
+    model = Model(
         bone_index=bone_index,
-        geometries=geometries,
+        geometries=[],
         render_bucket_mask=render_mask,
         has_skin=has_skin,
         matrix_count=matrix_count,
         flags=flags,
     )
+    pending_model = PendingModel(model, geometry_job, mesh_name, lod_level, materials, cache_key, source)
+    if cache_key is not None and source is None:
+        geometry_cache.put(cache_key, pending_model)
+
+    return pending_model
+
+
+@traced()
+def create_model_from_deferred_lod(
+    model_obj: Object,
+    lod_level: LODLevel,
+    materials: list[Material],
+    transforms_to_apply: Optional[Matrix] = None,
+) -> Optional[Model]:
+    """Creates the model of a deferred LOD level directly from its stored geometry, without building the mesh. Returns
+    ``None`` if the stored geometry cannot be used as is, then the model must be created from the mesh.
+    """
+    if lod_level == LODLevel.HIGH or model_obj.modifiers or model_obj.vertex_groups:
+        return None
+
+    if transforms_to_apply is not None and not _is_identity_matrix(transforms_to_apply):
+        return None
+
+    deferred_lod = get_deferred_lod(model_obj, lod_level)
+    if deferred_lod is None:
+        return None
+
+    mesh_data = deferred_lod.mesh_data
+    if "BlendWeights" in mesh_data.vert_arr.dtype.names:
+        return None
+
+    if any(mat not in materials for mat in deferred_lod.materials.values()):
+        return None
+
+    settings = export_context().settings
+    geometries: list[Geometry] = []
+    for mat_ind, material in deferred_lod.materials.items():
+        face_inds = np.flatnonzero(mesh_data.mat_inds == mat_ind)
+        vert_buffer, ind_buffer = get_faces_subset(mesh_data.vert_arr, mesh_data.ind_arr, face_inds)
+
+        vert_buffer = remove_unused_uvs(vert_buffer, get_used_texcoords(material))
+        vert_buffer = remove_unused_colors(vert_buffer, get_used_colors(material))
+
+        if not get_tangent_required(material):
+            vert_buffer = remove_arr_field("Tangent", vert_buffer)
+
+        if not get_normal_required(material):
+            vert_buffer = remove_arr_field("Normal", vert_buffer)
+
+        if settings.optimize_vertex_order:
+            with span("vertex_order_optimization"):
+                ind_buffer = optimize_vertex_cache(ind_buffer, len(vert_buffer))
+                vert_buffer, ind_buffer = optimize_vertex_fetch(vert_buffer, ind_buffer)
+
+        geometries.append(Geometry(
+            vertex_data_type=VertexDataType.DEFAULT,
+            vertex_buffer=vert_buffer,
+            index_buffer=ind_buffer,
+            bone_ids=np.empty(0),
+            shader_index=materials.index(material),
+        ))
+
+    return Model(
+        bone_index=get_model_bone_index(model_obj),
+        geometries=sort_geoms_by_shader(geometries),
+        render_bucket_mask=deferred_lod.render_mask,
+        has_skin=False,
+        matrix_count=0,
+        flags=0,
+    )
+
+
+def _is_identity_matrix(m: Matrix, tolerance: float = 1e-6) -> bool:
+    identity = Matrix.Identity(4)
+    return all(abs(m[i][j] - identity[i][j]) <= tolerance for i in range(4) for j in range(4))
 
 
 def triangulate_mesh(mesh: Mesh):
@@ -309,15 +516,95 @@ def create_geometries(
     char_cloth: CharacterCloth | None,
     mesh_domain_override: Optional[VBBuilderDomain],
 ) -> list[Geometry]:
+    return prepare_geometries(
+        model_obj, mesh_eval, materials, armature_obj, char_cloth, mesh_domain_override
+    ).build()
+
+
+class GeometryBuildJob:
+    """Builds the geometries of a mesh from the arrays read by `prepare_geometries`. Doesn't access Blender data."""
+
+    def __init__(
+        self,
+        mesh_name: str,
+        vert_buffers_by_mat: dict[int, NDArray],
+        bone_ids: Optional[list[int]],
+        optimize_vertex_order: bool,
+        geometries: Optional[list[Geometry]] = None,
+    ):
+        self.mesh_name = mesh_name
+        # Vertex buffer of each material with one vertex per triangle corner and only the fields used by the material
+        self.vert_buffers_by_mat = vert_buffers_by_mat
+        self.bone_ids = bone_ids
+        self.optimize_vertex_order = optimize_vertex_order
+        # Already built geometries, e.g. of cables or meshes without geometry
+        self.geometries = geometries
+
+    @staticmethod
+    def from_geometries(geometries: list[Geometry]) -> "GeometryBuildJob":
+        return GeometryBuildJob("", {}, None, False, geometries)
+
+    @traced("export_geometry_building")
+    def build(self) -> list[Geometry]:
+        if self.geometries is not None:
+            return self.geometries
+
+        geometries: list[Geometry] = []
+        acmr_misses_before = 0.0
+        acmr_misses_after = 0.0
+        for mat_index, vert_buffer in self.vert_buffers_by_mat.items():
+            vert_buffer, ind_buffer = dedupe_and_get_indices(vert_buffer)
+
+            if self.optimize_vertex_order:
+                with span("vertex_order_optimization"):
+                    num_verts = len(vert_buffer)
+                    acmr_misses_before += calculate_acmr(ind_buffer, num_verts) * (len(ind_buffer) // 3)
+                    ind_buffer = optimize_vertex_cache(ind_buffer, num_verts)
+                    acmr_misses_after += calculate_acmr(ind_buffer, num_verts) * (len(ind_buffer) // 3)
+                    vert_buffer, ind_buffer = optimize_vertex_fetch(vert_buffer, ind_buffer)
+
+            if self.bone_ids and "BlendWeights" in vert_buffer.dtype.names:
+                bone_ids = self.bone_ids
+            else:
+                bone_ids = np.empty(0)
+
+            geom = Geometry(
+                vertex_data_type=VertexDataType.DEFAULT,
+                vertex_buffer=vert_buffer,
+                index_buffer=ind_buffer,
+                bone_ids=bone_ids,
+                shader_index=mat_index,
+            )
+            geometries.append(geom)
+
+        if self.optimize_vertex_order and (num_tris := sum(len(g.index_buffer) // 3 for g in geometries)):
+            logger.info(
+                f"Optimized vertex order of Drawable Model '{self.mesh_name}': ACMR "
+                f"{acmr_misses_before / num_tris:.3f} -> {acmr_misses_after / num_tris:.3f}"
+            )
+
+        return sort_geoms_by_shader(geometries)
+
+
+@traced()
+def prepare_geometries(
+    model_obj: Object,
+    mesh_eval: Mesh,
+    materials: list[Material],
+    armature_obj: Optional[Object],
+    char_cloth: CharacterCloth | None,
+    mesh_domain_override: Optional[VBBuilderDomain],
+) -> GeometryBuildJob:
+    """Reads the mesh data needed to build the geometries of ``mesh_eval``."""
     is_cable = is_cable_mesh(mesh_eval)
     if len(mesh_eval.loops) == 0 and not is_cable:  # cable mesh don't have faces, so no loops either
         logger.warning(f"Drawable Model '{mesh_eval.original.name}' has no Geometry! Skipping...")
-        return []
+        return GeometryBuildJob.from_geometries([])
 
     if not mesh_eval.materials:
         logger.warning(
             f"Could not create geometries for Drawable Model '{mesh_eval.original.name}': Mesh has no Sollumz materials!")
-        return []
+        return GeometryBuildJob.from_geometries([])
 
     if is_cable:
         cable_total_vert_buffer, cable_vert_materials = CableVertexBufferBuilder(mesh_eval).build()
@@ -338,7 +625,7 @@ def create_geometries(
             )
             cable_geometries.append(geom)
 
-        return cable_geometries
+        return GeometryBuildJob.from_geometries(cable_geometries)
 
     # Validate UV maps and color attributes
     texcoords = [(t, get_uv_map_name(t)) for t in get_mesh_used_texcoords_indices(mesh_eval)]
@@ -379,59 +666,49 @@ def create_geometries(
 
     loop_inds_by_mat = get_loop_inds_by_material(mesh_eval, materials)
 
-    geometries: list[Geometry] = []
-
     bones = armature_obj.data.bones if armature_obj is not None else None
     bone_by_vgroup = try_get_bone_by_vgroup(model_obj, armature_obj)
 
-    domain = export_context().settings.mesh_domain if mesh_domain_override is None else mesh_domain_override
+    settings = export_context().settings
+    domain = settings.mesh_domain if mesh_domain_override is None else mesh_domain_override
     vb_builder = VertexBufferBuilder(mesh_eval, bone_by_vgroup, domain, materials, char_cloth)
-    total_vert_buffer = vb_builder.build()
-    if domain == VBBuilderDomain.VERTEX:
-        # bit dirty to use private data of the builder class, but we need this array here and it is already computed
-        loop_to_vert_inds = vb_builder._loop_to_vert_inds
-
-    for mat_index, loop_inds in loop_inds_by_mat.items():
-        material = materials[mat_index]
-        tangent_required = get_tangent_required(material)
-        normal_required = get_normal_required(material)
-
-        if domain == VBBuilderDomain.FACE_CORNER:
-            vert_buffer = total_vert_buffer[loop_inds]
-        elif domain == VBBuilderDomain.VERTEX:
-            vert_buffer = total_vert_buffer[loop_to_vert_inds[loop_inds]]
-        used_texcoords = get_used_texcoords(material)
-        used_colors = get_used_colors(material)
-
-        vert_buffer = remove_unused_uvs(vert_buffer, used_texcoords)
-        vert_buffer = remove_unused_colors(vert_buffer, used_colors)
-
-        if not tangent_required:
-            vert_buffer = remove_arr_field("Tangent", vert_buffer)
-
-        if not normal_required:
-            vert_buffer = remove_arr_field("Normal", vert_buffer)
-
-        vert_buffer, ind_buffer = dedupe_and_get_indices(vert_buffer)
-
-        if bones and "BlendWeights" in vert_buffer.dtype.names:
-            bone_ids = get_bone_ids(bones)
-        else:
-            bone_ids = np.empty(0)
+    attr_names = vb_builder.get_attr_names()
+    fields_by_mat = {
+        mat_index: get_material_vertex_fields(attr_names, materials[mat_index])
+        for mat_index in loop_inds_by_mat.keys()
+    }
+    vert_buffers_by_mat = vb_builder.build_per_material(loop_inds_by_mat, fields_by_mat)
 
+    return GeometryBuildJob(
+        mesh_eval.original.name,
+        vert_buffers_by_mat,
+        get_bone_ids(bones) if bones else None,
+        settings.optimize_vertex_order,
+    )
 
-        geom = Geometry(
-            vertex_data_type=VertexDataType.DEFAULT,
-            vertex_buffer=vert_buffer,
-            index_buffer=ind_buffer,
-            bone_ids=bone_ids,
-            shader_index=mat_index,
-        )
-        geometries.append(geom)
 
-    geometries = sort_geoms_by_shader(geometries)
+def get_material_vertex_fields(attr_names: list[str], material: Material) -> list[str]:
+    """Gets the vertex attributes in ``attr_names`` used by the shader of ``material``. Same fields kept by
+    `remove_unused_uvs`, `remove_unused_colors` and `remove_arr_field` in the other export paths.
+    """
+    used_texcoords = get_used_texcoords(material)
+    used_colors = get_used_colors(material)
+    tangent_required = get_tangent_required(material)
+    normal_required = get_normal_required(material)
+
+    fields = []
+    for name in attr_names:
+        if "TexCoord" in name and name not in used_texcoords:
+            continue
+        if "Colour" in name and name not in used_colors:
+            continue
+        if name == "Tangent" and not tangent_required:
+            continue
+        if name == "Normal" and not normal_required:
+            continue
+        fields.append(name)
 
-    return geometries
+    return fields
 
 
 def sort_geoms_by_shader(geometries: list[Geometry]) -> list[Geometry]:
@@ -485,7 +762,7 @@ def get_bone_ids(bones: list[Bone]) -> list[int]:
 
 
 def fix_vehglass_geometry_for_shattermap_generation(
-    mesh_eval: Mesh,
+    mesh_name: str,
     materials: list[Material],
     geometries: list[Geometry]
 ):
@@ -493,14 +770,15 @@ def fix_vehglass_geometry_for_shattermap_generation(
     for geometry in geometries:
         material = materials[geometry.shader_index]
         if material.shader_properties.name in {"vehicle_vehglass", "vehicle_vehglass_inner"}:
-            blue_channel = geometry.vertex_buffer['Colour0'][:, 2]
-            if np.all(blue_channel == 0):
+            if np.all(geometry.vertex_buffer['Colour0'][:, 2] == 0):
                 any_bad_geometry = True
-                blue_channel[:] = 255
+                # Copy, the buffer may be shared with other geometries through the geometry cache
+                geometry.vertex_buffer = geometry.vertex_buffer.copy()
+                geometry.vertex_buffer['Colour0'][:, 2] = 255
 
     if any_bad_geometry:
         logger.warning(
-            f"Mesh '{mesh_eval.name}' using VEHICLE VEHGLASS shader has color attribute 'Color 1' with no blue channel "
+            f"Mesh '{mesh_name}' using VEHICLE VEHGLASS shader has color attribute 'Color 1' with no blue channel "
             "data (all values are black). The blue channel is used to mark where vehicle glass borders connect to the "
             "frame for shattermap generation. Please paint the blue channel on connected border vertices for correct "
             "shattering behavior. Defaulting to treating the entire mesh as connected (blue = 255)."
@@ -613,6 +891,16 @@ def split_geom_by_vert_count(geom: Geometry) -> list[Geometry]:
             "Failed to split Geometry by vertex count. Vertex buffer and index buffer cannot be None!")
 
     vert_buffers, ind_buffers = split_vert_buffers(geom.vertex_buffer, geom.index_buffer)
+    if len(vert_buffers) == 1:
+        return [geom]
+
+    num_verts = len(geom.vertex_buffer)
+    num_split_verts = sum(len(vert_buffer) for vert_buffer in vert_buffers)
+    logger.info(
+        f"Split Geometry with {num_verts} vertices (shader index {geom.shader_index}) into {len(vert_buffers)} "
+        f"geometries, {num_split_verts - num_verts} vertices duplicated "
+        f"({(num_split_verts - num_verts) / num_verts:.2%})."
+    )
 
     geoms: list[Geometry] = []
 
@@ -633,42 +921,73 @@ def split_vert_buffers(
     ind_buffer: NDArray[np.uint32]
 ) -> tuple[list[NDArray], list[NDArray[np.uint32]]]:
     """Splits vertex and index buffers on chunks that fit in 16-bit indices.
-    Returns tuple of split vertex buffers and tuple of index buffers"""
-    MAX_INDEX = 65535
+    Returns tuple of split vertex buffers and tuple of index buffers.
+
+    Triangles are grouped following a Z-order curve through their centroids, so each chunk covers a compact region of
+    the mesh and few vertices end up shared between chunks. Chunks are filled up to the vertex limit. Triangles keep
+    their relative order within each chunk and vertices are numbered in order of first use.
+    """
+    if len(vert_buffer) <= MAX_VERTS_PER_GEOMETRY:
+        return [vert_buffer], [ind_buffer]
+
+    tris = ind_buffer.reshape((-1, 3))
+    tri_order = _z_order_triangles(vert_buffer["Position"], tris)
+
+    # Greedily fill chunks with triangles along the curve
+    chunk_of_vert = [-1] * len(vert_buffer)
+    chunk_starts = [0]
+    chunk = 0
+    chunk_num_verts = 0
+    for i, (v0, v1, v2) in enumerate(tris[tri_order].tolist()):
+        num_new_verts = (chunk_of_vert[v0] != chunk) + (chunk_of_vert[v1] != chunk and v1 != v0) + (
+            chunk_of_vert[v2] != chunk and v2 != v0 and v2 != v1
+        )
+        if chunk_num_verts + num_new_verts > MAX_VERTS_PER_GEOMETRY:
+            chunk += 1
+            chunk_starts.append(i)
+            chunk_num_verts = 3 - (v1 == v0) - (v2 == v0 or v2 == v1)
+        else:
+            chunk_num_verts += num_new_verts
+
+        chunk_of_vert[v0] = chunk_of_vert[v1] = chunk_of_vert[v2] = chunk
 
-    total_index = 0
-    idx_count = len(ind_buffer)
+    chunk_starts.append(len(tri_order))
 
     split_vert_arrs = []
     split_ind_arrs = []
-    while total_index < idx_count:
-        old_index_to_new_index = {}
-        chunk_vertices_indices = []
-        chunk_indices = []
-        chunk_index = 0
-        while total_index < idx_count and len(chunk_indices) < MAX_INDEX:
-            old_index = ind_buffer[total_index]
-            existing_index = old_index_to_new_index.get(old_index, None)
-            if existing_index is not None:
-                # we already have this index vertex addedm simply remap it to new index
-                chunk_indices.append(existing_index)
-            else:
-                # We got new index unseen before, we have to add both vertex and index
-                chunk_indices.append(chunk_index)
-                chunk_vertices_indices.append(old_index)
-                old_index_to_new_index[old_index] = chunk_index
-                chunk_index += 1
+    for chunk_start, chunk_end in zip(chunk_starts, chunk_starts[1:]):
+        chunk_tris = np.sort(tri_order[chunk_start:chunk_end])
+        chunk_ind_arr = tris[chunk_tris].ravel()
 
-            total_index += 1
+        # Renumber vertices in order of first use
+        chunk_verts, first_use, chunk_ind_arr = np.unique(chunk_ind_arr, return_index=True, return_inverse=True)
+        first_use_order = np.argsort(first_use)
+        remap = np.empty(len(chunk_verts), dtype=np.uint32)
+        remap[first_use_order] = np.arange(len(chunk_verts), dtype=np.uint32)
 
-        chunk_vertices_arr = vert_buffer[chunk_vertices_indices]
-        chunk_indices_arr = np.array(chunk_indices, dtype=np.uint32)
-        split_vert_arrs.append(chunk_vertices_arr)
-        split_ind_arrs.append(chunk_indices_arr)
+        split_vert_arrs.append(vert_buffer[chunk_verts[first_use_order]])
+        split_ind_arrs.append(remap[chunk_ind_arr.reshape(-1)])
 
     return (split_vert_arrs, split_ind_arrs)
 
 
+def _z_order_triangles(positions: NDArray[np.float32], tris: NDArray[np.uint32]) -> NDArray[np.intp]:
+    """Gets the triangle indices sorted along a Z-order (Morton) curve through the triangle centroids."""
+    centroids = positions[tris].mean(axis=1, dtype=np.float64)
+    bb_min = centroids.min(axis=0)
+    bb_size = np.maximum(centroids.max(axis=0) - bb_min, 1e-6)
+
+    # Quantize each axis to 10 bits and interleave them in a 30-bit code
+    cells = ((centroids - bb_min) / bb_size * 1023.0).astype(np.uint64)
+    codes = np.zeros(len(tris), dtype=np.uint64)
+    for bit in range(10):
+        for axis in range(3):
+            codes |= ((cells[:, axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(bit * 3 + axis)
+
+    return np.argsort(codes, kind="stable")
+
+
+@traced()
 def create_shader_group(
     materials: list[Material],
     out_hd_textures: dict[str, EmbeddedTexture] | None = None,
@@ -817,6 +1136,7 @@ def get_embedded_texture_nodes_from_materials(materials: list[Material]) -> list
     return nodes
 
 
+@traced()
 def create_skeleton(armature_obj: bpy.types.Object, apply_transforms: bool = False) -> Skeleton:
     assert armature_obj.type == "ARMATURE" and armature_obj.pose.bones
 
@@ -941,6 +1261,7 @@ def get_bone_rotation_limit(pose_bone: PoseBone) -> Optional[SkelBoneRotationLim
     ) if constraint is not None else None
 
 
+@traced()
 def create_embedded_bounds_asset(drawable_obj: Object) -> Optional[AssetBound]:
     bound_objs = [
         child for child in drawable_obj.children
@@ -45,12 +45,14 @@ from ..tools.blenderhelper import add_child_of_bone_constraint, create_empty_obj
 from ..shared.shader_nodes import SzShaderNodeParameter
 from .model_data import ModelData, get_model_data, get_model_data_split_by_group
 from .mesh_builder import MeshBuilder
+from .deferred_lods import store_deferred_lod
 from .cable_mesh_builder import CableMeshBuilder
 from .cable import CABLE_SHADER_NAME
 from ..lods import LODLevels, LODLevel
 from .lights import create_light_objs, serialize_lights_to_asset
 from .properties import DrawableModelProperties
 from ..iecontext import import_context, ImportTexturesMode
+from ..profiling import span, traced
 from .. import logger
 
 
@@ -61,6 +63,7 @@ def find_ydr_external_dependencies(asset: AssetDrawable, name: str) -> AssetWith
     return AssetWithDependencies(name, asset, {"hd_txd": hd_txd} if hd_txd else {})
 
 
+@traced()
 def import_ydr(asset: AssetWithDependencies, name: str) -> Object:
     drw = asset.main_asset
     hd_txd = asset.dependencies.get("hd_txd", None)
@@ -72,6 +75,7 @@ def import_ydr(asset: AssetWithDependencies, name: str) -> Object:
     return create_drawable(drw, name=name, hd_txd=hd_txd, hd_txd_suffix="+hidr")
 
 
+@traced()
 def create_drawable(
     drawable: AssetDrawable,
     hi_drawable: Optional[AssetDrawable] = None,
@@ -128,6 +132,7 @@ def create_drawable(
     return drawable_obj
 
 
+@traced()
 def create_drawable_models(
     drawable: AssetDrawable,
     hi_drawable: Optional[AssetDrawable],
@@ -135,12 +140,14 @@ def create_drawable_models(
     hi_materials: list[Material],
     model_names: Optional[str] = None
 ) -> list[Object]:
-    model_datas = get_model_data(drawable, hi_drawable)
+    with span("model_data_extraction"):
+        model_datas = get_model_data(drawable, hi_drawable)
     model_names = model_names or SOLLUMZ_UI_NAMES[SollumType.DRAWABLE_MODEL]
 
     return [create_model_obj(model_data, materials, hi_materials, name=model_names) for model_data in model_datas]
 
 
+@traced()
 def create_rigged_drawable_models(
     drawable: AssetDrawable,
     hi_drawable: Optional[AssetDrawable],
@@ -154,8 +161,9 @@ def create_rigged_drawable_models(
         split_by_group = import_context().settings.split_by_group
     else:
         split_by_group = False
-    model_datas = get_model_data_split_by_group(
-        drawable, hi_drawable) if split_by_group else get_model_data(drawable, hi_drawable)
+    with span("model_data_extraction"):
+        model_datas = get_model_data_split_by_group(
+            drawable, hi_drawable) if split_by_group else get_model_data(drawable, hi_drawable)
 
     set_skinned_model_properties(drawable_obj, drawable)
 
@@ -185,16 +193,38 @@ def create_rigged_model_obj(model_data: ModelData, materials: list[Material], hi
     return model_obj
 
 
+@traced()
 def create_lod_meshes(model_data: ModelData, model_obj: Object, materials: list[Material], hi_materials: list[Material], bones: Optional[list[Bone]] = None):
     lods: LODLevels = model_obj.sz_lods
     original_mesh = model_obj.data
 
+    is_cable = all(m.shader_properties.filename == CABLE_SHADER_NAME for m in materials)
+    if import_context().settings.defer_lod_meshes and not is_cable:
+        # Only the highest LOD level is built now, the rest are built when switching to them
+        built_lod_level = next(
+            (lod_level for lod_level in LODLevel if lod_level in model_data.mesh_data_lods), None
+        )
+    else:
+        built_lod_level = None
+
     for lod_level, mesh_data in model_data.mesh_data_lods.items():
         mesh_name = f"{model_obj.name}_{SOLLUMZ_UI_NAMES[lod_level].lower().replace(' ', '_')}"
         lod_materials = hi_materials if lod_level == LODLevel.VERYHIGH else materials
 
+        if built_lod_level is not None and lod_level != built_lod_level and len(mesh_data.ind_arr) > 0:
+            store_deferred_lod(
+                model_obj,
+                lod_level,
+                mesh_data,
+                lod_materials,
+                mesh_name,
+                model_data.lods[lod_level].render_bucket_mask,
+                validate_mesh=import_context().settings.validate_meshes,
+            )
+            continue
+
         try:
-            if all(m.shader_properties.filename == CABLE_SHADER_NAME for m in materials):
+            if is_cable:
                 mesh_builder = CableMeshBuilder(
                     mesh_name,
                     mesh_data.vert_arr,
@@ -211,7 +241,10 @@ def create_lod_meshes(model_data: ModelData, model_obj: Object, materials: list[
                     lod_materials
                 )
 
-            lod_mesh = mesh_builder.build()
+            with span("mesh_building"):
+                lod_mesh = mesh_builder.build()
+                if import_context().settings.validate_meshes:
+                    lod_mesh.validate()
         except:
             logger.error(
                 f"Error occurred during creation of mesh '{mesh_name}'! Is the mesh data valid?\n{traceback.format_exc()}")
@@ -298,6 +331,7 @@ def shader_group_to_materials(
     return shader_group_to_materials_with_hi(shader_group, None, hd_txd, hd_txd_suffix)[0]
 
 
+@traced("material_creation")
 def shader_group_to_materials_with_hi(
     shader_group: ShaderGroup,
     hi_shader_group: Optional[ShaderGroup],
@@ -460,6 +494,7 @@ def is_non_color_texture(shader_filename: str, param_name: str) -> bool:
     )
 
 
+@traced()
 def create_drawable_skel(armature_obj: Object, skeleton: Skeleton):
     bpy.context.view_layer.objects.active = armature_obj
     bones = skeleton.bones
@@ -555,6 +590,7 @@ def add_bone_constraint_translation_limit(pose_bone: PoseBone, limit: SkelBoneTr
     return constraint
 
 
+@traced()
 def create_embedded_collisions(bounds: AssetBound, drawable_obj: bpy.types.Object):
     if bounds.bound_type == BoundType.COMPOSITE:
         bound_obj = create_bound_composite(bounds, name=f"{drawable_obj.name}.col")
@@ -13,6 +13,7 @@ from ..sollumz_helper import find_sollumz_parent
 from ..sollumz_properties import BOUND_POLYGON_TYPES, BOUND_TYPES, MaterialType, SollumType, VehicleLightID
 from ..tools.blenderhelper import add_child_of_bone_constraint, create_blender_object, create_empty_object, get_child_of_bone
 from ..ybn.collision_materials import collisionmats
+from ..ybn.poly_primitives import read_poly_primitives, get_poly_primitives_volumes
 from ..dependencies import IS_SZIO_NATIVE_AVAILABLE
 
 
@@ -409,6 +410,10 @@ class SOLLUMZ_OT_CALCULATE_MASS(bpy.types.Operator):
             if child.sollum_type not in BOUND_POLYGON_TYPES or child.type != "MESH":
                 continue
 
+            if child.sollum_type == SollumType.BOUND_POLY_PRIMITIVES:
+                mass += self.calculate_poly_primitives_mass(child)
+                continue
+
             mat = self.get_collision_mat(child)
 
             if mat is None:
@@ -426,6 +431,23 @@ class SOLLUMZ_OT_CALCULATE_MASS(bpy.types.Operator):
 
         return volume * density
 
+    def calculate_poly_primitives_mass(self, obj: bpy.types.Object) -> float:
+        # The mesh only has a point per primitive, calculate the volume of the primitives instead of the mesh
+        mesh = obj.data
+        prims = read_poly_primitives(mesh)
+        if len(prims) == 0 or len(mesh.materials) == 0:
+            return 0.0
+
+        densities = np.array([
+            collisionmats[mat.collision_properties.collision_index].density
+            if mat is not None and mat.sollum_type == MaterialType.COLLISION else 0.0
+            for mat in mesh.materials
+        ])
+        material_inds = np.clip(prims.material_inds, 0, len(mesh.materials) - 1)
+        volumes = get_poly_primitives_volumes(prims) * abs(obj.matrix_world.to_3x3().determinant())
+
+        return float(np.dot(volumes, densities[material_inds]))
+
     def get_collision_mat(self, obj: bpy.types.Object):
         for mat in obj.data.materials:
             if mat.sollum_type == MaterialType.COLLISION:
@@ -8,11 +8,12 @@ from bpy.types import (
 )
 from bpy_extras.mesh_utils import mesh_linked_triangles
 import numpy as np
+from numpy.typing import NDArray
 from sys import float_info
 from typing import NamedTuple, Optional
 from collections import defaultdict
 from itertools import combinations, zip_longest
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
 from mathutils import Vector, Matrix
 
 from szio.gta5 import (
@@ -59,6 +60,7 @@ from ..ydr.lights import export_lights
 from ..ydr.cloth_env import cloth_env_export, cloth_env_find_mesh_objects
 
 from ..iecontext import export_context, ExportBundle
+from ..profiling import traced
 from .. import logger
 
 from .properties import (
@@ -68,6 +70,23 @@ from .properties import (
     GroupProperties,
     get_glass_type_index,
 )
+
+
+@dataclass(slots=True)
+class FragmentBoneObjects:
+    """Objects in a fragment hierarchy attached to a bone, in hierarchy order."""
+    collisions: list[Object] = field(default_factory=list)
+    """Bound objects, including those in the damaged composite."""
+    meshes: list[Object] = field(default_factory=list)
+    """Drawable model objects, including those in the damaged drawable."""
+    cloth_meshes: list[Object] = field(default_factory=list)
+    """Drawable model objects that use a cloth material."""
+    lights: list[Object] = field(default_factory=list)
+
+
+_NO_BONE_OBJECTS = FragmentBoneObjects()
+
+
 class FragmentObjects(NamedTuple):
     """Contains the important Blender objects in a fragment hierarchy."""
     fragment: Object
@@ -75,11 +94,24 @@ class FragmentObjects(NamedTuple):
     composite: Optional[Object]
     damaged_drawable: Optional[Object]
     damaged_composite: Optional[Object]
+    objects_by_bone: dict[str, FragmentBoneObjects]
+    """Objects attached to each bone, by bone name. Bones without attached objects are not included."""
+    bone_by_object: dict[Object, Optional[Bone]]
+    """Bone each bound, drawable model and light object is attached to."""
 
     @property
     def has_collisions(self) -> bool:
         return self.composite is not None
 
+    def get_bone_objects(self, bone_name: str) -> FragmentBoneObjects:
+        """Gets the objects attached to a bone. The returned object must not be modified."""
+        return self.objects_by_bone.get(bone_name, _NO_BONE_OBJECTS)
+
+    def get_object_bone(self, obj: Object) -> Optional[Bone]:
+        """Gets the bone ``obj`` is attached to. ``None`` if it is not attached to a bone or is not a bound, drawable
+        model or light object."""
+        return self.bone_by_object.get(obj, None)
+
 
 def locate_fragment_objects(frag: Object) -> Optional[FragmentObjects]:
     """Explore the fragment hierarchy looking for the important objects (drawables, bound composites). Returns ``None``
@@ -160,9 +192,51 @@ def locate_fragment_objects(frag: Object) -> Optional[FragmentObjects]:
     else:
         damaged_composite = None
 
-    return FragmentObjects(frag, drawable, composite, damaged_drawable, damaged_composite)
+    objects_by_bone, bone_by_object = build_fragment_bone_objects_index(frag)
+
+    return FragmentObjects(
+        frag, drawable, composite, damaged_drawable, damaged_composite, objects_by_bone, bone_by_object
+    )
+
 
+@traced()
+def build_fragment_bone_objects_index(
+    frag: Object
+) -> tuple[dict[str, FragmentBoneObjects], dict[Object, Optional[Bone]]]:
+    """Finds the objects attached to each bone of the fragment, resolving the bone of each object once.
+    Returns tuple (objects_by_bone, bone_by_object).
+    """
+    objects_by_bone: dict[str, FragmentBoneObjects] = defaultdict(FragmentBoneObjects)
+    bone_by_obj: dict[Object, Optional[Bone]] = {}
+    for obj in frag.children_recursive:
+        is_collision = obj.sollum_type in BOUND_TYPES
+        is_mesh = obj.sollum_type == SollumType.DRAWABLE_MODEL
+        is_light = obj.type == "LIGHT"
+        if not is_collision and not is_mesh and not is_light:
+            continue
+
+        bone = get_child_of_bone(obj)
+        bone_by_obj[obj] = bone
+        if bone is None:
+            continue
 
+        bone_objs = objects_by_bone[bone.name]
+        if is_collision:
+            bone_objs.collisions.append(obj)
+        elif is_mesh:
+            bone_objs.meshes.append(obj)
+        else:
+            bone_objs.lights.append(obj)
+
+    for obj in cloth_env_find_mesh_objects(frag, silent=True):
+        bone = bone_by_obj[obj]
+        if bone is not None:
+            objects_by_bone[bone.name].cloth_meshes.append(obj)
+
+    return dict(objects_by_bone), bone_by_obj
+
+
+@traced()
 def export_yft(obj: Object) -> ExportBundle:
     embedded_tex = []
     hd_tex: dict[str, EmbeddedTexture] = {}
@@ -192,6 +266,7 @@ def create_fragment_asset(
     )
 
 
+@traced()
 def create_fragment_asset_core(
     frag_objs: FragmentObjects,
     apply_transforms: bool = False,
@@ -311,12 +386,13 @@ def has_hi_lods(frag_obj: Object) -> bool:
             continue
 
         very_high_lod = child.sz_lods.get_lod(LODLevel.VERYHIGH)
-        if very_high_lod.mesh is not None:
+        if very_high_lod.has_geometry:
             return True
 
     return False
 
 
+@traced()
 def create_frag_drawable(
     frag_objs: FragmentObjects,
     materials: list[Material],
@@ -375,6 +451,7 @@ def create_bone_transforms_set(drawable: AssetFragDrawable) -> MatrixSet:
     return MatrixSet(is_skinned, bones_transforms)
 
 
+@traced()
 def create_frag_physics(
     frag_objs: FragmentObjects,
     main_drawable: AssetFragDrawable,
@@ -392,6 +469,7 @@ def create_frag_physics(
     return PhysLodGroup(lod), PhysLodGroup(hi_lod) if hi_lod else None, frag_flags, glass_windows
 
 
+@traced()
 def create_frag_phys_lod(
     frag_objs: FragmentObjects,
     main_drawable: AssetFragDrawable,
@@ -504,6 +582,7 @@ def create_frag_phys_collisions(
     return composite, damaged_composite
 
 
+@traced()
 def create_frag_phys_groups(
     frag_objs: FragmentObjects,
     materials: list[Material]
@@ -517,7 +596,7 @@ def create_frag_phys_groups(
         if not bone.sollumz_use_physics:
             continue
 
-        if not does_bone_have_collision(bone.name, frag_obj) and not does_bone_have_cloth(bone.name, frag_obj):
+        if not does_bone_have_collision(bone.name, frag_objs) and not does_bone_have_cloth(bone.name, frag_objs):
             logger.warning(
                 f"Bone '{bone.name}' has physics enabled, but no associated collision! A collision must be linked to the bone for physics to work.")
             continue
@@ -527,7 +606,7 @@ def create_frag_phys_groups(
         groups_by_bone[bone_index].append(group)
 
         if bone.group_properties.flags[GroupFlagBit.USE_GLASS_WINDOW]:
-            w = create_frag_glass_window(frag_obj, bone, materials)
+            w = create_frag_glass_window(frag_objs, bone, materials)
             if w is not None:
                 group.glass_window_index = len(glass_windows)
                 glass_windows.append(w)
@@ -606,6 +685,7 @@ def init_frag_phys_group(name: str, group_props: GroupProperties) -> PhysGroup:
     )
 
 
+@traced()
 def create_frag_phys_children(
     frag_objs: FragmentObjects,
     main_drawable: AssetFragDrawable,
@@ -635,6 +715,9 @@ def create_frag_phys_children(
         find_frag_phys_children_collisions(frag_objs, damaged=True) if frag_objs.damaged_composite else {}
     )
 
+    bounds_inertia_volume = get_frag_phys_bounds_inertia_volume(bound_composite)
+    damaged_bounds_inertia_volume = get_frag_phys_bounds_inertia_volume(damaged_bound_composite)
+
     children = []
     hi_children = [] if main_hi_drawable else None
     has_child_meshes = False
@@ -682,10 +765,10 @@ def create_frag_phys_children(
             pristine_mass = col_obj.child_properties.mass if col_obj else 0.0
             damaged_mass = damaged_col_obj.child_properties.mass if damaged_col_obj else pristine_mass
             inertia = \
-                calculate_frag_phys_child_inertia(bound_composite, pristine_mass, bound_index) \
+                calculate_frag_phys_child_inertia(bounds_inertia_volume, pristine_mass, bound_index) \
                 if col_obj else Vector((0.0, 0.0, 0.0, 0.0))
             damaged_inertia = \
-                calculate_frag_phys_child_inertia(damaged_bound_composite, damaged_mass, damaged_bound_index) \
+                calculate_frag_phys_child_inertia(damaged_bounds_inertia_volume, damaged_mass, damaged_bound_index) \
                 if damaged_col_obj else Vector((0.0, 0.0, 0.0, 0.0))
             child = PhysChild(
                 bone_tag=bones[bone_index].tag,
@@ -723,15 +806,26 @@ def create_frag_phys_children(
     return children, hi_children, has_child_meshes
 
 
-def calculate_frag_phys_child_inertia(bound_composite: AssetBoundComposite, mass: float, bound_index: int) -> Vector:
-    bounds = bound_composite.children
-    if not bounds or bound_index >= len(bounds):
+def get_frag_phys_bounds_inertia_volume(bound_composite: AssetBoundComposite | None) -> NDArray[np.float64]:
+    """Gets the inertia and volume of each child of ``bound_composite`` in a (N, 4) array, read once for all the
+    physics children.
+    """
+    bounds = bound_composite.children if bound_composite is not None else None
+    if not bounds:
+        return np.zeros((0, 4), dtype=np.float64)
+
+    return np.array([(*bound.inertia, bound.volume) for bound in bounds], dtype=np.float64)
+
+
+def calculate_frag_phys_child_inertia(
+    bounds_inertia_volume: NDArray[np.float64], mass: float, bound_index: int
+) -> Vector:
+    if bound_index >= len(bounds_inertia_volume):
         return Vector((0.0, 0.0, 0.0, 0.0))
 
-    bound = bounds[bound_index]
-    inertia = bound.inertia * mass
-    # volume*mass in the original files is probably not important and just a side-effect of SIMD operations, still do it just in case
-    return Vector((inertia.x, inertia.y, inertia.z, bound.volume * mass))
+    # volume*mass in the original files is probably not important and just a side-effect of SIMD operations, still do
+    # it just in case
+    return Vector(bounds_inertia_volume[bound_index] * mass)
 
 
 def calculate_frag_phys_groups_total_masses(groups: list[PhysGroup], children: list[PhysChild]):
@@ -851,6 +945,7 @@ def create_child_mat_arrays(
             first.damaged_drawable.frag_extra_bound_matrices = damaged_extra_matrices
 
 
+@traced()
 def create_frag_phys_archetypes(
     frag_objs: FragmentObjects,
     phys_children: list[PhysChild],
@@ -920,10 +1015,13 @@ def calculate_frag_phys_archetype_mass_inertia(
     from ..shared.geometry import calculate_composite_inertia
     # Filter out children with null bounds
     phys_children, bounds = zip(*((c, b) for c, b in zip(phys_children, bounds) if b is not None))
-    masses = [child.damaged_mass if damaged else child.pristine_mass for child in phys_children]
-    inertias = [(child.damaged_inertia if damaged else child.inertia).xyz for child in phys_children]
-    cgs = [bound.composite_transform.transposed() @ bound.cg for bound in bounds]
-    mass = sum(masses)
+    masses = np.array([child.damaged_mass if damaged else child.pristine_mass for child in phys_children])
+    inertias = np.array([(child.damaged_inertia if damaged else child.inertia).xyz for child in phys_children])
+    # Transform the CGs of all bounds to the composite space at once
+    transforms = np.array([bound.composite_transform.transposed() for bound in bounds], dtype=np.float64)
+    bound_cgs = np.array([bound.cg for bound in bounds], dtype=np.float64)
+    cgs = np.einsum("nij,nj->ni", transforms[:, :3, :3], bound_cgs) + transforms[:, :3, 3]
+    mass = float(masses.sum())
     inertia = calculate_composite_inertia(root_cg_offset, cgs, masses, inertias)
     return mass, inertia
 
@@ -944,28 +1042,12 @@ def calculate_frag_phys_inertia_limits(phys_children: list[PhysChild]) -> tuple[
     return smallest_inertia, largest_inertia
 
 
-def does_bone_have_collision(bone_name: str, frag_obj: Object):
-    col_objs = [obj for obj in frag_obj.children_recursive if obj.sollum_type in BOUND_TYPES]
+def does_bone_have_collision(bone_name: str, frag_objs: FragmentObjects) -> bool:
+    return bool(frag_objs.get_bone_objects(bone_name).collisions)
 
-    for obj in col_objs:
-        bone = get_child_of_bone(obj)
 
-        if bone is not None and bone.name == bone_name:
-            return True
-
-    return False
-
-
-def does_bone_have_cloth(bone_name: str, frag_obj: bpy.types.Object) -> bool:
-    cloth_objs = cloth_env_find_mesh_objects(frag_obj, silent=True)
-
-    for obj in cloth_objs:
-        bone = get_child_of_bone(obj)
-
-        if bone is not None and bone.name == bone_name:
-            return True
-
-    return False
+def does_bone_have_cloth(bone_name: str, frag_objs: FragmentObjects) -> bool:
+    return bool(frag_objs.get_bone_objects(bone_name).cloth_meshes)
 
 
 def calculate_frag_phys_link_attachments(
@@ -1069,7 +1151,7 @@ def find_frag_phys_children_collisions(frag_objs: FragmentObjects, damaged: bool
         if (bound_obj.type == "MESH" and not has_collision_materials(bound_obj)) or (bound_obj.type == "EMPTY" and not has_bvh_collision_materials(bound_obj)):
             continue
 
-        bone = get_child_of_bone(bound_obj)
+        bone = frag_objs.get_object_bone(bound_obj)
 
         if bone is None or not bone.sollumz_use_physics:
             continue
@@ -1087,7 +1169,7 @@ def find_frag_phys_children_meshes(frag_objs: FragmentObjects) -> dict[str, list
         if model_obj.sollum_type != SollumType.DRAWABLE_MODEL or not model_obj.sollumz_is_physics_child_mesh:
             continue
 
-        bone = get_child_of_bone(model_obj)
+        bone = frag_objs.get_object_bone(model_obj)
 
         if bone is None or not bone.sollumz_use_physics:
             continue
@@ -1122,8 +1204,7 @@ def create_frag_phys_child_drawable(main_drawable: AssetFragDrawable | None, mat
 
         lods = model_obj.sz_lods
         for lod_level in lod_levels:
-            lod_mesh = lods.get_lod(lod_level).mesh
-            if lod_mesh is None:
+            if not lods.get_lod(lod_level).has_geometry:
                 continue
 
             model: Model = create_model(model_obj, lod_level, materials, transforms_to_apply=transforms_to_apply)
@@ -1169,6 +1250,7 @@ def create_frag_vehicle_window_no_shattermap(component_id: int, geometry_index:
     )
 
 
+@traced()
 def create_frag_vehicle_windows(frag: AssetFragment, frag_objs: FragmentObjects) -> list[FragVehicleWindow]:
     """Exports all the vehicle windows found in the fragment."""
     main_drawable = frag.drawable
@@ -1352,11 +1434,11 @@ def find_frag_geometry_index_for_vehicle_window(drawable: AssetFragDrawable, bon
 
 
 def create_frag_glass_window(
-    frag_obj: Object,
+    frag_objs: FragmentObjects,
     glass_window_bone: Bone,
     materials: list[Material],
 ) -> FragGlassWindow | None:
-    mesh_obj, col_obj = find_frag_glass_window_mesh_and_col(frag_obj, glass_window_bone)
+    mesh_obj, col_obj = find_frag_glass_window_mesh_and_col(frag_objs, glass_window_bone)
     if mesh_obj is None or col_obj is None:
         logger.warning(f"Glass window '{glass_window_bone.name}' is missing the mesh and/or collision. Skipping...")
         return None
@@ -1460,7 +1542,7 @@ def create_frag_glass_window(
 
 
 def find_frag_glass_window_mesh_and_col(
-    frag_obj: Object,
+    frag_objs: FragmentObjects,
     glass_window_bone: Bone
 ) -> tuple[Object | None, Object | None]:
     """Finds the mesh and collision object for the glass window bone.
@@ -1468,11 +1550,11 @@ def find_frag_glass_window_mesh_and_col(
     """
     mesh_obj = None
     col_obj = None
-    for obj in frag_obj.children_recursive:
+    for obj in frag_objs.fragment.children_recursive:
         if obj.sollum_type != SollumType.DRAWABLE_MODEL and obj.sollum_type not in BOUND_TYPES:
             continue
 
-        parent_bone = get_child_of_bone(obj)
+        parent_bone = frag_objs.get_object_bone(obj)
         if parent_bone != glass_window_bone:
             continue
 
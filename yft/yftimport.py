@@ -33,6 +33,7 @@ from .properties import LODProperties, GroupFlagBit, GlassTypes
 from ..tools.blenderhelper import get_child_of_bone
 from ..ytd.ytdimport import try_load_hd_txd
 from ..iecontext import import_context
+from ..profiling import traced
 from .. import logger
 
 
@@ -63,6 +64,7 @@ def find_yft_external_dependencies(asset: AssetFragment, name: str) -> AssetWith
     return AssetWithDependencies(name, non_hi_frag, deps)
 
 
+@traced()
 def import_yft(asset: AssetWithDependencies, name: str) -> Object | None:
     non_hi_frag = asset.main_asset
     hi_frag = asset.dependencies.get("hi", None)
@@ -88,42 +90,33 @@ def make_frag_base_name(name: str) -> str:
 
 def try_load_non_hi_frag(name: str, prefers_xml: bool) -> AssetFragment | None:
     name = make_frag_base_name(name)
-    d = import_context().directory
-    non_hi_frag = None
 
     possible_exts = (".yft", ".yft.xml")
     if prefers_xml:
         possible_exts = possible_exts[::-1]
 
-    for ext in possible_exts:
-        non_hi_path = d / f"{name}{ext}"
-        if non_hi_path.is_file():
-            non_hi_frag = try_load_asset(non_hi_path)
-            if non_hi_frag:
-                break
+    for non_hi_path in import_context().find_files(name, possible_exts):
+        if non_hi_frag := try_load_asset(non_hi_path):
+            return non_hi_frag
 
-    return non_hi_frag
+    return None
 
 
 def try_load_hi_frag(name: str, prefers_xml: bool) -> AssetFragment | None:
     name = make_frag_base_name(name)
-    d = import_context().directory
-    hi_frag = None
 
     possible_exts = (".yft", ".yft.xml")
     if prefers_xml:
         possible_exts = possible_exts[::-1]
 
-    for ext in possible_exts:
-        hi_path = d / f"{name}_hi{ext}"
-        if hi_path.is_file():
-            hi_frag = try_load_asset(hi_path)
-            if hi_frag:
-                break
+    for hi_path in import_context().find_files(f"{name}_hi", possible_exts):
+        if hi_frag := try_load_asset(hi_path):
+            return hi_frag
 
-    return hi_frag
+    return None
 
 
+@traced()
 def create_fragment(
     frag: AssetFragment,
     hi_frag: Optional[AssetFragment],
@@ -174,6 +167,7 @@ def create_frag_armature(frag: AssetFragment, name: Optional[str] = None) -> Obj
     return frag_obj
 
 
+@traced()
 def create_frag_drawable(
     frag: AssetFragment,
     hi_frag: Optional[AssetFragment],
@@ -218,6 +212,7 @@ def create_frag_drawable(
     return drawable_obj
 
 
+@traced()
 def create_frag_collisions(frag: AssetFragment, frag_obj: Object, damaged: bool = False) -> Optional[Object]:
     lod1 = frag.physics.lod1
     bounds = None
@@ -281,6 +276,7 @@ def find_bound_bone(bound_index: int, frag: AssetFragment) -> SkelBone | None:
     return None
 
 
+@traced()
 def create_phys_lod(frag: AssetFragment, frag_obj: Object):
     """Create the Fragment.Physics.LOD1 data-block. (Currently LOD1 is only supported)"""
     lod = frag.physics.lod1
@@ -438,6 +434,7 @@ def create_phys_child_models(
     return child_objs
 
 
+@traced()
 def create_frag_env_cloth(frag: AssetFragment, frag_obj: Object, drawable_obj: Object, materials: list[Material]) -> Object | None:
     cloths = frag.cloths
     if not cloths:
@@ -574,6 +571,7 @@ def create_frag_env_cloth(frag: AssetFragment, frag_obj: Object, drawable_obj: O
     return model_obj
 
 
+@traced()
 def create_frag_vehicle_windows(frag: AssetFragment, frag_obj: Object):
     vehicle_windows = frag.vehicle_windows
     if not vehicle_windows:
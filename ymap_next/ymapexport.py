@@ -1,5 +1,6 @@
 import math
 from collections import Counter, defaultdict
+from collections.abc import Iterator
 
 import bpy
 import numpy as np
@@ -40,6 +41,7 @@ from szio.gta5 import (
 )
 from szio.gta5.maps import MAP_DISTANT_LOD_LIGHT_DTYPE, MAP_GRASS_INSTANCES_UNPACKED_DTYPE, MAP_LOD_LIGHT_DTYPE
 
+from ..profiling import traced
 from .. import logger
 from ..iecontext import ExportBundle, export_context
 from ..shared.game_assets.asset_info import AssetInfoCache
@@ -63,11 +65,20 @@ from .properties.map import (
 )
 
 
+@traced()
 def export_ymap(map_group: MapGroup) -> list[ExportBundle]:
+    return list(export_ymap_iter(map_group))
+
+
+@traced()
+def export_ymap_iter(map_group: MapGroup) -> Iterator[ExportBundle]:
+    """Same as `export_ymap` but builds the bundles lazily, so each one can be saved and released before building the
+    next one."""
     _ensure_auto_partitions_generated(map_group)
-    return create_map_data_assets(map_group)
+    yield from iter_map_data_assets(map_group)
 
 
+@traced()
 def _ensure_auto_partitions_generated(map_group: MapGroup):
     """Generate partitions for any AUTO map datas that have items assigned directly to them.
 
@@ -126,7 +137,12 @@ def _entity_log_display_name(entity: MapEntity) -> str:
     return f"{entity.archetype_name} at ({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})"
 
 
+@traced()
 def create_map_data_assets(map_group: MapGroup) -> list[ExportBundle]:
+    return list(iter_map_data_assets(map_group))
+
+
+def iter_map_data_assets(map_group: MapGroup) -> Iterator[ExportBundle]:
     # Map data UUID -> parent map data UUID
     map_parent_uuids = {m.uuid: m.parent_uuid for m in map_group.maps}
     # Pre-compute which maps are parents (have children pointing to them)
@@ -264,7 +280,6 @@ def create_map_data_assets(map_group: MapGroup) -> list[ExportBundle]:
     depsgraph = bpy.context.evaluated_depsgraph_get()
     asset_info_cache = AssetInfoCache()
 
-    bundles = []
     for map_data in map_group.maps:
         map_data: MapData
         map_data_asset = AssetMapData()
@@ -390,10 +405,7 @@ def create_map_data_assets(map_group: MapGroup) -> list[ExportBundle]:
             has_block_description=map_data.desc_enabled,
         )
 
-        bundle = export_context().make_bundle(map_data_asset, name_override=map_data.name)
-        bundles.append(bundle)
-
-    return bundles
+        yield export_context().make_bundle(map_data_asset, name_override=map_data.name)
 
 
 def calc_map_entity_transforms_from_object(entity: MapEntity) -> tuple[Vector, Quaternion, float, float]:
@@ -422,6 +434,7 @@ def calc_map_entity_transforms(entity: MapEntity) -> tuple[Vector, Quaternion, f
     )
 
 
+@traced()
 def _export_entity(
     e: MapEntity,
     entity_index_in_map: dict[bytes, int],
@@ -37,6 +37,7 @@ from szio.gta5 import (
     MapTimeCycleModifier as IOMapTimeCycleModifier,
 )
 
+from ..profiling import traced
 from .. import logger
 from ..sollumz_properties import SollumType
 from ..tools.blenderhelper import create_blender_object
@@ -362,6 +363,7 @@ class LodHierarchy:
         print("Create DB + close", t3 - t1)
 
 
+@traced()
 def import_ymap(asset: AssetMapData, name: str):
     # Import is delayed because we need to know all the .ymaps we are importing first to build the LOD hierarchy
     # TODO: we can replace _import_maps with the LOD hierarchy directly
@@ -391,6 +393,7 @@ def build_lod_hierarchy(maps: Sequence[tuple[AssetMapData, str]]) -> LodHierarch
     return lod_hierarchy
 
 
+@traced()
 def import_ymap_group(maps: Sequence[tuple[AssetMapData, str]]):
     lod_hierarchy = build_lod_hierarchy(maps)
     for root_map_key in lod_hierarchy.root_maps:
@@ -920,6 +923,7 @@ def _create_map_lod_lights(
     return ll
 
 
+@traced()
 def _organize_map_in_collections(map_group: MapGroup):
     """Places all map related objects in collections."""
     from ..ytyp.properties.extensions import ExtensionType
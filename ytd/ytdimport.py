@@ -1,3 +1,7 @@
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
@@ -10,8 +14,12 @@ from szio.gta5 import (
 )
 
 from ..iecontext import ImportTexturesMode, import_context
+from ..profiling import span
 from .properties import TextureDictionary
 
+# Extracting textures is mostly waiting on file writes, a few threads are enough to keep the disk busy
+MAX_TEXTURE_EXTRACTION_WORKERS = 4
+
 
 def find_ytd_external_dependencies(asset: AssetTextureDictionary, name: str) -> AssetWithDependencies:
     prefers_xml = import_context().asset_target.format == AssetFormat.CWXML
@@ -52,21 +60,15 @@ def try_load_hi_txd(name: str, prefers_xml: bool) -> AssetTextureDictionary | No
 
 
 def try_load_hd_txd(name: str, prefers_xml: bool, suffix: str) -> AssetTextureDictionary | None:
-    d = import_context().directory
-    hd_txd = None
-
     possible_exts = (".ytd", ".ytd.xml")
     if prefers_xml:
         possible_exts = possible_exts[::-1]
 
-    for ext in possible_exts:
-        hd_path = d / f"{name}{suffix}{ext}"
-        if hd_path.is_file():
-            hd_txd = try_load_asset(hd_path)
-            if hd_txd:
-                break
+    for hd_path in import_context().find_files(f"{name}{suffix}", possible_exts):
+        if hd_txd := try_load_asset(hd_path):
+            return hd_txd
 
-    return hd_txd
+    return None
 
 
 def import_ytd(asset: AssetWithDependencies, name: str) -> TextureDictionary:
@@ -161,7 +163,7 @@ def lookup_texture_file(
             #       a single texture with this the name in the directory tree.
             texture_path = next(directory.rglob(texture_filename), None)
         else:
-            texture_path = directory.joinpath(texture_filename)
+            texture_path = _find_file_case_insensitive(directory, texture_filename)
 
         return texture_path if texture_path is not None and texture_path.is_file() else None
 
@@ -185,8 +187,6 @@ def lookup_texture_file(
 
 
 def extract_embedded_textures(embedded_textures: dict[str, EmbeddedTexture], dir_suffix: str = ""):
-    import shutil
-
     if not embedded_textures:
         return
 
@@ -205,7 +205,7 @@ def extract_embedded_textures(embedded_textures: dict[str, EmbeddedTexture], dir
             textures = [
                 DataSource.create(p)
                 for t in embedded_textures.values()
-                if (p := textures_import_dir / f"{t.name}.dds").is_file()
+                if (p := _find_file_case_insensitive(textures_import_dir, f"{t.name}.dds")) is not None
             ]
 
     if not textures:
@@ -216,11 +216,68 @@ def extract_embedded_textures(embedded_textures: dict[str, EmbeddedTexture], dir
         return
 
     textures_extract_dir.mkdir(parents=True, exist_ok=True)
+
+    # Don't overwrite existing files. Texture names are case-insensitive, so are the file names on Windows. Also
+    # handles the same texture embedded in multiple drawables of a drawable dictionary, the first drawable extracts it
+    # and the rest find it already on disk.
+    existing_files = _list_file_names_lower(textures_extract_dir)
+    pending = {}
     for tex_data in textures:
-        tex_file = textures_extract_dir / tex_data.name
-        if tex_file.exists():
-            # Don't overwrite existing files
-            continue
+        name_lower = tex_data.name.lower()
+        if name_lower not in existing_files and name_lower not in pending:
+            pending[name_lower] = tex_data
+
+    if not pending:
+        return
+
+    with span("texture_extraction", directory=textures_extract_dir.name, count=len(pending)):
+        if len(pending) == 1:
+            _write_texture_file(next(iter(pending.values())), textures_extract_dir)
+            return
+
+        num_workers = min(len(pending), MAX_TEXTURE_EXTRACTION_WORKERS)
+        with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="sz_texture") as executor:
+            futures = [
+                executor.submit(_write_texture_file, tex_data, textures_extract_dir)
+                for tex_data in pending.values()
+            ]
+            for future in futures:
+                future.result()
+
+
+def _find_file_case_insensitive(directory: Path, filename: str) -> Path | None:
+    """Finds the file named ``filename`` in ``directory``, ignoring case. Texture names are case-insensitive but the
+    file system may not be, so the file extracted or edited by the user can have a different case than the texture.
+    """
+    file_path = directory / filename
+    if file_path.is_file():
+        return file_path
+
+    filename_lower = filename.lower()
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.lower() == filename_lower and entry.is_file():
+                    return directory / entry.name
+    except OSError:
+        pass
+
+    return None
+
+
+def _list_file_names_lower(directory: Path) -> set[str]:
+    with os.scandir(directory) as it:
+        return {entry.name.lower() for entry in it if entry.is_file()}
+
 
-        with tex_data.open() as src, tex_file.open("wb") as dst:
+def _write_texture_file(tex_data, directory: Path):
+    # Write to a temporary file first, a partially written texture would never be replaced otherwise as existing files
+    # are not overwritten
+    tex_file = directory / tex_data.name
+    tmp_file = directory / f".{tex_data.name}.{threading.get_ident()}.tmp"
+    try:
+        with tex_data.open() as src, tmp_file.open("wb") as dst:
             shutil.copyfileobj(src, dst)
+        os.replace(tmp_file, tex_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)